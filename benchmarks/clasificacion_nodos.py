@@ -0,0 +1,245 @@
+"""
+Nombre del módulo: clasificacion_nodos.py
+Ruta: benchmarks/clasificacion_nodos.py
+Descripción: Mide las líneas por segundo que clasifica AnalizadorTipoNodo
+             con el despacho por primera palabra frente a la cadena
+             anterior de verificaciones
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - time.perf_counter
+    - benchmarks.corpus
+    - contador_lineas.core.analizadores.analizador_cadenas.AnalizadorCadenas
+    - contador_lineas.core.arbol.analizador_nodos.AnalizadorTipoNodo
+    - contador_lineas.models.nodos.TipoNodo
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.clasificacion_nodos
+    PYTHONPATH=src python -m benchmarks.clasificacion_nodos --lineas 200000
+
+Notas:
+    - Las líneas salen del generador de corpus con su configuración por
+      defecto; cada analizador clasifica la misma secuencia desde el estado
+      inicial, así que el contexto de clase y método evoluciona igual
+    - Antes de medir se comprueba que ambos analizadores asignan el mismo
+      tipo a cada línea
+"""
+
+import argparse
+from time import perf_counter
+from typing import Callable, List, Optional
+
+from benchmarks.corpus import ParametrosCorpus, generar_modulo
+from contador_lineas.core.analizadores.analizador_cadenas import (
+    AnalizadorCadenas
+)
+from contador_lineas.core.arbol.analizador_nodos import AnalizadorTipoNodo
+from contador_lineas.models.nodos import TipoNodo
+
+
+class AnalizadorTipoNodoEncadenado(AnalizadorTipoNodo):
+    """
+    Réplica del analizador anterior, que prueba todas las reglas en orden
+    para cada línea.
+    """
+
+    def obtener_tipo_nodo(self, linea: str) -> TipoNodo:
+        """
+        Determina el tipo de nodo recorriendo la cadena completa de reglas.
+
+        Args:
+            linea (str): Línea de código a analizar
+
+        Returns:
+            TipoNodo: Tipo de nodo identificado
+        """
+        linea = linea.strip()
+
+        if not linea:
+            return TipoNodo.WHITE_SPACE
+
+        prefijo_async = self._remover_prefijo_async(linea)
+        if prefijo_async:
+            return self.obtener_tipo_nodo(prefijo_async)
+
+        tipo = (self._obtener_tipo_docstring(linea)
+                or (TipoNodo.COMMENT if linea.startswith('#') else None)
+                or self._verificar_constantes_e_imports(linea)
+                or self._verificar_definiciones(linea)
+                or self._verificar_condicionales(linea)
+                or self.verificar_comprensiones(linea)
+                or self.ver_operaciones_especiales(linea)
+                or self._verificar_sentencias_salto(linea)
+                or self._verificar_decoradores_y_propiedades(linea))
+        if tipo:
+            return tipo
+
+        if '=' in linea:
+            index = linea.index('=')
+            pos1 = AnalizadorCadenas().encontrar_sin_comillas(linea, '(', 0,
+                                                              True)
+            pos2 = AnalizadorCadenas().encontrar_sin_comillas(linea, ')', 0,
+                                                              True)
+            if not (index > pos1 and index < pos2):
+                return TipoNodo.ASSIGNMENT
+
+        return TipoNodo.EXPRESSION
+
+    def verificar_comprensiones(self, linea: str) -> Optional[TipoNodo]:
+        """
+        Busca una comprensión entre cada par de delimitadores, sin descartar
+        antes las líneas sin ' for '.
+
+        Args:
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: Tipo de comprensión o None
+        """
+        def tiene_contenido_valido(
+                inicio: int,
+                fin: int,
+                palabras_clave: List[str]) -> bool:
+            if inicio >= fin:
+                return False
+            contenido = linea[inicio + 1:fin]
+            return all(palabra in contenido for palabra in palabras_clave)
+
+        if '[' in linea and ']' in linea:
+            inicio = linea.index('[')
+            fin = linea.rindex(']')
+            if tiene_contenido_valido(inicio, fin, [' for ']):
+                return TipoNodo.LIST_COMPREHENSION
+
+        if '{' in linea and '}' in linea:
+            inicio = linea.index('{')
+            fin = linea.rindex('}')
+            if tiene_contenido_valido(inicio, fin, [' : ', ' for ']):
+                return TipoNodo.DICT_COMPREHENSION
+            elif tiene_contenido_valido(inicio, fin, [' for ']):
+                return TipoNodo.SET_COMPREHENSION
+
+        if '(' in linea and ')' in linea:
+            inicio = linea.index('(')
+            fin = linea.rindex(')')
+            if tiene_contenido_valido(inicio, fin, [' for ']):
+                return TipoNodo.GENERATOR_EXPRESSION
+
+        return None
+
+    def _verificar_condicionales(self, linea: str) -> Optional[TipoNodo]:
+        """
+        Prueba cada prefijo de control de flujo en orden.
+
+        Args:
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: Tipo de estructura o None
+        """
+        mapa_flujo_control = {
+            'if ': TipoNodo.IF,
+            'elif ': TipoNodo.ELIF,
+            'else:': TipoNodo.ELSE,
+            'for ': TipoNodo.FOR,
+            'while ': TipoNodo.WHILE,
+            'match ': TipoNodo.MATCH,
+            'case ': TipoNodo.CASE,
+        }
+
+        for inicio, tipo_nodo in mapa_flujo_control.items():
+            if linea.startswith(inicio):
+                return tipo_nodo
+
+        return None
+
+
+def clasificar(fabrica: Callable, lineas: List[str]) -> List[TipoNodo]:
+    """
+    Clasifica las líneas con un analizador nuevo.
+
+    Args:
+        fabrica (Callable): Clase del analizador
+        lineas (List[str]): Líneas a clasificar
+
+    Returns:
+        List[TipoNodo]: Tipo de cada línea
+
+    Example:
+        >>> clasificar(AnalizadorTipoNodo, ["x = 1"])[0] is TipoNodo.ASSIGNMENT
+        True
+    """
+    obtener_tipo_nodo = fabrica().obtener_tipo_nodo
+    return [obtener_tipo_nodo(linea) for linea in lineas]
+
+
+def medir_lineas_por_segundo(
+        fabrica: Callable,
+        lineas: List[str],
+        repeticiones: int) -> float:
+    """
+    Mide la mejor velocidad de clasificación de varias repeticiones.
+
+    Args:
+        fabrica (Callable): Clase del analizador
+        lineas (List[str]): Líneas a clasificar
+        repeticiones (int): Veces que se repite la medición
+
+    Returns:
+        float: Líneas clasificadas por segundo en la repetición más rápida
+
+    Example:
+        >>> medir_lineas_por_segundo(AnalizadorTipoNodo, lineas, 5)
+        286000.0
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = perf_counter()
+        clasificar(fabrica, lineas)
+        mejor = min(mejor, perf_counter() - inicio)
+    return len(lineas) / mejor
+
+
+def main() -> None:
+    """
+    Genera un módulo de prueba e imprime las líneas por segundo de cada
+    analizador.
+
+    Raises:
+        SystemExit: Si los analizadores no clasifican igual alguna línea
+    """
+    parser = argparse.ArgumentParser(
+        description="Mide las líneas por segundo de AnalizadorTipoNodo")
+    parser.add_argument("--lineas", type=int, default=100000,
+                        help="Líneas de código a generar")
+    parser.add_argument("--semilla", type=int, default=0,
+                        help="Semilla del generador de corpus")
+    parser.add_argument("--repeticiones", type=int, default=5,
+                        help="Repeticiones de cada medición")
+    args = parser.parse_args()
+
+    lineas = generar_modulo(
+        ParametrosCorpus(lineas=args.lineas, semilla=args.semilla))
+
+    if (clasificar(AnalizadorTipoNodoEncadenado, lineas)
+            != clasificar(AnalizadorTipoNodo, lineas)):
+        raise SystemExit("Los analizadores no clasifican igual las líneas")
+
+    antes = medir_lineas_por_segundo(
+        AnalizadorTipoNodoEncadenado, lineas, args.repeticiones)
+    despues = medir_lineas_por_segundo(
+        AnalizadorTipoNodo, lineas, args.repeticiones)
+
+    print(f"Líneas: {len(lineas)}")
+    print(f"Cadena de reglas:       {antes:12,.0f} líneas/s")
+    print(f"Despacho por palabra:   {despues:12,.0f} líneas/s")
+    print(f"Aceleración:            {despues / antes:12.2f} x")
+
+
+if __name__ == "__main__":
+    main()
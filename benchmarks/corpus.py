@@ -0,0 +1,548 @@
+"""
+Nombre del módulo: corpus.py
+Ruta: benchmarks/corpus.py
+Descripción: Genera módulos Python sintéticos y deterministas para medir el
+             rendimiento, y reúne la biblioteca estándar instalada como
+             corpus real
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - random.Random
+    - sysconfig
+    - tokenize
+    - analizador_cambios.config.longitud_lineas.LONGITUD_MAXIMA_LINEA
+
+Uso:
+    from benchmarks.corpus import (
+        ParametrosCorpus, archivos_stdlib, generar_modulo, mutar_lineas
+    )
+
+    lineas = generar_modulo(ParametrosCorpus(lineas=100000, profundidad=5))
+    modificadas = mutar_lineas(lineas, proporcion=0.05)
+    rutas = archivos_stdlib(limite=200)
+
+Notas:
+    - La misma semilla y los mismos parámetros producen siempre el mismo
+      módulo, línea por línea
+    - El código generado es Python válido y cumple el estándar del proyecto:
+      sin lambdas, sin varias declaraciones por línea y sin comprensiones ni
+      ternarios anidados, así que recorre todas las etapas del análisis
+    - El módulo termina en la primera función o clase que alcanza el número
+      de líneas pedido, así que puede excederlo en unas decenas de líneas
+"""
+
+import io
+import random
+import sysconfig
+import tokenize
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set
+
+from analizador_cambios.config.longitud_lineas import LONGITUD_MAXIMA_LINEA
+
+# Nivel de sangría máximo de una estructura de control: su encabezado y su
+# contenido deben caber en la longitud máxima de línea
+NIVEL_MAXIMO = 10
+
+# Fragmentos de las cadenas generadas; incluyen caracteres que los
+# analizadores deben ignorar dentro de comillas
+FRAGMENTOS_CADENA = [
+    "valor", "total: {}", "# no es comentario", "a; b", "x if y else z",
+    "[i for i in datos]", "lambda: 0", "(", "]", "{clave}", "it's",
+    "ruta/al/archivo.py", "    sangría", "\\t", "ñandú", "def f():",
+]
+
+CONDICIONES = [
+    "valor > 0", "not datos", "total is None", "indice % 2 == 0",
+    "clave in registro", "len(datos) > limite", "activo and not vacio",
+]
+
+EXPRESIONES = [
+    "valor + 1", "total * factor", "len(datos)", "registro.get(clave)",
+    "indice // 2", "max(valor, limite)", "datos[indice]", "-valor",
+    "self.calcular(valor)", "float(total) / (limite + 1)",
+]
+
+COMPRENSIONES = [
+    "[elemento * 2 for elemento in datos]",
+    "[elemento for elemento in datos if elemento > limite]",
+    "{clave: valor for clave, valor in registro.items()}",
+    "{elemento % 7 for elemento in datos}",
+    "sum(elemento for elemento in datos)",
+]
+
+# Términos de las líneas largas de una sola línea física
+TERMINOS_SIMPLES = [
+    "valor", "total * factor", "indice // 2", "-valor", "limite",
+    "indice % 7", "total", "factor ** 2",
+]
+
+TERNARIOS = [
+    "valor if valor > 0 else -valor",
+    "total if total is not None else 0",
+    "\"par\" if indice % 2 == 0 else \"impar\"",
+]
+
+
+@dataclass(frozen=True)
+class ParametrosCorpus:
+    """
+    Forma de un módulo sintético.
+
+    Attributes:
+        lineas (int): Líneas aproximadas del módulo
+        profundidad (int): Niveles máximos de bloques anidados dentro de una
+            función
+        densidad_cadenas (float): Fracción de sentencias con cadenas
+        frecuencia_expresiones (float): Fracción de sentencias con una
+            comprensión o un ternario
+        frecuencia_lineas_largas (float): Fracción de sentencias largas, en
+            una sola línea física o repartidas entre paréntesis
+        clases (int): Clases del módulo; el resto son funciones de módulo
+        semilla (int): Semilla del generador
+
+    Example:
+        >>> ParametrosCorpus(lineas=1000000, profundidad=6, clases=50)
+    """
+
+    lineas: int = 1000
+    profundidad: int = 3
+    densidad_cadenas: float = 0.2
+    frecuencia_expresiones: float = 0.1
+    frecuencia_lineas_largas: float = 0.05
+    clases: int = 10
+    semilla: int = 0
+
+
+class GeneradorModulo:
+    """
+    Escribe un módulo sintético a partir de un generador aleatorio con
+    semilla.
+
+    Attributes:
+        parametros (ParametrosCorpus): Forma del módulo
+        azar (random.Random): Generador aleatorio propio del módulo
+        lineas (List[str]): Líneas generadas hasta el momento
+        contador (int): Contador para nombres únicos
+
+    Methods:
+        generar() -> List[str]:
+            Genera el módulo completo.
+
+    Example:
+        >>> len(GeneradorModulo(ParametrosCorpus(lineas=500)).generar()) >= 500
+        True
+    """
+
+    def __init__(self, parametros: ParametrosCorpus):
+        self.parametros = parametros
+        self.azar = random.Random(parametros.semilla)
+        self.lineas: List[str] = []
+        self.contador = 0
+
+    def generar(self) -> List[str]:
+        """
+        Genera el módulo: encabezado, clases y funciones de módulo.
+
+        Returns:
+            List[str]: Líneas del módulo, terminadas en salto de línea
+        """
+        semilla = self.parametros.semilla
+        self._agregar(0, f'"""Módulo sintético {semilla} para medir el '
+                         'rendimiento."""')
+        self._agregar(0, "import os")
+        self._agregar(0, "from typing import Dict, List")
+        self._agregar(0, "")
+        self._agregar(0, "LIMITE = 100")
+
+        # Las clases y las funciones de módulo se reparten las líneas en
+        # partes iguales
+        partes = self.parametros.clases + 1
+        for indice in range(self.parametros.clases):
+            meta = self.parametros.lineas * (indice + 1) // partes
+            self._generar_clase(meta)
+        while len(self.lineas) < self.parametros.lineas:
+            self._agregar(0, "")
+            self._agregar(0, "")
+            self._generar_funcion(0, es_metodo=False)
+        return self.lineas
+
+    def _agregar(self, nivel: int, texto: str) -> None:
+        """
+        Agrega una línea con la sangría del nivel indicado.
+
+        Args:
+            nivel (int): Nivel de sangría, en bloques de cuatro espacios
+            texto (str): Contenido de la línea, vacío para una línea en blanco
+        """
+        self.lineas.append(f"{'    ' * nivel}{texto}\n" if texto else "\n")
+
+    def _nombre(self, prefijo: str) -> str:
+        """
+        Genera un nombre único con el prefijo indicado.
+
+        Args:
+            prefijo (str): Prefijo del nombre
+
+        Returns:
+            str: Nombre único
+        """
+        self.contador += 1
+        return f"{prefijo}_{self.contador}"
+
+    def _probabilidad(self, fraccion: float) -> bool:
+        """
+        Decide si ocurre un evento con la probabilidad indicada.
+
+        Args:
+            fraccion (float): Probabilidad entre 0 y 1
+
+        Returns:
+            bool: True si el evento ocurre
+        """
+        return self.azar.random() < fraccion
+
+    def _cabe(self, nivel: int, texto: str) -> bool:
+        """
+        Indica si una línea cabe sin que analizador_cambios la reformatee.
+
+        Args:
+            nivel (int): Nivel de sangría de la línea
+            texto (str): Contenido de la línea
+
+        Returns:
+            bool: True si la línea no supera la longitud máxima
+        """
+        return 4 * nivel + len(texto) < LONGITUD_MAXIMA_LINEA
+
+    def _cadena(self, disponible: int) -> str:
+        """
+        Genera un literal de cadena con fragmentos que contienen caracteres
+        especiales.
+
+        Args:
+            disponible (int): Caracteres máximos del literal, con comillas
+
+        Returns:
+            str: Literal de cadena con comillas dobles o simples
+        """
+        fragmentos = [self.azar.choice(FRAGMENTOS_CADENA)
+                      for _ in range(self.azar.randint(1, 4))]
+        while len(fragmentos) > 1 and \
+        len(" ".join(fragmentos)) + 2 > disponible:
+            fragmentos.pop()
+        texto = " ".join(fragmentos)
+        if len(texto) + 2 > disponible:
+            texto = "valor"
+        # Solo se usan comillas simples si el texto no contiene una
+        if "'" in texto or self._probabilidad(0.5):
+            return f'"{texto}"'
+        return f"'{texto}'"
+
+    def _generar_clase(self, meta: int) -> None:
+        """
+        Genera una clase con métodos hasta alcanzar la línea indicada.
+
+        Args:
+            meta (int): Número de línea del módulo en la que termina la clase
+        """
+        self._agregar(0, "")
+        self._agregar(0, "")
+        self._agregar(0, f"class {self._nombre('Clase').title()}:")
+        self._agregar(1, '"""Clase generada para medir el rendimiento."""')
+        self._agregar(1, "")
+        self._agregar(1, "limite = LIMITE")
+        self._agregar(1, "")
+        # Al menos un método, aunque la clase ya haya alcanzado su meta
+        self._generar_funcion(1, es_metodo=True)
+        while len(self.lineas) < meta:
+            self._agregar(1, "")
+            self._generar_funcion(1, es_metodo=True)
+
+    def _generar_funcion(self, nivel: int, es_metodo: bool) -> None:
+        """
+        Genera una función o método con docstring, cuerpo y retorno.
+
+        Args:
+            nivel (int): Nivel de sangría de la definición
+            es_metodo (bool): Si es True, recibe self como primer parámetro
+        """
+        if self._probabilidad(0.1):
+            self._agregar(nivel, "@staticmethod" if es_metodo
+                          else "@registrar")
+            parametros = "valor, datos"
+        else:
+            parametros = "self, valor, datos" if es_metodo else "valor, datos"
+        self._agregar(nivel, f"def {self._nombre('funcion')}({parametros}):")
+
+        if self._probabilidad(self.parametros.densidad_cadenas):
+            self._agregar(nivel + 1, '"""')
+            self._agregar(nivel + 1, "Docstring de varias líneas, con "
+                                     "'comillas' y # almohadillas.")
+            self._agregar(nivel + 1, '"""')
+        else:
+            self._agregar(nivel + 1, '"""Función generada."""')
+        self._agregar(nivel + 1, "total = 0")
+        self._generar_cuerpo(nivel + 1, 1, self.azar.randint(3, 8))
+        self._agregar(nivel + 1, "return total")
+
+    def _generar_cuerpo(
+            self,
+            nivel: int,
+            profundidad: int,
+            sentencias: int) -> None:
+        """
+        Genera las sentencias de un bloque, algunas de ellas bloques anidados.
+
+        Args:
+            nivel (int): Nivel de sangría de las sentencias
+            profundidad (int): Niveles de bloque ya abiertos en la función
+            sentencias (int): Cantidad de sentencias del bloque
+        """
+        for _ in range(sentencias):
+            # Las estructuras más profundas no dejarían sitio para su
+            # contenido dentro de la longitud máxima de línea
+            if profundidad < self.parametros.profundidad and \
+            nivel < NIVEL_MAXIMO and self._probabilidad(0.3):
+                self._generar_bloque(nivel, profundidad)
+            else:
+                self._generar_sentencia(nivel)
+
+    def _generar_bloque(self, nivel: int, profundidad: int) -> None:
+        """
+        Genera una estructura de control con su cuerpo.
+
+        Args:
+            nivel (int): Nivel de sangría de la estructura
+            profundidad (int): Niveles de bloque ya abiertos en la función
+        """
+        cuerpo = self.azar.randint(1, 4)
+        tipo = self.azar.choice(["if", "for", "while", "with", "try"])
+        if tipo == "if":
+            self._agregar(nivel, f"if {self.azar.choice(CONDICIONES)}:")
+            self._generar_cuerpo(nivel + 1, profundidad + 1, cuerpo)
+            if self._probabilidad(0.3):
+                self._agregar(nivel, f"elif {self.azar.choice(CONDICIONES)}:")
+                self._generar_cuerpo(nivel + 1, profundidad + 1, 1)
+            if self._probabilidad(0.4):
+                self._agregar(nivel, "else:")
+                self._generar_cuerpo(nivel + 1, profundidad + 1, 1)
+        elif tipo == "for":
+            self._agregar(nivel, "for elemento in datos:")
+            self._generar_cuerpo(nivel + 1, profundidad + 1, cuerpo)
+        elif tipo == "while":
+            self._agregar(nivel, "while total < LIMITE:")
+            self._agregar(nivel + 1, "total += 1")
+            self._generar_cuerpo(nivel + 1, profundidad + 1, cuerpo - 1)
+        elif tipo == "with":
+            self._agregar(nivel, "with open(os.devnull) as archivo:")
+            self._generar_cuerpo(nivel + 1, profundidad + 1, cuerpo)
+        else:
+            self._agregar(nivel, "try:")
+            self._generar_cuerpo(nivel + 1, profundidad + 1, cuerpo)
+            self._agregar(nivel, "except (KeyError, ValueError) as error:")
+            self._agregar(nivel + 1, "total = -1")
+            if self._probabilidad(0.3):
+                self._agregar(nivel, "finally:")
+                self._generar_cuerpo(nivel + 1, profundidad + 1, 1)
+
+    def _generar_sentencia(self, nivel: int) -> None:
+        """
+        Genera una sentencia simple según las frecuencias de los parámetros.
+
+        Las sentencias normales caben en la longitud máxima de línea; si no,
+        se reemplazan por un incremento.
+
+        Args:
+            nivel (int): Nivel de sangría de la sentencia
+        """
+        parametros = self.parametros
+        variable = self._nombre("valor")
+        disponible = LONGITUD_MAXIMA_LINEA - 4 * nivel - len(variable) - 4
+        if self._probabilidad(parametros.frecuencia_lineas_largas):
+            self._generar_sentencia_larga(nivel, variable)
+            return
+        if self._probabilidad(parametros.frecuencia_expresiones):
+            expresion = self.azar.choice(COMPRENSIONES + TERNARIOS)
+            texto = f"{variable} = {expresion}"
+        elif self._probabilidad(parametros.densidad_cadenas):
+            if self._probabilidad(0.5):
+                texto = f"{variable} = {self._cadena(disponible)}"
+            else:
+                texto = (f"print({self._cadena(disponible // 2 - 4)}, "
+                         f"{self._cadena(disponible // 2 - 4)})")
+        elif self._probabilidad(0.2):
+            texto = f"total += {self.azar.randint(1, 99)}"
+        else:
+            texto = f"{variable} = {self.azar.choice(EXPRESIONES)}"
+        self._agregar(nivel, texto if self._cabe(nivel, texto)
+                      else "total += 1")
+
+    def _generar_sentencia_larga(self, nivel: int, variable: str) -> None:
+        """
+        Genera una sentencia larga en una línea o entre paréntesis.
+
+        La línea larga solo suma términos sin paréntesis ni comas, que
+        analizador_cambios puede partir en varias líneas; la lista entre
+        paréntesis tiene un elemento por línea.
+
+        Args:
+            nivel (int): Nivel de sangría de la sentencia
+            variable (str): Variable asignada
+        """
+        cantidad = self.azar.randint(8, 30)
+        if self._probabilidad(0.5):
+            terminos = [self.azar.choice(TERMINOS_SIMPLES)
+                        for _ in range(cantidad)]
+            self._agregar(nivel, f"{variable} = {' + '.join(terminos)}")
+            return
+        self._agregar(nivel, f"{variable} = sum([")
+        # Cada elemento es "len(...)," con la sangría del nivel siguiente
+        disponible = LONGITUD_MAXIMA_LINEA - 4 * (nivel + 1) - 7
+        for _ in range(cantidad):
+            if self._probabilidad(self.parametros.densidad_cadenas):
+                argumento = self._cadena(disponible)
+            else:
+                argumento = self.azar.choice(EXPRESIONES)
+            self._agregar(nivel + 1, f"len({argumento}),")
+        self._agregar(nivel, "])")
+
+
+def generar_modulo(parametros: ParametrosCorpus) -> List[str]:
+    """
+    Genera un módulo sintético determinista.
+
+    Args:
+        parametros (ParametrosCorpus): Forma del módulo
+
+    Returns:
+        List[str]: Líneas del módulo, terminadas en salto de línea
+
+    Example:
+        >>> lineas = generar_modulo(ParametrosCorpus(lineas=10000))
+        >>> len(lineas) >= 10000
+        True
+    """
+    return GeneradorModulo(parametros).generar()
+
+
+def mutar_lineas(
+        lineas: List[str],
+        proporcion: float = 0.05,
+        semilla: int = 0) -> List[str]:
+    """
+    Produce una versión editada del código para medir la comparación.
+
+    Solo se editan asignaciones simples que ocupan una línea física: se
+    modifican, se duplican o se borran si la sentencia anterior del mismo
+    bloque también es una asignación simple, así que el resultado sigue
+    siendo Python válido y no vacía ningún bloque.
+
+    Args:
+        lineas (List[str]): Código original, válido para tokenize
+        proporcion (float): Fracción de asignaciones editadas
+        semilla (int): Semilla del generador
+
+    Returns:
+        List[str]: Código editado; el original si no se puede tokenizar
+
+    Example:
+        >>> original = generar_modulo(ParametrosCorpus(lineas=10000))
+        >>> modificado = mutar_lineas(original, proporcion=0.05)
+    """
+    candidatas = _asignaciones_simples(lineas)
+    if candidatas is None:
+        return list(lineas)
+
+    azar = random.Random(semilla)
+    resultado = []
+    # Sangría de la línea anterior conservada si era una asignación simple
+    sangria_anterior = None
+    for numero, linea in enumerate(lineas):
+        es_candidata = numero in candidatas
+        sangria = len(linea) - len(linea.lstrip())
+        if es_candidata and azar.random() < proporcion:
+            operacion = azar.randrange(3)
+            modificada = f"{linea.rstrip()} + 0\n"
+            if operacion == 0 and \
+            len(modificada) <= LONGITUD_MAXIMA_LINEA:
+                resultado.append(modificada)
+            elif operacion == 0:
+                resultado.append(linea)
+            elif operacion == 1:
+                resultado.extend([linea, linea])
+            elif sangria_anterior == sangria:
+                # La asignación anterior mantiene el bloque con contenido
+                continue
+            else:
+                resultado.append(linea)
+        else:
+            resultado.append(linea)
+        sangria_anterior = sangria if es_candidata else None
+    return resultado
+
+
+def _asignaciones_simples(lineas: List[str]) -> Optional[Set[int]]:
+    """
+    Encuentra las líneas que son una asignación simple completa.
+
+    Una asignación simple empieza con un nombre seguido de "=", ocupa una
+    sola línea física y no tiene cadenas, comentarios ni punto y coma.
+
+    Args:
+        lineas (List[str]): Código a analizar
+
+    Returns:
+        Optional[Set[int]]: Números de línea (desde 0) de las asignaciones, o
+            None si el código no se puede tokenizar
+    """
+    candidatas = set()
+    tokens = []
+    try:
+        for token in tokenize.generate_tokens(
+                io.StringIO("".join(lineas)).readline):
+            if token.type == tokenize.NEWLINE:
+                fila = tokens[0].start[0]
+                if fila == token.start[0] and len(tokens) >= 3 and \
+                tokens[0].type == tokenize.NAME and \
+                tokens[1].string == "=" and \
+                all(t.type not in (tokenize.STRING, tokenize.COMMENT) and
+                    t.string != ";" for t in tokens):
+                    candidatas.add(fila - 1)
+                tokens = []
+            elif token.type not in (tokenize.NL, tokenize.INDENT,
+                                    tokenize.DEDENT, tokenize.ENDMARKER):
+                tokens.append(token)
+    except (tokenize.TokenError, SyntaxError):
+        return None
+    return candidatas
+
+
+def archivos_stdlib(limite: Optional[int] = None) -> List[Path]:
+    """
+    Lista los módulos de la biblioteca estándar instalada.
+
+    Args:
+        limite (Optional[int]): Máximo de archivos; se toma una muestra
+            repartida por todo el árbol, o todos si es None
+
+    Returns:
+        List[Path]: Rutas ordenadas de los archivos .py
+
+    Example:
+        >>> len(archivos_stdlib(limite=100))
+        100
+    """
+    raiz = Path(sysconfig.get_paths()["stdlib"])
+    archivos = sorted(ruta for ruta in raiz.rglob("*.py")
+                      if "site-packages" not in ruta.parts)
+    if limite is not None and len(archivos) > limite:
+        paso = len(archivos) / limite
+        archivos = [archivos[int(indice * paso)] for indice in range(limite)]
+    return archivos
@@ -0,0 +1,213 @@
+"""
+Nombre del módulo: memoria_nodos.py
+Ruta: benchmarks/memoria_nodos.py
+Descripción: Mide los bytes por nodo del árbol sintáctico con el nodo
+             compartido con __slots__ frente al nodo anterior con __dict__
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - tracemalloc
+    - contador_lineas.core.arbol.constructor_arbol.ConstructorArbol
+    - contador_lineas.core.arbol.nodo.Nodo
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.memoria_nodos
+    PYTHONPATH=src python -m benchmarks.memoria_nodos --lineas 1000000
+
+Notas:
+    - El árbol se construye una sola vez y se copia con cada tipo de nodo; el
+      contenido de las líneas se comparte entre copias, así que la diferencia
+      medida corresponde solo a la estructura de los nodos
+"""
+
+import argparse
+import tracemalloc
+from typing import Callable, List, Optional
+
+from contador_lineas.core.arbol.constructor_arbol import ConstructorArbol
+from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.models.nodos import TipoNodo
+
+PLANTILLA_CLASE = [
+    "class Clase{indice}:",
+    "    \"\"\"Clase generada para medir memoria.\"\"\"",
+    "",
+    "    def __init__(self, valor):",
+    "        self.valor = valor",
+    "        self.datos = [valor, valor + 1, valor + 2]",
+    "",
+    "    def calcular(self, factor):",
+    "        if factor > 0:",
+    "            return self.valor * factor",
+    "        for elemento in self.datos:",
+    "            factor += elemento",
+    "        return factor",
+    "",
+]
+
+
+class NodoConDiccionario:
+    """
+    Réplica del nodo anterior, con un __dict__ y una lista por instancia.
+
+    Attributes:
+        tipo (TipoNodo): Tipo de nodo
+        contenido (str): Contenido textual del nodo
+        nivel_indentacion (int): Nivel de indentación del nodo
+        numero_nodo (Optional[int]): Número del nodo
+        hijos (List[NodoConDiccionario]): Lista de nodos hijos
+        padre (Optional[NodoConDiccionario]): Referencia al nodo padre
+    """
+
+    def __init__(
+            self,
+            tipo: TipoNodo,
+            contenido: str,
+            nivel_indentacion: int,
+            numero_nodo: Optional[int] = None
+        ):
+        self.tipo = tipo
+        self.contenido = contenido
+        self.nivel_indentacion = nivel_indentacion
+        self.numero_nodo = numero_nodo
+        self.hijos: List[NodoConDiccionario] = []
+        self.padre: Optional[NodoConDiccionario] = None
+
+    def agregar_hijo(self, hijo: 'NodoConDiccionario') -> None:
+        """
+        Agrega un nodo hijo al nodo actual.
+
+        Args:
+            hijo (NodoConDiccionario): Nodo a agregar como hijo
+        """
+        hijo.padre = self
+        self.hijos.append(hijo)
+
+
+def generar_codigo(total_lineas: int) -> List[str]:
+    """
+    Genera código Python válido repitiendo una clase de ejemplo.
+
+    Args:
+        total_lineas (int): Cantidad aproximada de líneas a generar
+
+    Returns:
+        List[str]: Líneas de código generadas
+
+    Example:
+        >>> len(generar_codigo(28))
+        28
+    """
+    lineas = []
+    indice = 0
+    while len(lineas) < total_lineas:
+        lineas.extend(linea.format(indice=indice)
+                      for linea in PLANTILLA_CLASE)
+        indice += 1
+    return lineas
+
+
+def copiar_arbol(raiz: Nodo, fabrica: Callable) -> object:
+    """
+    Copia un árbol creando cada nodo con la fábrica indicada.
+
+    Args:
+        raiz (Nodo): Raíz del árbol original
+        fabrica (Callable): Clase de nodo para la copia
+
+    Returns:
+        object: Raíz del árbol copiado
+
+    Example:
+        >>> copia = copiar_arbol(raiz, NodoConDiccionario)
+    """
+    copia_raiz = fabrica(raiz.tipo, raiz.contenido, raiz.nivel_indentacion)
+    pila = [(raiz, copia_raiz)]
+    while pila:
+        original, copia = pila.pop()
+        for hijo in original.hijos:
+            copia_hijo = fabrica(hijo.tipo, hijo.contenido,
+                                 hijo.nivel_indentacion)
+            copia.agregar_hijo(copia_hijo)
+            pila.append((hijo, copia_hijo))
+    return copia_raiz
+
+
+def medir_bytes_por_nodo(
+        raiz: Nodo,
+        fabrica: Callable,
+        total_nodos: int) -> float:
+    """
+    Mide la memoria que ocupa una copia del árbol con un tipo de nodo.
+
+    Args:
+        raiz (Nodo): Raíz del árbol original
+        fabrica (Callable): Clase de nodo para la copia
+        total_nodos (int): Cantidad de nodos del árbol
+
+    Returns:
+        float: Bytes asignados por nodo
+
+    Example:
+        >>> medir_bytes_por_nodo(raiz, Nodo, 1000)
+        88.0
+    """
+    tracemalloc.start()
+    try:
+        inicial, _ = tracemalloc.get_traced_memory()
+        copia = copiar_arbol(raiz, fabrica)
+        final, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del copia
+    return (final - inicial) / total_nodos
+
+
+def contar_nodos(raiz: Nodo) -> int:
+    """
+    Cuenta los nodos de un árbol, incluida la raíz.
+
+    Args:
+        raiz (Nodo): Raíz del árbol
+
+    Returns:
+        int: Cantidad de nodos
+    """
+    total = 0
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        total += 1
+        pila.extend(nodo.hijos)
+    return total
+
+
+def main() -> None:
+    """
+    Construye un árbol de prueba e imprime los bytes por nodo de cada tipo.
+    """
+    parser = argparse.ArgumentParser(
+        description="Mide los bytes por nodo del árbol sintáctico")
+    parser.add_argument("--lineas", type=int, default=100000,
+                        help="Líneas de código a generar")
+    args = parser.parse_args()
+
+    raiz = ConstructorArbol().construir(generar_codigo(args.lineas))
+    total_nodos = contar_nodos(raiz)
+
+    antes = medir_bytes_por_nodo(raiz, NodoConDiccionario, total_nodos)
+    despues = medir_bytes_por_nodo(raiz, Nodo, total_nodos)
+
+    print(f"Nodos: {total_nodos}")
+    print(f"Nodo con __dict__:   {antes:8.1f} bytes/nodo")
+    print(f"Nodo con __slots__:  {despues:8.1f} bytes/nodo")
+    print(f"Reducción:           {100 * (1 - despues / antes):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
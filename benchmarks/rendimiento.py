@@ -0,0 +1,506 @@
+"""
+Nombre del módulo: rendimiento.py
+Ruta: benchmarks/rendimiento.py
+Descripción: Mide el tiempo de cada etapa del análisis sobre corpus
+             sintéticos y sobre la biblioteca estándar, guarda los
+             resultados en JSON y los compara con una línea base
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - argparse
+    - json
+    - time.perf_counter
+    - benchmarks.corpus
+    - contador_lineas.core.arbol.arbol_sintactico.ArbolArchivoPython
+    - contador_lineas.core.arbol.verificador_estandar_codigo
+    - contador_lineas.core.contadores.contador_fisico.ContadorLineasFisicas
+    - contador_lineas.core.contadores.contador_logico.ContadorLineasLogicas
+    - contador_lineas.core.gestion_archivos.almacenamiento_metricas
+    - contador_lineas.core.gestion_archivos.lector_archivo
+    - analizador_cambios.core.arbol.comparador_principal
+    - analizador_cambios.core.contadores.analizador.AnalizadorCodigo
+
+Uso:
+    PYTHONPATH=src python -m benchmarks.rendimiento generar modulo.py \\
+        --lineas 100000 --profundidad 5
+    PYTHONPATH=src python -m benchmarks.rendimiento ejecutar \\
+        --lineas 1000 10000 100000 --stdlib --salida base.json
+    PYTHONPATH=src python -m benchmarks.rendimiento comparar \\
+        base.json actual.json --umbral 0.10
+
+Notas:
+    - Cada etapa se mide por separado sobre todos los archivos del corpus y
+      se guarda el mínimo de las repeticiones, que es la medida menos
+      afectada por el ruido de la máquina
+    - Las etapas contar, almacenar y comparar solo procesan los archivos que
+      cumplen el estándar; gran parte de la biblioteca estándar no lo cumple
+      y cuenta como error de validación
+    - La etapa mapear lee y construye cada árbol desde el archivo mapeado en
+      memoria, como AnalizadorCodigo con umbral_mapeo; se compara con la
+      suma de leer y construir
+    - La etapa comparar incluye el formateo y la construcción de las dos
+      versiones en analizador_cambios, además del emparejamiento de nodos
+    - comparar termina con código 1 si alguna etapa empeora más que el
+      umbral, para usarse en integración continua
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO, ALGORITMOS_COMPARACION, ComparadorVersiones
+)
+from analizador_cambios.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from analizador_cambios.utils.formateador_linea import ExcepcionFormateo
+from benchmarks.corpus import (
+    ParametrosCorpus, archivos_stdlib, generar_modulo, mutar_lineas
+)
+from contador_lineas.core.arbol.arbol_sintactico import ArbolArchivoPython
+from contador_lineas.core.arbol.verificador_estandar_codigo import (
+    VerificadorEstandarCodigo
+)
+from contador_lineas.core.contadores.contador_fisico import (
+    ContadorLineasFisicas
+)
+from contador_lineas.core.contadores.contador_logico import (
+    ContadorLineasLogicas
+)
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas
+)
+from contador_lineas.core.gestion_archivos.lector_archivo import (
+    LectorArchivoPython
+)
+from contador_lineas.models.metricas import MetricasArchivo
+
+ETAPAS = ("leer", "construir", "mapear", "validar", "contar", "almacenar",
+          "comparar")
+
+# Etapas cuya salida no alimenta a ninguna otra; si no se miden se omiten
+ETAPAS_FINALES = ("mapear", "comparar")
+
+# Las etapas con una línea base más corta son ruido y no se comparan
+MINIMO_SEGUNDOS = 0.005
+
+
+@dataclass
+class ResultadoCorpus:
+    """
+    Tiempos y conteos de un corpus.
+
+    Attributes:
+        archivos (int): Archivos del corpus
+        lineas (int): Líneas físicas leídas
+        validos (int): Archivos que cumplen el estándar
+        errores (int): Archivos que no se pudieron leer o violan el estándar
+        comparados (int): Archivos válidos cuya comparación terminó
+        etapas (Dict[str, float]): Segundos mínimos de cada etapa medida
+
+    Example:
+        >>> ResultadoCorpus(archivos=1, lineas=1000, validos=1, errores=0)
+    """
+
+    archivos: int = 0
+    lineas: int = 0
+    validos: int = 0
+    errores: int = 0
+    comparados: int = 0
+    etapas: Dict[str, float] = field(default_factory=dict)
+
+
+class MedidorEtapas:
+    """
+    Ejecuta las etapas del análisis sobre un corpus y mide cada una.
+
+    Attributes:
+        etapas (Tuple[str, ...]): Etapas a medir, en el orden de ETAPAS
+        repeticiones (int): Veces que se mide cada etapa
+        algoritmo (str): Algoritmo de comparación de analizador_cambios
+        proporcion_cambios (float): Fracción de asignaciones editadas en la
+            versión nueva de cada archivo
+        directorio (Path): Carpeta temporal del registro de métricas
+
+    Methods:
+        medir(rutas: List[Path]) -> ResultadoCorpus:
+            Mide todas las etapas sobre los archivos indicados.
+
+    Example:
+        >>> medidor = MedidorEtapas(ETAPAS, 3, "voraz", 0.05, Path("/tmp"))
+        >>> medidor.medir([Path("modulo.py")]).etapas["construir"]
+        0.042
+    """
+
+    def __init__(
+            self,
+            etapas: Tuple[str, ...],
+            repeticiones: int,
+            algoritmo: str,
+            proporcion_cambios: float,
+            directorio: Path):
+        self.etapas = etapas
+        self.repeticiones = repeticiones
+        self.algoritmo = algoritmo
+        self.proporcion_cambios = proporcion_cambios
+        self.directorio = directorio
+        # Tiempos del corpus que se está midiendo
+        self._tiempos: Dict[str, float] = {}
+
+    def medir(self, rutas: List[Path]) -> ResultadoCorpus:
+        """
+        Mide todas las etapas sobre los archivos indicados.
+
+        Cada etapa recibe la salida de la anterior, calculada fuera del
+        tiempo medido, así que las etapas se pueden medir por separado.
+
+        Args:
+            rutas (List[Path]): Archivos del corpus
+
+        Returns:
+            ResultadoCorpus: Tiempos mínimos y conteos del corpus
+        """
+        resultado = ResultadoCorpus(archivos=len(rutas))
+        self._tiempos = {}
+        codigos = self._cronometrar("leer", self._leer, rutas)
+        legibles = [(ruta, lineas) for ruta, lineas in zip(rutas, codigos)
+                    if lineas is not None]
+        resultado.lineas = sum(len(lineas) for _, lineas in legibles)
+
+        arboles = self._cronometrar("construir", self._construir, legibles)
+        self._cronometrar("mapear", self._mapear, legibles)
+        validez = self._cronometrar("validar", self._validar, arboles)
+        validos = [(ruta, lineas, arbol) for (ruta, lineas), arbol, valido
+                   in zip(legibles, arboles, validez) if valido]
+        resultado.validos = len(validos)
+        resultado.errores = len(rutas) - len(validos)
+
+        metricas = self._cronometrar("contar", self._contar, validos)
+        self._cronometrar("almacenar", self._almacenar, metricas)
+        cambios = self._cronometrar("comparar", self._comparar, validos)
+        resultado.comparados = sum(1 for cambio in cambios
+                                   if cambio is not None)
+        resultado.etapas = dict(self._tiempos)
+        return resultado
+
+    def _cronometrar(
+            self,
+            etapa: str,
+            funcion: Callable[[List], List],
+            entradas: List) -> List:
+        """
+        Ejecuta una etapa las veces indicadas y guarda su tiempo mínimo.
+
+        Args:
+            etapa (str): Nombre de la etapa
+            funcion (Callable[[List], List]): Procesa una lista de entradas
+            entradas (List): Entradas de la etapa
+
+        Returns:
+            List: Salida de la última ejecución; la de una sola ejecución
+                si la etapa no se mide, porque las siguientes la necesitan
+        """
+        if etapa not in self.etapas:
+            return [] if etapa in ETAPAS_FINALES else funcion(entradas)
+        mejor = None
+        for _ in range(self.repeticiones):
+            inicio = perf_counter()
+            salida = funcion(entradas)
+            transcurrido = perf_counter() - inicio
+            if mejor is None or transcurrido < mejor:
+                mejor = transcurrido
+        self._tiempos[etapa] = mejor
+        return salida
+
+    @staticmethod
+    def _leer(rutas: List[Path]) -> List[Optional[List[str]]]:
+        codigos = []
+        for ruta in rutas:
+            lineas, error = LectorArchivoPython(ruta).leer_lineas()
+            codigos.append(None if error else lineas)
+        return codigos
+
+    @staticmethod
+    def _construir(
+            legibles: List[Tuple[Path, List[str]]]
+        ) -> List[ArbolArchivoPython]:
+        return [ArbolArchivoPython(lineas) for _, lineas in legibles]
+
+    @staticmethod
+    def _mapear(legibles: List[Tuple[Path, List[str]]]) -> List:
+        for ruta, _ in legibles:
+            with LectorArchivoPython(ruta).mapear() as archivo:
+                ArbolArchivoPython(archivo)
+        return []
+
+    @staticmethod
+    def _validar(arboles: List[ArbolArchivoPython]) -> List[bool]:
+        verificador = VerificadorEstandarCodigo()
+        return [verificador.es_arbol_sintactico_valido(arbol.raiz)[0]
+                for arbol in arboles]
+
+    @staticmethod
+    def _contar(validos: List[Tuple]) -> List[MetricasArchivo]:
+        metricas = []
+        for ruta, _, arbol in validos:
+            metricas.append(MetricasArchivo(
+                nombre_archivo=str(ruta),
+                lineas_logicas=ContadorLineasLogicas.contar_lineas_logicas(
+                    arbol.raiz),
+                lineas_fisicas=ContadorLineasFisicas.contar_lineas_fisicas(
+                    arbol.raiz)))
+        return metricas
+
+    def _almacenar(self, metricas: List[MetricasArchivo]) -> List:
+        # Un registro nuevo en cada repetición para no medir uno que crece
+        ruta = self.directorio / "metricas_registro.json"
+        ruta.unlink(missing_ok=True)
+        almacen = AlmacenamientoMetricas(str(ruta))
+        with almacen.lote():
+            for metrica in metricas:
+                almacen.guardar_metricas(metrica)
+        return []
+
+    def _comparar(self, validos: List[Tuple]) -> List[Optional[Tuple]]:
+        comparador = ComparadorVersiones(self.algoritmo)
+        cambios = []
+        for ruta, lineas, _ in validos:
+            original = AnalizadorCodigo()
+            modificado = AnalizadorCodigo()
+            nuevas = mutar_lineas(lineas, self.proporcion_cambios)
+            try:
+                original.obtener_metricas_codigo(lineas, str(ruta))
+                modificado.obtener_metricas_codigo(nuevas, str(ruta))
+            except (ExcepcionAnalizador, ExcepcionFormateo):
+                # El formateador de analizador_cambios rechaza algunos
+                # archivos que contador_lineas acepta
+                cambios.append(None)
+                continue
+            cambios.append(comparador.contar_cambios(
+                comparador.comparar_archivos(original.arbol,
+                                             modificado.arbol)))
+        return cambios
+
+
+def _parametros_corpus(args: argparse.Namespace, lineas: int) \
+        -> ParametrosCorpus:
+    return ParametrosCorpus(
+        lineas=lineas,
+        profundidad=args.profundidad,
+        densidad_cadenas=args.densidad_cadenas,
+        frecuencia_expresiones=args.frecuencia_expresiones,
+        frecuencia_lineas_largas=args.frecuencia_lineas_largas,
+        clases=args.clases,
+        semilla=args.semilla)
+
+
+def generar(args: argparse.Namespace) -> int:
+    """
+    Escribe un módulo sintético en el archivo indicado.
+
+    Args:
+        args (argparse.Namespace): Argumentos del subcomando generar
+
+    Returns:
+        int: Código de salida
+    """
+    lineas = generar_modulo(_parametros_corpus(args, args.lineas))
+    Path(args.archivo).write_text("".join(lineas), encoding="utf-8")
+    print(f"{args.archivo}: {len(lineas)} líneas")
+    return 0
+
+
+def ejecutar(args: argparse.Namespace) -> int:
+    """
+    Mide las etapas sobre los corpus pedidos y escribe los resultados.
+
+    Args:
+        args (argparse.Namespace): Argumentos del subcomando ejecutar
+
+    Returns:
+        int: Código de salida
+    """
+    resultados = {
+        "entorno": {
+            "python": platform.python_version(),
+            "implementacion": platform.python_implementation(),
+            "plataforma": platform.platform(),
+        },
+        "parametros": {
+            "repeticiones": args.repeticiones,
+            "algoritmo": args.algoritmo,
+            "proporcion_cambios": args.proporcion_cambios,
+        },
+        "corpus": {},
+    }
+    etapas = tuple(etapa for etapa in ETAPAS if etapa in args.etapas)
+    with tempfile.TemporaryDirectory() as temporal:
+        directorio = Path(temporal)
+        medidor = MedidorEtapas(etapas, args.repeticiones, args.algoritmo,
+                                args.proporcion_cambios, directorio)
+        corpus = []
+        for total in args.lineas:
+            parametros = _parametros_corpus(args, total)
+            ruta = directorio / f"sintetico_{total}.py"
+            ruta.write_text("".join(generar_modulo(parametros)),
+                            encoding="utf-8")
+            corpus.append((f"sintetico-{total}", [ruta],
+                           asdict(parametros)))
+        if args.stdlib:
+            corpus.append(("stdlib", archivos_stdlib(args.limite_stdlib),
+                           None))
+
+        for nombre, rutas, parametros in corpus:
+            resultado = medidor.medir(rutas)
+            resultados["corpus"][nombre] = dict(asdict(resultado),
+                                                generador=parametros)
+            _imprimir_resultado(nombre, resultado)
+
+    if args.salida:
+        Path(args.salida).write_text(
+            json.dumps(resultados, indent=2, ensure_ascii=False),
+            encoding="utf-8")
+    return 0
+
+
+def _imprimir_resultado(nombre: str, resultado: ResultadoCorpus) -> None:
+    print(f"{nombre}: {resultado.archivos} archivos, {resultado.lineas} "
+          f"líneas, {resultado.validos} válidos, {resultado.comparados} "
+          f"comparados")
+    for etapa, segundos in resultado.etapas.items():
+        velocidad = resultado.lineas / segundos if segundos else 0
+        print(f"    {etapa:<10} {segundos:10.4f} s "
+              f"{velocidad:14,.0f} líneas/s")
+
+
+def comparar(args: argparse.Namespace) -> int:
+    """
+    Compara dos resultados y señala las etapas que empeoraron.
+
+    Args:
+        args (argparse.Namespace): Argumentos del subcomando comparar
+
+    Returns:
+        int: 1 si alguna etapa empeora más que el umbral, 0 si no
+    """
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    actual = json.loads(Path(args.actual).read_text(encoding="utf-8"))
+    regresiones = 0
+    for nombre, corpus_base in base["corpus"].items():
+        corpus_actual = actual["corpus"].get(nombre)
+        if corpus_actual is None:
+            continue
+        for etapa, antes in corpus_base["etapas"].items():
+            despues = corpus_actual["etapas"].get(etapa)
+            if despues is None or antes < args.minimo:
+                continue
+            razon = despues / antes
+            marca = ""
+            if razon > 1 + args.umbral:
+                marca = "REGRESIÓN"
+                regresiones += 1
+            elif razon < 1 - args.umbral:
+                marca = "mejora"
+            print(f"{nombre:<18} {etapa:<10} {antes:10.4f} s "
+                  f"{despues:10.4f} s {razon:6.2f}x {marca}")
+    print(f"Regresiones: {regresiones}")
+    return 1 if regresiones else 0
+
+
+def procesar_argumentos(argumentos: Optional[List[str]] = None) \
+        -> argparse.Namespace:
+    """
+    Procesa los argumentos de línea de comandos.
+
+    Args:
+        argumentos (Optional[List[str]]): Argumentos; sys.argv si es None
+
+    Returns:
+        argparse.Namespace: Argumentos procesados
+    """
+    parser = argparse.ArgumentParser(
+        description="Mide el rendimiento de cada etapa del análisis")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    corpus = argparse.ArgumentParser(add_help=False)
+    corpus.add_argument("--profundidad", type=int, default=3,
+                        help="Niveles máximos de bloques anidados")
+    corpus.add_argument("--densidad-cadenas", type=float, default=0.2,
+                        help="Fracción de sentencias con cadenas")
+    corpus.add_argument("--frecuencia-expresiones", type=float, default=0.1,
+                        help="Fracción de comprensiones y ternarios")
+    corpus.add_argument("--frecuencia-lineas-largas", type=float,
+                        default=0.05, help="Fracción de sentencias largas")
+    corpus.add_argument("--clases", type=int, default=10,
+                        help="Clases de cada módulo")
+    corpus.add_argument("--semilla", type=int, default=0,
+                        help="Semilla del generador")
+
+    generador = subcomandos.add_parser(
+        "generar", parents=[corpus], help="Escribe un módulo sintético")
+    generador.add_argument("archivo", help="Archivo de salida")
+    generador.add_argument("--lineas", type=int, default=1000,
+                           help="Líneas del módulo")
+    generador.set_defaults(funcion=generar)
+
+    ejecucion = subcomandos.add_parser(
+        "ejecutar", parents=[corpus], help="Mide las etapas del análisis")
+    ejecucion.add_argument("--lineas", type=int, nargs="*",
+                           default=[1000, 10000],
+                           help="Tamaños de los módulos sintéticos")
+    ejecucion.add_argument("--stdlib", action="store_true",
+                           help="Medir también la biblioteca estándar")
+    ejecucion.add_argument("--limite-stdlib", type=int, default=None,
+                           help="Archivos de la biblioteca estándar a medir")
+    ejecucion.add_argument("--repeticiones", type=int, default=3,
+                           help="Repeticiones de cada etapa; se guarda el "
+                                "mínimo")
+    ejecucion.add_argument("--etapas", nargs="+", choices=ETAPAS,
+                           default=list(ETAPAS), help="Etapas a medir")
+    ejecucion.add_argument("--algoritmo", choices=ALGORITMOS_COMPARACION,
+                           default=ALGORITMO_PREDETERMINADO,
+                           help="Algoritmo de la etapa comparar")
+    ejecucion.add_argument("--proporcion-cambios", type=float, default=0.05,
+                           help="Fracción de asignaciones editadas en la "
+                                "versión comparada")
+    ejecucion.add_argument("--salida", help="Archivo JSON de resultados")
+    ejecucion.set_defaults(funcion=ejecutar)
+
+    comparacion = subcomandos.add_parser(
+        "comparar", help="Compara resultados con una línea base")
+    comparacion.add_argument("base", help="JSON de la línea base")
+    comparacion.add_argument("actual", help="JSON a comparar")
+    comparacion.add_argument("--umbral", type=float, default=0.10,
+                             help="Empeoramiento relativo tolerado")
+    comparacion.add_argument("--minimo", type=float, default=MINIMO_SEGUNDOS,
+                             help="Segundos mínimos de la línea base para "
+                                  "comparar una etapa")
+    comparacion.set_defaults(funcion=comparar)
+    return parser.parse_args(argumentos)
+
+
+def main() -> int:
+    """
+    Ejecuta el subcomando indicado en la línea de comandos.
+
+    Returns:
+        int: Código de salida
+    """
+    args = procesar_argumentos()
+    return args.funcion(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
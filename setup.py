@@ -15,6 +15,7 @@ setup(
             "contador_lineas=contador_lineas.__main__:main",
             "lineas_por_clase=lineas_por_clase.__main__:main",
             "analizador_cambios=analizador_cambios.__main__:main",
+            "analisis_completo=analisis_completo.__main__:main",
         ],
     }
 )
\ No newline at end of file
@@ -0,0 +1,381 @@
+"""
+Nombre del módulo: __main__.py
+Ruta: analisis_completo/__main__.py
+Descripción: Punto de entrada que ejecuta contador_lineas, lineas_por_clase y
+             analizador_cambios sobre los mismos archivos en una sola pasada
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - argparse
+    - contador_lineas.utils.colores.Fore, Style, iniciar_colores
+    - contador_lineas.utils.perfil.MODO_FASES, perfilar, tipo_modo_perfil
+    - contextlib.ExitStack
+    - pathlib.Path
+    - core.contadores.analizador.ResultadoCompleto
+    - core.contadores.analizador_lote.AnalizadorCompletoLote
+    - contador_lineas.core.gestion_archivos.almacenamiento_metricas
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
+    - lineas_por_clase.core.gestion_archivos.almacenamiento_metricas
+
+Uso:
+    >>> analisis_completo ruta [ruta ...] [--recursivo] [--trabajadores N]
+                                          [-t]
+    >>> analisis_completo ruta --base RUTA_BASE [--recursivo]
+                                                [--algoritmo {voraz,lcs}]
+
+    Opciones:
+        ruta: Archivos o directorios Python a analizar
+        --base: Versión anterior (archivo o directorio, del mismo tipo que la
+                única ruta) contra la que se cuentan los cambios
+        --recursivo: Incluye subdirectorios al analizar un directorio
+        --trabajadores: Número de procesos
+        --algoritmo: Motor para emparejar líneas entre versiones
+        --cache-arboles: Directorio de la caché de árboles sintácticos
+                         compartida con las tres herramientas
+        -t: Muestra las tablas de métricas de los archivos procesados
+        --sin-color: Escribe la salida sin color y sin cargar colorama
+        --perfil[=MODO]: Muestra el tiempo de cada fase al terminar;
+                         --perfil=cprofile:RUTA guarda además un
+                         perfil completo de cProfile
+
+Notas:
+    - Cada archivo se valida, se lee y se convierte en árbol una vez para
+      las métricas de contador_lineas y lineas_por_clase; el árbol de
+      cambios se construye de las mismas líneas solo si hay base
+    - Los registros de las tres herramientas se escriben en un único lote al
+      terminar; si el análisis se interrumpe, ninguno se modifica
+    - analizador_cambios usa por defecto el registro de lineas_por_clase; si
+      ambos registros son el mismo, se abre una sola vez y prevalecen las
+      métricas de lineas_por_clase de la versión actual
+    - No escribe los archivos comentados de analizador_cambios
+"""
+
+import argparse
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterable, Tuple
+
+from analisis_completo.core.contadores.analizador import ResultadoCompleto
+from analisis_completo.core.contadores.analizador_lote import (
+    AnalizadorCompletoLote
+)
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO, ALGORITMOS_COMPARACION
+)
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas as AlmacenamientoLineas
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.utils.colores import Fore, Style, iniciar_colores
+from contador_lineas.utils.perfil import (
+    MODO_FASES, perfilar, tipo_modo_perfil
+)
+from contador_lineas.utils.formateador_metricas import (
+    mostrar_tabla_metricas as mostrar_tabla_lineas
+)
+from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas as AlmacenamientoClases
+)
+from lineas_por_clase.utils.formateador_metricas import (
+    mostrar_tabla_metricas as mostrar_tabla_clases
+)
+__version__ = "1.0.0"
+
+# Registros de cada herramienta: (contador_lineas, lineas_por_clase,
+# analizador_cambios)
+Registros = Tuple[AlmacenamientoLineas, AlmacenamientoClases,
+                  AlmacenamientoClases]
+
+
+def procesar_argumentos() -> argparse.Namespace:
+    """
+    Procesa los argumentos de línea de comandos.
+
+    Returns:
+        argparse.Namespace: Argumentos procesados
+
+    Example:
+        >>> args = procesar_argumentos()
+        >>> print(args.rutas)
+        ['src']
+    """
+    analizador = argparse.ArgumentParser(
+        description="Análisis de líneas, clases y cambios en una sola pasada"
+    )
+    analizador.add_argument(
+        "--version",
+        action="version",
+        version=f"analisis_completo {__version__}",
+        help="Muestra la versión del programa"
+    )
+    analizador.add_argument(
+        "rutas",
+        type=str,
+        nargs='+',
+        help="Archivos Python o directorios a analizar"
+    )
+    analizador.add_argument(
+        "--base",
+        type=str,
+        help="Versión anterior de la ruta contra la que se cuentan cambios"
+    )
+    analizador.add_argument(
+        "--recursivo",
+        action="store_true",
+        help="Analizar también los subdirectorios de los directorios"
+    )
+    analizador.add_argument(
+        "--trabajadores",
+        type=int,
+        default=None,
+        help="Número de procesos para el análisis"
+    )
+    analizador.add_argument(
+        "--algoritmo",
+        choices=sorted(ALGORITMOS_COMPARACION),
+        default=ALGORITMO_PREDETERMINADO,
+        help="Algoritmo para emparejar líneas entre versiones"
+    )
+    analizador.add_argument(
+        "--cache-arboles",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Cargar y guardar los árboles sintácticos en una caché "
+             "compartida con las tres herramientas"
+    )
+    analizador.add_argument(
+        "-t",
+        action="store_true",
+        help="Mostrar tablas de métricas de los archivos procesados"
+    )
+    analizador.add_argument(
+        "--sin-color",
+        action="store_true",
+        help="Escribir la salida sin códigos de color"
+    )
+    analizador.add_argument(
+        "--perfil",
+        nargs="?",
+        const=MODO_FASES,
+        type=tipo_modo_perfil,
+        metavar="MODO",
+        help="Mostrar el tiempo de pared y de CPU de cada fase al terminar; "
+             "con cprofile:RUTA guarda además un perfil completo en RUTA"
+    )
+    analizador.add_argument(
+        "--dev-db-path-lineas",
+        type=str,
+        help=argparse.SUPPRESS,
+        default="db/metricas_registro.json"
+    )
+    analizador.add_argument(
+        "--dev-db-path-clases",
+        type=str,
+        help=argparse.SUPPRESS,
+        default="db/lineas_por_clase_registro.json"
+    )
+    analizador.add_argument(
+        "--dev-db-path-cambios",
+        type=str,
+        help=argparse.SUPPRESS,
+        default="db/lineas_por_clase_registro.json"
+    )
+    return analizador.parse_args()
+
+
+def imprimir_exito(mensaje_exito) -> None:
+    """
+    Imprime un mensaje de éxito al procesar los archivos
+    """
+    print(f"{Fore.GREEN}{mensaje_exito}{Style.RESET_ALL}")
+
+
+def validar_argumentos(args: argparse.Namespace) -> Tuple[bool, str]:
+    """
+    Valida los argumentos de línea de comandos
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
+
+    Returns:
+        Tuple[bool, str]: (es_valido, mensaje_error)
+
+    Example:
+        >>> args = argparse.Namespace(rutas=["src"], base=None,
+        ...                           trabajadores=None)
+        >>> validar_argumentos(args)
+        (True, '')
+    """
+    for ruta in args.rutas:
+        if not Path(ruta).exists():
+            return False, f"Error: '{ruta}' no existe"
+    if args.base:
+        if len(args.rutas) != 1:
+            return False, "Error: --base requiere una sola ruta"
+        if not Path(args.base).exists():
+            return False, f"Error: '{args.base}' no existe"
+        if Path(args.base).is_dir() != Path(args.rutas[0]).is_dir():
+            return False, "Error: Se requieren 2 archivos o 2 directorios"
+    if args.trabajadores is not None and args.trabajadores < 1:
+        return False, "Error: --trabajadores debe ser al menos 1"
+    return True, ""
+
+
+def abrir_registros(args: argparse.Namespace) -> Registros:
+    """
+    Abre los registros de las tres herramientas.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
+
+    Returns:
+        Registros: Almacenamientos de contador_lineas, lineas_por_clase y
+            analizador_cambios
+
+    Example:
+        >>> almacen_lineas, almacen_clases, almacen_cambios = \\
+        ...     abrir_registros(args)
+    """
+    almacen_lineas = AlmacenamientoLineas(args.dev_db_path_lineas)
+    almacen_clases = AlmacenamientoClases(args.dev_db_path_clases)
+    # Dos lotes sobre el mismo archivo se sobrescribirían al volcarse, así
+    # que un registro compartido se abre una sola vez
+    if args.dev_db_path_cambios == args.dev_db_path_clases:
+        almacen_cambios = almacen_clases
+    else:
+        almacen_cambios = AlmacenamientoClases(args.dev_db_path_cambios)
+    return almacen_lineas, almacen_clases, almacen_cambios
+
+
+def guardar_resultados(
+        resultados: Iterable[ResultadoCompleto],
+        registros: Registros,
+        mostrar_tabla: bool) -> Tuple[int, int, Tuple[int, int, int]]:
+    """
+    Guarda las métricas de todos los archivos en un solo lote por registro.
+
+    Args:
+        resultados (Iterable[ResultadoCompleto]): Resultado de cada archivo
+        registros (Registros): Registros de las tres herramientas
+        mostrar_tabla (bool): Mostrar tablas de métricas
+
+    Returns:
+        Tuple[int, int, Tuple[int, int, int]]: Archivos procesados, archivos
+            con error y totales (agregadas, modificadas, borradas)
+
+    Example:
+        >>> guardar_resultados(resultados, abrir_registros(args), False)
+        (120, 2, (0, 0, 0))
+    """
+    almacen_lineas, almacen_clases, almacen_cambios = registros
+    # Las métricas solo se conservan para las tablas; sin ellas, la memoria
+    # no crece con el número de archivos
+    metricas_lineas = []
+    metricas_clases = []
+    procesados = errores = 0
+    totales = [0, 0, 0]
+
+    # Los lotes se cierran juntos: un error dentro del bloque descarta los
+    # cambios de todos los registros. Un registro compartido abre un lote
+    # anidado, que usa el búfer del primero
+    with ExitStack() as pila:
+        for almacen in registros:
+            pila.enter_context(almacen.lote())
+        for resultado in resultados:
+            if resultado.error:
+                errores += 1
+                print(f"{Fore.RED}{resultado.nombre_archivo}: "
+                      f"{resultado.error}{Style.RESET_ALL}")
+                continue
+            procesados += 1
+            # Primero las de cambios, para que en un registro compartido
+            # prevalezcan las de lineas_por_clase
+            almacen_cambios.guardar_multiples_metricas(
+                resultado.metricas_cambios)
+            if resultado.metricas_lineas is not None:
+                almacen_lineas.guardar_metricas(resultado.metricas_lineas)
+                almacen_clases.guardar_metricas(resultado.metricas_clases)
+                if mostrar_tabla:
+                    metricas_lineas.append(resultado.metricas_lineas)
+                    metricas_clases.append(resultado.metricas_clases)
+            if resultado.conteo is not None:
+                for posicion, cantidad in enumerate(resultado.conteo):
+                    totales[posicion] += cantidad
+
+    if mostrar_tabla:
+        mostrar_tabla_lineas(metricas_lineas)
+        mostrar_tabla_clases(metricas_clases)
+    return procesados, errores, tuple(totales)
+
+
+def imprimir_conteo_cambios(
+        agregados: int,
+        modificados: int,
+        borradas: int) -> None:
+    """
+    Imprime el conteo de líneas añadidas, modificadas y borradas.
+
+    Args:
+        agregados (int): Líneas añadidas nuevas
+        modificados (int): Líneas añadidas modificadas
+        borradas (int): Líneas borradas
+    """
+    print("\nConteo de cambios:")
+    print(f"{Fore.GREEN}Líneas añadidas nuevas: {agregados}")
+    print(f"{Fore.YELLOW}Líneas añadidas modificadas: {modificados}")
+    print(f"{Fore.RED}Líneas borradas: {borradas}{Style.RESET_ALL}\n")
+
+
+def ejecutar(args: argparse.Namespace) -> None:
+    """
+    Ejecuta la acción indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
+    """
+    # Validamos argumentos antes de cualquier procesamiento para fallar rápido
+    # si hay errores
+    es_valido, mensaje_error = validar_argumentos(args)
+    if not es_valido:
+        print(f"{Fore.RED}{mensaje_error}{Style.RESET_ALL}")
+        return
+
+    cache_arboles = (CacheArboles(args.cache_arboles)
+                     if args.cache_arboles else None)
+    analizador = AnalizadorCompletoLote(args.trabajadores,
+                                        algoritmo=args.algoritmo,
+                                        cache_arboles=cache_arboles)
+    procesados, errores, totales = guardar_resultados(
+        analizador.analizar(args.rutas, args.base, args.recursivo),
+        abrir_registros(args),
+        args.t)
+
+    if args.base:
+        imprimir_conteo_cambios(*totales)
+    imprimir_exito(f"¡{procesados} archivos procesados exitosamente!")
+    if errores:
+        print(f"{Fore.RED}{errores} archivos con errores{Style.RESET_ALL}")
+
+
+def main() -> None:
+    """
+    Punto de entrada del análisis combinado
+
+    Example:
+        >>> main()
+    """
+    args = procesar_argumentos()
+    iniciar_colores(activar=not args.sin_color)
+    # El desglose por fases se imprime al terminar, incluso si la
+    # ejecución se interrumpe
+    with perfilar(args.perfil):
+        ejecutar(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Nombre del módulo: analizador.py
+Ruta: analisis_completo/core/contadores/analizador.py
+Descripción: Obtiene en una sola lectura de cada archivo las métricas de
+             contador_lineas, lineas_por_clase y analizador_cambios
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - contador_lineas.core.arbol.arbol_sintactico.ArbolArchivoPython
+    - contador_lineas.core.contadores.recorrido_metricas.RecorridoMetricas
+    - contador_lineas.core.gestion_archivos.lector_archivo
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
+    - lineas_por_clase.core.arbol.arbol_sintactico.ArbolArchivoPython
+    - lineas_por_clase.core.contadores.analizador.AnalizadorCodigo
+    - analizador_cambios.core.arbol.comparador_principal
+    - analizador_cambios.core.contadores.analizador.AnalizadorCodigo
+    - analizador_cambios.core.contadores.comparador_lote.crear_version_vacia
+
+Uso:
+    from analisis_completo.core.contadores.analizador import (
+        AnalizadorCompleto
+    )
+
+    analizador = AnalizadorCompleto()
+    resultado = analizador.analizar("script.py", "script.py")
+    print(resultado.metricas_lineas, resultado.metricas_clases)
+
+    # Con una versión base también se cuentan los cambios
+    resultado = analizador.analizar_par("v1/script.py", "v2/script.py",
+                                        "script.py")
+    print(resultado.conteo)
+
+Notas:
+    - Cada archivo se valida y se lee una sola vez
+    - Un único árbol del constructor estándar se valida y se cuenta en un
+      recorrido (PLOC/LLOC) y después se mide por clases; ambas herramientas
+      construyen el mismo árbol, así que el resultado no cambia
+    - El árbol de analizador_cambios conserva las líneas vacías, numera sus
+      nodos y parte del código formateado, así que no se deriva del árbol
+      estándar: se construye a partir de las mismas líneas ya leídas, y solo
+      cuando hay una versión base con la que comparar
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO, ComparadorVersiones
+)
+from analizador_cambios.core.contadores.analizador import (
+    AnalizadorCodigo as AnalizadorCambios
+)
+from analizador_cambios.core.contadores.comparador_lote import (
+    Version, crear_version_vacia
+)
+from contador_lineas.core.arbol.arbol_sintactico import ArbolArchivoPython
+from contador_lineas.core.contadores.analizador import ExcepcionAnalizador
+from contador_lineas.core.contadores.recorrido_metricas import (
+    RecorridoMetricas
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.core.gestion_archivos.lector_archivo import (
+    LectorArchivoPython
+)
+from contador_lineas.models.metricas import (
+    MetricasArchivo as MetricasLineas
+)
+from lineas_por_clase.core.arbol.arbol_sintactico import (
+    ArbolArchivoPython as ArbolClases
+)
+from lineas_por_clase.core.contadores.analizador import (
+    AnalizadorCodigo as AnalizadorClases
+)
+from lineas_por_clase.models.metricas import (
+    MetricasArchivo as MetricasClases
+)
+
+
+@dataclass
+class ResultadoCompleto:
+    """
+    Métricas de las tres herramientas para un archivo.
+
+    Attributes:
+        nombre_archivo (str): Nombre con el que se registra el archivo
+        metricas_lineas (Optional[MetricasLineas]): Líneas físicas y
+            lógicas, None si el archivo no existe en la versión actual
+        metricas_clases (Optional[MetricasClases]): Métricas por clase,
+            None en el mismo caso
+        metricas_cambios (List[MetricasClases]): Métricas de las versiones
+            comparadas que existen, primero la base, como las registra
+            analizador_cambios
+        conteo (Optional[Tuple[int, int, int]]): Líneas (agregadas,
+            modificadas, borradas) respecto a la base, None sin base
+        error (Optional[str]): Mensaje de error o None si fue exitoso
+
+    Example:
+        >>> ResultadoCompleto("mod.py", metricas_lineas, metricas_clases)
+    """
+
+    nombre_archivo: str
+    metricas_lineas: Optional[MetricasLineas] = None
+    metricas_clases: Optional[MetricasClases] = None
+    metricas_cambios: List[MetricasClases] = field(default_factory=list)
+    conteo: Optional[Tuple[int, int, int]] = None
+    error: Optional[str] = None
+
+
+class AnalizadorCompleto:
+    """
+    Analiza archivos Python una sola vez para las tres herramientas.
+
+    Attributes:
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+        algoritmo (str): Algoritmo de comparación de ComparadorVersiones
+        recorrido_metricas (RecorridoMetricas): Validación y conteo de
+            líneas físicas y lógicas en un recorrido
+        analizador_clases (AnalizadorClases): Medición por clases de
+            lineas_por_clase
+
+    Methods:
+        analizar(ruta_archivo: str,
+                 nombre_archivo: str) -> ResultadoCompleto:
+            Obtiene las métricas de líneas y de clases de un archivo.
+        analizar_par(ruta_base: Optional[str], ruta_archivo: Optional[str],
+                     nombre_archivo: str) -> ResultadoCompleto:
+            Obtiene además el conteo de cambios respecto a una versión base.
+
+    Example:
+        >>> analizador = AnalizadorCompleto(algoritmo="lcs")
+        >>> analizador.analizar_par("v1/mod.py", "v2/mod.py", "mod.py").conteo
+        (3, 1, 0)
+    """
+
+    def __init__(
+            self,
+            cache_arboles: Optional[CacheArboles] = None,
+            algoritmo: str = ALGORITMO_PREDETERMINADO):
+        self.cache_arboles = cache_arboles
+        self.algoritmo = algoritmo
+        self.recorrido_metricas = RecorridoMetricas()
+        self.analizador_clases = AnalizadorClases()
+
+    def analizar(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> ResultadoCompleto:
+        """
+        Obtiene las métricas de líneas y de clases de un archivo.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            ResultadoCompleto: Métricas del archivo, sin conteo de cambios
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo es inválido o viola el estándar
+
+        Example:
+            >>> analizar("script.py", "script.py").metricas_lineas
+        """
+        lineas = self._leer_codigo(ruta_archivo)
+        metricas_lineas, metricas_clases = self._medir(lineas, nombre_archivo)
+        return ResultadoCompleto(nombre_archivo, metricas_lineas,
+                                 metricas_clases)
+
+    def analizar_par(
+            self,
+            ruta_base: Optional[str],
+            ruta_archivo: Optional[str],
+            nombre_archivo: str) -> ResultadoCompleto:
+        """
+        Obtiene las métricas de un archivo y sus cambios respecto a la base.
+
+        Args:
+            ruta_base (Optional[str]): Ruta del archivo en la versión base o
+                None si es un archivo nuevo
+            ruta_archivo (Optional[str]): Ruta del archivo actual o None si
+                se borró
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            ResultadoCompleto: Métricas de la versión actual, métricas de
+                ambas versiones y conteo de cambios
+
+        Raises:
+            ExcepcionAnalizador: Si un archivo es inválido o viola el
+                estándar
+            ExcepcionFormateo: Si una línea no se puede formatear para la
+                comparación
+
+        Example:
+            >>> analizar_par("v1/mod.py", "v2/mod.py", "mod.py").conteo
+            (3, 1, 0)
+        """
+        resultado = ResultadoCompleto(nombre_archivo)
+        version_actual = crear_version_vacia()
+        if ruta_archivo is not None:
+            lineas = self._leer_codigo(ruta_archivo)
+            resultado.metricas_lineas, resultado.metricas_clases = \
+                self._medir(lineas, nombre_archivo)
+            # El árbol de cambios parte de las líneas ya leídas
+            analizador = AnalizadorCambios(self.cache_arboles)
+            version_actual = (analizador, analizador.obtener_metricas_codigo(
+                lineas, nombre_archivo))
+        version_base = self._analizar_base(ruta_base, nombre_archivo)
+
+        comparador = ComparadorVersiones(self.algoritmo)
+        cambios = comparador.comparar_archivos(version_base[0].arbol,
+                                               version_actual[0].arbol)
+        resultado.conteo = comparador.contar_cambios(cambios)
+        resultado.metricas_cambios = [
+            metricas for _, metricas in (version_base, version_actual)
+            if metricas is not None]
+        return resultado
+
+    def _leer_codigo(self, ruta_archivo: str) -> List[str]:
+        """
+        Valida y lee un archivo con un mismo lector.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo
+
+        Returns:
+            List[str]: Líneas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo es inválido o no se puede leer
+        """
+        lector = LectorArchivoPython(ruta_archivo)
+        es_valido, error = lector.validar()
+        if not es_valido:
+            raise ExcepcionAnalizador(f"Archivo inválido: {error}")
+        codigo, error = lector.leer_lineas()
+        if error:
+            raise ExcepcionAnalizador(f"Error al leer archivo: {error}")
+        return codigo
+
+    def _medir(
+            self,
+            lineas: List[str],
+            nombre_archivo: str) -> Tuple[MetricasLineas, MetricasClases]:
+        """
+        Construye el árbol estándar una vez y obtiene ambas métricas de él.
+
+        Args:
+            lineas (List[str]): Líneas del archivo
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            Tuple[MetricasLineas, MetricasClases]: Métricas de líneas y de
+                clases
+
+        Raises:
+            ExcepcionAnalizador: Si el código viola el estándar
+        """
+        arbol = ArbolArchivoPython(lineas, self.cache_arboles)
+        resultado = self.recorrido_metricas.recorrer(arbol.raiz)
+        if not resultado.es_valido:
+            raise ExcepcionAnalizador(
+                f"Violación del estándar: {resultado.error}")
+        metricas_lineas = MetricasLineas(
+            nombre_archivo=nombre_archivo,
+            lineas_logicas=resultado.lineas_logicas,
+            lineas_fisicas=resultado.lineas_fisicas
+        )
+
+        # La medición por clases reindenta los nodos de nivel superior, así
+        # que va después del conteo de líneas
+        metricas_clases = self.analizador_clases.medir_arbol(
+            ArbolClases.desde_raiz(arbol.raiz), nombre_archivo)
+        return metricas_lineas, metricas_clases
+
+    def _analizar_base(
+            self,
+            ruta_base: Optional[str],
+            nombre_archivo: str) -> Version:
+        """
+        Analiza la versión base de un archivo para compararla.
+
+        Args:
+            ruta_base (Optional[str]): Ruta del archivo base o None si no
+                existe
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            Version: Analizador con el árbol de la base, y sus métricas
+        """
+        if ruta_base is None:
+            return crear_version_vacia()
+        analizador = AnalizadorCambios(self.cache_arboles)
+        return analizador, analizador.obtener_metricas(ruta_base,
+                                                       nombre_archivo)
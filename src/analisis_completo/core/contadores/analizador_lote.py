@@ -0,0 +1,231 @@
+"""
+Nombre del módulo: analizador_lote.py
+Ruta: analisis_completo/core/contadores/analizador_lote.py
+Descripción: Ejecuta el análisis completo sobre varias rutas en paralelo,
+             opcionalmente contra una versión base
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - concurrent.futures.ProcessPoolExecutor (con más de un trabajador)
+    - analisis_completo.core.contadores.analizador.AnalizadorCompleto
+    - analizador_cambios.core.contadores.analizador.ExcepcionAnalizador
+    - analizador_cambios.core.contadores.comparador_lote.emparejar
+    - analizador_cambios.utils.formateador_linea.ExcepcionFormateo
+    - contador_lineas.core.contadores.analizador.ExcepcionAnalizador
+    - contador_lineas.core.contadores.analizador_lote (AnalizadorLote,
+      agrupar, ejecutar_por_grupos)
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
+
+Uso:
+    from analisis_completo.core.contadores.analizador_lote import (
+        AnalizadorCompletoLote
+    )
+
+    analizador = AnalizadorCompletoLote(trabajadores=4)
+    for resultado in analizador.analizar(["src", "setup.py"], recursivo=True):
+        print(resultado.nombre_archivo, resultado.error)
+
+    # Contra una versión base, archivo contra archivo o directorio contra
+    # directorio
+    for resultado in analizador.analizar(["v2"], "v1", recursivo=True):
+        print(resultado.nombre_archivo, resultado.conteo)
+
+Notas:
+    - Las tareas se envían al pool de forma perezosa, con un número acotado
+      de grupos en vuelo, como en AnalizadorLote
+    - Con una base, los archivos de dos directorios se emparejan por ruta
+      relativa mientras se recorren; un archivo que solo existe en una
+      versión se compara contra una versión vacía, igual que en
+      analizador_cambios
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from analisis_completo.core.contadores.analizador import (
+    AnalizadorCompleto, ResultadoCompleto
+)
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO
+)
+from analizador_cambios.core.contadores.analizador import (
+    ExcepcionAnalizador as ExcepcionCambios
+)
+from analizador_cambios.core.contadores.comparador_lote import emparejar
+from analizador_cambios.utils.formateador_linea import ExcepcionFormateo
+from contador_lineas.core.contadores.analizador import ExcepcionAnalizador
+from contador_lineas.core.contadores.analizador_lote import (
+    AnalizadorLote, agrupar, ejecutar_por_grupos
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+
+# Archivos enviados a un proceso en cada tarea; cada archivo hace el trabajo
+# de varias herramientas, así que los grupos son menores que en
+# contador_lineas
+TAMANO_GRUPO = 16
+
+# Archivo a analizar: (ruta_base, ruta_actual, nombre_archivo); ruta_base es
+# None sin versión base o si el archivo es nuevo, y ruta_actual es None si el
+# archivo se borró
+Tarea = Tuple[Optional[str], Optional[str], str]
+
+
+def _analizar_grupo(
+        tareas: List[Tarea],
+        comparar: bool,
+        algoritmo: str,
+        cache_arboles: Optional[CacheArboles] = None
+    ) -> List[ResultadoCompleto]:
+    """
+    Analiza un grupo de archivos dentro de un proceso trabajador.
+
+    Args:
+        tareas (List[Tarea]): Archivos a analizar
+        comparar (bool): Si True, cuenta los cambios respecto a la base
+        algoritmo (str): Algoritmo de comparación
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        List[ResultadoCompleto]: Resultado de cada archivo del grupo
+    """
+    # Debe ser una función de módulo para que el pool pueda serializarla
+    analizador = AnalizadorCompleto(cache_arboles, algoritmo)
+    resultados = []
+    for ruta_base, ruta_actual, nombre_archivo in tareas:
+        try:
+            if comparar:
+                resultados.append(analizador.analizar_par(
+                    ruta_base, ruta_actual, nombre_archivo))
+            else:
+                resultados.append(analizador.analizar(ruta_actual,
+                                                      nombre_archivo))
+        except (ExcepcionAnalizador, ExcepcionCambios,
+                ExcepcionFormateo) as e:
+            resultados.append(ResultadoCompleto(nombre_archivo,
+                                                error=str(e)))
+        except Exception as e:
+            resultados.append(ResultadoCompleto(
+                nombre_archivo, error=f"Error inesperado: {str(e)}"))
+    return resultados
+
+
+class AnalizadorCompletoLote:
+    """
+    Analiza archivos y directorios para las tres herramientas a la vez.
+
+    Attributes:
+        trabajadores (int): Número de procesos trabajadores
+        tamano_grupo (int): Archivos enviados por tarea
+        algoritmo (str): Algoritmo de comparación de ComparadorVersiones
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Methods:
+        planificar(rutas: Sequence[str], ruta_base: Optional[str],
+                   recursivo: bool) -> Iterator[Tarea]:
+            Enumera los archivos a analizar y su versión base.
+        analizar(rutas: Sequence[str], ruta_base: Optional[str],
+                 recursivo: bool) -> Iterator[ResultadoCompleto]:
+            Analiza los archivos y entrega resultados conforme terminan.
+
+    Example:
+        >>> analizador = AnalizadorCompletoLote(trabajadores=2)
+        >>> list(analizador.analizar(["src"], recursivo=True))
+    """
+
+    def __init__(
+            self,
+            trabajadores: Optional[int] = None,
+            tamano_grupo: int = TAMANO_GRUPO,
+            algoritmo: str = ALGORITMO_PREDETERMINADO,
+            cache_arboles: Optional[CacheArboles] = None):
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.tamano_grupo = tamano_grupo
+        self.algoritmo = algoritmo
+        self.cache_arboles = cache_arboles
+
+    def planificar(
+            self,
+            rutas: Sequence[str],
+            ruta_base: Optional[str] = None,
+            recursivo: bool = False) -> Iterator[Tarea]:
+        """
+        Enumera los archivos de las rutas, emparejados con la base si hay.
+
+        Args:
+            rutas (Sequence[str]): Archivos o directorios a analizar
+            ruta_base (Optional[str]): Versión base de la única ruta, del
+                mismo tipo que ella, o None para no comparar
+            recursivo (bool): Si True, incluye subdirectorios
+
+        Returns:
+            Iterator[Tarea]: Archivos a analizar
+
+        Raises:
+            ValueError: Si hay base y no hay exactamente una ruta del mismo
+                tipo que ella
+
+        Example:
+            >>> list(planificar(["v2"], "v1"))
+            [('v1/mod.py', 'v2/mod.py', 'mod.py'), (None, 'v2/nuevo.py',
+             'nuevo.py')]
+        """
+        descubridor = AnalizadorLote(trabajadores=1)
+        if ruta_base is None:
+            for ruta in rutas:
+                if Path(ruta).is_dir():
+                    for ruta_archivo, nombre_archivo in \
+                    descubridor.descubrir_archivos(ruta, recursivo):
+                        yield None, ruta_archivo, nombre_archivo
+                else:
+                    yield None, ruta, Path(ruta).name
+            return
+
+        if len(rutas) != 1 or Path(rutas[0]).is_dir() != \
+        Path(ruta_base).is_dir():
+            raise ValueError("La base se compara con una sola ruta del "
+                             "mismo tipo: archivo o directorio")
+        ruta = rutas[0]
+        if not Path(ruta).is_dir():
+            yield ruta_base, ruta, Path(ruta).name
+            return
+        yield from emparejar(descubridor.descubrir_archivos(ruta_base,
+                                                            recursivo),
+                             descubridor.descubrir_archivos(ruta, recursivo))
+
+    def analizar(
+            self,
+            rutas: Sequence[str],
+            ruta_base: Optional[str] = None,
+            recursivo: bool = False) -> Iterator[ResultadoCompleto]:
+        """
+        Analiza los archivos repartiéndolos entre procesos.
+
+        Args:
+            rutas (Sequence[str]): Archivos o directorios a analizar
+            ruta_base (Optional[str]): Versión base con la que contar
+                cambios, o None
+            recursivo (bool): Si True, incluye subdirectorios
+
+        Returns:
+            Iterator[ResultadoCompleto]: Resultados en el orden en que
+                terminan
+
+        Raises:
+            ValueError: Si la base no corresponde a las rutas
+
+        Example:
+            >>> for resultado in analizar(["v2"], "v1", True):
+            ...     print(resultado.nombre_archivo, resultado.conteo)
+        """
+        comparar = ruta_base is not None
+        grupos = agrupar(self.planificar(rutas, ruta_base, recursivo),
+                         self.tamano_grupo)
+        return ejecutar_por_grupos(_analizar_grupo, grupos, self.trabajadores,
+                                   comparar, self.algoritmo,
+                                   self.cache_arboles)
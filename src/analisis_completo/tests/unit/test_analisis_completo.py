@@ -0,0 +1,191 @@
+# tests/unit/test_analisis_completo.py
+import pytest
+
+from analisis_completo.__main__ import (
+    abrir_registros, guardar_resultados, main, procesar_argumentos
+)
+from analisis_completo.core.contadores.analizador import AnalizadorCompleto
+from analisis_completo.core.contadores.analizador_lote import (
+    AnalizadorCompletoLote
+)
+from analizador_cambios.core.contadores.comparador_lote import ComparadorLote
+from contador_lineas.core.arbol.constructor_arbol import ConstructorArbol
+from contador_lineas.core.contadores.analizador import (
+    AnalizadorCodigo as AnalizadorLineas
+)
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas as AlmacenamientoLineas
+)
+from contador_lineas.core.gestion_archivos.lector_archivo import (
+    LectorArchivoPython
+)
+from lineas_por_clase.core.contadores.analizador import (
+    AnalizadorCodigo as AnalizadorClases
+)
+from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas as AlmacenamientoClases
+)
+
+ORIGINAL = """class Cuenta:
+    def depositar(self, monto):
+        self.saldo = self.saldo + monto
+
+    def retirar(self, monto):
+        self.saldo = self.saldo - monto
+
+
+def sumar(a, b):
+    return a + b
+"""
+
+MODIFICADO = """class Cuenta:
+    def depositar(self, monto):
+        self.saldo = self.saldo + monto + 1
+
+    def retirar(self, monto):
+        self.saldo = self.saldo - monto
+
+
+def sumar(a, b):
+    total = a + b
+    return total
+"""
+
+INVALIDO = "x = lambda a: a\n"
+
+
+@pytest.fixture
+def directorios(tmp_path):
+    base = tmp_path / "v1"
+    actual = tmp_path / "v2"
+    base.mkdir()
+    actual.mkdir()
+    (base / "cuenta.py").write_text(ORIGINAL, encoding="utf-8")
+    (actual / "cuenta.py").write_text(MODIFICADO, encoding="utf-8")
+    (base / "viejo.py").write_text(ORIGINAL, encoding="utf-8")
+    (actual / "nuevo.py").write_text(MODIFICADO, encoding="utf-8")
+    return str(base), str(actual)
+
+
+@pytest.fixture
+def args(tmp_path, monkeypatch):
+    def _args(*argumentos):
+        monkeypatch.setattr("sys.argv", [
+            "analisis_completo", *argumentos,
+            "--dev-db-path-lineas", str(tmp_path / "lineas.json"),
+            "--dev-db-path-clases", str(tmp_path / "clases.json"),
+            "--dev-db-path-cambios", str(tmp_path / "clases.json")])
+    return _args
+
+
+class TestAnalizadorCompleto:
+    def test_coincide_con_las_herramientas(self, directorios):
+        ruta = f"{directorios[1]}/cuenta.py"
+        resultado = AnalizadorCompleto().analizar(ruta, "cuenta.py")
+        assert resultado.metricas_lineas == \
+            AnalizadorLineas().obtener_metricas(ruta, "cuenta.py")
+        assert resultado.metricas_clases == \
+            AnalizadorClases().obtener_metricas(ruta, "cuenta.py")
+        assert resultado.conteo is None
+
+    def test_lee_y_construye_una_vez(self, directorios, monkeypatch):
+        llamadas = []
+        construir = ConstructorArbol.construir
+        leer_lineas = LectorArchivoPython.leer_lineas
+        monkeypatch.setattr(ConstructorArbol, "construir", lambda self, l: (
+            llamadas.append("construir"), construir(self, l))[1])
+        monkeypatch.setattr(LectorArchivoPython, "leer_lineas", lambda self: (
+            llamadas.append("leer"), leer_lineas(self))[1])
+
+        AnalizadorCompleto().analizar(f"{directorios[1]}/cuenta.py",
+                                      "cuenta.py")
+
+        assert llamadas == ["leer", "construir"]
+
+    def test_violacion_del_estandar(self, tmp_path):
+        ruta = tmp_path / "invalido.py"
+        ruta.write_text(INVALIDO, encoding="utf-8")
+        resultado, = AnalizadorCompletoLote(1).analizar([str(ruta)])
+        assert "lambda" in resultado.error
+        assert resultado.metricas_lineas is None
+
+
+class TestAnalizadorCompletoLote:
+    def test_cambios_coinciden_con_comparador_lote(self, directorios,
+                                                   tmp_path):
+        base, actual = directorios
+        resultados = {resultado.nombre_archivo: resultado for resultado in
+                      AnalizadorCompletoLote(1).analizar([actual], base)}
+        esperados = {resultado.nombre_archivo: resultado for resultado in
+                     ComparadorLote(1).comparar_directorios(
+                         base, actual, str(tmp_path / "salida"))}
+
+        assert sorted(resultados) == ["cuenta.py", "nuevo.py", "viejo.py"]
+        for nombre, esperado in esperados.items():
+            assert resultados[nombre].conteo == esperado.conteo
+            assert resultados[nombre].metricas_cambios == esperado.metricas
+        assert resultados["viejo.py"].metricas_lineas is None
+        assert resultados["nuevo.py"].metricas_clases is not None
+
+    def test_base_requiere_una_ruta_del_mismo_tipo(self, directorios):
+        base, actual = directorios
+        with pytest.raises(ValueError):
+            list(AnalizadorCompletoLote(1).planificar(
+                [f"{actual}/cuenta.py"], base))
+
+    def test_varias_rutas_sin_base(self, directorios):
+        base, actual = directorios
+        tareas = list(AnalizadorCompletoLote(1).planificar(
+            [actual, f"{base}/viejo.py"]))
+        assert [tarea[2] for tarea in tareas] == \
+            ["cuenta.py", "nuevo.py", "viejo.py"]
+        assert all(tarea[0] is None for tarea in tareas)
+
+    def test_trabajadores_en_paralelo(self, directorios):
+        base, actual = directorios
+        secuencial = AnalizadorCompletoLote(1).analizar([actual], base)
+        paralelo = AnalizadorCompletoLote(2, tamano_grupo=1).analizar(
+            [actual], base)
+        ordenar = lambda resultados: sorted(
+            resultados, key=lambda resultado: resultado.nombre_archivo)
+        assert ordenar(paralelo) == ordenar(secuencial)
+
+
+class TestRegistros:
+    def test_main_escribe_los_tres_registros(self, directorios, args,
+                                             tmp_path, capsys):
+        base, actual = directorios
+        args(actual, "--base", base)
+        main()
+        assert "3 archivos procesados" in capsys.readouterr().out
+
+        lineas = AlmacenamientoLineas(str(tmp_path / "lineas.json"))
+        clases = AlmacenamientoClases(str(tmp_path / "clases.json"))
+        assert lineas.cargar_metricas("cuenta.py") == \
+            AnalizadorLineas().obtener_metricas(f"{actual}/cuenta.py",
+                                                "cuenta.py")
+        # En el registro compartido prevalece la métrica de lineas_por_clase
+        assert clases.cargar_metricas("cuenta.py") == \
+            AnalizadorClases().obtener_metricas(f"{actual}/cuenta.py",
+                                                "cuenta.py")
+        assert clases.cargar_metricas("viejo.py") is not None
+
+    def test_registro_compartido_se_abre_una_vez(self, args, directorios):
+        args(directorios[1])
+        lineas, clases, cambios = abrir_registros(procesar_argumentos())
+        assert cambios is clases
+
+    def test_error_descarta_todos_los_registros(self, args, directorios,
+                                                tmp_path):
+        args(directorios[1])
+        registros = abrir_registros(procesar_argumentos())
+
+        def resultados():
+            yield AnalizadorCompleto().analizar(
+                f"{directorios[1]}/cuenta.py", "cuenta.py")
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            guardar_resultados(resultados(), registros, False)
+        assert [almacen.obtener_todas_las_metricas()
+                for almacen in registros] == [[], [], []]
@@ -7,23 +7,49 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 02-12-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - argparse
-    - colorama.Init, Fore, Style
+    - contador_lineas.utils.colores.Fore, Style, iniciar_colores
+    - contador_lineas.utils.perfil.MODO_FASES, perfilar, tipo_modo_perfil
     - pathlib.Path
     - core.contadores.analizador.AnalizadorCodigo, ExcepcionAnalizador
+    - core.contadores.comparador_git.ComparadorGit
+    - core.contadores.comparador_lote.ComparadorLote
     - core.gestion_archivos.almacenamiento_metricas.AlmacenamientoMetricas
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
     - utils.formatters.mostrar_tabla_metricas
 
 Uso:
     >>> analizador_cambios archivo1.py archivo2.py [-t] [-tc] [-cc]
+                                                   [--algoritmo {voraz,lcs}]
+                                                   [--estadisticas]
+    >>> analizador_cambios directorio1 directorio2 [--salida DIR]
+                                                   [--trabajadores N]
+                                                   [--algoritmo {voraz,lcs}]
+                                                   [-t] [-tc]
+    >>> analizador_cambios --git REPOSITORIO REVISION1 REVISION2
+                                                   [--salida DIR]
+                                                   [--algoritmo {voraz,lcs}]
     
     Opciones:
-        archivo.py: Ruta del archivo a analizar
+        archivo.py: Ruta del archivo o directorio a analizar
         -t: Muestra tabla de LOC físicas y lógicas del archivo actual
         -tc: Muestra tabla de LOC físicas y lógicas de todos los archivos
+        --algoritmo: Motor para emparejar líneas entre versiones
+        --estadisticas: Muestra cuántos cálculos de similitud se evitaron
+        --salida: Directorio de los archivos comentados al comparar
+                  directorios
+        --trabajadores: Número de procesos para comparar directorios
+        --git: Compara los archivos .py que cambian entre dos revisiones de
+               un repositorio sin hacer checkout
+        --cache-arboles: Directorio de la caché de árboles sintácticos
+                         compartida con contador_lineas y lineas_por_clase
+        --sin-color: Escribe la salida sin color y sin cargar colorama
+        --perfil[=MODO]: Muestra el tiempo de cada fase al terminar;
+                         --perfil=cprofile:RUTA guarda además un
+                         perfil completo de cProfile
 
 Notas:
     - Requiere permisos de lectura en archivos a analizar
@@ -31,21 +57,29 @@ Notas:
 
 import argparse
 from pathlib import Path
-from typing import Tuple
-
-from colorama import init, Fore, Style
+from typing import Iterable, Optional, Tuple
 
 from analizador_cambios.core.arbol.comparador_principal import (
-    ComparadorVersiones
+    ALGORITMO_PREDETERMINADO, ALGORITMOS_COMPARACION, ComparadorVersiones
 )
 from analizador_cambios.core.contadores.analizador import (
     AnalizadorCodigo, ExcepcionAnalizador
 )
+from analizador_cambios.core.contadores.comparador_git import ComparadorGit
+from analizador_cambios.core.contadores.comparador_lote import (
+    ComparadorLote, ResultadoPar, obtener_ruta_comentada
+)
 from analizador_cambios.core.gestion_archivos.escribir_cambios import (
     EscribirCambios
 )
+from analizador_cambios.core.gestion_archivos.lector_git import ExcepcionGit
 from analizador_cambios.utils.formateador_linea import ExcepcionFormateo
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.utils.archivo_utils import escribir_python
+from contador_lineas.utils.colores import Fore, Style, iniciar_colores
+from contador_lineas.utils.perfil import (
+    MODO_FASES, perfilar, tipo_modo_perfil
+)
 from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
     AlmacenamientoMetricas
 )
@@ -95,13 +129,13 @@ def procesar_argumentos() -> argparse.Namespace:
         "ruta_archivo_1",
         type=str,
         nargs='?',
-        help="Ruta del primer archivo Python a analizar"
+        help="Ruta del primer archivo Python o directorio a analizar"
     )
     analizador.add_argument(
         "ruta_archivo_2",
         type=str,
         nargs='?',
-        help="Ruta del segundo archivo Python a analizar"
+        help="Ruta del segundo archivo Python o directorio a analizar"
     )
     analizador.add_argument(
         "-t",
@@ -124,6 +158,59 @@ def procesar_argumentos() -> argparse.Namespace:
         action="store_true",
         help="Mostrar conteo de cambios entre archivos"
     )
+    analizador.add_argument(
+        "--algoritmo",
+        choices=sorted(ALGORITMOS_COMPARACION),
+        default=ALGORITMO_PREDETERMINADO,
+        help="Algoritmo para emparejar líneas entre versiones: voraz o lcs "
+             "(alineación exacta antes de buscar similitud)"
+    )
+    analizador.add_argument(
+        "--estadisticas",
+        action="store_true",
+        help="Mostrar contadores de los cálculos de similitud"
+    )
+    analizador.add_argument(
+        "--salida",
+        type=str,
+        default="comentados",
+        help="Directorio donde se escriben los archivos comentados al "
+             "comparar dos directorios"
+    )
+    analizador.add_argument(
+        "--trabajadores",
+        type=int,
+        default=None,
+        help="Número de procesos para comparar dos directorios"
+    )
+    analizador.add_argument(
+        "--git",
+        nargs=3,
+        metavar=("REPOSITORIO", "REVISION1", "REVISION2"),
+        help="Comparar los archivos Python que cambian entre dos revisiones "
+             "de un repositorio git"
+    )
+    analizador.add_argument(
+        "--cache-arboles",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Cargar y guardar los árboles sintácticos en una caché "
+             "compartida con contador_lineas y lineas_por_clase"
+    )
+    analizador.add_argument(
+        "--sin-color",
+        action="store_true",
+        help="Escribir la salida sin códigos de color"
+    )
+    analizador.add_argument(
+        "--perfil",
+        nargs="?",
+        const=MODO_FASES,
+        type=tipo_modo_perfil,
+        metavar="MODO",
+        help="Mostrar el tiempo de pared y de CPU de cada fase al terminar; "
+             "con cprofile:RUTA guarda además un perfil completo en RUTA"
+    )
     return analizador.parse_args()
 
 
@@ -151,51 +238,77 @@ def validar_argumentos(args: argparse.Namespace) -> Tuple[bool, str]:
         >>> print(es_valido, error)
         True, ""
     """
+    if args.git:
+        if args.ruta_archivo_1 or args.ruta_archivo_2:
+            return False, "Error: --git no admite rutas de archivos"
+        return True, ""
     if not args.tc:
         if not (args.ruta_archivo_1 and args.ruta_archivo_2):
             return False, "Error: Se requieren 2 archivos cuando no se usa -tc"
+    if args.ruta_archivo_1 and args.ruta_archivo_2 and \
+    Path(args.ruta_archivo_1).is_dir() != Path(args.ruta_archivo_2).is_dir():
+        return False, "Error: Se requieren 2 archivos o 2 directorios"
+    if args.trabajadores is not None and args.trabajadores < 1:
+        return False, "Error: --trabajadores debe ser al menos 1"
     return True, ""
 
 
+def imprimir_conteo_cambios(
+        agregados: int,
+        modificados: int,
+        borradas: int) -> None:
+    """
+    Imprime el conteo de líneas añadidas, modificadas y borradas.
+
+    Args:
+        agregados (int): Líneas añadidas nuevas
+        modificados (int): Líneas añadidas modificadas
+        borradas (int): Líneas borradas
+    """
+    print("\nConteo de cambios:")
+    print(f"{Fore.GREEN}Líneas añadidas nuevas: {agregados}")
+    print(f"{Fore.YELLOW}Líneas añadidas modificadas: {modificados}")
+    print(f"{Fore.RED}Líneas borradas: {borradas}{Style.RESET_ALL}\n")
+
+
 def procesar_archivos(
         ruta_archivo_1: str,
         ruta_archivo_2: str,
         ruta_almacenamiento: str,
         almacen: AlmacenamientoMetricas,
         mostrar_tabla: bool,
-        mostrar_cambios: bool) -> None:
+        mostrar_cambios: bool,
+        algoritmo: str = ALGORITMO_PREDETERMINADO,
+        mostrar_estadisticas: bool = False,
+        cache_arboles: Optional[CacheArboles] = None) -> None:
     """
     Procesa dos archivos, los compara y guarda resultados
     """
     nombre_archivo_1 = obtener_nombre_archivo(ruta_archivo_1)
     nombre_archivo_2 = obtener_nombre_archivo(ruta_archivo_2)
 
-    analizador1 = AnalizadorCodigo()
-    analizador2 = AnalizadorCodigo()
+    analizador1 = AnalizadorCodigo(cache_arboles)
+    analizador2 = AnalizadorCodigo(cache_arboles)
 
     resultado1 = analizador1.analizar_archivo(
         ruta_archivo_1,
         nombre_archivo_1,
-        ruta_almacenamiento)
+        ruta_almacenamiento,
+        almacen)
     resultado2 = analizador2.analizar_archivo(
         ruta_archivo_2,
         nombre_archivo_2,
-        ruta_almacenamiento)
+        ruta_almacenamiento,
+        almacen)
 
-    comparador = ComparadorVersiones()
+    comparador = ComparadorVersiones(algoritmo)
     cambios = comparador.comparar_archivos(analizador1.arbol, analizador2.arbol)
 
     escritor = EscribirCambios()
     codigo_1, codigo_2 = escritor.escribir(analizador1, analizador2, cambios)
 
-    ruta_1 = Path(ruta_archivo_1)
-    ruta_2 = Path(ruta_archivo_2)
-
-    ruta_comentada_1 = ruta_1.parent / f"{ruta_1.stem}_comentado{ruta_1.suffix}"
-    ruta_comentada_2 = ruta_2.parent / f"{ruta_2.stem}_comentado{ruta_2.suffix}"
-
-    escribir_python(ruta_comentada_1, codigo_1)
-    escribir_python(ruta_comentada_2, codigo_2)
+    escribir_python(obtener_ruta_comentada(Path(ruta_archivo_1)), codigo_1)
+    escribir_python(obtener_ruta_comentada(Path(ruta_archivo_2)), codigo_2)
 
     if mostrar_tabla:
         mostrar_tabla_metricas([
@@ -204,27 +317,155 @@ def procesar_archivos(
         ])
 
     if mostrar_cambios:
-        agregados, modificados, borradas = comparador.contar_cambios(cambios)
-        print("\nConteo de cambios:")
-        print(f"{Fore.GREEN}Líneas añadidas nuevas: {agregados}")
-        print(f"{Fore.YELLOW}Líneas añadidas modificadas: {modificados}")
-        print(f"{Fore.RED}Líneas borradas: {borradas}{Style.RESET_ALL}\n")
+        imprimir_conteo_cambios(*comparador.contar_cambios(cambios))
+
+    if mostrar_estadisticas:
+        estadisticas = comparador.comparador.estadisticas
+        print("\nEstadísticas de similitud:")
+        print(f"Consultas: {estadisticas.consultas}")
+        print(f"Resueltas desde memoria: {estadisticas.aciertos_memo}")
+        print(f"Descartadas por longitud: {estadisticas.descartes_longitud}")
+        print("Descartadas por quick_ratio: "
+              f"{estadisticas.descartes_quick_ratio}")
+        print(f"Ratios completos: {estadisticas.ratios_completos} "
+              f"(evitados: {estadisticas.ratios_evitados})")
+        print("Subárboles iguales omitidos: "
+              f"{estadisticas.subarboles_iguales}\n")
+
+
+def procesar_directorios(
+        ruta_directorio_1: str,
+        ruta_directorio_2: str,
+        ruta_salida: str,
+        almacen: AlmacenamientoMetricas,
+        trabajadores: Optional[int],
+        mostrar_tabla: bool,
+        algoritmo: str = ALGORITMO_PREDETERMINADO,
+        cache_arboles: Optional[CacheArboles] = None
+    ) -> Tuple[int, int, Tuple[int, int, int]]:
+    """
+    Compara en paralelo los archivos Python de dos directorios.
 
+    Args:
+        ruta_directorio_1 (str): Directorio de la versión original
+        ruta_directorio_2 (str): Directorio de la versión nueva
+        ruta_salida (str): Directorio de los archivos comentados
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        trabajadores (Optional[int]): Número de procesos, None para usar todos
+        mostrar_tabla (bool): Mostrar tabla de métricas
+        algoritmo (str): Algoritmo de comparación
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
 
-def main() -> None:
+    Returns:
+        Tuple[int, int, Tuple[int, int, int]]: Pares procesados, pares con
+            error y totales (agregadas, modificadas, borradas)
+
+    Example:
+        >>> procesar_directorios("v1", "v2", "salida", almacen, 4, False)
+        (120, 0, (35, 12, 8))
     """
-    Punto de entrada principal del sistema de conteo de LOCs de código Python
+    comparador = ComparadorLote(trabajadores, algoritmo=algoritmo,
+                                cache_arboles=cache_arboles)
+    return acumular_resultados(
+        comparador.comparar_directorios(ruta_directorio_1, ruta_directorio_2,
+                                        ruta_salida),
+        almacen,
+        mostrar_tabla)
+
+
+def procesar_git(
+        ruta_repositorio: str,
+        revision1: str,
+        revision2: str,
+        ruta_salida: str,
+        almacen: AlmacenamientoMetricas,
+        mostrar_tabla: bool,
+        algoritmo: str = ALGORITMO_PREDETERMINADO,
+        cache_arboles: Optional[CacheArboles] = None
+    ) -> Tuple[int, int, Tuple[int, int, int]]:
+    """
+    Compara los archivos Python que cambian entre dos revisiones de git.
+
+    Args:
+        ruta_repositorio (str): Ruta del repositorio git
+        revision1 (str): Revisión original
+        revision2 (str): Revisión nueva
+        ruta_salida (str): Directorio de los archivos comentados
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        mostrar_tabla (bool): Mostrar tabla de métricas
+        algoritmo (str): Algoritmo de comparación
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        Tuple[int, int, Tuple[int, int, int]]: Archivos procesados, archivos
+            con error y totales (agregadas, modificadas, borradas)
 
     Example:
-        >>> main()
+        >>> procesar_git(".", "v1.0", "v1.1", "salida", almacen, False)
+        (14, 0, (120, 31, 40))
+    """
+    comparador = ComparadorGit(algoritmo, cache_arboles)
+    return acumular_resultados(
+        comparador.comparar_revisiones(ruta_repositorio, revision1, revision2,
+                                       ruta_salida),
+        almacen,
+        mostrar_tabla)
+
+
+def acumular_resultados(
+        resultados: Iterable[ResultadoPar],
+        almacen: AlmacenamientoMetricas,
+        mostrar_tabla: bool) -> Tuple[int, int, Tuple[int, int, int]]:
+    """
+    Guarda las métricas de varios pares y suma su conteo de cambios.
+
+    Args:
+        resultados (Iterable[ResultadoPar]): Resultados de cada par
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        mostrar_tabla (bool): Mostrar tabla de métricas
+
+    Returns:
+        Tuple[int, int, Tuple[int, int, int]]: Pares procesados, pares con
+            error y totales (agregadas, modificadas, borradas)
+    """
+    # Las métricas solo se conservan para la tabla; sin ella, la memoria no
+    # crece con el número de pares
+    metricas = []
+    procesados = errores = 0
+    totales = [0, 0, 0]
+    # El lote guarda en memoria y escribe el registro una sola vez al final
+    with almacen.lote():
+        for resultado in resultados:
+            if resultado.error:
+                errores += 1
+                print(f"{Fore.RED}{resultado.nombre_archivo}: "
+                      f"{resultado.error}{Style.RESET_ALL}")
+                continue
+            procesados += 1
+            almacen.guardar_multiples_metricas(resultado.metricas)
+            if mostrar_tabla:
+                metricas.extend(resultado.metricas)
+            for posicion, cantidad in enumerate(resultado.conteo):
+                totales[posicion] += cantidad
+
+    if mostrar_tabla:
+        mostrar_tabla_metricas(metricas)
+    return procesados, errores, tuple(totales)
+
+
+def ejecutar(args: argparse.Namespace) -> None:
+    """
+    Ejecuta la acción indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
     """
-    init()
-    args = procesar_argumentos()
     almacen = AlmacenamientoMetricas(args.dev_db_path)
 
     # Caso especial: si solo se pide tabla completa (-tc), mostramos todas las
     # métricas y terminamos
-    if args.tc and not (args.ruta_archivo_1 or args.ruta_archivo_2):
+    if args.tc and not (args.ruta_archivo_1 or args.ruta_archivo_2 or
+                        args.git):
         mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
         return
 
@@ -235,6 +476,40 @@ def main() -> None:
         print(f"{Fore.RED}{mensaje_error}{Style.RESET_ALL}")
         return
 
+    cache_arboles = (CacheArboles(args.cache_arboles)
+                     if args.cache_arboles else None)
+    if args.git or Path(args.ruta_archivo_1).is_dir():
+        try:
+            if args.git:
+                procesados, errores, totales = procesar_git(
+                    *args.git,
+                    args.salida,
+                    almacen,
+                    args.t,
+                    args.algoritmo,
+                    cache_arboles)
+            else:
+                procesados, errores, totales = procesar_directorios(
+                    args.ruta_archivo_1,
+                    args.ruta_archivo_2,
+                    args.salida,
+                    almacen,
+                    args.trabajadores,
+                    args.t,
+                    args.algoritmo,
+                    cache_arboles)
+        except ExcepcionGit as e:
+            print(f"{Fore.RED}{str(e)}{Style.RESET_ALL}")
+            return
+        imprimir_conteo_cambios(*totales)
+        imprimir_exito(f"¡{procesados} pares de archivos procesados "
+                       "exitosamente!")
+        if errores:
+            print(f"{Fore.RED}{errores} pares con errores{Style.RESET_ALL}")
+        if args.tc:
+            mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
+        return
+
     try:
         # Procesamos el archivo actual y opcionalmente mostramos la tabla
         # histórica si se solicitó
@@ -244,7 +519,10 @@ def main() -> None:
             args.dev_db_path,
             almacen,
             args.t,
-            args.cc
+            args.cc,
+            args.algoritmo,
+            args.estadisticas,
+            cache_arboles
         )
         imprimir_exito("¡Archivo procesado exitosamente!")
         if args.tc:
@@ -259,5 +537,20 @@ def main() -> None:
         print(f"{Fore.RED}Error inesperado: {str(e)}{Style.RESET_ALL}")
 
 
+def main() -> None:
+    """
+    Punto de entrada principal del sistema de conteo de LOCs de código Python
+
+    Example:
+        >>> main()
+    """
+    args = procesar_argumentos()
+    iniciar_colores(activar=not args.sin_color)
+    # El desglose por fases se imprime al terminar, incluso si la
+    # ejecución se interrumpe
+    with perfilar(args.perfil):
+        ejecutar(args)
+
+
 if __name__ == "__main__":
     main()
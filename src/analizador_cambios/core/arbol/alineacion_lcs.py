@@ -0,0 +1,265 @@
+"""
+Nombre del módulo: alineacion_lcs.py
+Ruta: analizador_cambios/core/arbol/alineacion_lcs.py
+Descripción: Alinea dos secuencias por igualdad exacta con la subsecuencia
+             común más larga (patience diff con respaldo de Myers)
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - bisect
+    - collections.Counter
+    - difflib.SequenceMatcher (solo en tramos largos)
+
+Uso:
+    from analizador_cambios.core.arbol.alineacion_lcs import alinear
+
+    alinear(["a", "b", "c"], ["a", "c", "d"])
+    # [(0, 0), (2, 1)]
+
+Notas:
+    - Los elementos deben ser comparables por igualdad y hashables
+    - Patience diff usa como anclas los elementos que aparecen una sola vez en
+      cada lado; los tramos sin anclas se resuelven con el algoritmo de Myers
+    - Un elemento que solo existe en un lado nunca se empareja, así que se
+      descarta antes de Myers para que su costo dependa de los elementos
+      compartidos y no del tamaño total
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Hashable, List, Sequence, Tuple
+
+# Tamaño máximo (suma de ambos lados) que se resuelve con Myers; los tramos
+# mayores sin anclas usan los bloques de SequenceMatcher para acotar el costo
+LIMITE_MYERS = 4000
+
+
+def alinear(
+        a: Sequence[Hashable],
+        b: Sequence[Hashable]) -> List[Tuple[int, int]]:
+    """
+    Empareja los elementos iguales de dos secuencias conservando el orden.
+
+    Args:
+        a (Sequence[Hashable]): Secuencia original
+        b (Sequence[Hashable]): Secuencia nueva
+
+    Returns:
+        List[Tuple[int, int]]: Pares (índice en a, índice en b) ordenados y
+            crecientes en ambos índices
+
+    Example:
+        >>> alinear(["x", "y", "z"], ["y", "z", "x"])
+        [(1, 0), (2, 1)]
+    """
+    pares: List[Tuple[int, int]] = []
+    # Los tramos pendientes se procesan con una pila explícita para no
+    # depender de la profundidad de recursión
+    pendientes = [(0, len(a), 0, len(b))]
+    while pendientes:
+        inicio_a, fin_a, inicio_b, fin_b = pendientes.pop()
+
+        # Prefijo y sufijo comunes se emparejan directamente
+        while inicio_a < fin_a and inicio_b < fin_b and \
+                a[inicio_a] == b[inicio_b]:
+            pares.append((inicio_a, inicio_b))
+            inicio_a += 1
+            inicio_b += 1
+        while inicio_a < fin_a and inicio_b < fin_b and \
+                a[fin_a - 1] == b[fin_b - 1]:
+            fin_a -= 1
+            fin_b -= 1
+            pares.append((fin_a, fin_b))
+        if inicio_a == fin_a or inicio_b == fin_b:
+            continue
+
+        anclas = _anclas_unicas(a, inicio_a, fin_a, b, inicio_b, fin_b)
+        if not anclas:
+            pares.extend(_alinear_sin_anclas(a, inicio_a, fin_a,
+                                             b, inicio_b, fin_b))
+            continue
+
+        # Las anclas dividen el tramo en huecos que se alinean por separado
+        anterior_a, anterior_b = inicio_a, inicio_b
+        for indice_a, indice_b in anclas:
+            pares.append((indice_a, indice_b))
+            pendientes.append((anterior_a, indice_a, anterior_b, indice_b))
+            anterior_a, anterior_b = indice_a + 1, indice_b + 1
+        pendientes.append((anterior_a, fin_a, anterior_b, fin_b))
+
+    pares.sort()
+    return pares
+
+
+def _anclas_unicas(
+        a: Sequence[Hashable], inicio_a: int, fin_a: int,
+        b: Sequence[Hashable], inicio_b: int, fin_b: int
+        ) -> List[Tuple[int, int]]:
+    """
+    Obtiene la mayor cadena creciente de elementos únicos en ambos lados.
+
+    Args:
+        a (Sequence[Hashable]): Secuencia original
+        inicio_a (int): Inicio del tramo en a
+        fin_a (int): Fin (exclusivo) del tramo en a
+        b (Sequence[Hashable]): Secuencia nueva
+        inicio_b (int): Inicio del tramo en b
+        fin_b (int): Fin (exclusivo) del tramo en b
+
+    Returns:
+        List[Tuple[int, int]]: Anclas ordenadas por ambos índices
+    """
+    conteo_a = Counter(a[inicio_a:fin_a])
+    conteo_b = Counter(b[inicio_b:fin_b])
+    posicion_b = {b[indice]: indice for indice in range(inicio_b, fin_b)
+                  if conteo_b[b[indice]] == 1}
+    candidatos = [(indice, posicion_b[a[indice]])
+                  for indice in range(inicio_a, fin_a)
+                  if conteo_a[a[indice]] == 1 and a[indice] in posicion_b]
+    if not candidatos:
+        return []
+
+    # Patience sorting: la subsecuencia creciente más larga de los índices en
+    # b, en O(k log k), con un enlace al candidato anterior de cada pila
+    topes: List[int] = []
+    indices_topes: List[int] = []
+    anteriores = [-1] * len(candidatos)
+    for posicion, (_, indice_b) in enumerate(candidatos):
+        pila = bisect_left(topes, indice_b)
+        if pila > 0:
+            anteriores[posicion] = indices_topes[pila - 1]
+        if pila == len(topes):
+            topes.append(indice_b)
+            indices_topes.append(posicion)
+        else:
+            topes[pila] = indice_b
+            indices_topes[pila] = posicion
+
+    anclas = []
+    posicion = indices_topes[-1]
+    while posicion != -1:
+        anclas.append(candidatos[posicion])
+        posicion = anteriores[posicion]
+    anclas.reverse()
+    return anclas
+
+
+def _alinear_sin_anclas(
+        a: Sequence[Hashable], inicio_a: int, fin_a: int,
+        b: Sequence[Hashable], inicio_b: int, fin_b: int
+        ) -> List[Tuple[int, int]]:
+    """
+    Alinea un tramo sin anclas únicas usando solo los elementos compartidos.
+
+    Args:
+        a (Sequence[Hashable]): Secuencia original
+        inicio_a (int): Inicio del tramo en a
+        fin_a (int): Fin (exclusivo) del tramo en a
+        b (Sequence[Hashable]): Secuencia nueva
+        inicio_b (int): Inicio del tramo en b
+        fin_b (int): Fin (exclusivo) del tramo en b
+
+    Returns:
+        List[Tuple[int, int]]: Pares emparejados dentro del tramo
+    """
+    comunes = set(a[inicio_a:fin_a]).intersection(b[inicio_b:fin_b])
+    if not comunes:
+        return []
+
+    indices_a = [indice for indice in range(inicio_a, fin_a)
+                 if a[indice] in comunes]
+    indices_b = [indice for indice in range(inicio_b, fin_b)
+                 if b[indice] in comunes]
+    filtrada_a = [a[indice] for indice in indices_a]
+    filtrada_b = [b[indice] for indice in indices_b]
+
+    if len(filtrada_a) + len(filtrada_b) <= LIMITE_MYERS:
+        pares = _myers(filtrada_a, filtrada_b)
+    else:
+        from difflib import SequenceMatcher
+        bloques = SequenceMatcher(None, filtrada_a, filtrada_b,
+                                  autojunk=False).get_matching_blocks()
+        pares = [(bloque.a + desplazamiento, bloque.b + desplazamiento)
+                 for bloque in bloques
+                 for desplazamiento in range(bloque.size)]
+    return [(indices_a[x], indices_b[y]) for x, y in pares]
+
+
+def _myers(
+        a: Sequence[Hashable],
+        b: Sequence[Hashable]) -> List[Tuple[int, int]]:
+    """
+    Calcula la subsecuencia común más larga con el algoritmo de Myers.
+
+    Args:
+        a (Sequence[Hashable]): Secuencia original
+        b (Sequence[Hashable]): Secuencia nueva
+
+    Returns:
+        List[Tuple[int, int]]: Pares emparejados, ordenados
+
+    Example:
+        >>> _myers("abcabba", "cbabac")
+        [(2, 0), (3, 2), (4, 3), (6, 4)]
+    """
+    total_a, total_b = len(a), len(b)
+    # v[k] es la x más lejana alcanzada en la diagonal k = x - y; guardamos
+    # una copia por cada costo d para reconstruir el camino
+    v = {1: 0}
+    trazas = []
+    for d in range(total_a + total_b + 1):
+        trazas.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < total_a and y < total_b and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= total_a and y >= total_b:
+                return _reconstruir_myers(trazas, total_a, total_b)
+    return []
+
+
+def _reconstruir_myers(
+        trazas: List[dict],
+        total_a: int,
+        total_b: int) -> List[Tuple[int, int]]:
+    """
+    Recorre las trazas de Myers desde el final para obtener los pares.
+
+    Args:
+        trazas (List[dict]): Estado de v antes de cada costo d
+        total_a (int): Longitud de la secuencia original
+        total_b (int): Longitud de la secuencia nueva
+
+    Returns:
+        List[Tuple[int, int]]: Pares emparejados, ordenados
+    """
+    pares = []
+    x, y = total_a, total_b
+    for d in range(len(trazas) - 1, -1, -1):
+        v = trazas[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            k_anterior = k + 1
+        else:
+            k_anterior = k - 1
+        x_anterior = v[k_anterior]
+        y_anterior = x_anterior - k_anterior
+        # La diagonal final del paso d son elementos iguales
+        while x > x_anterior and y > y_anterior:
+            x -= 1
+            y -= 1
+            pares.append((x, y))
+        x, y = x_anterior, y_anterior
+    pares.reverse()
+    return pares
@@ -7,11 +7,13 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 02-12-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - utils.constructor_arbol.ConstructorArbol
     - utils.impresion_arbol.imprimir_arbol
+    - contador_lineas.core.arbol.recorrido_arbol.recorrer_preorden
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
 
 Uso:
     from analizador_cambios.core.arbol.arbol_sintactico import (
@@ -20,17 +22,28 @@ Uso:
     arbol = ArbolArchivoPython(contenido_archivo)
     arbol.imprimir_arbol()
 
+    # Carga el árbol de la caché si otra ejecución ya lo construyó
+    arbol = ArbolArchivoPython(contenido_archivo, CacheArboles("db/arboles"))
+
 Notas:
     - Implementa representación jerárquica del código fuente
+    - En la caché de árboles usa su propia variante: conserva las líneas
+      vacías y numera los nodos, así que su árbol no coincide con el de
+      contador_lineas aunque las líneas sean las mismas
 """
 
-from typing import List
+from typing import Iterable, List, Optional
 
 from analizador_cambios.core.arbol.nodo import Nodo
 from analizador_cambios.core.arbol.constructor_arbol import ConstructorArbol
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_preorden
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.models.nodos import TipoNodo
 from contador_lineas.utils.impresion_arbol import imprimir_arbol
 
+# Variante de los árboles de este constructor en la caché de árboles
+VARIANTE_CAMBIOS = "cambios"
+
 
 class ArbolArchivoPython:
     """
@@ -51,10 +64,32 @@ class ArbolArchivoPython:
         >>> arbol.imprimir_arbol()
     """
 
-    def __init__(self, file_content: List[str]):
+    def __init__(
+            self,
+            file_content: Iterable[str],
+            cache: Optional[CacheArboles] = None):
         self.constructor = ConstructorArbol()
-        self.raiz = self.constructor.construir(file_content)
-        self.mapeo_lineas = self.constructor.arbol_a_lineas
+        clave = entrada = None
+        if cache is not None:
+            file_content = list(file_content)
+            clave = cache.calcular_clave(file_content, VARIANTE_CAMBIOS)
+            entrada = cache.obtener(clave, Nodo)
+
+        if entrada is None:
+            self.raiz = self.constructor.construir(file_content)
+            self.mapeo_lineas = self.constructor.arbol_a_lineas
+            if clave is not None:
+                cache.guardar(clave, self.raiz)
+        else:
+            self.raiz = entrada.raiz
+            # El hash de un str cambia entre procesos, así que los hashes de
+            # los subárboles no se guardan y se recalculan al cargar
+            ConstructorArbol.calcular_hashes(self.raiz)
+            self.mapeo_lineas = {
+                nodo.numero_nodo: nodo.lineas
+                for nodo in recorrer_preorden(self.raiz)
+                if nodo is not self.raiz
+            }
 
     def imprimir_arbol(self) -> None:
         """
@@ -7,14 +7,17 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 03-12-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
-    - difflib.SequenceMatcher
-    - typing.List
+    - bisect.bisect_right
+    - dataclasses.dataclass
+    - difflib.SequenceMatcher (al calcular la primera similitud)
+    - typing.Dict, Iterator, List, Set, Tuple
     - analizador_cambios.config.umbral
     - analizador_cambios.core.arbol.nodo
     - analizador_cambios.models.cambios
+    - contador_lineas.core.arbol.recorrido_arbol.recorrer_preorden
 
 Uso:
     from analizador_cambios.core.arbol.comparador_arboles import (
@@ -22,17 +25,64 @@ Uso:
     )
     comparador = ComparadorArboles()
     cambios = comparador.comparar(arbol1, arbol2)
+    print(comparador.estadisticas.ratios_evitados)
+
+Notas:
+    - La similitud de cada par de nodos se calcula una sola vez por
+      comparación; antes del ratio completo se descartan los pares cuya cota
+      superior (por longitud o por quick_ratio) no alcanza el umbral
+    - Dos subárboles con el mismo hash estructural no se recorren, y la
+      búsqueda de nodos desplazados consulta un índice de contenidos por
+      padre en lugar de recorrer a los hermanos
 """
 
-from difflib import SequenceMatcher
-from typing import List
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Set, Tuple
 
 from analizador_cambios.config.umbral import UMBRAL_SIMILITUD
 from analizador_cambios.core.arbol.nodo import Nodo
 from analizador_cambios.models.cambios import TipoCambio, Cambio
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_preorden
 from contador_lineas.models.nodos import TipoNodo
 
 
+@dataclass
+class EstadisticasSimilitud:
+    """
+    Contadores de las consultas de similitud de una comparación.
+
+    Attributes:
+        consultas (int): Similitudes solicitadas entre pares de nodos
+        aciertos_memo (int): Consultas resueltas con un valor ya calculado
+        descartes_longitud (int): Pares descartados por la cota de longitudes
+        descartes_quick_ratio (int): Pares descartados por quick_ratio
+        ratios_completos (int): Ratios de SequenceMatcher calculados
+        subarboles_iguales (int): Subárboles omitidos por tener el mismo hash
+
+    Example:
+        >>> EstadisticasSimilitud().ratios_evitados
+        0
+    """
+
+    consultas: int = 0
+    aciertos_memo: int = 0
+    descartes_longitud: int = 0
+    descartes_quick_ratio: int = 0
+    ratios_completos: int = 0
+    subarboles_iguales: int = 0
+
+    @property
+    def ratios_evitados(self) -> int:
+        """
+        Consultas que no necesitaron calcular el ratio completo.
+
+        Returns:
+            int: Consultas menos ratios completos calculados
+        """
+        return self.consultas - self.ratios_completos
+
+
 class ComparadorArboles:
     """
     Compara árboles sintácticos y detecta diferencias entre versiones.
@@ -41,6 +91,8 @@ class ComparadorArboles:
         cambios (List[Cambio]): Lista de cambios detectados
         nodos_agregados (dict): Mapeo de nodos agregados
         nodos_eliminados (dict): Mapeo de nodos eliminados
+        estadisticas (EstadisticasSimilitud): Contadores de similitud de la
+            última comparación
 
     Methods:
         comparar(arbol1: Nodo, arbol2: Nodo) -> List[Cambio]:
@@ -54,6 +106,12 @@ class ComparadorArboles:
         self.cambios: List[Cambio] = []
         self.nodos_agregados = {}
         self.nodos_eliminados = {}
+        self.estadisticas = EstadisticasSimilitud()
+        # Similitudes ya calculadas, por identidad del par de nodos
+        self._memo_similitud: Dict[Tuple[int, int], float] = {}
+        # Contenidos de los hijos de cada padre consultado, por identidad
+        self._indices_hijos: Dict[
+            int, Tuple[Set[str], Dict[str, List[int]]]] = {}
 
     def comparar(
             self,
@@ -73,25 +131,119 @@ class ComparadorArboles:
             >>> comparar(arbol1, arbol2)
         """
         self.cambios = []
+        self.estadisticas = EstadisticasSimilitud()
+        self._memo_similitud = {}
+        self._indices_hijos = {}
         self._comparar_recursivamente(arbol1, arbol2)
 
         return self.cambios
 
+    def _subarboles_iguales(self, nodo1: Nodo, nodo2: Nodo) -> bool:
+        """
+        Indica si dos subárboles tienen el mismo hash estructural.
+
+        Args:
+            nodo1 (Nodo): Nodo del árbol original
+            nodo2 (Nodo): Nodo del árbol modificado
+
+        Returns:
+            bool: True si ambos hashes están calculados y coinciden
+        """
+        hash1 = getattr(nodo1, 'hash_subarbol', None)
+        if hash1 is None or hash1 != getattr(nodo2, 'hash_subarbol', None):
+            return False
+        self.estadisticas.subarboles_iguales += 1
+        return True
+
+    def _indice_hijos(
+            self,
+            nodo: Nodo) -> Tuple[Set[str], Dict[str, List[int]]]:
+        """
+        Obtiene el índice de contenidos de los hijos de un nodo.
+
+        Args:
+            nodo (Nodo): Padre cuyos hijos se indexan
+
+        Returns:
+            Tuple[Set[str], Dict[str, List[int]]]: Contenidos de todos los
+                hijos y, por contenido, las posiciones crecientes de los hijos
+                que no son espacios en blanco
+        """
+        indice = self._indices_hijos.get(id(nodo))
+        if indice is None:
+            posiciones: Dict[str, List[int]] = {}
+            for posicion, hijo in enumerate(nodo.hijos):
+                if hijo.tipo != TipoNodo.WHITE_SPACE:
+                    posiciones.setdefault(hijo.contenido, []).append(posicion)
+            indice = ({hijo.contenido for hijo in nodo.hijos}, posiciones)
+            self._indices_hijos[id(nodo)] = indice
+        return indice
+
+    def _similitud_nodos(self, nodo1: Nodo, nodo2: Nodo) -> float:
+        """
+        Obtiene la similitud entre el contenido de dos nodos, con memoria.
+
+        Args:
+            nodo1 (Nodo): Nodo cuyo contenido es la primera cadena
+            nodo2 (Nodo): Nodo cuyo contenido es la segunda cadena
+
+        Returns:
+            float: Igual que _calcular_similitud
+
+        Example:
+            >>> _similitud_nodos(hijo1, hijo2)
+        """
+        # El ratio no es simétrico, así que el orden del par forma parte de
+        # la clave
+        clave = (id(nodo1), id(nodo2))
+        self.estadisticas.consultas += 1
+        similitud = self._memo_similitud.get(clave)
+        if similitud is None:
+            similitud = self._calcular_similitud(nodo1.contenido,
+                                                 nodo2.contenido)
+            self._memo_similitud[clave] = similitud
+        else:
+            self.estadisticas.aciertos_memo += 1
+        return similitud
+
     def _calcular_similitud(self, str1: str, str2: str) -> float:
         """
         Calcula ratio de similitud entre dos cadenas.
 
+        Si una cota superior del ratio queda por debajo de UMBRAL_SIMILITUD,
+        se retorna esa cota sin calcular el ratio completo; los llamadores
+        solo usan el valor cuando alcanza el umbral.
+
         Args:
             str1 (str): Primera cadena
             str2 (str): Segunda cadena
 
         Returns:
-            float: Ratio de similitud entre 0 y 1
+            float: Ratio de similitud entre 0 y 1, o una cota menor al umbral
 
         Example:
             >>> _calcular_similitud("abc", "abd")
         """
-        return SequenceMatcher(None, str1, str2).ratio()
+        # Los caracteres en común no pueden superar a la cadena más corta; es
+        # la misma cota de real_quick_ratio sin construir el SequenceMatcher
+        total = len(str1) + len(str2)
+        if total:
+            cota = 2.0 * min(len(str1), len(str2)) / total
+            if cota < UMBRAL_SIMILITUD:
+                self.estadisticas.descartes_longitud += 1
+                return cota
+
+        # difflib se importa aquí para no cargarlo al arrancar; tras la
+        # primera vez la importación es una consulta a sys.modules
+        from difflib import SequenceMatcher
+        comparador = SequenceMatcher(None, str1, str2)
+        cota = comparador.quick_ratio()
+        if cota < UMBRAL_SIMILITUD:
+            self.estadisticas.descartes_quick_ratio += 1
+            return cota
+
+        self.estadisticas.ratios_completos += 1
+        return comparador.ratio()
 
     def _comparar_recursivamente(self, nodo1: Nodo, nodo2: Nodo):
         """
@@ -104,6 +256,10 @@ class ComparadorArboles:
         Example:
             >>> _comparar_recursivamente(nodo1, nodo2)
         """
+        # Un subárbol idéntico no aporta cambios
+        if self._subarboles_iguales(nodo1, nodo2):
+            return
+
         # Comparar hijos
         idx1 = 0
         idx2 = 0
@@ -124,17 +280,15 @@ class ComparadorArboles:
             hijo1 = nodo1.hijos[idx1]
             hijo2 = nodo2.hijos[idx2]
 
-            similitud = self._calcular_similitud(
-                    hijo1.contenido,
-                    hijo2.contenido
-                )
-
             # Si los nodos son iguales, comparar recursivamente y avanzar
             if hijo1.contenido == hijo2.contenido:
                 self._comparar_recursivamente(hijo1, hijo2)
                 idx1 += 1
                 idx2 += 1
             else:
+                # La similitud solo se usa cuando los nodos son distintos
+                similitud = self._similitud_nodos(hijo1, hijo2)
+
                 # Si los nodos son diferentes, buscar si estos fueron eliminados
                 # o modificados
 
@@ -337,9 +491,9 @@ class ComparadorArboles:
             for j in range(idx1, len(nodo1.hijos)):
                 # Se calcula la similitud entre el nodo de la versión 2 y el
                 # nodo de la versión 1
-                similitud_temporal = self._calcular_similitud(
-                        hijo2.contenido,
-                        nodo1.hijos[j].contenido
+                similitud_temporal = self._similitud_nodos(
+                        hijo2,
+                        nodo1.hijos[j]
                     )
 
                 if (similitud_temporal >= UMBRAL_SIMILITUD) and \
@@ -383,12 +537,8 @@ class ComparadorArboles:
         Example:
             >>> _existe_explicito(hijo, nodo)
         """
-        # Se recorren los nodos
-        for j in range(0,len(nodo.hijos)):
-            # Se determina si este existe explícitamente
-            if hijo.contenido == nodo.hijos[j].contenido:
-                return True
-        return False
+        # Se determina si este existe explícitamente entre los hijos
+        return hijo.contenido in self._indice_hijos(nodo)[0]
 
     def _encontrar_en_version_nueva(self, nodo1, nodo2, idx1, idx2) -> bool:
         """
@@ -408,19 +558,18 @@ class ComparadorArboles:
         """
         hijo1 = nodo1.hijos[idx1]
 
-        # Se recorren los nodos de la versión 2
-        for j in range(idx2 + 1, len(nodo2.hijos)):
-            # Se ignora los espacios en blanco
-            if nodo2.hijos[j].tipo == TipoNodo.WHITE_SPACE:
-                continue
+        # Se recorren, después de idx2, los nodos de la versión 2 con el mismo
+        # contenido; el índice ya omite los espacios en blanco
+        posiciones = self._indice_hijos(nodo2)[1].get(hijo1.contenido, ())
+        for posicion in range(bisect_right(posiciones, idx2),
+                              len(posiciones)):
+            numero_nodo = nodo2.hijos[posiciones[posicion]].numero_nodo
 
             # Si el nodo de la versión 1 se encuentra en la versión 2, se
             # considera que fue desplazado
-            if (hijo1.contenido == nodo2.hijos[j].contenido) and \
-            (nodo2.hijos[j].numero_nodo not in self.nodos_eliminados):
-                self.nodos_eliminados[nodo2.hijos[j].numero_nodo] = \
-                hijo1.numero_nodo
-                return (True, nodo2.hijos[j].numero_nodo)
+            if numero_nodo not in self.nodos_eliminados:
+                self.nodos_eliminados[numero_nodo] = hijo1.numero_nodo
+                return (True, numero_nodo)
 
             # El nodo de la versión 1 no se encuentra en la versión 2
             # explícitamente
@@ -452,9 +601,9 @@ class ComparadorArboles:
 
             # Se calcula la similitud entre el nodo de la versión 1 y el nodo de
             # la versión 2
-            similitud = self._calcular_similitud(
-                    hijo1.contenido,
-                    nodo2.hijos[j].contenido
+            similitud = self._similitud_nodos(
+                    hijo1,
+                    nodo2.hijos[j]
                 )
 
             if (similitud >= UMBRAL_SIMILITUD) and \
@@ -487,18 +636,39 @@ class ComparadorArboles:
             >>> _todo_modificado(nodo1, nodo2, TipoCambio.MODIFICADA)
         """
         if nodo1 is not None:
-            for hijo in nodo1.hijos:
-                if hijo.tipo == TipoNodo.WHITE_SPACE:
-                    continue
-
-                self.cambios.append(Cambio(tipo, hijo, None, hijo.numero_nodo))
-                if hijo.hijos:
-                    self._todo_modificado(hijo, None, tipo)
+            for descendiente in self._descendientes_con_contenido(nodo1):
+                self.cambios.append(Cambio(tipo, descendiente, None,
+                                           descendiente.numero_nodo))
         elif nodo2 is not None:
-            for hijo in nodo2.hijos:
-                if hijo.tipo == TipoNodo.WHITE_SPACE:
-                    continue
+            for descendiente in self._descendientes_con_contenido(nodo2):
+                self.cambios.append(Cambio(tipo, None, descendiente,
+                                           descendiente.numero_nodo))
+
+    @staticmethod
+    def _descendientes_con_contenido(nodo: Nodo) -> Iterator[Nodo]:
+        """
+        Recorre en preorden los descendientes de un nodo sin espacios en blanco.
+
+        Args:
+            nodo (Nodo): Nodo cuyos descendientes se recorren
+
+        Returns:
+            Iterator[Nodo]: Descendientes, sin incluir al propio nodo
+        """
+        # El recorrido es iterativo para soportar anidamiento profundo
+        for hijo in nodo.hijos:
+            yield from recorrer_preorden(
+                hijo, ComparadorArboles._es_espacio_en_blanco)
+
+    @staticmethod
+    def _es_espacio_en_blanco(nodo: Nodo) -> bool:
+        """
+        Indica si un nodo representa una línea en blanco.
 
-                self.cambios.append(Cambio(tipo, None, hijo, hijo.numero_nodo))
-                if hijo.hijos:
-                    self._todo_modificado(None, hijo, tipo)
+        Args:
+            nodo (Nodo): Nodo a evaluar
+
+        Returns:
+            bool: True si el nodo es de tipo WHITE_SPACE
+        """
+        return nodo.tipo == TipoNodo.WHITE_SPACE
@@ -0,0 +1,198 @@
+"""
+Nombre del módulo: comparador_lcs.py
+Ruta: analizador_cambios/core/arbol/comparador_lcs.py
+Descripción: Compara árboles sintácticos alineando hermanos por contenido
+             exacto antes de buscar similitud
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - typing
+    - analizador_cambios.config.umbral
+    - analizador_cambios.core.arbol.alineacion_lcs.alinear
+    - analizador_cambios.core.arbol.comparador_arboles.ComparadorArboles
+    - analizador_cambios.core.arbol.nodo
+    - analizador_cambios.models.cambios
+
+Uso:
+    from analizador_cambios.core.arbol.comparador_lcs import (
+        ComparadorArbolesLCS
+    )
+    comparador = ComparadorArbolesLCS()
+    cambios = comparador.comparar(arbol1, arbol2)
+
+Notas:
+    - Produce los mismos tipos de Cambio que ComparadorArboles: un nodo igual
+      no genera cambios, uno modificado genera BORRADA y AGREGADA con su
+      similitud, y uno borrado o agregado arrastra a todo su subárbol
+    - Un par alineado cuyos subárboles tienen el mismo hash estructural no
+      se recorre
+    - La similitud solo se calcula entre los hermanos que quedan en un mismo
+      hueco de la alineación, en lugar de contra todos los hermanos restantes
+"""
+
+from typing import List, Optional, Sequence
+
+from analizador_cambios.config.umbral import UMBRAL_SIMILITUD
+from analizador_cambios.core.arbol.alineacion_lcs import alinear
+from analizador_cambios.core.arbol.comparador_arboles import ComparadorArboles
+from analizador_cambios.core.arbol.nodo import Nodo
+from analizador_cambios.models.cambios import Cambio, TipoCambio
+
+# Acciones pendientes de la comparación
+COMPARAR = 0
+BORRAR = 1
+AGREGAR = 2
+MODIFICAR = 3
+
+
+class ComparadorArbolesLCS(ComparadorArboles):
+    """
+    Compara árboles emparejando hermanos con la subsecuencia común más larga.
+
+    Los hermanos con contenido idéntico se alinean primero por hash; después,
+    dentro de cada hueco entre pares alineados, un nodo original se empareja
+    con el primer nodo nuevo cuya similitud alcance el umbral.
+
+    Methods:
+        comparar(arbol1: Nodo, arbol2: Nodo) -> List[Cambio]:
+            Compara dos árboles y devuelve los cambios detectados
+
+    Example:
+        >>> comparador = ComparadorArbolesLCS()
+        >>> cambios = comparador.comparar(arbol1, arbol2)
+    """
+
+    def _comparar_recursivamente(self, nodo1: Nodo, nodo2: Nodo):
+        """
+        Compara dos nodos y sus subárboles.
+
+        Args:
+            nodo1 (Nodo): Nodo del árbol original
+            nodo2 (Nodo): Nodo del árbol modificado
+
+        Example:
+            >>> _comparar_recursivamente(nodo1, nodo2)
+        """
+        # Pila de acciones pendientes; los cambios de un subárbol se
+        # registran antes que los de los hermanos siguientes, igual que en la
+        # comparación recursiva
+        pendientes = [(COMPARAR, nodo1, nodo2, 0.0)]
+        while pendientes:
+            accion, hijo1, hijo2, similitud = pendientes.pop()
+            if accion == COMPARAR:
+                if self._subarboles_iguales(hijo1, hijo2):
+                    continue
+                acciones = self._alinear_hijos(hijo1, hijo2)
+                pendientes.extend(reversed(acciones))
+            elif accion == BORRAR:
+                self.cambios.append(Cambio(TipoCambio.BORRADA, hijo1, None,
+                                           hijo1.numero_nodo))
+                self._todo_modificado(hijo1, None, TipoCambio.BORRADA)
+            elif accion == AGREGAR:
+                self.cambios.append(Cambio(TipoCambio.AGREGADA, None, hijo2,
+                                           hijo2.numero_nodo))
+                self._todo_modificado(None, hijo2, TipoCambio.AGREGADA)
+            else:
+                self.cambios.append(Cambio(TipoCambio.BORRADA, hijo1, hijo2,
+                                           hijo1.numero_nodo,
+                                           round(similitud, 2)))
+                self.cambios.append(Cambio(TipoCambio.AGREGADA, hijo1, hijo2,
+                                           hijo2.numero_nodo,
+                                           round(similitud, 2)))
+                pendientes.append((COMPARAR, hijo1, hijo2, 0.0))
+
+    def _alinear_hijos(self, nodo1: Nodo, nodo2: Nodo) -> List[tuple]:
+        """
+        Obtiene, en orden, las acciones para los hijos de dos nodos.
+
+        Args:
+            nodo1 (Nodo): Nodo del árbol original
+            nodo2 (Nodo): Nodo del árbol modificado
+
+        Returns:
+            List[tuple]: Acciones (accion, hijo1, hijo2, similitud)
+        """
+        hijos1 = [hijo for hijo in nodo1.hijos
+                  if not self._es_espacio_en_blanco(hijo)]
+        hijos2 = [hijo for hijo in nodo2.hijos
+                  if not self._es_espacio_en_blanco(hijo)]
+        contenidos1 = [hijo.contenido for hijo in hijos1]
+        contenidos2 = [hijo.contenido for hijo in hijos2]
+
+        # Un nodo cuyo contenido existe tal cual del otro lado fue desplazado,
+        # así que no se empareja por similitud con otro nodo
+        existentes1 = set(contenidos1)
+        existentes2 = set(contenidos2)
+
+        acciones = []
+        anterior1 = anterior2 = 0
+        for indice1, indice2 in alinear(contenidos1, contenidos2) + \
+                [(len(hijos1), len(hijos2))]:
+            acciones.extend(self._acciones_hueco(
+                hijos1[anterior1:indice1], hijos2[anterior2:indice2],
+                existentes1, existentes2))
+            if indice1 < len(hijos1):
+                acciones.append((COMPARAR, hijos1[indice1], hijos2[indice2],
+                                 0.0))
+            anterior1, anterior2 = indice1 + 1, indice2 + 1
+        return acciones
+
+    def _acciones_hueco(
+            self,
+            hueco1: Sequence[Nodo],
+            hueco2: Sequence[Nodo],
+            existentes1: set,
+            existentes2: set) -> List[tuple]:
+        """
+        Empareja por similitud los hermanos de un hueco de la alineación.
+
+        Args:
+            hueco1 (Sequence[Nodo]): Hermanos originales sin pareja exacta
+            hueco2 (Sequence[Nodo]): Hermanos nuevos sin pareja exacta
+            existentes1 (set): Contenidos de todos los hermanos originales
+            existentes2 (set): Contenidos de todos los hermanos nuevos
+
+        Returns:
+            List[tuple]: Acciones del hueco, en orden
+        """
+        parejas: List[Optional[int]] = [None] * len(hueco1)
+        similitudes = [0.0] * len(hueco1)
+        emparejados2 = set()
+        siguiente = 0
+        for indice1, hijo1 in enumerate(hueco1):
+            if hijo1.contenido in existentes2:
+                continue
+            for indice2 in range(siguiente, len(hueco2)):
+                hijo2 = hueco2[indice2]
+                if hijo2.contenido in existentes1:
+                    continue
+                similitud = self._similitud_nodos(hijo1, hijo2)
+                if similitud >= UMBRAL_SIMILITUD:
+                    parejas[indice1] = indice2
+                    similitudes[indice1] = similitud
+                    emparejados2.add(indice2)
+                    siguiente = indice2 + 1
+                    break
+
+        # Las parejas conservan el orden, así que basta avanzar ambos lados;
+        # como en la comparación voraz, las líneas agregadas van primero
+        acciones = []
+        indice1 = indice2 = 0
+        while indice1 < len(hueco1) or indice2 < len(hueco2):
+            if indice2 < len(hueco2) and indice2 not in emparejados2:
+                acciones.append((AGREGAR, None, hueco2[indice2], 0.0))
+                indice2 += 1
+            elif parejas[indice1] is None:
+                acciones.append((BORRAR, hueco1[indice1], None, 0.0))
+                indice1 += 1
+            else:
+                acciones.append((MODIFICAR, hueco1[indice1], hueco2[indice2],
+                                 similitudes[indice1]))
+                indice1 += 1
+                indice2 += 1
+        return acciones
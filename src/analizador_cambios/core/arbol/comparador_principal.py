@@ -7,7 +7,7 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 02-12-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing.List
@@ -15,6 +15,8 @@ Dependencias:
     - analizador_cambios.models.cambios
     - analizador_cambios.core.arbol.arbol_sintactico
     - analizador_cambios.core.arbol.comparador_arboles
+    - analizador_cambios.core.arbol.comparador_lcs
+    - contador_lineas.utils.perfil.fase
 
 Uso:
     from analizador_cambios.core.arbol.comparador_principal import (
@@ -22,6 +24,12 @@ Uso:
     )
     comparador = ComparadorVersiones()
     cambios = comparador.comparar_archivos(arbol1, arbol2)
+
+Notas:
+    - El algoritmo "voraz" recorre los hermanos comparando cada par contra
+      los restantes; "lcs" alinea primero los hermanos idénticos y solo
+      calcula similitudes dentro de los huecos, lo que escala mejor en
+      módulos con miles de sentencias
 """
 
 from typing import List, Union
@@ -29,6 +37,15 @@ from typing import List, Union
 from analizador_cambios.models.cambios import Cambio, TipoCambio
 from analizador_cambios.core.arbol.arbol_sintactico import ArbolArchivoPython
 from analizador_cambios.core.arbol.comparador_arboles import ComparadorArboles
+from analizador_cambios.core.arbol.comparador_lcs import ComparadorArbolesLCS
+from contador_lineas.utils.perfil import fase
+
+# Motores de emparejamiento de hermanos disponibles
+ALGORITMOS_COMPARACION = {
+    "voraz": ComparadorArboles,
+    "lcs": ComparadorArbolesLCS,
+}
+ALGORITMO_PREDETERMINADO = "voraz"
 
 
 class ComparadorVersiones:
@@ -38,7 +55,8 @@ class ComparadorVersiones:
     Procesa árboles sintácticos y genera reportes de cambios entre versiones.
 
     Attributes:
-        comparador (ComparadorArboles): Instancia para comparar árboles
+        comparador (ComparadorArboles): Instancia para comparar árboles según
+            el algoritmo elegido
 
     Methods:
         comparar_archivos(arbol_v1: ArbolArchivoPython,
@@ -52,9 +70,13 @@ class ComparadorVersiones:
         >>> comparador = ComparadorVersiones()
         >>> cambios = comparador.comparar_archivos(arbol1, arbol2)
     """
-    def __init__(self):
-        self.comparador = ComparadorArboles()
+    def __init__(self, algoritmo: str = ALGORITMO_PREDETERMINADO):
+        if algoritmo not in ALGORITMOS_COMPARACION:
+            raise ValueError(f"Algoritmo de comparación desconocido: "
+                             f"{algoritmo}")
+        self.comparador = ALGORITMOS_COMPARACION[algoritmo]()
 
+    @fase("comparar")
     def comparar_archivos(
             self,
             arbol_v1: ArbolArchivoPython,
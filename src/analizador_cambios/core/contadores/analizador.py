@@ -7,7 +7,7 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 02-12-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.contadores.contador_fisico.ContadorLineasFisicas
@@ -16,7 +16,9 @@ Dependencias:
     - core.gestion_archivos.manejador_json.AlmacenamientoMetricas
     - core.arbol_sintaxis.arbol_archivo.ArbolArchivoPython
     - models.metricas.MetricasArchivo
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
     - utils.formateador_linea.FormateadorLinea
+    - contador_lineas.utils.perfil.fase
 
 Uso:
     from analizador_cambios.core.contadores.analizador import Analizador
@@ -35,6 +37,7 @@ from typing import Optional, Tuple, List
 from analizador_cambios.utils.formateador_linea import FormateadorLinea
 from analizador_cambios.core.arbol.nodo import Nodo
 from analizador_cambios.core.arbol.arbol_sintactico import ArbolArchivoPython
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.core.contadores.contador_fisico import (
     ContadorLineasFisicas
 )
@@ -48,6 +51,7 @@ from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
     AlmacenamientoMetricas
 )
 from lineas_por_clase.models.metricas import MetricasClase, MetricasArchivo
+from contador_lineas.utils.perfil import fase
 
 
 class ExcepcionAnalizador(Exception):
@@ -98,24 +102,34 @@ class AnalizadorCodigo:
         formateador (FormateadorLinea): Formateador de líneas
         contador_fisico (ContadorLineasFisicas): Contador de líneas físicas
         contador_logico (ContadorLineasLogicas): Contador de líneas lógicas
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+            con contador_lineas y lineas_por_clase
 
     Methods:
         analizar_archivo(ruta_archivo: str, 
             nombre_archivo: str) -> ResultadoAnalisis:
             Analiza un archivo Python y retorna sus métricas.
+        obtener_metricas(ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+            Calcula las métricas de un archivo sin almacenarlas.
+        obtener_metricas_codigo(lineas: List[str],
+            nombre_archivo: str) -> MetricasArchivo:
+            Calcula las métricas de código en memoria sin almacenarlas.
 
     Example:
         >>> analizador = Analizador()
         >>> resultado = analizador.analizar_archivo("script.py", "script.py")
     """
 
-    def __init__(self):
+    def __init__(self, cache_arboles: Optional[CacheArboles] = None):
+        self.cache_arboles = cache_arboles
         self.arbol = None
         self.codigo = None
         self.formateador = FormateadorLinea()
         self.contador_fisico = ContadorLineasFisicas()
         self.verificador_estandar = VerificadorEstandarCodigo()
 
+    @fase("formatear")
     def formatear_codigo(self, codigo: List[str]) -> List[str]:
         """
         Formatea el código fuente para su análisis.
@@ -158,7 +172,8 @@ class AnalizadorCodigo:
             self, 
             ruta_archivo: str, 
             nombre_archivo: str, 
-            ruta_almacenamiento: str = "db/lineas_por_clase_registro.json"
+            ruta_almacenamiento: str = "db/lineas_por_clase_registro.json",
+            almacen: Optional[AlmacenamientoMetricas] = None
         ) -> ResultadoAnalisis:
         """
         Analiza un archivo Python y obtiene sus métricas.
@@ -166,6 +181,9 @@ class AnalizadorCodigo:
         Args:
             ruta_archivo (str): Ruta al archivo
             nombre_archivo (str): Nombre del archivo
+            ruta_almacenamiento (str): Registro a usar si no se inyecta almacen
+            almacen (Optional[AlmacenamientoMetricas]): Almacenamiento
+                compartido; evita abrir el registro en cada llamada
 
         Returns:
             ResultadoAnalisis: Métricas del archivo
@@ -173,14 +191,62 @@ class AnalizadorCodigo:
         Example:
             >>> analizar_archivo("script.py", "script.py")
         """
+        metricas = self.obtener_metricas(ruta_archivo, nombre_archivo)
+        if almacen is None:
+            almacen = AlmacenamientoMetricas(ruta_almacenamiento)
+        almacen.guardar_metricas(metricas)
+        return self._crear_resultado(metricas)
+
+    def obtener_metricas(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Valida, lee y mide un archivo Python sin almacenar sus métricas.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo es inválido o viola el estándar
+
+        Example:
+            >>> obtener_metricas("script.py", "script.py")
+        """
         # El flujo de análisis sigue un orden específico para garantizar la
-        # validez del código antes de procesar y almacenar métricas
+        # validez del código antes de procesar métricas
         self._validar_archivo(ruta_archivo)
         codigo = self._obtener_codigo(ruta_archivo)
         self.codigo = codigo
-        metricas = self._procesar_codigo(codigo, nombre_archivo)
-        AlmacenamientoMetricas(ruta_almacenamiento).guardar_metricas(metricas)
-        return self._crear_resultado(metricas)
+        return self._procesar_codigo(codigo, nombre_archivo)
+
+    def obtener_metricas_codigo(
+            self,
+            lineas: List[str],
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Mide código ya leído en memoria sin almacenar sus métricas.
+
+        Args:
+            lineas (List[str]): Líneas del código, como las de readlines()
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del código
+
+        Raises:
+            ExcepcionAnalizador: Si el código viola el estándar
+
+        Example:
+            >>> obtener_metricas_codigo(["def f():\\n", "    pass\\n"], "f.py")
+        """
+        codigo = self.formatear_codigo(lineas)
+        self.codigo = codigo
+        return self._procesar_codigo(codigo, nombre_archivo)
 
     def _validar_archivo(self, ruta_archivo: str) -> None:
         """
@@ -239,7 +305,7 @@ class AnalizadorCodigo:
         """
         # Construimos y validamos el AST primero para asegurar que el código
         # cumple con el estándar antes de calcular métricas
-        arbol = ArbolArchivoPython(codigo)
+        arbol = ArbolArchivoPython(codigo, self.cache_arboles)
         self._validar_arbol_sintaxis(arbol)
         self.arbol = arbol
 
@@ -251,6 +317,7 @@ class AnalizadorCodigo:
             clases=clases
         )
 
+    @fase("contar clases")
     def _analizar_clases(
             self,
             arbol: ArbolArchivoPython) -> List[MetricasClase]:
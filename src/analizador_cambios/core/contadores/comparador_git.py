@@ -0,0 +1,150 @@
+"""
+Nombre del módulo: comparador_git.py
+Ruta: analizador_cambios/core/contadores/comparador_git.py
+Descripción: Compara los archivos Python que cambian entre dos revisiones de
+             un repositorio git
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - analizador_cambios.core.arbol.comparador_principal
+    - analizador_cambios.core.contadores.analizador.AnalizadorCodigo
+    - analizador_cambios.core.contadores.comparador_lote
+    - analizador_cambios.core.gestion_archivos.lector_git.LectorGit
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
+
+Uso:
+    from analizador_cambios.core.contadores.comparador_git import (
+        ComparadorGit
+    )
+
+    comparador = ComparadorGit()
+    for resultado in comparador.comparar_revisiones(".", "v1.0", "v1.1",
+                                                    "salida"):
+        print(resultado.nombre_archivo, resultado.conteo)
+
+Notas:
+    - Solo se comparan los archivos que git reporta como cambiados, y su
+      contenido se analiza en memoria sin hacer checkout
+    - Los resultados y los archivos comentados siguen el mismo formato que la
+      comparación de directorios
+"""
+
+from typing import Iterator, Optional
+
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO
+)
+from analizador_cambios.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from analizador_cambios.core.contadores.comparador_lote import (
+    ResultadoPar, Version, comparar_versiones, crear_version_vacia
+)
+from analizador_cambios.core.gestion_archivos.lector_git import (
+    ExcepcionGit, LectorGit
+)
+from analizador_cambios.utils.formateador_linea import ExcepcionFormateo
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+
+
+class ComparadorGit:
+    """
+    Compara dos revisiones de un repositorio git archivo por archivo.
+
+    Attributes:
+        algoritmo (str): Algoritmo de comparación de ComparadorVersiones
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida;
+            un archivo que no cambió entre dos comparaciones no se vuelve a
+            construir
+
+    Methods:
+        comparar_revisiones(ruta_repositorio: str, revision1: str,
+                            revision2: str,
+                            ruta_salida: str) -> Iterator[ResultadoPar]:
+            Compara los archivos .py cambiados entre dos revisiones.
+
+    Example:
+        >>> comparador = ComparadorGit("lcs")
+        >>> list(comparador.comparar_revisiones(".", "HEAD~1", "HEAD",
+        ...                                     "salida"))
+    """
+
+    def __init__(
+            self,
+            algoritmo: str = ALGORITMO_PREDETERMINADO,
+            cache_arboles: Optional[CacheArboles] = None):
+        self.algoritmo = algoritmo
+        self.cache_arboles = cache_arboles
+
+    def comparar_revisiones(
+            self,
+            ruta_repositorio: str,
+            revision1: str,
+            revision2: str,
+            ruta_salida: str) -> Iterator[ResultadoPar]:
+        """
+        Compara los archivos .py que cambian entre dos revisiones.
+
+        Args:
+            ruta_repositorio (str): Ruta del repositorio git
+            revision1 (str): Revisión original
+            revision2 (str): Revisión nueva
+            ruta_salida (str): Directorio donde se escriben los comentados
+
+        Returns:
+            Iterator[ResultadoPar]: Un resultado por archivo cambiado
+
+        Raises:
+            ExcepcionGit: Si no se pueden listar los cambios entre revisiones
+
+        Example:
+            >>> for resultado in comparar_revisiones(".", "v1", "v2", "out"):
+            ...     print(resultado.nombre_archivo)
+        """
+        with LectorGit(ruta_repositorio) as lector:
+            for _, ruta1, ruta2 in lector.archivos_modificados(revision1,
+                                                               revision2):
+                nombre_archivo = ruta2 if ruta2 is not None else ruta1
+                try:
+                    yield comparar_versiones(
+                        self._analizar_version(lector, revision1, ruta1,
+                                               nombre_archivo),
+                        self._analizar_version(lector, revision2, ruta2,
+                                               nombre_archivo),
+                        nombre_archivo, ruta_salida, self.algoritmo)
+                except (ExcepcionAnalizador, ExcepcionFormateo,
+                        ExcepcionGit) as e:
+                    yield ResultadoPar(nombre_archivo, error=str(e))
+                except Exception as e:
+                    yield ResultadoPar(nombre_archivo,
+                                       error=f"Error inesperado: {str(e)}")
+
+    def _analizar_version(
+            self,
+            lector: LectorGit,
+            revision: str,
+            ruta: Optional[str],
+            nombre_archivo: str) -> Version:
+        """
+        Analiza en memoria un archivo de una revisión.
+
+        Args:
+            lector (LectorGit): Lector abierto sobre el repositorio
+            revision (str): Revisión del archivo
+            ruta (Optional[str]): Ruta en la revisión o None si no existe
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            Version: Analizador con el árbol y el código, y sus métricas
+        """
+        if ruta is None:
+            return crear_version_vacia()
+        analizador = AnalizadorCodigo(self.cache_arboles)
+        lineas = lector.leer_lineas(revision, ruta)
+        return analizador, analizador.obtener_metricas_codigo(lineas,
+                                                              nombre_archivo)
@@ -0,0 +1,426 @@
+"""
+Nombre del módulo: comparador_lote.py
+Ruta: analizador_cambios/core/contadores/comparador_lote.py
+Descripción: Compara en paralelo dos directorios de archivos Python,
+             emparejando los archivos por ruta relativa
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - concurrent.futures.ProcessPoolExecutor (con más de un trabajador)
+    - analizador_cambios.core.arbol.arbol_sintactico.ArbolArchivoPython
+    - analizador_cambios.core.arbol.comparador_principal
+    - analizador_cambios.core.contadores.analizador.AnalizadorCodigo
+    - analizador_cambios.core.gestion_archivos.escribir_cambios
+    - contador_lineas.core.contadores.analizador_lote (AnalizadorLote,
+      agrupar, ejecutar_por_grupos)
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
+    - contador_lineas.utils.archivo_utils.escribir_python
+
+Uso:
+    from analizador_cambios.core.contadores.comparador_lote import (
+        ComparadorLote
+    )
+
+    comparador = ComparadorLote(trabajadores=4)
+    for resultado in comparador.comparar_directorios("v1", "v2", "salida"):
+        print(resultado.nombre_archivo, resultado.conteo)
+
+Notas:
+    - Los directorios se recorren de forma recursiva y los pares se forman
+      mientras se recorren, sin cargar antes la lista completa de archivos
+    - Un archivo que solo existe en un directorio se compara contra una
+      versión vacía, así que cuenta como borrado o agregado por completo
+    - Los archivos comentados se escriben en salida/original y salida/nueva
+      conservando la ruta relativa, sin tocar los directorios comparados
+"""
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from analizador_cambios.core.arbol.arbol_sintactico import ArbolArchivoPython
+from analizador_cambios.core.arbol.comparador_principal import (
+    ALGORITMO_PREDETERMINADO, ComparadorVersiones
+)
+from analizador_cambios.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from analizador_cambios.core.gestion_archivos.escribir_cambios import (
+    EscribirCambios
+)
+from analizador_cambios.utils.formateador_linea import ExcepcionFormateo
+from contador_lineas.core.contadores.analizador_lote import (
+    AnalizadorLote, agrupar, ejecutar_por_grupos
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.utils.archivo_utils import escribir_python
+from lineas_por_clase.models.metricas import MetricasArchivo
+
+# Pares enviados a un proceso en cada tarea; comparar es más costoso que
+# contar, así que los grupos son menores que en contador_lineas
+TAMANO_GRUPO = 8
+
+# Subdirectorios de la salida para cada versión
+DIRECTORIO_ORIGINAL = "original"
+DIRECTORIO_NUEVA = "nueva"
+
+# Par a comparar: (ruta_original, ruta_nueva, nombre_archivo); una ruta es
+# None si el archivo no existe en esa versión
+ParArchivos = Tuple[Optional[str], Optional[str], str]
+
+# Versión analizada de un archivo: el analizador con su árbol y código, y sus
+# métricas, que son None si el archivo no existe en esa versión
+Version = Tuple[AnalizadorCodigo, Optional[MetricasArchivo]]
+
+
+@dataclass
+class ResultadoPar:
+    """
+    Resultado de comparar un par de archivos dentro de un lote.
+
+    Attributes:
+        nombre_archivo (str): Ruta relativa común a ambas versiones
+        metricas (List[MetricasArchivo]): Métricas de las versiones que
+            existen, primero la original
+        conteo (Tuple[int, int, int]): Líneas (agregadas, modificadas,
+            borradas) según ComparadorVersiones.contar_cambios
+        error (Optional[str]): Mensaje de error o None si fue exitoso
+
+    Example:
+        >>> ResultadoPar("pkg/mod.py", [metricas1, metricas2], (3, 1, 0))
+    """
+
+    nombre_archivo: str
+    metricas: List[MetricasArchivo] = field(default_factory=list)
+    conteo: Tuple[int, int, int] = (0, 0, 0)
+    error: Optional[str] = None
+
+
+def _clave_recorrido(nombre_archivo: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Obtiene la clave que ordena las rutas relativas como os.walk ordenado.
+
+    Args:
+        nombre_archivo (str): Ruta relativa con separadores '/'
+
+    Returns:
+        Tuple[Tuple[int, str], ...]: Un par por componente; los archivos de
+            un directorio van antes que sus subdirectorios
+
+    Example:
+        >>> _clave_recorrido("pkg/mod.py")
+        ((1, 'pkg'), (0, 'mod.py'))
+    """
+    *directorios, archivo = nombre_archivo.split("/")
+    return tuple((1, directorio) for directorio in directorios) + \
+        ((0, archivo),)
+
+
+def emparejar(
+        originales: Iterable[Tuple[str, str]],
+        nuevos: Iterable[Tuple[str, str]]) -> Iterator[ParArchivos]:
+    """
+    Empareja por ruta relativa dos recorridos de descubrir_archivos.
+
+    Args:
+        originales (Iterable[Tuple[str, str]]): Pares (ruta, nombre) de la
+            versión original, en el orden de AnalizadorLote
+        nuevos (Iterable[Tuple[str, str]]): Pares (ruta, nombre) de la
+            versión nueva, en el mismo orden
+
+    Returns:
+        Iterator[ParArchivos]: Pares en el orden del recorrido
+
+    Example:
+        >>> list(emparejar([("v1/a.py", "a.py")], [("v2/b.py", "b.py")]))
+        [('v1/a.py', None, 'a.py'), (None, 'v2/b.py', 'b.py')]
+    """
+    # Ambos recorridos llegan ordenados por la misma clave, así que basta una
+    # mezcla que avanza el menor; nunca se guardan los directorios completos
+    originales, nuevos = iter(originales), iter(nuevos)
+    original = next(originales, None)
+    nuevo = next(nuevos, None)
+    while original is not None or nuevo is not None:
+        if nuevo is None or (original is not None and
+                             _clave_recorrido(original[1])
+                             < _clave_recorrido(nuevo[1])):
+            yield original[0], None, original[1]
+            original = next(originales, None)
+        elif original is None or original[1] != nuevo[1]:
+            yield None, nuevo[0], nuevo[1]
+            nuevo = next(nuevos, None)
+        else:
+            yield original[0], nuevo[0], nuevo[1]
+            original = next(originales, None)
+            nuevo = next(nuevos, None)
+
+
+def obtener_ruta_comentada(ruta_archivo: Path) -> Path:
+    """
+    Obtiene la ruta del archivo comentado junto a la ruta indicada.
+
+    Args:
+        ruta_archivo (Path): Ruta del archivo comparado
+
+    Returns:
+        Path: Misma carpeta con el sufijo _comentado antes de la extensión
+
+    Example:
+        >>> obtener_ruta_comentada(Path("src/mod.py"))
+        PosixPath('src/mod_comentado.py')
+    """
+    return ruta_archivo.parent / \
+        f"{ruta_archivo.stem}_comentado{ruta_archivo.suffix}"
+
+
+def crear_version_vacia() -> Version:
+    """
+    Crea la versión de un archivo que no existe.
+
+    Returns:
+        Version: Analizador sin líneas y sin métricas
+    """
+    # Un archivo vacío no pasa la validación del estándar, así que la
+    # versión inexistente se arma directamente sin líneas
+    analizador = AnalizadorCodigo()
+    analizador.codigo = []
+    analizador.arbol = ArbolArchivoPython([])
+    return analizador, None
+
+
+def _analizar_version(
+        ruta_archivo: Optional[str],
+        nombre_archivo: str,
+        cache_arboles: Optional[CacheArboles] = None) -> Version:
+    """
+    Analiza una versión de un archivo, o crea una versión vacía.
+
+    Args:
+        ruta_archivo (Optional[str]): Ruta del archivo o None si no existe
+        nombre_archivo (str): Nombre con el que se registran las métricas
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        Version: Analizador con el árbol y el código, y sus métricas
+    """
+    if ruta_archivo is None:
+        return crear_version_vacia()
+    analizador = AnalizadorCodigo(cache_arboles)
+    return analizador, analizador.obtener_metricas(ruta_archivo,
+                                                   nombre_archivo)
+
+
+def _escribir_comentado(
+        ruta_salida: Path,
+        nombre_archivo: str,
+        codigo: List[str]) -> None:
+    """
+    Escribe un archivo comentado dentro del árbol de salida.
+
+    Args:
+        ruta_salida (Path): Directorio de la versión dentro de la salida
+        nombre_archivo (str): Ruta relativa del archivo comparado
+        codigo (List[str]): Líneas comentadas
+
+    Raises:
+        ExcepcionAnalizador: Si no se pudo escribir el archivo
+    """
+    ruta = obtener_ruta_comentada(ruta_salida / nombre_archivo)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    error = escribir_python(ruta, codigo)
+    if error:
+        raise ExcepcionAnalizador(f"Error al escribir {ruta}: {error}")
+
+
+def comparar_versiones(
+        version1: Version,
+        version2: Version,
+        nombre_archivo: str,
+        ruta_salida: str,
+        algoritmo: str) -> ResultadoPar:
+    """
+    Compara dos versiones analizadas y escribe sus copias comentadas.
+
+    Args:
+        version1 (Version): Versión original
+        version2 (Version): Versión nueva
+        nombre_archivo (str): Ruta relativa del archivo
+        ruta_salida (str): Directorio raíz de la salida
+        algoritmo (str): Algoritmo de comparación
+
+    Returns:
+        ResultadoPar: Métricas y conteo de cambios del par
+
+    Example:
+        >>> comparar_versiones(version1, crear_version_vacia(), "mod.py",
+        ...                    "salida", "voraz")
+    """
+    analizador1, metricas1 = version1
+    analizador2, metricas2 = version2
+
+    comparador = ComparadorVersiones(algoritmo)
+    cambios = comparador.comparar_archivos(analizador1.arbol, analizador2.arbol)
+    codigo_1, codigo_2 = EscribirCambios().escribir(analizador1, analizador2,
+                                                    cambios)
+
+    # Solo se escriben las versiones que existen
+    salida = Path(ruta_salida)
+    if metricas1 is not None:
+        _escribir_comentado(salida / DIRECTORIO_ORIGINAL, nombre_archivo,
+                            codigo_1)
+    if metricas2 is not None:
+        _escribir_comentado(salida / DIRECTORIO_NUEVA, nombre_archivo,
+                            codigo_2)
+
+    return ResultadoPar(
+        nombre_archivo,
+        [metricas for metricas in (metricas1, metricas2)
+         if metricas is not None],
+        comparador.contar_cambios(cambios))
+
+
+def _comparar_par(
+        par: ParArchivos,
+        ruta_salida: str,
+        algoritmo: str,
+        cache_arboles: Optional[CacheArboles] = None) -> ResultadoPar:
+    """
+    Compara un par de archivos y escribe sus versiones comentadas.
+
+    Args:
+        par (ParArchivos): Rutas de ambas versiones y nombre relativo
+        ruta_salida (str): Directorio raíz de la salida
+        algoritmo (str): Algoritmo de comparación
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        ResultadoPar: Métricas y conteo de cambios del par
+    """
+    ruta_original, ruta_nueva, nombre_archivo = par
+    return comparar_versiones(
+        _analizar_version(ruta_original, nombre_archivo, cache_arboles),
+        _analizar_version(ruta_nueva, nombre_archivo, cache_arboles),
+        nombre_archivo, ruta_salida, algoritmo)
+
+
+def _comparar_grupo(
+        pares: List[ParArchivos],
+        ruta_salida: str,
+        algoritmo: str,
+        cache_arboles: Optional[CacheArboles] = None) -> List[ResultadoPar]:
+    """
+    Compara un grupo de pares dentro de un proceso trabajador.
+
+    Args:
+        pares (List[ParArchivos]): Pares a comparar
+        ruta_salida (str): Directorio raíz de la salida
+        algoritmo (str): Algoritmo de comparación
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        List[ResultadoPar]: Resultado de cada par del grupo
+    """
+    # Debe ser una función de módulo para que el pool pueda serializarla
+    resultados = []
+    for par in pares:
+        nombre_archivo = par[2]
+        try:
+            resultados.append(_comparar_par(par, ruta_salida, algoritmo,
+                                            cache_arboles))
+        except (ExcepcionAnalizador, ExcepcionFormateo) as e:
+            resultados.append(ResultadoPar(nombre_archivo, error=str(e)))
+        except Exception as e:
+            resultados.append(ResultadoPar(
+                nombre_archivo, error=f"Error inesperado: {str(e)}"))
+    return resultados
+
+
+class ComparadorLote:
+    """
+    Compara todos los archivos Python de dos directorios.
+
+    Attributes:
+        trabajadores (int): Número de procesos trabajadores
+        tamano_grupo (int): Pares enviados por tarea
+        algoritmo (str): Algoritmo de comparación de ComparadorVersiones
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Methods:
+        emparejar_archivos(ruta_original: str,
+                           ruta_nueva: str) -> Iterator[ParArchivos]:
+            Empareja los archivos de ambos directorios por ruta relativa.
+        comparar_directorios(ruta_original: str, ruta_nueva: str,
+                             ruta_salida: str) -> Iterator[ResultadoPar]:
+            Compara los pares y entrega resultados conforme terminan.
+
+    Example:
+        >>> comparador = ComparadorLote(trabajadores=2)
+        >>> list(comparador.comparar_directorios("v1", "v2", "salida"))
+    """
+
+    def __init__(
+            self,
+            trabajadores: Optional[int] = None,
+            tamano_grupo: int = TAMANO_GRUPO,
+            algoritmo: str = ALGORITMO_PREDETERMINADO,
+            cache_arboles: Optional[CacheArboles] = None):
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.tamano_grupo = tamano_grupo
+        self.algoritmo = algoritmo
+        self.cache_arboles = cache_arboles
+
+    def emparejar_archivos(
+            self,
+            ruta_original: str,
+            ruta_nueva: str) -> Iterator[ParArchivos]:
+        """
+        Empareja los archivos .py de ambos directorios por ruta relativa.
+
+        Args:
+            ruta_original (str): Directorio de la versión original
+            ruta_nueva (str): Directorio de la versión nueva
+
+        Returns:
+            Iterator[ParArchivos]: Pares en el orden de recorrido de
+                AnalizadorLote.descubrir_archivos
+
+        Example:
+            >>> list(emparejar_archivos("v1", "v2"))
+            [('v1/mod.py', 'v2/mod.py', 'mod.py'), (None, 'v2/nuevo.py',
+             'nuevo.py')]
+        """
+        descubridor = AnalizadorLote(trabajadores=1)
+        return emparejar(descubridor.descubrir_archivos(ruta_original, True),
+                         descubridor.descubrir_archivos(ruta_nueva, True))
+
+    def comparar_directorios(
+            self,
+            ruta_original: str,
+            ruta_nueva: str,
+            ruta_salida: str) -> Iterator[ResultadoPar]:
+        """
+        Compara los pares de archivos repartiéndolos entre procesos.
+
+        Args:
+            ruta_original (str): Directorio de la versión original
+            ruta_nueva (str): Directorio de la versión nueva
+            ruta_salida (str): Directorio donde se escriben los comentados
+
+        Returns:
+            Iterator[ResultadoPar]: Resultados en el orden en que terminan
+
+        Example:
+            >>> for resultado in comparar_directorios("v1", "v2", "salida"):
+            ...     print(resultado.nombre_archivo)
+        """
+        grupos = agrupar(self.emparejar_archivos(ruta_original, ruta_nueva),
+                         self.tamano_grupo)
+        return ejecutar_por_grupos(_comparar_grupo, grupos, self.trabajadores,
+                                   ruta_salida, self.algoritmo,
+                                   self.cache_arboles)
@@ -7,12 +7,13 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 28-11-2024
-Última Actualización: 30-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing.List, Tuple
     - analizador_cambios.core.contadores.analizador
     - analizador_cambios.models.cambios
+    - contador_lineas.utils.perfil.fase
 
 Uso:
     from analizador_cambios.core.gestion_archivos.escribir_cambios import (
@@ -27,6 +28,7 @@ from typing import List, Tuple
 from analizador_cambios.core.contadores.analizador import AnalizadorCodigo
 from analizador_cambios.models.cambios import TipoCambio
 from analizador_cambios.models.cambios import Cambio
+from contador_lineas.utils.perfil import fase
 
 
 class EscribirCambios:
@@ -47,6 +49,7 @@ class EscribirCambios:
         >>> codigo1, codigo2 = escritor.escribir(analisis1, analisis2, cambios)
     """
 
+    @fase("anotar cambios")
     def escribir(
             self,
             analisis_1: AnalizadorCodigo,
@@ -0,0 +1,265 @@
+"""
+Nombre del módulo: lector_git.py
+Ruta: analizador_cambios/core/gestion_archivos/lector_git.py
+Descripción: Lee archivos Python de revisiones de un repositorio git sin
+             modificar su directorio de trabajo
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - io.StringIO
+    - subprocess
+
+Uso:
+    from analizador_cambios.core.gestion_archivos.lector_git import LectorGit
+
+    with LectorGit("repositorio") as lector:
+        for estado, ruta1, ruta2 in lector.archivos_modificados("v1", "v2"):
+            lineas = lector.leer_lineas("v2", ruta2)
+
+Notas:
+    - Requiere el ejecutable git en el PATH
+    - Los contenidos se piden a un único proceso git cat-file --batch que
+      vive mientras el lector esté abierto, en lugar de lanzar un proceso
+      por archivo
+    - Nunca hace checkout; solo lee objetos del repositorio
+"""
+
+import subprocess
+from io import StringIO
+from typing import List, Optional, Tuple
+
+# Cambio entre revisiones: (estado, ruta_original, ruta_nueva); la ruta de
+# una versión es None si el archivo no existe en ella
+CambioGit = Tuple[str, Optional[str], Optional[str]]
+
+EXTENSION_PYTHON = '.py'
+
+
+class ExcepcionGit(Exception):
+    """
+    Excepción para errores al consultar un repositorio git.
+
+    Example:
+        >>> raise ExcepcionGit("Revisión desconocida: v9")
+    """
+
+    pass
+
+
+class LectorGit:
+    """
+    Lee los archivos Python modificados entre dos revisiones de git.
+
+    Attributes:
+        ruta_repositorio (str): Ruta del repositorio git
+        codificacion (str): Codificación de los archivos
+
+    Methods:
+        archivos_modificados(revision1: str,
+                             revision2: str) -> List[CambioGit]:
+            Lista los archivos .py que cambian entre dos revisiones.
+        leer_lineas(revision: str, ruta: str) -> List[str]:
+            Obtiene las líneas de un archivo en una revisión.
+        cerrar() -> None:
+            Termina el proceso git cat-file.
+
+    Example:
+        >>> with LectorGit(".") as lector:
+        ...     lector.leer_lineas("HEAD", "setup.py")
+    """
+
+    def __init__(self, ruta_repositorio: str, codificacion: str = 'utf-8'):
+        self.ruta_repositorio = ruta_repositorio
+        self.codificacion = codificacion
+        self._proceso: Optional[subprocess.Popen] = None
+
+    def __enter__(self) -> 'LectorGit':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def archivos_modificados(
+            self,
+            revision1: str,
+            revision2: str) -> List[CambioGit]:
+        """
+        Lista los archivos .py que cambian entre dos revisiones.
+
+        Args:
+            revision1 (str): Revisión original
+            revision2 (str): Revisión nueva
+
+        Returns:
+            List[CambioGit]: Cambios en el orden que reporta git
+
+        Raises:
+            ExcepcionGit: Si git falla o alguna revisión no existe
+
+        Example:
+            >>> lector.archivos_modificados("v1.0", "v1.1")
+            [('M', 'pkg/mod.py', 'pkg/mod.py'), ('A', None, 'pkg/nuevo.py')]
+        """
+        salida = self._ejecutar_git(
+            "diff", "--name-status", "-z", "-M", "--no-ext-diff",
+            revision1, revision2, "--", f"*{EXTENSION_PYTHON}")
+
+        # Con -z cada campo termina en NUL; los renombrados y copiados traen
+        # dos rutas después del estado
+        campos = salida.split('\0')
+        cambios = []
+        posicion = 0
+        while posicion < len(campos) and campos[posicion]:
+            estado = campos[posicion]
+            if estado[0] in 'RC':
+                ruta1, ruta2 = campos[posicion + 1], campos[posicion + 2]
+                posicion += 3
+            else:
+                ruta1 = ruta2 = campos[posicion + 1]
+                posicion += 2
+            if estado[0] == 'A':
+                ruta1 = None
+            elif estado[0] == 'D':
+                ruta2 = None
+            ruta1, ruta2 = self._ruta_python(ruta1), self._ruta_python(ruta2)
+            if ruta1 is not None or ruta2 is not None:
+                cambios.append((estado[0], ruta1, ruta2))
+        return cambios
+
+    def leer_lineas(self, revision: str, ruta: str) -> List[str]:
+        """
+        Obtiene las líneas de un archivo en una revisión.
+
+        Args:
+            revision (str): Revisión de la que se lee el archivo
+            ruta (str): Ruta del archivo relativa al repositorio
+
+        Returns:
+            List[str]: Líneas con su salto de línea, como readlines()
+
+        Raises:
+            ExcepcionGit: Si el objeto no existe o no se puede decodificar
+
+        Example:
+            >>> lector.leer_lineas("HEAD", "pkg/mod.py")
+            ['def f():\\n', '    pass\\n']
+        """
+        contenido = self._leer_objeto(f"{revision}:{ruta}")
+        try:
+            texto = contenido.decode(self.codificacion)
+        except UnicodeDecodeError:
+            raise ExcepcionGit(f"Error de codificación en {revision}:{ruta}, "
+                               f"codificación esperada: {self.codificacion}")
+        # StringIO aplica la misma conversión de saltos de línea que leer el
+        # archivo en modo texto
+        return StringIO(texto, newline=None).readlines()
+
+    def cerrar(self) -> None:
+        """
+        Termina el proceso git cat-file si está abierto.
+        """
+        if self._proceso is not None:
+            self._proceso.stdin.close()
+            self._proceso.wait()
+            self._proceso.stdout.close()
+            self._proceso = None
+
+    def _leer_objeto(self, nombre_objeto: str) -> bytes:
+        """
+        Pide un objeto al proceso git cat-file --batch.
+
+        Args:
+            nombre_objeto (str): Nombre del objeto, como revision:ruta
+
+        Returns:
+            bytes: Contenido del objeto
+
+        Raises:
+            ExcepcionGit: Si el objeto no existe o el proceso terminó
+        """
+        if self._proceso is None:
+            self._proceso = self._iniciar_proceso(
+                "cat-file", "--batch", stdin=subprocess.PIPE)
+        entrada, salida = self._proceso.stdin, self._proceso.stdout
+        # Las rutas llegan de git con surrogateescape, así que se codifican
+        # igual para pedir exactamente los mismos bytes
+        entrada.write(nombre_objeto.encode('utf-8', 'surrogateescape') +
+                      b'\n')
+        entrada.flush()
+
+        # Cada respuesta es "<oid> <tipo> <tamaño>\n<contenido>\n" o
+        # "<nombre> missing\n"
+        encabezado = salida.readline().decode('utf-8').split()
+        if not encabezado:
+            raise ExcepcionGit("git cat-file terminó inesperadamente")
+        if encabezado[-1] in ('missing', 'ambiguous'):
+            raise ExcepcionGit(f"Objeto no encontrado: {nombre_objeto}")
+        tamano = int(encabezado[2])
+        contenido = salida.read(tamano)
+        salida.read(1)
+        return contenido
+
+    def _ejecutar_git(self, *argumentos: str) -> str:
+        """
+        Ejecuta un comando git y retorna su salida.
+
+        Args:
+            *argumentos (str): Argumentos después de git -C repositorio
+
+        Returns:
+            str: Salida estándar decodificada
+
+        Raises:
+            ExcepcionGit: Si git no existe o termina con error
+        """
+        proceso = self._iniciar_proceso(*argumentos, stdin=subprocess.DEVNULL,
+                                        stderr=subprocess.PIPE)
+        salida, errores = proceso.communicate()
+        if proceso.returncode != 0:
+            raise ExcepcionGit(f"Error de git: "
+                               f"{errores.decode('utf-8', 'replace').strip()}")
+        return salida.decode('utf-8', 'surrogateescape')
+
+    def _iniciar_proceso(
+            self,
+            *argumentos: str,
+            **opciones) -> subprocess.Popen:
+        """
+        Lanza git sobre el repositorio con la salida estándar en un pipe.
+
+        Args:
+            *argumentos (str): Argumentos después de git -C repositorio
+            **opciones: Opciones adicionales para subprocess.Popen
+
+        Returns:
+            subprocess.Popen: Proceso lanzado
+
+        Raises:
+            ExcepcionGit: Si el ejecutable git no existe
+        """
+        try:
+            return subprocess.Popen(
+                ["git", "-C", self.ruta_repositorio, *argumentos],
+                stdout=subprocess.PIPE, **opciones)
+        except FileNotFoundError:
+            raise ExcepcionGit("No se encontró el ejecutable git")
+
+    @staticmethod
+    def _ruta_python(ruta: Optional[str]) -> Optional[str]:
+        """
+        Descarta la ruta si no es de un archivo Python.
+
+        Args:
+            ruta (Optional[str]): Ruta a evaluar
+
+        Returns:
+            Optional[str]: La ruta si termina en .py, None en otro caso
+        """
+        if ruta is not None and ruta.endswith(EXTENSION_PYTHON):
+            return ruta
+        return None
@@ -0,0 +1,104 @@
+# tests/unit/arbol/test_comparador_arboles.py
+from difflib import SequenceMatcher
+
+import pytest
+
+from analizador_cambios.config.umbral import UMBRAL_SIMILITUD
+from analizador_cambios.core.arbol.arbol_sintactico import ArbolArchivoPython
+from analizador_cambios.core.arbol.comparador_arboles import ComparadorArboles
+from analizador_cambios.core.arbol.nodo import Nodo
+from contador_lineas.models.nodos import TipoNodo
+
+
+class TestSimilitud:
+    @pytest.fixture
+    def comparador(self):
+        return ComparadorArboles()
+
+    @pytest.mark.parametrize("str1, str2", [
+        ("x = calcular(1, 2)", "x = calcular(1, 3)"),
+        ("return total", "return totales"),
+        ("", ""),
+    ])
+    def test_ratio_completo_sobre_el_umbral(self, comparador, str1, str2):
+        similitud = comparador._calcular_similitud(str1, str2)
+        assert similitud == SequenceMatcher(None, str1, str2).ratio()
+        assert similitud >= UMBRAL_SIMILITUD
+        assert comparador.estadisticas.ratios_completos == 1
+
+    def test_descarte_por_longitud(self, comparador):
+        similitud = comparador._calcular_similitud("x = 1", "x = 1" * 10)
+        assert similitud < UMBRAL_SIMILITUD
+        assert comparador.estadisticas.descartes_longitud == 1
+        assert comparador.estadisticas.ratios_completos == 0
+
+    def test_descarte_por_quick_ratio(self, comparador):
+        similitud = comparador._calcular_similitud("abcdefgh", "stuvwxyz")
+        assert similitud < UMBRAL_SIMILITUD
+        assert comparador.estadisticas.descartes_quick_ratio == 1
+        assert comparador.estadisticas.ratios_completos == 0
+
+    def test_memoria_por_par_de_nodos(self, comparador):
+        nodo1 = Nodo(TipoNodo.ASSIGNMENT, "x = calcular(1, 2)", 0, 1)
+        nodo2 = Nodo(TipoNodo.ASSIGNMENT, "x = calcular(1, 3)", 0, 1)
+        primera = comparador._similitud_nodos(nodo1, nodo2)
+        assert comparador._similitud_nodos(nodo1, nodo2) == primera
+        comparador._similitud_nodos(nodo2, nodo1)
+
+        estadisticas = comparador.estadisticas
+        assert estadisticas.consultas == 3
+        assert estadisticas.aciertos_memo == 1
+        assert estadisticas.ratios_completos == 2
+        assert estadisticas.ratios_evitados == 1
+
+    def test_comparar_reinicia_estadisticas(self, comparador):
+        raiz1 = Nodo(TipoNodo.ROOT, "raiz", -1, -1)
+        raiz2 = Nodo(TipoNodo.ROOT, "raiz", -1, -1)
+        raiz1.agregar_hijo(Nodo(TipoNodo.ASSIGNMENT, "x = 1", 0, 0))
+        raiz2.agregar_hijo(Nodo(TipoNodo.ASSIGNMENT, "x = 2", 0, 0))
+        comparador._calcular_similitud("abc", "abd")
+        comparador.comparar(raiz1, raiz2)
+        assert comparador.estadisticas.consultas > 0
+        assert comparador.estadisticas.consultas == \
+            comparador.estadisticas.aciertos_memo + \
+            comparador.estadisticas.descartes_longitud + \
+            comparador.estadisticas.descartes_quick_ratio + \
+            comparador.estadisticas.ratios_completos
+
+
+class TestHashSubarbol:
+    CODIGO = ["def sumar(a, b):", "    total = a + b", "    return total",
+              "def restar(a, b):", "    return a - b"]
+
+    def test_codigo_igual_mismo_hash(self):
+        raiz1 = ArbolArchivoPython(self.CODIGO).raiz
+        raiz2 = ArbolArchivoPython(list(self.CODIGO)).raiz
+        assert raiz1.hash_subarbol is not None
+        assert raiz1.hash_subarbol == raiz2.hash_subarbol
+
+    def test_lineas_en_blanco_no_cambian_el_hash(self):
+        con_blancos = self.CODIGO[:3] + [""] + self.CODIGO[3:]
+        raiz1 = ArbolArchivoPython(self.CODIGO).raiz
+        raiz2 = ArbolArchivoPython(con_blancos).raiz
+        assert raiz1.hash_subarbol == raiz2.hash_subarbol
+
+    def test_cambio_en_hijo_cambia_ancestros(self):
+        modificado = list(self.CODIGO)
+        modificado[2] = "    return total * 2"
+        raiz1 = ArbolArchivoPython(self.CODIGO).raiz
+        raiz2 = ArbolArchivoPython(modificado).raiz
+        sumar1, restar1 = raiz1.hijos
+        sumar2, restar2 = raiz2.hijos
+        assert raiz1.hash_subarbol != raiz2.hash_subarbol
+        assert sumar1.hash_subarbol != sumar2.hash_subarbol
+        assert restar1.hash_subarbol == restar2.hash_subarbol
+
+    def test_subarboles_iguales_se_omiten(self):
+        modificado = list(self.CODIGO)
+        modificado[4] = "    return b - a"
+        comparador = ComparadorArboles()
+        cambios = comparador.comparar(
+            ArbolArchivoPython(self.CODIGO).raiz,
+            ArbolArchivoPython(modificado).raiz)
+        assert len(cambios) == 2
+        assert comparador.estadisticas.subarboles_iguales == 1
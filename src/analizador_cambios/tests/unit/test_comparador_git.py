@@ -0,0 +1,95 @@
+# tests/unit/contadores/test_comparador_git.py
+import shutil
+import subprocess
+
+import pytest
+
+from analizador_cambios.core.contadores.comparador_git import ComparadorGit
+from analizador_cambios.core.gestion_archivos.lector_git import (
+    ExcepcionGit, LectorGit
+)
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None,
+                                reason="git no está instalado")
+
+ORIGINAL = "def sumar(a, b):\n    return a + b\n"
+MODIFICADO = "def sumar(a, b):\n    return a + b + 1\n"
+
+
+def git(repositorio, *argumentos):
+    subprocess.run(["git", "-C", str(repositorio), *argumentos], check=True,
+                   capture_output=True)
+
+
+@pytest.fixture
+def repositorio(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "pkg").mkdir(parents=True)
+    git(repo, "init", "-q")
+    git(repo, "config", "user.email", "equipo3@example.com")
+    git(repo, "config", "user.name", "Equipo 3")
+    (repo / "pkg" / "mod.py").write_text(ORIGINAL, encoding="utf-8")
+    (repo / "viejo.py").write_text(ORIGINAL, encoding="utf-8")
+    (repo / "igual.py").write_text(ORIGINAL, encoding="utf-8")
+    (repo / "notas.txt").write_text("v1\n", encoding="utf-8")
+    git(repo, "add", ".")
+    git(repo, "commit", "-q", "-m", "v1")
+    git(repo, "tag", "v1")
+
+    (repo / "pkg" / "mod.py").write_text(MODIFICADO, encoding="utf-8")
+    (repo / "viejo.py").unlink()
+    (repo / "nuevo.py").write_bytes(b"def f(a):\r\n    return a\r\n")
+    (repo / "notas.txt").write_text("v2\n", encoding="utf-8")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "v2")
+    git(repo, "tag", "v2")
+    return repo
+
+
+class TestLectorGit:
+    def test_archivos_modificados(self, repositorio):
+        with LectorGit(str(repositorio)) as lector:
+            cambios = sorted(lector.archivos_modificados("v1", "v2"),
+                             key=lambda cambio: cambio[0])
+        assert cambios == [("A", None, "nuevo.py"),
+                           ("D", "viejo.py", None),
+                           ("M", "pkg/mod.py", "pkg/mod.py")]
+
+    def test_leer_lineas_de_varias_revisiones(self, repositorio):
+        with LectorGit(str(repositorio)) as lector:
+            assert lector.leer_lineas("v1", "pkg/mod.py") == \
+                ORIGINAL.splitlines(keepends=True)
+            assert lector.leer_lineas("v2", "pkg/mod.py") == \
+                MODIFICADO.splitlines(keepends=True)
+            assert lector.leer_lineas("v2", "nuevo.py") == \
+                ["def f(a):\n", "    return a\n"]
+
+    def test_objeto_inexistente(self, repositorio):
+        with LectorGit(str(repositorio)) as lector:
+            with pytest.raises(ExcepcionGit):
+                lector.leer_lineas("v2", "viejo.py")
+            # El proceso sigue disponible después de un objeto faltante
+            assert lector.leer_lineas("v1", "viejo.py")
+
+    def test_revision_desconocida(self, repositorio):
+        with pytest.raises(ExcepcionGit):
+            LectorGit(str(repositorio)).archivos_modificados("v1", "v9")
+
+
+class TestComparadorGit:
+    def test_compara_sin_tocar_el_directorio(self, repositorio, tmp_path):
+        (repositorio / "pkg" / "mod.py").write_text("sin confirmar\n",
+                                                    encoding="utf-8")
+        salida = tmp_path / "salida"
+        resultados = {
+            resultado.nombre_archivo: resultado
+            for resultado in ComparadorGit().comparar_revisiones(
+                str(repositorio), "v1", "v2", str(salida))
+        }
+        assert resultados["pkg/mod.py"].conteo == (0, 1, 1)
+        assert resultados["nuevo.py"].conteo == (2, 0, 0)
+        assert resultados["viejo.py"].conteo == (0, 0, 2)
+        assert (salida / "nueva" / "pkg" / "mod_comentado.py").exists()
+        assert (repositorio / "pkg" / "mod.py").read_text(
+            encoding="utf-8") == "sin confirmar\n"
+        assert not list(repositorio.rglob("*_comentado.py"))
@@ -0,0 +1,79 @@
+# tests/unit/arbol/test_comparador_lcs.py
+import pytest
+
+from analizador_cambios.core.arbol.alineacion_lcs import _myers, alinear
+from analizador_cambios.core.arbol.arbol_sintactico import ArbolArchivoPython
+from analizador_cambios.core.arbol.comparador_principal import (
+    ComparadorVersiones
+)
+from analizador_cambios.models.cambios import TipoCambio
+
+VERSION_ORIGINAL = """
+import os
+def sumar(a, b):
+    return a + b
+def restar(a, b):
+    return a - b
+x = sumar(1, 2)
+"""
+
+VERSION_NUEVA = """
+import os
+import sys
+def sumar(a, b):
+    return a + b
+def restar(a, c):
+    return a - c
+"""
+
+
+def comparar(original, nuevo, algoritmo):
+    arbol1 = ArbolArchivoPython(original.strip().split('\n'))
+    arbol2 = ArbolArchivoPython(nuevo.strip().split('\n'))
+    comparador = ComparadorVersiones(algoritmo)
+    cambios = comparador.comparar_archivos(arbol1, arbol2)
+    return comparador.contar_cambios(cambios), [
+        (cambio.tipo, cambio.posicion, round(cambio.medida_de_cambio, 2))
+        for cambio in cambios]
+
+
+class TestAlineacion:
+    def test_secuencias_iguales(self):
+        assert alinear(list("abc"), list("abc")) == [(0, 0), (1, 1), (2, 2)]
+
+    def test_elemento_desplazado(self):
+        assert alinear(list("xyz"), list("yzx")) == [(1, 0), (2, 1)]
+
+    def test_sin_elementos_comunes(self):
+        assert alinear(list("abc"), list("def")) == []
+
+    def test_elementos_repetidos(self):
+        pares = alinear(list("aabaa"), list("abaab"))
+        assert len(pares) == 4
+        assert all("aabaa"[i] == "abaab"[j] for i, j in pares)
+
+    def test_myers_es_optimo(self):
+        assert _myers("abcabba", "cbabac") == [(2, 0), (3, 2), (4, 3), (6, 4)]
+
+
+class TestComparadorLCS:
+    def test_algoritmo_desconocido(self):
+        with pytest.raises(ValueError):
+            ComparadorVersiones("otro")
+
+    def test_mismos_cambios_que_voraz(self):
+        assert comparar(VERSION_ORIGINAL, VERSION_NUEVA, "lcs") == \
+            comparar(VERSION_ORIGINAL, VERSION_NUEVA, "voraz")
+
+    def test_versiones_iguales(self):
+        conteo, cambios = comparar(VERSION_ORIGINAL, VERSION_ORIGINAL, "lcs")
+        assert conteo == (0, 0, 0)
+        assert cambios == []
+
+    def test_linea_modificada_entre_muchas(self):
+        original = "\n".join(f"valor_{i} = {i}" for i in range(300))
+        nuevo = original.replace("valor_150 = 150", "valor_150 = 1500")
+        conteo, cambios = comparar(original, nuevo, "lcs")
+        assert conteo == (0, 1, 1)
+        assert [tipo for tipo, _, _ in cambios] == \
+            [TipoCambio.BORRADA, TipoCambio.AGREGADA]
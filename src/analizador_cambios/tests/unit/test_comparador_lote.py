@@ -0,0 +1,100 @@
+# tests/unit/contadores/test_comparador_lote.py
+import pytest
+
+from analizador_cambios.core.contadores.comparador_lote import (
+    DIRECTORIO_NUEVA, DIRECTORIO_ORIGINAL, ComparadorLote, emparejar
+)
+
+ORIGINAL = """def sumar(a, b):
+    return a + b
+"""
+
+MODIFICADO = """def sumar(a, b):
+    return a + b + 1
+"""
+
+NUEVO = """def restar(a, b):
+    resultado = a - b
+    return resultado
+"""
+
+
+@pytest.fixture
+def directorios(tmp_path):
+    original = tmp_path / "v1"
+    nueva = tmp_path / "v2"
+    (original / "pkg").mkdir(parents=True)
+    (nueva / "pkg").mkdir(parents=True)
+    (original / "pkg" / "mod.py").write_text(ORIGINAL, encoding="utf-8")
+    (nueva / "pkg" / "mod.py").write_text(MODIFICADO, encoding="utf-8")
+    (original / "igual.py").write_text(ORIGINAL, encoding="utf-8")
+    (nueva / "igual.py").write_text(ORIGINAL, encoding="utf-8")
+    (original / "viejo.py").write_text(ORIGINAL, encoding="utf-8")
+    (nueva / "nuevo.py").write_text(NUEVO, encoding="utf-8")
+    return str(original), str(nueva), tmp_path / "salida"
+
+
+class TestComparadorLote:
+    def test_empareja_por_ruta_relativa(self, directorios):
+        original, nueva, _ = directorios
+        pares = list(ComparadorLote(1).emparejar_archivos(original, nueva))
+        # Mismo orden que descubrir_archivos: los archivos de un directorio
+        # antes que sus subdirectorios
+        assert [nombre for _, _, nombre in pares] == [
+            "igual.py", "nuevo.py", "viejo.py", "pkg/mod.py"]
+        assert pares[1][0] is None
+        assert pares[2][1] is None
+
+    def test_emparejar_mezcla_recorridos_anidados(self):
+        originales = [("1/z.py", "z.py"), ("1/a/b/x.py", "a/b/x.py"),
+                      ("1/c/y.py", "c/y.py")]
+        nuevos = [("2/a/w.py", "a/w.py"), ("2/a/b/x.py", "a/b/x.py"),
+                  ("2/b/v.py", "b/v.py")]
+        assert list(emparejar(originales, nuevos)) == [
+            ("1/z.py", None, "z.py"),
+            (None, "2/a/w.py", "a/w.py"),
+            ("1/a/b/x.py", "2/a/b/x.py", "a/b/x.py"),
+            (None, "2/b/v.py", "b/v.py"),
+            ("1/c/y.py", None, "c/y.py"),
+        ]
+
+    @pytest.mark.parametrize("trabajadores", [1, 2])
+    def test_conteo_por_par(self, directorios, trabajadores):
+        original, nueva, salida = directorios
+        resultados = {
+            resultado.nombre_archivo: resultado
+            for resultado in ComparadorLote(trabajadores).comparar_directorios(
+                original, nueva, str(salida))
+        }
+        assert all(resultado.error is None
+                   for resultado in resultados.values())
+        assert resultados["igual.py"].conteo == (0, 0, 0)
+        assert resultados["pkg/mod.py"].conteo == (0, 1, 1)
+        assert resultados["nuevo.py"].conteo == (3, 0, 0)
+        assert resultados["viejo.py"].conteo == (0, 0, 2)
+        assert len(resultados["pkg/mod.py"].metricas) == 2
+        assert len(resultados["nuevo.py"].metricas) == 1
+
+    def test_escribe_arbol_de_salida(self, directorios):
+        original, nueva, salida = directorios
+        list(ComparadorLote(1).comparar_directorios(original, nueva,
+                                                    str(salida)))
+        assert (salida / DIRECTORIO_ORIGINAL / "pkg" /
+                "mod_comentado.py").exists()
+        assert (salida / DIRECTORIO_NUEVA / "pkg" /
+                "mod_comentado.py").exists()
+        assert (salida / DIRECTORIO_NUEVA / "nuevo_comentado.py").exists()
+        assert not (salida / DIRECTORIO_ORIGINAL /
+                    "nuevo_comentado.py").exists()
+
+    def test_archivo_invalido_reporta_error(self, directorios):
+        original, nueva, salida = directorios
+        with open(f"{nueva}/igual.py", "w", encoding="utf-8") as archivo:
+            archivo.write("x = 1; y = 2\n")
+        resultados = {
+            resultado.nombre_archivo: resultado
+            for resultado in ComparadorLote(1).comparar_directorios(
+                original, nueva, str(salida))
+        }
+        assert resultados["igual.py"].error is not None
+        assert resultados["pkg/mod.py"].error is None
@@ -7,23 +7,41 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 20-11-2024
-Última Actualización: 20-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - argparse
-    - colorama.Init, Fore, Style
+    - contador_lineas.utils.colores.Fore, Style, iniciar_colores
+    - contador_lineas.utils.perfil.MODO_FASES, perfilar, tipo_modo_perfil
     - pathlib.Path
     - core.contadores.analizador.AnalizadorCodigo, ExcepcionAnalizador
+    - core.contadores.analizador_lote.AnalizadorLote
+    - core.contadores.vigilancia.Vigilancia
+    - core.gestion_archivos.cache_resultados.CacheResultados
+    - core.gestion_archivos.cache_arboles.CacheArboles
     - core.gestion_archivos.almacenamiento_metricas.AlmacenamientoMetricas
     - utils.formateador_metricas.mostrar_tabla_metricas
 
 Uso:
     >>> contador_lineas archivo.py [-t] [-tc]
+    >>> contador_lineas directorio [--recursivo] [--trabajadores N] [-t] [-tc]
+    >>> contador_lineas --vigilar directorio [--recursivo]
     
     Opciones:
-        archivo.py: Ruta del archivo a analizar
+        archivo.py: Ruta del archivo o directorio a analizar
         -t: Muestra tabla de LOC físicas y lógicas del archivo actual
         -tc: Muestra tabla de LOC físicas y lógicas de todos los archivos
+        --recursivo: Incluye subdirectorios al analizar un directorio
+        --trabajadores: Número de procesos para analizar un directorio
+        --sin-cache: No usa la caché de resultados por contenido (db/cache)
+        --cache-arboles: Directorio de la caché de árboles sintácticos
+                         compartida con lineas_por_clase y analizador_cambios
+        --vigilar: Vuelve a analizar los archivos del directorio cada vez que
+                   cambian, hasta interrumpir con Ctrl+C
+        --sin-color: Escribe la salida sin color y sin cargar colorama
+        --perfil[=MODO]: Muestra el tiempo de cada fase al terminar;
+                         --perfil=cprofile:RUTA guarda además un
+                         perfil completo de cProfile
 
 Notas:
     - Requiere permisos de lectura en archivos a analizar
@@ -31,17 +49,27 @@ Notas:
 
 import argparse
 from pathlib import Path
-from typing import Tuple
-
-from colorama import init, Fore, Style
+from typing import List, Optional, Tuple
 
 from contador_lineas.core.contadores.analizador import (
     AnalizadorCodigo, ExcepcionAnalizador
 )
+from contador_lineas.core.contadores.analizador_lote import AnalizadorLote
+from contador_lineas.core.contadores.vigilancia import (
+    CambioVigilado, Vigilancia, formatear_diferencia
+)
 from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
     AlmacenamientoMetricas
 )
+from contador_lineas.core.gestion_archivos.cache_resultados import (
+    CacheResultados
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.utils.colores import Fore, Style, iniciar_colores
 from contador_lineas.utils.formateador_metricas import mostrar_tabla_metricas
+from contador_lineas.utils.perfil import (
+    MODO_FASES, perfilar, tipo_modo_perfil
+)
 __version__ = "1.0.0"
 
 
@@ -87,7 +115,7 @@ def procesar_argumentos() -> argparse.Namespace:
         "ruta_archivo",
         type=str,
         nargs='?',
-        help="Ruta del archivo Python a analizar"
+        help="Ruta del archivo Python o directorio a analizar"
     )
     analizador.add_argument(
         "-t",
@@ -99,12 +127,62 @@ def procesar_argumentos() -> argparse.Namespace:
         action="store_true",
         help="Mostrar tabla de métricas de todos los archivos procesados"
     )
+    analizador.add_argument(
+        "--recursivo",
+        action="store_true",
+        help="Analizar también los subdirectorios del directorio indicado"
+    )
+    analizador.add_argument(
+        "--trabajadores",
+        type=int,
+        default=None,
+        help="Número de procesos para analizar un directorio"
+    )
+    analizador.add_argument(
+        "--sin-cache",
+        action="store_true",
+        help="Analizar sin consultar ni actualizar la caché de resultados"
+    )
+    analizador.add_argument(
+        "--cache-arboles",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Cargar y guardar los árboles sintácticos en una caché "
+             "compartida con lineas_por_clase y analizador_cambios"
+    )
+    analizador.add_argument(
+        "--vigilar",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Vigilar un directorio y volver a analizar los archivos que "
+             "cambien"
+    )
+    analizador.add_argument(
+        "--sin-color",
+        action="store_true",
+        help="Escribir la salida sin códigos de color"
+    )
+    analizador.add_argument(
+        "--perfil",
+        nargs="?",
+        const=MODO_FASES,
+        type=tipo_modo_perfil,
+        metavar="MODO",
+        help="Mostrar el tiempo de pared y de CPU de cada fase al terminar; "
+             "con cprofile:RUTA guarda además un perfil completo en RUTA"
+    )
     analizador.add_argument(
         "--dev-db-path",
         type=str,
         help=argparse.SUPPRESS,
         default="db/metricas_registro.json"
     )
+    analizador.add_argument(
+        "--dev-cache-path",
+        type=str,
+        help=argparse.SUPPRESS,
+        default="db/cache"
+    )
     return analizador.parse_args()
 
 
@@ -132,16 +210,59 @@ def validar_argumentos(args: argparse.Namespace) -> Tuple[bool, str]:
         >>> print(es_valido, error)
         True, ""
     """
+    # Los argumentos armados a mano pueden no incluir las opciones nuevas
+    vigilar = getattr(args, 'vigilar', None)
+    if vigilar:
+        if not Path(vigilar).is_dir():
+            return False, f"Error: '{vigilar}' no es un directorio"
+        return True, ""
     if not args.tc and not args.ruta_archivo:
         return False, "Error: Se requiere el archivo cuando no se usa -tc"
     return True, ""
 
 
+def crear_cache(args: argparse.Namespace) -> Optional[CacheResultados]:
+    """
+    Crea la caché de resultados indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
+
+    Returns:
+        Optional[CacheResultados]: Caché a usar o None si está desactivada
+
+    Example:
+        >>> cache = crear_cache(args)
+    """
+    if args.sin_cache:
+        return None
+    return CacheResultados(args.dev_cache_path, __version__)
+
+
+def crear_cache_arboles(args: argparse.Namespace) -> Optional[CacheArboles]:
+    """
+    Crea la caché de árboles indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
+
+    Returns:
+        Optional[CacheArboles]: Caché a usar o None si no se pidió
+
+    Example:
+        >>> cache_arboles = crear_cache_arboles(args)
+    """
+    ruta = getattr(args, 'cache_arboles', None)
+    return CacheArboles(ruta) if ruta else None
+
+
 def procesar_archivo(
         ruta_archivo: str,
         ruta_almacenamiento: str,
         almacen: AlmacenamientoMetricas,
-        mostrar_tabla: bool) -> None:
+        mostrar_tabla: bool,
+        cache: Optional[CacheResultados] = None,
+        cache_arboles: Optional[CacheArboles] = None) -> None:
     """
     Procesa un archivo individual y muestra resultados.
 
@@ -149,17 +270,21 @@ def procesar_archivo(
         ruta_archivo (str): Ruta del archivo a procesar
         almacen (AlmacenamientoMetricas): Almacenamiento de métricas
         mostrar_tabla (bool): Mostrar tabla de métricas
-        formatear (bool): Guardar archivo formateado
+        cache (Optional[CacheResultados]): Caché de resultados por contenido
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
 
     Example:
         >>> procesar_archivo("archivo.py", AlmacenamientoMetricas(), True)
     """
     nombre_archivo = obtener_nombre_archivo(ruta_archivo)
-    analizador = AnalizadorCodigo()
+    # Solo se necesitan las métricas, así que el archivo se lee en flujo
+    analizador = AnalizadorCodigo(cache, leer_en_flujo=True,
+                                  cache_arboles=cache_arboles)
     resultado = analizador.analizar_archivo(
         ruta_archivo,
         nombre_archivo,
-        ruta_almacenamiento)
+        ruta_almacenamiento,
+        almacen)
 
     if mostrar_tabla:
         mostrar_tabla_metricas([
@@ -167,20 +292,134 @@ def procesar_archivo(
         ])
 
 
-def main() -> None:
+def procesar_directorio(
+        ruta_directorio: str,
+        almacen: AlmacenamientoMetricas,
+        recursivo: bool,
+        trabajadores: Optional[int],
+        mostrar_tabla: bool,
+        cache: Optional[CacheResultados] = None,
+        cache_arboles: Optional[CacheArboles] = None) -> Tuple[int, int]:
     """
-    Punto de entrada principal del sistema de conteo de LOCs de código Python
+    Procesa todos los archivos Python de un directorio en paralelo.
+
+    Args:
+        ruta_directorio (str): Directorio a procesar
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        recursivo (bool): Incluir subdirectorios
+        trabajadores (Optional[int]): Número de procesos, None para usar todos
+        mostrar_tabla (bool): Mostrar tabla de métricas
+        cache (Optional[CacheResultados]): Caché de resultados por contenido
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        Tuple[int, int]: (archivos_procesados, archivos_con_error)
 
     Example:
-        >>> main()
+        >>> procesar_directorio("src", almacen, True, 4, False)
+        (120, 2)
+    """
+    analizador = AnalizadorLote(trabajadores, cache=cache,
+                                cache_arboles=cache_arboles)
+    # Las métricas solo se conservan para la tabla; sin ella, la memoria no
+    # crece con el número de archivos
+    metricas = []
+    procesados = errores = 0
+    # El lote guarda en memoria y escribe el registro una sola vez al final
+    with almacen.lote():
+        for resultado in analizador.analizar_directorio(ruta_directorio,
+                                                        recursivo):
+            if resultado.error:
+                errores += 1
+                print(f"{Fore.RED}{resultado.nombre_archivo}: "
+                      f"{resultado.error}{Style.RESET_ALL}")
+            else:
+                procesados += 1
+                almacen.guardar_metricas(resultado.metricas)
+                if mostrar_tabla:
+                    metricas.append(resultado.metricas)
+
+    if mostrar_tabla:
+        mostrar_tabla_metricas(metricas)
+    return procesados, errores
+
+
+def imprimir_cambios_vigilados(cambios: List[CambioVigilado]) -> None:
+    """
+    Imprime las métricas de los archivos que cambiaron y su diferencia.
+
+    Args:
+        cambios (List[CambioVigilado]): Cambios de un sondeo
+    """
+    for cambio in cambios:
+        if cambio.error:
+            print(f"{Fore.RED}{cambio.nombre_archivo}: "
+                  f"{cambio.error}{Style.RESET_ALL}")
+        elif cambio.actual is None:
+            print(f"{Fore.YELLOW}{cambio.nombre_archivo}: "
+                  f"borrado{Style.RESET_ALL}")
+        else:
+            anterior = cambio.anterior
+            fisicas = formatear_diferencia(
+                cambio.actual.lineas_fisicas,
+                anterior.lineas_fisicas if anterior else None)
+            logicas = formatear_diferencia(
+                cambio.actual.lineas_logicas,
+                anterior.lineas_logicas if anterior else None)
+            print(f"{cambio.nombre_archivo}: físicas {fisicas}, "
+                  f"lógicas {logicas}")
+
+
+def vigilar_directorio(
+        ruta_directorio: str,
+        almacen: AlmacenamientoMetricas,
+        recursivo: bool,
+        cache: Optional[CacheResultados] = None,
+        cache_arboles: Optional[CacheArboles] = None) -> None:
+    """
+    Vuelve a analizar los archivos del directorio cada vez que cambian.
+
+    Args:
+        ruta_directorio (str): Directorio a vigilar
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        recursivo (bool): Incluir subdirectorios
+        cache (Optional[CacheResultados]): Caché de resultados por contenido
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Example:
+        >>> vigilar_directorio("src", almacen, True)
+    """
+    analizador = AnalizadorCodigo(cache, cache_arboles=cache_arboles)
+    vigilancia = Vigilancia(ruta_directorio, analizador, almacen, recursivo)
+    cambios = vigilancia.sincronizar()
+    errores = [cambio for cambio in cambios if cambio.error]
+    imprimir_cambios_vigilados(errores)
+    imprimir_exito(f"Vigilando {len(cambios)} archivos en {ruta_directorio} "
+                   f"({vigilancia.ultima_duracion * 1000:.0f} ms); "
+                   "Ctrl+C para salir")
+
+    def al_cambiar(cambios: List[CambioVigilado]) -> None:
+        imprimir_cambios_vigilados(cambios)
+        print(f"Actualizado en {vigilancia.ultima_duracion * 1000:.1f} ms")
+
+    try:
+        vigilancia.vigilar(al_cambiar)
+    except KeyboardInterrupt:
+        imprimir_exito("Vigilancia terminada")
+
+
+def ejecutar(args: argparse.Namespace) -> None:
+    """
+    Ejecuta la acción indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
     """
-    init()
-    args = procesar_argumentos()
     almacen = AlmacenamientoMetricas(args.dev_db_path)
 
     # Caso especial: si solo se pide tabla completa (-tc), mostramos todas las
     # métricas y terminamos
-    if args.tc and not args.ruta_archivo:
+    if args.tc and not (args.ruta_archivo or args.vigilar):
         mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
         return
 
@@ -191,10 +430,32 @@ def main() -> None:
         print(f"{Fore.RED}{mensaje_error}{Style.RESET_ALL}")
         return
 
+    if args.vigilar:
+        vigilar_directorio(args.vigilar, almacen, args.recursivo,
+                           crear_cache(args), crear_cache_arboles(args))
+        return
+
+    if Path(args.ruta_archivo).is_dir():
+        procesados, errores = procesar_directorio(
+            args.ruta_archivo,
+            almacen,
+            args.recursivo,
+            args.trabajadores,
+            args.t,
+            crear_cache(args),
+            crear_cache_arboles(args))
+        imprimir_exito(f"¡{procesados} archivos procesados exitosamente!")
+        if errores:
+            print(f"{Fore.RED}{errores} archivos con errores{Style.RESET_ALL}")
+        if args.tc:
+            mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
+        return
+
     try:
         # Procesamos el archivo actual y opcionalmente mostramos la tabla
         # histórica si se solicitó
-        procesar_archivo(args.ruta_archivo, args.dev_db_path, almacen, args.t)
+        procesar_archivo(args.ruta_archivo, args.dev_db_path, almacen, args.t,
+                         crear_cache(args), crear_cache_arboles(args))
         imprimir_exito("¡Archivo procesado exitosamente!")
         if args.tc:
             mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
@@ -206,5 +467,20 @@ def main() -> None:
         print(f"{Fore.RED}Error inesperado: {str(e)}{Style.RESET_ALL}")
 
 
+def main() -> None:
+    """
+    Punto de entrada principal del sistema de conteo de LOCs de código Python
+
+    Example:
+        >>> main()
+    """
+    args = procesar_argumentos()
+    iniciar_colores(activar=not args.sin_color)
+    # El desglose por fases se imprime al terminar, incluso si la
+    # ejecución se interrumpe
+    with perfilar(args.perfil):
+        ejecutar(args)
+
+
 if __name__ == "__main__":
     main()
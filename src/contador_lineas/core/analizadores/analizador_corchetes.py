@@ -8,9 +8,10 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
+    - contador_lineas.core.analizadores.indice_lexico
     - contador_lineas.core.constantes.CORCHETES
 
 Uso:
@@ -29,6 +30,9 @@ Notas:
 
 from typing import Tuple
 
+from contador_lineas.core.analizadores.indice_lexico import (
+    obtener_indice_lexico
+)
 from contador_lineas.core.constantes import CORCHETES
 
 
@@ -74,6 +78,13 @@ class AnalizadorCorchetes:
             >>> encontrar_par_corchetes("(x + y)", 0, ('(', ')'))
             6
         """
+        # Los pares de corchetes ya están resueltos en el índice léxico de la
+        # línea; solo recorremos la línea si el par pedido no es el estándar
+        if (0 <= posicion_inicial < len(codigo) and
+                codigo[posicion_inicial] == corchetes[0] and
+                CORCHETES.get(corchetes[0]) == corchetes[1]):
+            return obtener_indice_lexico(codigo).par_corchete(posicion_inicial)
+
         try:
             caracter_apertura, caracter_cierre = corchetes
             # Usamos un contador para manejar corchetes anidados
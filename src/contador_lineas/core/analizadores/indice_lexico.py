@@ -0,0 +1,424 @@
+"""
+Nombre del módulo: indice_lexico.py
+Ruta: contador_lineas/core/analizadores/indice_lexico.py
+Descripción: Construye un índice léxico por línea (cadenas, comentario y pares
+             de corchetes) en una sola pasada de izquierda a derecha
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - bisect
+    - functools.lru_cache
+    - re
+
+Uso:
+    from contador_lineas.core.analizadores.indice_lexico import (
+        obtener_indice_lexico
+    )
+
+    indice = obtener_indice_lexico(linea)
+    indice.esta_en_cadena(posicion)
+
+Notas:
+    - Las consultas responden en O(1) u O(log n) a partir del índice
+    - Reproduce las reglas de AnalizadorCadenas y AnalizadorCorchetes
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Solo nos interesan las barras invertidas (en rachas), las comillas, el
+# inicio de comentario y los corchetes; el resto de caracteres se salta
+PATRON_LEXICO = re.compile(r"\\+|['\"#()\[\]{}]")
+
+COMILLAS = ("'", '"')
+OTRA_COMILLA = {"'": '"', '"': "'"}
+CIERRES_CORCHETES = {')': '(', ']': '[', '}': '{'}
+
+# Número de líneas distintas cuyo índice se conserva en memoria
+TAMANO_CACHE_INDICES = 2048
+
+
+class IndiceLexico:
+    """
+    Índice léxico de una línea de código construido en una sola pasada.
+
+    Attributes:
+        codigo (str): Línea indexada
+        pares_corchetes (Dict[int, int]): Apertura -> cierre por tipo
+        comentario (int): Posición donde inicia el comentario o -1
+
+    Methods:
+        esta_en_cadena(posicion: int, cerrado: bool) -> bool:
+            Verifica si una posición está dentro de una cadena.
+        encontrar_sin_comillas(subcadena: str, posicion_inicio: int,
+                               cerrado: bool) -> int:
+            Encuentra una subcadena fuera de comillas.
+        contar_sin_comillas(caracter: str) -> int:
+            Cuenta ocurrencias de un caracter fuera de comillas.
+        tiene_corchetes_sin_comillas() -> bool:
+            Verifica si hay corchetes fuera de cadenas cerradas.
+        balance_corchetes() -> int:
+            Calcula aperturas menos cierres de corchetes.
+        par_corchete(posicion: int) -> int:
+            Obtiene el corchete que cierra al de la posición dada.
+
+    Example:
+        >>> indice = IndiceLexico("x = '(' # )")
+        >>> indice.contar_sin_comillas('(')
+        0
+    """
+
+    def __init__(self, codigo: str):
+        self.codigo = codigo
+        self.pares_corchetes: Dict[int, int] = {}
+        # Tramos de cadena según el conteo alternado de comillas: las
+        # posiciones p con inicio < p <= fin están dentro de la cadena
+        self._inicios_cadena: List[int] = []
+        self._fines_cadena: List[int] = []
+        # Rachas de barras invertidas como intervalos [inicio, fin)
+        self._inicios_barras: List[int] = []
+        self._fines_barras: List[int] = []
+        # Comillas no escapadas leyendo hacia adelante (racha previa par)
+        self._comillas_libres: Dict[str, List[int]] = {"'": [], '"': []}
+        self._comillas_libres_todas: List[int] = []
+        # Comillas que pueden abrir una cadena al leer hacia atrás
+        self._aperturas_atras: List[int] = []
+        self._primera_atras: Dict[str, Optional[int]] = {"'": None, '"': None}
+        self._almohadillas: List[int] = []
+        self._corchetes: List[int] = []
+        self._segmentos: Optional[List[Tuple[int, int]]] = None
+        self._comentario: Optional[int] = None
+        self._conteos: Dict[str, int] = {}
+        self._construir()
+
+    def _construir(self) -> None:
+        """
+        Recorre la línea una sola vez registrando los eventos léxicos.
+        """
+        codigo = self.codigo
+        pilas_corchetes = {'(': [], '[': [], '{': []}
+        comilla_abierta = None
+        fin_barras = -1
+        barras_impares = False
+        comilla_pendiente = -1
+
+        for coincidencia in PATRON_LEXICO.finditer(codigo):
+            posicion = coincidencia.start()
+            caracter = codigo[posicion]
+
+            # Una comilla seguida de una racha impar de barras queda escapada
+            # para la lectura hacia atrás, así que la confirmamos aquí
+            if comilla_pendiente != -1:
+                self._confirmar_apertura_atras(
+                    comilla_pendiente,
+                    caracter == '\\' and posicion == comilla_pendiente + 1 and
+                    (coincidencia.end() - posicion) % 2 == 1
+                )
+                comilla_pendiente = -1
+
+            if caracter == '\\':
+                fin_barras = coincidencia.end()
+                barras_impares = (fin_barras - posicion) % 2 == 1
+                self._inicios_barras.append(posicion)
+                self._fines_barras.append(fin_barras)
+            elif caracter in COMILLAS:
+                comilla_pendiente = posicion
+                if posicion == fin_barras and barras_impares:
+                    continue
+                self._comillas_libres[caracter].append(posicion)
+                self._comillas_libres_todas.append(posicion)
+                # Alternamos el estado solo si no hay una cadena del otro tipo
+                # activa, igual que el conteo alternado original
+                if comilla_abierta is None:
+                    comilla_abierta = caracter
+                    self._inicios_cadena.append(posicion)
+                elif comilla_abierta == caracter:
+                    comilla_abierta = None
+                    self._fines_cadena.append(posicion)
+            elif caracter == '#':
+                self._almohadillas.append(posicion)
+            elif caracter in pilas_corchetes:
+                self._corchetes.append(posicion)
+                pilas_corchetes[caracter].append(posicion)
+            else:
+                self._corchetes.append(posicion)
+                pila = pilas_corchetes[CIERRES_CORCHETES[caracter]]
+                if pila:
+                    self.pares_corchetes[pila.pop()] = posicion
+
+        if comilla_pendiente != -1:
+            self._confirmar_apertura_atras(comilla_pendiente, False)
+        if comilla_abierta is not None:
+            self._fines_cadena.append(len(codigo))
+
+    def _confirmar_apertura_atras(self, posicion: int, escapada: bool) -> None:
+        """
+        Registra una comilla como posible apertura en la lectura hacia atrás.
+
+        Args:
+            posicion (int): Posición de la comilla
+            escapada (bool): Si la sigue una racha impar de barras
+        """
+        if escapada:
+            return
+        comilla = self.codigo[posicion]
+        # Una comilla solo abre si no hay antes una comilla del otro tipo
+        if self._primera_atras[OTRA_COMILLA[comilla]] is None:
+            self._aperturas_atras.append(posicion)
+        if self._primera_atras[comilla] is None:
+            self._primera_atras[comilla] = posicion
+
+    @property
+    def comentario(self) -> int:
+        """
+        Obtiene la posición del '#' que inicia el comentario o -1.
+        """
+        if self._segmentos is None:
+            self._calcular_segmentos()
+        return self._comentario
+
+    def esta_en_cadena(self, posicion: int, cerrado: bool = False) -> bool:
+        """
+        Verifica si una posición está dentro de una cadena de texto.
+
+        Args:
+            posicion (int): Posición a verificar
+            cerrado (bool): Si True, exige que la cadena esté cerrada
+
+        Returns:
+            bool: True si está dentro de comillas (y cerrada si cerrado=True)
+        """
+        if not cerrado:
+            return self._tramo_cadena(posicion) != -1
+        return self._esta_en_cadena_cerrada(posicion)
+
+    def encontrar_sin_comillas(
+            self,
+            subcadena: str,
+            posicion_inicio: int = 0,
+            cerrado: bool = False) -> int:
+        """
+        Encuentra una subcadena fuera de comillas.
+
+        Args:
+            subcadena (str): Texto a buscar
+            posicion_inicio (int): Posición inicial de búsqueda
+            cerrado (bool): Si True, exige que la cadena esté cerrada
+
+        Returns:
+            int: Posición donde se encuentra la subcadena o -1
+        """
+        codigo = self.codigo
+        posicion = posicion_inicio
+        while True:
+            posicion = codigo.find(subcadena, posicion)
+            if posicion == -1:
+                return -1
+            if cerrado:
+                if not self._esta_en_cadena_cerrada(posicion):
+                    return posicion
+                posicion += 1
+                continue
+            # Todas las coincidencias dentro del mismo tramo están en cadena,
+            # así que continuamos justo después de su comilla de cierre
+            tramo = self._tramo_cadena(posicion)
+            if tramo == -1:
+                return posicion
+            posicion = self._fines_cadena[tramo] + 1
+
+    def contar_sin_comillas(self, caracter: str) -> int:
+        """
+        Cuenta ocurrencias de un caracter fuera de comillas y comentarios.
+
+        Args:
+            caracter (str): Caracter a contar
+
+        Returns:
+            int: Número de ocurrencias encontradas
+        """
+        if caracter in self._conteos:
+            return self._conteos[caracter]
+        if self._segmentos is None:
+            self._calcular_segmentos()
+
+        # Las barras invertidas nunca se cuentan porque solo marcan escapes
+        if len(caracter) != 1 or caracter == '\\':
+            total = 0
+        else:
+            total = sum(self.codigo.count(caracter, inicio, fin)
+                        for inicio, fin in self._segmentos)
+        self._conteos[caracter] = total
+        return total
+
+    def tiene_corchetes_sin_comillas(self) -> bool:
+        """
+        Verifica si algún corchete queda fuera de una cadena cerrada.
+
+        Returns:
+            bool: True si hay al menos un corchete fuera de cadenas cerradas
+        """
+        return any(not self._esta_en_cadena_cerrada(posicion)
+                   for posicion in self._corchetes)
+
+    def balance_corchetes(self) -> int:
+        """
+        Calcula aperturas menos cierres de corchetes fuera de comillas.
+
+        Returns:
+            int: Balance de corchetes de la línea
+        """
+        return (self.contar_sin_comillas('(') +
+                self.contar_sin_comillas('[') +
+                self.contar_sin_comillas('{') -
+                self.contar_sin_comillas(')') -
+                self.contar_sin_comillas(']') -
+                self.contar_sin_comillas('}'))
+
+    def par_corchete(self, posicion: int) -> int:
+        """
+        Obtiene la posición del corchete que cierra al de la posición dada.
+
+        Args:
+            posicion (int): Posición del corchete de apertura
+
+        Returns:
+            int: Posición del corchete de cierre o -1
+        """
+        return self.pares_corchetes.get(posicion, -1)
+
+    def _tramo_cadena(self, posicion: int) -> int:
+        """
+        Obtiene el índice del tramo de cadena que contiene la posición o -1.
+        """
+        tramo = bisect_left(self._inicios_cadena, posicion) - 1
+        if tramo >= 0 and posicion <= self._fines_cadena[tramo]:
+            return tramo
+        return -1
+
+    def _racha_barras(self, posicion: int) -> int:
+        """
+        Obtiene el índice de la racha de barras que contiene la posición o -1.
+        """
+        racha = bisect_right(self._inicios_barras, posicion) - 1
+        if racha >= 0 and posicion < self._fines_barras[racha]:
+            return racha
+        return -1
+
+    def _esta_en_cadena_cerrada(self, posicion: int) -> bool:
+        """
+        Verifica si la posición está entre una apertura y un cierre válidos.
+        """
+        apertura = self._buscar_apertura(posicion)
+        if apertura == -1:
+            return False
+        return self._existe_cierre(self.codigo[apertura], posicion)
+
+    def _buscar_apertura(self, posicion: int) -> int:
+        """
+        Obtiene la comilla de apertura más cercana hacia atrás o -1.
+        """
+        # La racha de barras pegada a la posición se recorta en la posición, por
+        # eso el caracter previo a esa racha se evalúa por separado
+        anterior = posicion - 1
+        racha = self._racha_barras(anterior)
+        if racha != -1:
+            anterior = self._inicios_barras[racha] - 1
+        if anterior < 0:
+            return -1
+
+        comilla = self.codigo[anterior]
+        if comilla in COMILLAS and (posicion - 1 - anterior) % 2 == 0:
+            primera_otra = self._primera_atras[OTRA_COMILLA[comilla]]
+            if primera_otra is None or primera_otra > anterior:
+                return anterior
+
+        candidata = bisect_left(self._aperturas_atras, anterior) - 1
+        if candidata >= 0:
+            return self._aperturas_atras[candidata]
+        return -1
+
+    def _existe_cierre(self, comilla: str, posicion: int) -> bool:
+        """
+        Verifica si existe una comilla de cierre después de la posición.
+        """
+        siguiente = posicion + 1
+        racha = self._racha_barras(siguiente)
+        barras = 0
+        if racha != -1:
+            barras = self._fines_barras[racha] - siguiente
+            siguiente = self._fines_barras[racha]
+
+        if (siguiente < len(self.codigo) and
+                self.codigo[siguiente] == comilla and barras % 2 == 0):
+            return True
+        libres = self._comillas_libres[comilla]
+        return bisect_right(libres, siguiente) < len(libres)
+
+    def _calcular_segmentos(self) -> None:
+        """
+        Calcula los segmentos fuera de cadenas cerradas y antes del comentario.
+        """
+        segmentos = []
+        inicio_segmento = 0
+        actual = 0
+        self._comentario = -1
+
+        while True:
+            comilla = self._siguiente(self._comillas_libres_todas, actual)
+            almohadilla = self._siguiente(self._almohadillas, actual)
+
+            # El comentario tiene precedencia si aparece antes que la
+            # siguiente comilla, igual que en el conteo original
+            if almohadilla != -1 and (comilla == -1 or almohadilla < comilla):
+                self._comentario = almohadilla
+                segmentos.append((inicio_segmento, almohadilla))
+                break
+            if comilla == -1:
+                segmentos.append((inicio_segmento, len(self.codigo)))
+                break
+
+            # Una comilla sin pareja se trata como un caracter normal
+            cierre = self._siguiente(self._comillas_libres[self.codigo[comilla]],
+                                     comilla + 1)
+            if cierre == -1:
+                actual = comilla + 1
+                continue
+            segmentos.append((inicio_segmento, comilla))
+            inicio_segmento = actual = cierre + 1
+
+        self._segmentos = segmentos
+
+    @staticmethod
+    def _siguiente(posiciones: List[int], desde: int) -> int:
+        """
+        Obtiene la primera posición de la lista mayor o igual a 'desde' o -1.
+        """
+        indice = bisect_left(posiciones, desde)
+        if indice < len(posiciones):
+            return posiciones[indice]
+        return -1
+
+
+@lru_cache(maxsize=TAMANO_CACHE_INDICES)
+def obtener_indice_lexico(codigo: str) -> IndiceLexico:
+    """
+    Obtiene el índice léxico de una línea, reutilizándolo si ya existe.
+
+    Args:
+        codigo (str): Línea de código a indexar
+
+    Returns:
+        IndiceLexico: Índice construido o recuperado de la caché
+
+    Example:
+        >>> obtener_indice_lexico("x = '#'").comentario
+        -1
+    """
+    return IndiceLexico(codigo)
@@ -7,10 +7,12 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
-    - typing.Optional
+    - re
+    - functools.partial
+    - typing.Callable, Dict, List, Optional, Tuple
     - contador_lineas.core.analizadores.analizador_cadenas.AnalizadorCadenas
     - contador_lineas.models.nodos.TipoNodo
 
@@ -20,15 +22,68 @@ Uso:
     )
     analizador = AnalizadorTipoNodo()
     tipo = analizador.obtener_tipo_nodo(linea)
+
+Notas:
+    - La clasificación depende de las líneas ya vistas (por ejemplo, un def
+      después de una clase es un método); obtener_contexto y
+      restaurar_contexto permiten retomar el análisis desde una línea
+    - La primera palabra de la línea (o su primer carácter, si no empieza
+      con una) elige en un diccionario la única verificación que puede
+      aplicar; las búsquedas de comprensiones, ternarios y asignaciones
+      solo recorren las líneas que podrían contenerlos
+    - Las líneas cuya palabra no elige una verificación, o cuya
+      verificación falla (por ejemplo "breakfast = 1"), siguen el orden
+      original de reglas, así que la clasificación no cambia
 """
 
-from typing import Optional, List
+import re
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
 
 from contador_lineas.core.analizadores.analizador_cadenas import (
     AnalizadorCadenas
 )
 from contador_lineas.models.nodos import TipoNodo
 
+# Contexto del analizador: (en_clase, es_nivel_modulo, en_metodo,
+# clase_actual)
+ContextoAnalisis = Tuple[bool, bool, bool, Optional[str]]
+
+# Primera palabra de una línea sin espacios iniciales
+PATRON_PRIMERA_PALABRA = re.compile(r'\w+')
+
+# Estructuras que se reconocen solo por su prefijo, por primera palabra
+PREFIJOS_DIRECTOS: Dict[str, Tuple[str, TipoNodo]] = {
+    '#': ('#', TipoNodo.COMMENT),
+    'import': ('import ', TipoNodo.IMPORT),
+    'from': ('from ', TipoNodo.IMPORT),
+    'if': ('if ', TipoNodo.IF),
+    'elif': ('elif ', TipoNodo.ELIF),
+    'else': ('else:', TipoNodo.ELSE),
+    'for': ('for ', TipoNodo.FOR),
+    'while': ('while ', TipoNodo.WHILE),
+    'match': ('match ', TipoNodo.MATCH),
+    'case': ('case ', TipoNodo.CASE),
+}
+
+# Bloques en los que una comprensión de la línea tiene prioridad
+PREFIJOS_BLOQUES: Dict[str, Tuple[str, TipoNodo]] = {
+    'with': ('with ', TipoNodo.WITH),
+    'try': ('try:', TipoNodo.TRY),
+    'except': ('except', TipoNodo.EXCEPT),
+    'finally': ('finally:', TipoNodo.FINALLY),
+}
+
+# Sentencias de salto en las que una comprensión o un ternario de la línea
+# tienen prioridad
+PREFIJOS_SALTOS: Dict[str, Tuple[str, TipoNodo]] = {
+    'return': ('return ', TipoNodo.RETURN),
+    'break': ('break', TipoNodo.BREAK),
+    'continue': ('continue', TipoNodo.CONTINUE),
+    'raise': ('raise ', TipoNodo.RAISE),
+    'assert': ('assert ', TipoNodo.ASSERT),
+}
+
 
 class AnalizadorTipoNodo:
     """
@@ -50,6 +105,10 @@ class AnalizadorTipoNodo:
             Verifica si la línea contiene operaciones especiales.
         verificar_comprensiones(linea: str) -> Optional[TipoNodo]:
             Verifica si la línea contiene comprensiones.
+        obtener_contexto() -> ContextoAnalisis:
+            Obtiene el estado que influye en la clasificación.
+        restaurar_contexto(contexto: ContextoAnalisis) -> None:
+            Retoma un estado obtenido con obtener_contexto.
 
     Example:
         >>> analizador = AnalizadorTipoNodo()
@@ -61,6 +120,7 @@ class AnalizadorTipoNodo:
         self._es_nivel_modulo = True
         self._en_metodo = False
         self._clase_actual = None
+        self._despacho = self._crear_despacho()
 
     def obtener_tipo_nodo(self, linea: str) -> TipoNodo:
         """
@@ -81,61 +141,225 @@ class AnalizadorTipoNodo:
         if not linea:
             return TipoNodo.WHITE_SPACE
 
-        # Se procesa async primero para normalizar la línea y reutilizar la
-        # lógica existente
-        prefijo_async = self._remover_prefijo_async(linea)
-        if prefijo_async:
-            return self.obtener_tipo_nodo(prefijo_async)
+        palabra = PATRON_PRIMERA_PALABRA.match(linea)
+        clave = palabra.group() if palabra else linea[0]
+        verificar = self._despacho.get(clave)
+        if verificar is not None:
+            tipo = verificar(linea)
+            if tipo:
+                return tipo
 
-        tipo_docstring = self._obtener_tipo_docstring(linea)
-        if tipo_docstring:
-            return tipo_docstring
+        return self._clasificar_sentencia(linea)
 
-        if linea.startswith('#'):
-            return TipoNodo.COMMENT
+    def obtener_contexto(self) -> ContextoAnalisis:
+        """
+        Obtiene el estado que influye en la clasificación de las líneas.
 
-        tipo_constante_prop = self._verificar_constantes_e_imports(linea)
-        if tipo_constante_prop:
-            return tipo_constante_prop
+        Returns:
+            ContextoAnalisis: Estado actual del analizador
 
-        tipo_definicion = self._verificar_definiciones(linea)
-        if tipo_definicion:
-            return tipo_definicion
+        Example:
+            >>> analizador.obtener_contexto()
+            (False, True, False, None)
+        """
+        return (self._en_clase, self._es_nivel_modulo, self._en_metodo,
+                self._clase_actual)
 
-        tipo_flujo_control = self._verificar_condicionales(linea)
-        if tipo_flujo_control:
-            return tipo_flujo_control
+    def restaurar_contexto(self, contexto: ContextoAnalisis) -> None:
+        """
+        Retoma un estado obtenido con obtener_contexto.
 
-        tipo_comprension = self.verificar_comprensiones(linea)
-        if tipo_comprension:
-            return tipo_comprension
+        Args:
+            contexto (ContextoAnalisis): Estado a restaurar
 
-        tipo_op_especial = self.ver_operaciones_especiales(linea)
-        if tipo_op_especial:
-            return tipo_op_especial
+        Example:
+            >>> analizador.restaurar_contexto((True, False, False, "class A:"))
+        """
+        (self._en_clase, self._es_nivel_modulo, self._en_metodo,
+         self._clase_actual) = contexto
 
-        tipo_sentencia_salto = self._verificar_sentencias_salto(linea)
-        if tipo_sentencia_salto:
-            return tipo_sentencia_salto
+    def _crear_despacho(
+            self) -> Dict[str, Callable[[str], Optional[TipoNodo]]]:
+        """
+        Asocia cada primera palabra con la verificación que le corresponde.
 
-        tipo_decorador_import = self._verificar_decoradores_y_propiedades(linea)
-        if tipo_decorador_import:
-            return tipo_decorador_import
+        Returns:
+            Dict[str, Callable[[str], Optional[TipoNodo]]]: Verificación por
+                primera palabra o primer carácter de la línea
+        """
+        despacho = {
+            'async': self._clasificar_async,
+            '"': self._obtener_tipo_docstring,
+            "'": self._obtener_tipo_docstring,
+            'def': self._verificar_definiciones,
+            'class': self._verificar_definiciones,
+            '@': self._clasificar_decorador,
+        }
+        for clave, (prefijo, tipo) in PREFIJOS_DIRECTOS.items():
+            despacho[clave] = partial(self._verificar_prefijo, prefijo, tipo)
+        for clave, (prefijo, tipo) in PREFIJOS_BLOQUES.items():
+            despacho[clave] = partial(self._clasificar_bloque, prefijo, tipo)
+        for clave, (prefijo, tipo) in PREFIJOS_SALTOS.items():
+            despacho[clave] = partial(self._clasificar_salto, prefijo, tipo)
+        return despacho
+
+    def _clasificar_sentencia(self, linea: str) -> TipoNodo:
+        """
+        Clasifica una línea que ninguna verificación por palabra reconoció.
 
-        # Verificación de asignación después de todas las reglas especiales para
-        # evitar falsos positivos con operadores de comparación
+        Args:
+            linea (str): Línea sin espacios iniciales ni finales
+
+        Returns:
+            TipoNodo: Tipo de nodo identificado
+
+        Example:
+            >>> _clasificar_sentencia("x = f(a=1)")
+            TipoNodo.ASSIGNMENT
+        """
+        # Mismo orden que las reglas originales; las de definiciones y
+        # control de flujo ya no pueden aplicar
+        tipo = (self._verificar_constantes_e_imports(linea)
+                or self.verificar_comprensiones(linea)
+                or self.ver_operaciones_especiales(linea)
+                or self._verificar_sentencias_salto(linea)
+                or self._verificar_decoradores_y_propiedades(linea))
+        if tipo:
+            return tipo
+
+        # Verificación de asignación después de todas las reglas especiales
+        # para evitar falsos positivos con operadores de comparación
         if '=' in linea:
+            # Sin ')' el '=' no puede estar dentro de paréntesis
+            if ')' not in linea:
+                return TipoNodo.ASSIGNMENT
             index = linea.index('=')
-            pos1 = AnalizadorCadenas().encontrar_sin_comillas(linea, '(', 0,
-                                                              True)
-            pos2 = AnalizadorCadenas().encontrar_sin_comillas(linea, ')', 0,
-                                                              True)
+            pos1 = AnalizadorCadenas.encontrar_sin_comillas(linea, '(', 0,
+                                                            True)
+            pos2 = AnalizadorCadenas.encontrar_sin_comillas(linea, ')', 0,
+                                                            True)
             # Ignora '=' si está dentro de paréntesis (ej: función con kwargs)
             if not (index > pos1 and index < pos2):
                 return TipoNodo.ASSIGNMENT
 
         return TipoNodo.EXPRESSION
 
+    def _clasificar_async(self, linea: str) -> Optional[TipoNodo]:
+        """
+        Clasifica una línea async según la sentencia que sigue al prefijo.
+
+        Args:
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: Tipo de la sentencia o None
+
+        Example:
+            >>> _clasificar_async('async def funcion():')
+            TipoNodo.FUNCTION
+        """
+        # Se procesa async primero para normalizar la línea y reutilizar la
+        # lógica existente
+        prefijo_async = self._remover_prefijo_async(linea)
+        if prefijo_async:
+            return self.obtener_tipo_nodo(prefijo_async)
+        return None
+
+    def _verificar_prefijo(
+            self,
+            prefijo: str,
+            tipo: TipoNodo,
+            linea: str) -> Optional[TipoNodo]:
+        """
+        Verifica una estructura que se reconoce solo por su prefijo.
+
+        Args:
+            prefijo (str): Inicio que identifica la estructura
+            tipo (TipoNodo): Tipo de la estructura
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: El tipo indicado o None
+
+        Example:
+            >>> _verificar_prefijo('if ', TipoNodo.IF, 'if condicion:')
+            TipoNodo.IF
+        """
+        if linea.startswith(prefijo):
+            return tipo
+        return None
+
+    def _clasificar_bloque(
+            self,
+            prefijo: str,
+            tipo: TipoNodo,
+            linea: str) -> Optional[TipoNodo]:
+        """
+        Clasifica un with, try, except o finally.
+
+        Args:
+            prefijo (str): Inicio que identifica el bloque
+            tipo (TipoNodo): Tipo del bloque
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: Tipo de comprensión, el tipo indicado o None
+
+        Example:
+            >>> _clasificar_bloque('with ', TipoNodo.WITH, 'with a(b):')
+            TipoNodo.WITH
+        """
+        if not linea.startswith(prefijo):
+            return None
+        return self.verificar_comprensiones(linea) or tipo
+
+    def _clasificar_salto(
+            self,
+            prefijo: str,
+            tipo: TipoNodo,
+            linea: str) -> Optional[TipoNodo]:
+        """
+        Clasifica un return, break, continue, raise o assert.
+
+        Args:
+            prefijo (str): Inicio que identifica la sentencia
+            tipo (TipoNodo): Tipo de la sentencia
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: Tipo de comprensión, TERNARY, el tipo
+                indicado o None
+
+        Example:
+            >>> _clasificar_salto('return ', TipoNodo.RETURN,
+            ...                   'return a if b else c')
+            TipoNodo.TERNARY
+        """
+        if not linea.startswith(prefijo):
+            return None
+        return (self.verificar_comprensiones(linea)
+                or self._verificar_ternario(linea)
+                or tipo)
+
+    def _clasificar_decorador(self, linea: str) -> TipoNodo:
+        """
+        Clasifica una línea que empieza con '@'.
+
+        Args:
+            linea (str): Línea a verificar
+
+        Returns:
+            TipoNodo: CONSTANT, comprensión, TERNARY, PROPERTY o DECORATOR
+
+        Example:
+            >>> _clasificar_decorador('@staticmethod')
+            TipoNodo.DECORATOR
+        """
+        return (self._verificar_constantes_e_imports(linea)
+                or self.verificar_comprensiones(linea)
+                or self._verificar_ternario(linea)
+                or self._verificar_decoradores_y_propiedades(linea))
+
     def verificar_comprensiones(self, linea: str) -> Optional[TipoNodo]:
         """
         Verifica si la línea contiene una comprensión.
@@ -150,6 +374,11 @@ class AnalizadorTipoNodo:
             >>> verificar_comprensiones("[x for x in range(5)]")
             TipoNodo.LIST_COMPREHENSION
         """
+        # Toda comprensión contiene ' for '; se descartan las demás líneas
+        # antes de buscar los delimitadores
+        if ' for ' not in linea:
+            return None
+
         # Función anidada para evitar duplicación en la lógica de validación de
         # diferentes tipos de comprensiones (lista, dict, set, generator)
         def tiene_contenido_valido(
@@ -210,10 +439,25 @@ class AnalizadorTipoNodo:
         if linea.startswith('finally:'):
             return TipoNodo.FINALLY
 
+        return self._verificar_ternario(linea)
+
+    def _verificar_ternario(self, linea: str) -> Optional[TipoNodo]:
+        """
+        Verifica si la línea contiene una expresión ternaria.
+
+        Args:
+            linea (str): Línea a verificar
+
+        Returns:
+            Optional[TipoNodo]: TERNARY o None
+
+        Example:
+            >>> _verificar_ternario('x = a if b else c')
+            TipoNodo.TERNARY
+        """
         if ' if ' in linea and ' else ' in linea and \
         not linea.startswith('if '):
             return TipoNodo.TERNARY
-
         return None
 
     def _obtener_tipo_docstring(self, linea: str) -> TipoNodo:
@@ -274,36 +518,6 @@ class AnalizadorTipoNodo:
             return TipoNodo.CLASS
         return None
 
-    def _verificar_condicionales(self, linea: str) -> Optional[TipoNodo]:
-        """
-        Verifica si la línea contiene estructuras de control.
-
-        Args:
-            linea (str): Línea a verificar
-
-        Returns:
-            Optional[TipoNodo]: Tipo de estructura o None
-
-        Example:
-            >>> _verificar_condicionales('if condicion:')
-            TipoNodo.IF
-        """
-        mapa_flujo_control = {
-            'if ': TipoNodo.IF,
-            'elif ': TipoNodo.ELIF,
-            'else:': TipoNodo.ELSE,
-            'for ': TipoNodo.FOR,
-            'while ': TipoNodo.WHILE,
-            'match ': TipoNodo.MATCH,
-            'case ': TipoNodo.CASE,
-        }
-
-        for inicio, tipo_nodo in mapa_flujo_control.items():
-            if linea.startswith(inicio):
-                return tipo_nodo
-
-        return None
-
     def _verificar_sentencias_salto(self, linea: str) -> Optional[TipoNodo]:
         """
         Verifica si la línea contiene sentencias de salto.
@@ -7,9 +7,12 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
+    - bisect
+    - core.arbol.analizador_nodos.ContextoAnalisis
+    - core.gestion_archivos.cache_arboles.CacheArboles
     - utils.constructor_arbol.ConstructorArbol
     - utils.impresion_arbol.imprimir_arbol
 
@@ -18,15 +21,66 @@ Uso:
     arbol = ArbolArchivoPython(contenido_archivo)
     arbol.imprimir_arbol()
 
+    # Carga el árbol de la caché si otra ejecución ya lo construyó
+    arbol = ArbolArchivoPython(contenido_archivo, CacheArboles("db/arboles"))
+
+    # Reemplaza las líneas 10 a 11 y reconstruye solo el bloque que las
+    # contiene
+    edicion = arbol.aplicar_edicion(10, 12, ["def f():", "    return 2"])
+
 Notas:
     - Implementa representación jerárquica del código fuente
+    - El árbol recuerda los puntos de corte de su construcción: líneas sin
+      indentación que empiezan fuera de cualquier bloque abierto, junto con
+      el contexto del analizador de tipos en ese punto. Una edición solo
+      reconstruye los bloques de nivel superior entre dos cortes, y el
+      resultado es idéntico al de construir el archivo completo
+    - Acepta cualquier iterable de líneas; solo una lista o tupla se conserva
+      en lineas, así que un árbol construido desde un flujo no guarda el
+      código fuente y no admite ediciones
+    - Con una caché de árboles, un árbol de una lista de líneas se carga
+      junto con sus cortes sin construirlo; lineas_por_clase usa la misma
+      variante, así que ambas herramientas comparten las entradas
 """
 
-from typing import List
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence
 
-from contador_lineas.core.arbol.constructor_arbol import ConstructorArbol
+from contador_lineas.core.arbol.analizador_nodos import ContextoAnalisis
+from contador_lineas.core.arbol.constructor_arbol import (
+    ConstructorArbol, Corte
+)
+from contador_lineas.core.arbol.nodo import SIN_HIJOS, Nodo
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.utils.impresion_arbol import imprimir_arbol
 
+# Variante de los árboles de este constructor en la caché de árboles
+VARIANTE_ESTANDAR = "estandar"
+
+
+@dataclass
+class EdicionArbol:
+    """
+    Nodos de nivel superior reemplazados por una edición.
+
+    Attributes:
+        nodos_anteriores (List[Nodo]): Hijos de la raíz que se retiraron
+        nodos_nuevos (List[Nodo]): Hijos de la raíz que los reemplazan
+        linea_inicio (int): Primera línea reconstruida, ya editada
+        linea_fin (int): Línea siguiente a la última reconstruida
+
+    Example:
+        >>> edicion = arbol.aplicar_edicion(3, 4, ["    return 2"])
+        >>> [nodo.contenido for nodo in edicion.nodos_nuevos]
+        ['def f():']
+    """
+
+    nodos_anteriores: List[Nodo]
+    nodos_nuevos: List[Nodo]
+    linea_inicio: int
+    linea_fin: int
+
 
 class ArbolArchivoPython:
     """
@@ -35,10 +89,18 @@ class ArbolArchivoPython:
     Attributes:
         constructor (ConstructorArbol): Constructor del árbol sintáctico
         raiz (Nodo): Nodo raíz del árbol sintáctico
+        lineas (Optional[List[str]]): Líneas del código fuente
+            representado, None si se construyó desde un flujo
+        cortes (List[Corte]): Puntos de corte del archivo, en orden; el
+            primero siempre es la línea 0. Vacío si se construyó desde un
+            flujo
 
     Methods:
         imprimir_arbol() -> None:
             Imprime el árbol sintáctico en consola.
+        aplicar_edicion(linea_inicio: int, linea_fin: int,
+                        nuevas_lineas: Sequence[str]) -> EdicionArbol:
+            Reemplaza un rango de líneas y reconstruye solo su bloque.
 
     Example:
         >>> contenido = ["def suma(a, b):", "    return a + b"]
@@ -46,15 +108,192 @@ class ArbolArchivoPython:
         >>> arbol.imprimir_arbol()
     """
 
-    def __init__(self, file_content: List[str]):
+    def __init__(
+            self,
+            file_content: Iterable[str],
+            cache: Optional[CacheArboles] = None):
         # Usamos ConstructorArbol para construir el árbol sintáctico ya que la
         # construcción requiere un análisis complejo del código que se mantiene
         # separado de la representación del árbol
         self.constructor = ConstructorArbol()
+        self.lineas: Optional[List[str]] = None
+        self.cortes: List[Corte] = []
+        # Solo un árbol que conserva sus líneas puede editarse, así que solo
+        # él necesita los cortes
+        if isinstance(file_content, (list, tuple)):
+            self.lineas = file_content = list(file_content)
+            self.constructor.registrar_cortes = True
+        # La clave necesita todas las líneas, así que un flujo no usa la caché
+        clave = None
+        if cache is not None and self.lineas is not None:
+            clave = cache.calcular_clave(self.lineas, VARIANTE_ESTANDAR)
+            entrada = cache.obtener(clave)
+            if entrada is not None and entrada.cortes:
+                self.raiz, self.cortes = entrada.raiz, entrada.cortes
+                return
+
+        contexto = self.constructor.analizador_tipo.obtener_contexto()
         self.raiz = self.constructor.construir(file_content)
+        if self.lineas is not None:
+            self.cortes = self._cortes_desde(self.constructor.cortes, 0, 0,
+                                             contexto)
+        if clave is not None:
+            cache.guardar(clave, self.raiz, self.cortes)
 
     def imprimir_arbol(self) -> None:
         """
         Imprime la estructura del árbol en consola.
         """
         imprimir_arbol(self.raiz)
+
+    def aplicar_edicion(
+            self,
+            linea_inicio: int,
+            linea_fin: int,
+            nuevas_lineas: Sequence[str]) -> EdicionArbol:
+        """
+        Reemplaza las líneas [linea_inicio, linea_fin) y actualiza el árbol.
+
+        Solo se reconstruyen los bloques de nivel superior entre los cortes
+        que rodean al rango. La región se amplía al corte anterior si su
+        primera línea ya no es un corte, y al siguiente si termina con una
+        cadena o expresión abierta o cambia la clasificación de las líneas
+        posteriores (por ejemplo, al agregar una clase).
+
+        Args:
+            linea_inicio (int): Primera línea reemplazada, desde 0
+            linea_fin (int): Línea siguiente a la última reemplazada
+            nuevas_lineas (Sequence[str]): Líneas que ocupan el rango
+
+        Returns:
+            EdicionArbol: Hijos de la raíz retirados y agregados
+
+        Raises:
+            ValueError: Si el rango no está dentro del archivo o el árbol se
+                        construyó desde un flujo de líneas
+
+        Example:
+            >>> arbol = ArbolArchivoPython(["def f():", "    return 1"])
+            >>> edicion = arbol.aplicar_edicion(1, 2, ["    return 2"])
+            >>> edicion.nodos_nuevos[0].hijos[0].contenido
+            'return 2'
+        """
+        if self.lineas is None:
+            raise ValueError("El árbol se construyó desde un flujo de líneas "
+                             "y no conserva el código a editar")
+        if not 0 <= linea_inicio <= linea_fin <= len(self.lineas):
+            raise ValueError(f"Rango de líneas inválido: [{linea_inicio}, "
+                             f"{linea_fin}) en un archivo de "
+                             f"{len(self.lineas)} líneas")
+
+        lineas_cortes = [corte[0] for corte in self.cortes]
+        primero = bisect_right(lineas_cortes, linea_inicio) - 1
+        ultimo = bisect_left(lineas_cortes, max(linea_fin, linea_inicio + 1))
+        nuevas_lineas = list(nuevas_lineas)
+
+        while True:
+            inicio, _, contexto = self.cortes[primero]
+            fin = (lineas_cortes[ultimo] if ultimo < len(self.cortes)
+                   else len(self.lineas))
+            region = (self.lineas[inicio:linea_inicio] + nuevas_lineas +
+                      self.lineas[linea_fin:fin])
+            constructor = ConstructorArbol()
+            constructor.registrar_cortes = True
+            constructor.analizador_tipo.restaurar_contexto(contexto)
+            raiz = constructor.construir(region)
+
+            # La región debe empezar en un corte para no pertenecer al bloque
+            # anterior, y terminar cerrada y con el mismo contexto para que
+            # el resto del archivo se clasifique igual
+            if region and inicio > 0 and \
+                    (not constructor.cortes or constructor.cortes[0][0] != 0):
+                primero -= 1
+            elif ultimo < len(self.cortes) and (
+                    constructor.cierre_forzado or
+                    constructor.analizador_tipo.obtener_contexto() !=
+                    self.cortes[ultimo][2]):
+                ultimo += 1
+            else:
+                break
+
+        retirados = self._reemplazar(
+            primero, ultimo, raiz.hijos,
+            self._cortes_desde(constructor.cortes, inicio,
+                               self.cortes[primero][1], contexto)
+            if region else [],
+            region, len(nuevas_lineas) - (linea_fin - linea_inicio))
+        return EdicionArbol(retirados, list(raiz.hijos), inicio,
+                            inicio + len(region))
+
+    def _reemplazar(
+            self,
+            primero: int,
+            ultimo: int,
+            nodos_nuevos: Sequence[Nodo],
+            cortes_region: List[Corte],
+            region: List[str],
+            desplazamiento: int) -> List[Nodo]:
+        """
+        Sustituye los bloques entre dos cortes por los reconstruidos.
+
+        Args:
+            primero (int): Índice del corte donde empieza la región
+            ultimo (int): Índice del corte donde termina la región
+            nodos_nuevos (Sequence[Nodo]): Hijos de la raíz reconstruida
+            cortes_region (List[Corte]): Cortes de la región en el archivo
+            region (List[str]): Líneas de la región ya editada
+            desplazamiento (int): Líneas agregadas menos líneas retiradas
+
+        Returns:
+            List[Nodo]: Hijos de la raíz retirados
+        """
+        inicio, hijo_inicio, contexto = self.cortes[primero]
+        if ultimo < len(self.cortes):
+            fin, hijo_fin, _ = self.cortes[ultimo]
+        else:
+            fin, hijo_fin = len(self.lineas), len(self.raiz.hijos)
+
+        for nodo in nodos_nuevos:
+            nodo.padre = self.raiz
+        if self.raiz.hijos is SIN_HIJOS:
+            self.raiz.hijos = []
+        hijos = self.raiz.hijos
+        retirados = hijos[hijo_inicio:hijo_fin]
+        hijos[hijo_inicio:hijo_fin] = nodos_nuevos
+        self.lineas[inicio:fin] = region
+
+        diferencia_hijos = len(nodos_nuevos) - len(retirados)
+        self.cortes[primero:] = cortes_region + [
+            (linea + desplazamiento, hijo + diferencia_hijos, contexto_corte)
+            for linea, hijo, contexto_corte in self.cortes[ultimo:]
+        ]
+        # Solo un archivo que quedó vacío se queda sin el corte de la línea 0
+        if not self.cortes:
+            self.cortes.append((0, 0, contexto))
+        return retirados
+
+    @staticmethod
+    def _cortes_desde(
+            cortes: List[Corte],
+            linea_base: int,
+            hijo_base: int,
+            contexto: ContextoAnalisis) -> List[Corte]:
+        """
+        Ubica en el archivo los cortes de una construcción parcial.
+
+        La primera línea de la construcción siempre es un corte, aunque esté
+        indentada: el constructor empieza en ella sin bloques abiertos.
+
+        Args:
+            cortes (List[Corte]): Cortes relativos a la construcción
+            linea_base (int): Línea del archivo donde empieza la construcción
+            hijo_base (int): Índice del primer hijo de la raíz construido
+            contexto (ContextoAnalisis): Contexto con el que empezó
+
+        Returns:
+            List[Corte]: Cortes con líneas e índices del archivo
+        """
+        if not cortes or cortes[0][0] != 0:
+            cortes = [(0, 0, contexto)] + cortes
+        return [(linea + linea_base, hijo + hijo_base, contexto_corte)
+                for linea, hijo, contexto_corte in cortes]
@@ -7,40 +7,66 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 19-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing.List
-    - contador_lineas.core.analizadores.analizador_cadenas
+    - contador_lineas.core.analizadores.indice_lexico
     - contador_lineas.core.arbol.nodo
     - contador_lineas.models.nodos
+    - contador_lineas.utils.perfil.fase
 
 Uso:
     from contador_lineas.core.arbol.constructor_arbol import ConstructorArbol
     constructor = ConstructorArbol()
     arbol = constructor.construir(lineas_codigo)
+
+Notas:
+    - La construcción es un autómata de una sola pasada: el estado (cadena
+      multilínea, delimitadores abiertos y continuación) se conserva entre
+      líneas, por lo que ninguna línea se vuelve a analizar
+    - Con registrar_cortes activo se anotan las líneas sin indentación que
+      empiezan fuera de cualquier bloque abierto; desde ellas el árbol puede
+      reconstruirse por partes (ver ArbolArchivoPython.aplicar_edicion)
 """
 
-from typing import List
+from typing import Iterable, List, Optional, Tuple
 
-from contador_lineas.core.analizadores.analizador_cadenas import (
-    AnalizadorCadenas
+from contador_lineas.core.analizadores.indice_lexico import (
+    obtener_indice_lexico
+)
+from contador_lineas.core.arbol.analizador_nodos import (
+    AnalizadorTipoNodo, ContextoAnalisis
 )
-from contador_lineas.core.arbol.analizador_nodos import AnalizadorTipoNodo
 from contador_lineas.core.arbol.nodo import Nodo
 from contador_lineas.config.node_types import PARENT_NODE_TYPES
 from contador_lineas.models.nodos import TipoNodo
+from contador_lineas.utils.perfil import fase
+
+# Modos del autómata de construcción
+MODO_NORMAL = 0
+MODO_CADENA = 1
+MODO_CONTINUACION = 2
+
+# Punto de corte: (línea, hijos de la raíz antes de la línea, contexto del
+# analizador de tipos al llegar a la línea)
+Corte = Tuple[int, int, ContextoAnalisis]
 
 
 class ConstructorArbol:
     """
     Construye un árbol sintáctico a partir de código fuente Python.
 
-    Procesa líneas de código y genera una estructura jerárquica que 
+    Procesa líneas de código y genera una estructura jerárquica que
     representa la sintaxis del programa.
 
     Attributes:
         multilinea_vale_1 (bool): Indica si las líneas múltiples cuentan como 1
+        conservar_lineas_vacias (bool): Si True, las líneas vacías generan nodos
+        registrar_cortes (bool): Si True, se anotan los puntos de corte
+        cortes (List[Corte]): Puntos de corte de la última construcción
+        cierre_forzado (bool): Si la última construcción terminó con una
+            cadena o expresión sin cerrar
         analizador_tipo (AnalizadorTipoNodo): Analizador de tipos de nodos
         buffer_multilinea (List[str]): Buffer temporal para líneas múltiples
         delimitadores_abiertos (int): Contador de delimitadores sin cerrar
@@ -48,7 +74,7 @@ class ConstructorArbol:
         delimitador_cadena (str): Tipo de delimitador de cadena actual
 
     Methods:
-        construir(lineas: List[str]) -> Nodo:
+        construir(lineas: Iterable[str]) -> Nodo:
             Construye el árbol sintáctico a partir de las líneas de código
 
     Example:
@@ -56,6 +82,9 @@ class ConstructorArbol:
         >>> arbol = constructor.construir(["def suma(a, b):", "  return a + b"])
     """
 
+    conservar_lineas_vacias = False
+    registrar_cortes = False
+
     def __init__(self, multilinea_vale_1: bool = True):
         self.multilinea_vale_1 = multilinea_vale_1
         self.analizador_tipo = AnalizadorTipoNodo()
@@ -63,13 +92,24 @@ class ConstructorArbol:
         self.delimitadores_abiertos = 0
         self.en_cadena_multilinea = False
         self.delimitador_cadena = None
-
-    def construir(self, lineas: List[str]) -> Nodo:
+        self.cortes: List[Corte] = []
+        self.cierre_forzado = False
+        # Estado del autómata; construir lo reinicia en cada construcción
+        self._padre_actual: Optional[Nodo] = None
+        self._pila_indentacion: List[Tuple[Nodo, int]] = []
+        self._modo = MODO_NORMAL
+        self._tipo_bloque: Optional[TipoNodo] = None
+        self._linea_inicio = ""
+        self._ultima_linea = ""
+        self._lineas_bloque: List[int] = []
+
+    @fase("construir árbol")
+    def construir(self, lineas: Iterable[str]) -> Nodo:
         """
-        Construye el árbol sintáctico desde una lista de líneas.
+        Construye el árbol sintáctico desde una secuencia de líneas.
 
         Args:
-            lineas (List[str]): Lista de líneas de código a procesar
+            lineas (Iterable[str]): Líneas de código a procesar
 
         Returns:
             Nodo: Raíz del árbol sintáctico construido
@@ -77,96 +117,249 @@ class ConstructorArbol:
         Example:
             >>> construir(["def suma(a, b):", "    return a + b"])
         """
-        raiz = Nodo(TipoNodo.ROOT, "raiz", -1)
-        padre_actual = raiz
+        raiz = self._crear_raiz()
+        self._padre_actual = raiz
         # Usamos una pila para rastrear la indentación y los padres cada
         # elemento es una tupla (nodo_padre, nivel_indentacion)
-        pila_indentacion = [(raiz, -1)]
-        i = 0
-        j = 0
-        while i < len(lineas):
-            linea = lineas[i]
-
-            # Ignoramos líneas vacías para mantener la estructura limpia
-            if not linea.strip():
-                i += 1
-                continue
-
-            # Guardamos líneas múltiples en el buffer para procesarlas juntas
-            if len(linea) > 1:
-                self.buffer_multilinea = [l.strip() for l in linea]
-            j = i
-
-            # El orden de análisis es importante:
-            # 1. Primero docstrings para evitar confusión con delimitadores
-            # 2. Luego análisis de delimitadores para manejo de líneas múltiples
-            # 3. Finalmente procesamiento normal de nodos
-            if not self._analizar_docstring(linea):
-                tipo_nodo = self.analizador_tipo.obtener_tipo_nodo(linea)
-                indentacion = len(lineas[i]) - len(lineas[i].lstrip())
-                nodo_nuevo = Nodo(tipo_nodo, lineas[i].strip(), indentacion)
-                padre_actual.agregar_hijo(nodo_nuevo)
-
-                # Procesamos líneas consecutivas del mismo tipo (útil para
-                # docstrings y líneas múltiples)
-                while i + 1 < len(lineas) and not self._analizar_docstring(
-                lineas[i + 1]):
-                    i += 1
-                    indentacion = len(lineas[i]) - len(lineas[i].lstrip())
-                    nodo_nuevo = Nodo(tipo_nodo, lineas[i].strip(), indentacion)
-                    padre_actual.agregar_hijo(nodo_nuevo)
-
-                if i + 1 < len(lineas):
-                    i += 1
-
-                linea = lineas[i]
-
-            # Manejo especial para líneas múltiples con continuación (\)
-            elif not self._analizar_delimitadores(linea.strip()):
-                # Acumulamos líneas en el buffer hasta encontrar el final de la
-                # expresión múltiple
-                self.buffer_multilinea = [linea.strip()[:-1] if \
-                linea.strip().endswith('\\') else linea.strip()]
-                while i + 1 < len(lineas) and \
-                not self._analizar_delimitadores(lineas[i + 1].strip()):
-                    i += 1
-                    self.buffer_multilinea.append(lineas[i].strip()[:-1] if \
-                    lineas[i].strip().endswith('\\') else lineas[i].strip())
-
-                if i + 1 < len(lineas):
-                    i += 1
-                    self.buffer_multilinea.append(lineas[i].strip())
-
-                linea = ' '.join(self.buffer_multilinea)
-                self.buffer_multilinea = []
-                self.delimitadores_abiertos = 0
-
-                tipo_nodo = self.analizador_tipo.obtener_tipo_nodo(linea)
+        self._pila_indentacion = [(raiz, -1)]
+        self._modo = MODO_NORMAL
+        self._tipo_bloque = None
+        self._linea_inicio = ""
+        self._ultima_linea = ""
+        self._lineas_bloque = []
+        self.cortes = []
+
+        for numero_linea, linea in enumerate(lineas):
+            linea_limpia = linea.strip()
+            if self._modo == MODO_NORMAL:
+                self._procesar_linea_normal(numero_linea, linea, linea_limpia)
+            elif self._modo == MODO_CADENA:
+                self._procesar_linea_cadena(numero_linea, linea, linea_limpia)
             else:
-                tipo_nodo = self.analizador_tipo.obtener_tipo_nodo(linea)
+                self._procesar_linea_continuacion(numero_linea, linea_limpia)
 
-            indentacion = len(lineas[j]) - len(lineas[j].lstrip())
-            nodo_nuevo = Nodo(tipo_nodo, linea.strip(), indentacion)
+        # Un bloque abierto al final del archivo se cierra con lo acumulado
+        self.cierre_forzado = self._modo != MODO_NORMAL
+        if self._modo == MODO_CADENA:
+            self._insertar_nodo(self._tipo_bloque, self._ultima_linea,
+                                self._linea_inicio, None)
+        elif self._modo == MODO_CONTINUACION:
+            self._cerrar_continuacion()
 
-            # Ajustamos la jerarquía del árbol basándonos en la indentación
-            # Subimos en la jerarquía mientras el nivel actual sea menor o igual
-            # al nivel del tope de la pila
-            while pila_indentacion and indentacion <= pila_indentacion[-1][1]:
-                pila_indentacion.pop()
-                if pila_indentacion:
-                    padre_actual = pila_indentacion[-1][0]
+        return raiz
 
-            padre_actual.agregar_hijo(nodo_nuevo)
+    def _procesar_linea_normal(
+            self,
+            numero_linea: int,
+            linea: str,
+            linea_limpia: str) -> None:
+        """
+        Procesa una línea que no pertenece a ningún bloque abierto.
 
-            # Si el nodo puede tener hijos, lo convertimos en el nuevo padre y
-            # lo añadimos a la pila de indentación
-            if self._puede_tener_hijos(tipo_nodo):
-                padre_actual = nodo_nuevo
-                pila_indentacion.append((nodo_nuevo, indentacion))
+        Args:
+            numero_linea (int): Índice de la línea en el archivo
+            linea (str): Línea original
+            linea_limpia (str): Línea sin espacios al inicio y al final
+        """
+        # Ignoramos líneas vacías para mantener la estructura limpia
+        if not linea_limpia and not self.conservar_lineas_vacias:
+            return
+
+        # El orden de análisis es importante:
+        # 1. Primero docstrings para evitar confusión con delimitadores
+        # 2. Luego análisis de delimitadores para manejo de líneas múltiples
+        # 3. Finalmente procesamiento normal de nodos
+        if not self._analizar_docstring(linea_limpia):
+            # Las líneas de la cadena cuelgan del padre actual con el tipo de
+            # la línea que la abre; la línea de cierre se inserta al final
+            self._tipo_bloque = \
+                self.analizador_tipo.obtener_tipo_nodo(linea_limpia)
+            self._linea_inicio = linea
+            self._agregar_linea_cadena(numero_linea, linea, linea_limpia)
+            self._modo = MODO_CADENA
+            return
+
+        # Una línea sin indentación que no abre una cadena cierra todos los
+        # bloques anteriores; las líneas de una cadena, en cambio, cuelgan del
+        # padre actual hasta que la cadena se cierra
+        if self.registrar_cortes and linea_limpia and not linea[0].isspace():
+            self.cortes.append(
+                (numero_linea, len(self._pila_indentacion[0][0].hijos),
+                 self.analizador_tipo.obtener_contexto()))
+
+        if not self._analizar_delimitadores(linea_limpia):
+            # Acumulamos líneas en el buffer hasta encontrar el final de la
+            # expresión múltiple
+            self._linea_inicio = linea
+            self._lineas_bloque = [numero_linea]
+            self.buffer_multilinea = [self._sin_continuacion(linea_limpia)]
+            self._modo = MODO_CONTINUACION
+        else:
+            tipo_nodo = self.analizador_tipo.obtener_tipo_nodo(linea_limpia)
+            self._insertar_nodo(tipo_nodo, linea_limpia, linea, [numero_linea])
+
+    def _procesar_linea_cadena(
+            self,
+            numero_linea: int,
+            linea: str,
+            linea_limpia: str) -> None:
+        """
+        Procesa una línea dentro de una cadena multilínea abierta.
 
-            i += 1
+        Args:
+            numero_linea (int): Índice de la línea en el archivo
+            linea (str): Línea original
+            linea_limpia (str): Línea sin espacios al inicio y al final
+        """
+        if not self._analizar_docstring(linea_limpia):
+            self._agregar_linea_cadena(numero_linea, linea, linea_limpia)
+            return
+
+        self._insertar_nodo(self._tipo_bloque, linea_limpia,
+                            self._linea_inicio, [numero_linea])
+        self._modo = MODO_NORMAL
+
+    def _procesar_linea_continuacion(
+            self,
+            numero_linea: int,
+            linea_limpia: str) -> None:
+        """
+        Procesa una línea que continúa una expresión de varias líneas.
 
-        return raiz
+        Args:
+            numero_linea (int): Índice de la línea en el archivo
+            linea_limpia (str): Línea sin espacios al inicio y al final
+        """
+        completa = self._analizar_delimitadores(linea_limpia)
+        self.buffer_multilinea.append(self._sin_continuacion(linea_limpia))
+        self._lineas_bloque.append(numero_linea)
+        if completa:
+            self._cerrar_continuacion()
+
+    def _agregar_linea_cadena(
+            self,
+            numero_linea: int,
+            linea: str,
+            linea_limpia: str) -> None:
+        """
+        Agrega una línea de cadena multilínea como hijo del padre actual.
+
+        Args:
+            numero_linea (int): Índice de la línea en el archivo
+            linea (str): Línea original
+            linea_limpia (str): Línea sin espacios al inicio y al final
+        """
+        indentacion = self._calcular_indentacion(self._tipo_bloque, linea)
+        nodo_nuevo = self._crear_nodo(self._tipo_bloque, linea_limpia,
+                                      indentacion, [numero_linea])
+        self._padre_actual.agregar_hijo(nodo_nuevo)
+        self._ultima_linea = linea_limpia
+
+    def _cerrar_continuacion(self) -> None:
+        """
+        Une las líneas acumuladas e inserta la expresión como un solo nodo.
+        """
+        linea = ' '.join(self.buffer_multilinea).strip()
+        self.buffer_multilinea = []
+        self.delimitadores_abiertos = 0
+        tipo_nodo = self.analizador_tipo.obtener_tipo_nodo(linea)
+        self._insertar_nodo(tipo_nodo, linea, self._linea_inicio,
+                            self._lineas_bloque)
+        self._modo = MODO_NORMAL
+
+    def _insertar_nodo(
+            self,
+            tipo_nodo: TipoNodo,
+            contenido: str,
+            linea_inicio: str,
+            lineas_origen: Optional[List[int]]) -> None:
+        """
+        Inserta un nodo en la jerarquía según su indentación.
+
+        Args:
+            tipo_nodo (TipoNodo): Tipo del nodo
+            contenido (str): Contenido del nodo
+            linea_inicio (str): Línea original que define la indentación
+            lineas_origen (Optional[List[int]]): Líneas del nodo o None si el
+                                                 nodo no aporta líneas nuevas
+        """
+        indentacion = self._calcular_indentacion(tipo_nodo, linea_inicio)
+        nodo_nuevo = self._crear_nodo(tipo_nodo, contenido, indentacion,
+                                      lineas_origen)
+
+        # Ajustamos la jerarquía del árbol basándonos en la indentación
+        # Subimos en la jerarquía mientras el nivel actual sea menor o igual
+        # al nivel del tope de la pila
+        pila_indentacion = self._pila_indentacion
+        while pila_indentacion and indentacion <= pila_indentacion[-1][1]:
+            pila_indentacion.pop()
+            if pila_indentacion:
+                self._padre_actual = pila_indentacion[-1][0]
+
+        self._padre_actual.agregar_hijo(nodo_nuevo)
+
+        # Si el nodo puede tener hijos, lo convertimos en el nuevo padre y
+        # lo añadimos a la pila de indentación
+        if self._puede_tener_hijos(tipo_nodo):
+            self._padre_actual = nodo_nuevo
+            pila_indentacion.append((nodo_nuevo, indentacion))
+
+    def _crear_raiz(self) -> Nodo:
+        """
+        Crea el nodo raíz del árbol.
+
+        Returns:
+            Nodo: Nodo raíz
+        """
+        return Nodo(TipoNodo.ROOT, "raiz", -1)
+
+    def _crear_nodo(
+            self,
+            tipo_nodo: TipoNodo,
+            contenido: str,
+            indentacion: int,
+            lineas_origen: Optional[List[int]]) -> Nodo:
+        """
+        Crea un nodo del árbol.
+
+        Args:
+            tipo_nodo (TipoNodo): Tipo del nodo
+            contenido (str): Contenido del nodo
+            indentacion (int): Nivel de indentación
+            lineas_origen (Optional[List[int]]): Líneas del nodo
+
+        Returns:
+            Nodo: Nodo creado
+        """
+        return Nodo(tipo_nodo, contenido, indentacion)
+
+    def _calcular_indentacion(self, tipo_nodo: TipoNodo, linea: str) -> int:
+        """
+        Calcula la indentación de un nodo a partir de su línea original.
+
+        Args:
+            tipo_nodo (TipoNodo): Tipo del nodo
+            linea (str): Línea original
+
+        Returns:
+            int: Número de caracteres de indentación
+        """
+        return len(linea) - len(linea.lstrip())
+
+    @staticmethod
+    def _sin_continuacion(linea_limpia: str) -> str:
+        """
+        Elimina la barra de continuación explícita al final de la línea.
+
+        Args:
+            linea_limpia (str): Línea sin espacios al inicio y al final
+
+        Returns:
+            str: Línea sin la barra final
+        """
+        if linea_limpia.endswith('\\'):
+            return linea_limpia[:-1]
+        return linea_limpia
 
     def _es_asignacion_cadena(self, linea: str) -> bool:
         """
@@ -186,10 +379,10 @@ class ConstructorArbol:
         # 1. Debe haber un operador de asignación
         # 2. El lado derecho debe contener delimitadores de cadena multilínea
         # Esto evita confundir asignaciones normales con asignaciones de cadenas
-        linea_limpia = linea.strip()
-        return ('=' in linea_limpia and
-                ('"""' in linea_limpia.split('=')[1] or
-                "'''" in linea_limpia.split('=')[1]))
+        if '=' not in linea:
+            return False
+        lado_derecho = linea.split('=', 2)[1]
+        return '"""' in lado_derecho or "'''" in lado_derecho
 
     def _es_inicio_docstring_valido(self, linea: str) -> bool:
         """
@@ -212,12 +405,12 @@ class ConstructorArbol:
         return (linea_limpia.startswith('"""') or
                 linea_limpia.startswith("'''"))
 
-    def _analizar_docstring(self, linea: str) -> bool:
+    def _analizar_docstring(self, linea_limpia: str) -> bool:
         """
         Analiza si la línea está completa según reglas de docstring.
 
         Args:
-            linea (str): Línea a analizar
+            linea_limpia (str): Línea sin espacios al inicio y al final
 
         Returns:
             bool: True si la línea está completa
@@ -226,7 +419,10 @@ class ConstructorArbol:
             >>> _analizar_docstring('''Docstring''')
             True
         """
-        linea_limpia = linea.strip()
+        # La mayoría de las líneas no tienen comillas triples, así que las
+        # descartamos antes de cualquier otro análisis
+        if '"""' not in linea_limpia and "'''" not in linea_limpia:
+            return not self.en_cadena_multilinea
 
         # Caso especial: asignación de cadena multilínea
         # Ejemplo: variable = """contenido"""
@@ -234,16 +430,9 @@ class ConstructorArbol:
             if not self.en_cadena_multilinea:
                 # Buscamos delimitadores fuera de otras cadenas para evitar
                 # falsos positivos en cadenas anidadas
-                pos1 = AnalizadorCadenas.encontrar_sin_comillas(
-                            linea_limpia,
-                            '"""',
-                            0
-                        )
-                pos2 = AnalizadorCadenas.encontrar_sin_comillas(
-                            linea_limpia,
-                            "'''",
-                            0
-                        )
+                indice = obtener_indice_lexico(linea_limpia)
+                pos1 = indice.encontrar_sin_comillas('"""')
+                pos2 = indice.encontrar_sin_comillas("'''")
 
                 if pos1 == -1 and pos2 == -1:
                     return not self.en_cadena_multilinea
@@ -265,51 +454,41 @@ class ConstructorArbol:
                 else:
                     self.delimitador_cadena = "'''"
                 return False
-        # Caso: línea contiene comillas triples pero no es asignación
-        elif '"""' in linea_limpia or "'''" in linea_limpia:
-            pos1 = AnalizadorCadenas.encontrar_sin_comillas(
-                        linea_limpia,
-                        '"""',
-                        0
-                    )
-            pos2 = AnalizadorCadenas.encontrar_sin_comillas(
-                        linea_limpia,
-                        "'''",
-                        0
-                    )
-
-            if pos1 == -1 and pos2 == -1:
-                return not self.en_cadena_multilinea
-
-            # Caso: inicio de nuevo docstring (debe estar al inicio de línea)
-            if not self.en_cadena_multilinea and \
-            self._es_inicio_docstring_valido(linea_limpia):
-                if pos1 != -1:
-                    self.delimitador_cadena = '"""'
-                else:
-                    self.delimitador_cadena = "'''"
+            return not self.en_cadena_multilinea
 
-                # Docstring de una línea: abre y cierra en la misma línea
-                if linea_limpia[3:].endswith(self.delimitador_cadena):
-                    self.en_cadena_multilinea = False
-                    self.delimitador_cadena = None
-                    return True
-
-                # Inicio de docstring multilínea
-                self.en_cadena_multilinea = True
-                return False
+        # Caso: línea contiene comillas triples pero no es asignación
+        indice = obtener_indice_lexico(linea_limpia)
+        pos1 = indice.encontrar_sin_comillas('"""')
+        pos2 = indice.encontrar_sin_comillas("'''")
+
+        if pos1 == -1 and pos2 == -1:
+            return not self.en_cadena_multilinea
+
+        # Caso: inicio de nuevo docstring (debe estar al inicio de línea)
+        if not self.en_cadena_multilinea and \
+        self._es_inicio_docstring_valido(linea_limpia):
+            if pos1 != -1:
+                self.delimitador_cadena = '"""'
+            else:
+                self.delimitador_cadena = "'''"
 
-            # Caso: fin de docstring multilínea
-            elif self.en_cadena_multilinea and self.delimitador_cadena in \
-            linea_limpia:
+            # Docstring de una línea: abre y cierra en la misma línea
+            if linea_limpia[3:].endswith(self.delimitador_cadena):
                 self.en_cadena_multilinea = False
                 self.delimitador_cadena = None
                 return True
+
+            # Inicio de docstring multilínea
+            self.en_cadena_multilinea = True
             return False
 
-        # Si no hay comillas triples, la línea está completa solo si
-        # no estamos dentro de un docstring multilínea
-        return not self.en_cadena_multilinea
+        # Caso: fin de docstring multilínea
+        elif self.en_cadena_multilinea and self.delimitador_cadena in \
+        linea_limpia:
+            self.en_cadena_multilinea = False
+            self.delimitador_cadena = None
+            return True
+        return False
 
     def _analizar_delimitadores(self, linea: str) -> bool:
         """
@@ -325,35 +504,18 @@ class ConstructorArbol:
             >>> _analizar_delimitadores('def funcion():')
             True
         """
-        # Buscamos cada tipo de delimitador fuera de cadenas de texto para
-        # evitar falsos positivos con delimitadores en strings
-        pos1 = AnalizadorCadenas.encontrar_sin_comillas(linea, '(', 0, True)
-        pos2 = AnalizadorCadenas.encontrar_sin_comillas(linea, ")", 0, True)
-        pos3 = AnalizadorCadenas.encontrar_sin_comillas(linea, '[', 0, True)
-        pos4 = AnalizadorCadenas.encontrar_sin_comillas(linea, "]", 0, True)
-        pos5 = AnalizadorCadenas.encontrar_sin_comillas(linea, '{', 0, True)
-        pos6 = AnalizadorCadenas.encontrar_sin_comillas(linea, "}", 0, True)
+        # Buscamos delimitadores fuera de cadenas de texto para evitar falsos
+        # positivos; el índice léxico resuelve todos los tipos en una pasada
+        indice = obtener_indice_lexico(linea)
 
         # Si no hay delimitadores, la línea está completa solo si:
         # 1. No hay delimitadores abiertos pendientes de líneas anteriores
         # 2. No termina en continuación explícita (\)
-        if pos1 == -1 and pos2 == -1 and pos3 == -1 and pos4 == -1 and \
-        pos5 == -1 and pos6 == -1:
-            return self.delimitadores_abiertos == 0 and \
-            not linea.rstrip().endswith('\\')
-
-        if self.multilinea_vale_1:
+        if self.multilinea_vale_1 and indice.tiene_corchetes_sin_comillas():
             # Actualizamos el contador de delimitadores abiertos sumando
             # aperturas y restando cierres para mantener el balance en
             # expresiones multilínea
-            self.delimitadores_abiertos += \
-            (AnalizadorCadenas.contar_sin_comillas(linea, '(') +
-                     AnalizadorCadenas.contar_sin_comillas(linea, '[') +
-                     AnalizadorCadenas.contar_sin_comillas(linea, '{'))
-            self.delimitadores_abiertos -= \
-            (AnalizadorCadenas.contar_sin_comillas(linea, ')') +
-                      AnalizadorCadenas.contar_sin_comillas(linea, ']') +
-                      AnalizadorCadenas.contar_sin_comillas(linea, '}'))
+            self.delimitadores_abiertos += indice.balance_corchetes()
 
         # La línea está completa solo si todos los delimitadores están
         # balanceados y no hay continuación explícita
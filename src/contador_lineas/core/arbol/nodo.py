@@ -7,7 +7,7 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing
@@ -19,12 +19,20 @@ Uso:
 
 Notas:
     - Implementa estructura jerárquica padre-hijo
+    - Es el nodo compartido por contador_lineas, lineas_por_clase y
+      analizador_cambios
+    - Usa __slots__ para no reservar un diccionario por instancia, y los nodos
+      hoja comparten una tupla vacía en lugar de tener su propia lista
 """
 
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from contador_lineas.models.nodos import TipoNodo
 
+# Tupla vacía compartida por todos los nodos sin hijos; la lista propia se crea
+# al agregar el primer hijo
+SIN_HIJOS: tuple = ()
+
 
 class Nodo:
     """
@@ -34,12 +42,17 @@ class Nodo:
         tipo (TipoNodo): Tipo de nodo según la enumeración TipoNodo
         contenido (str): Contenido textual del nodo
         nivel_indentacion (int): Nivel de indentación del nodo
-        hijos (List[Nodo]): Lista de nodos hijos
+        hijos (Sequence[Nodo]): Nodos hijos, SIN_HIJOS si no tiene
         padre (Optional[Nodo]): Referencia al nodo padre
+        numero_nodo (Optional[int]): Número del nodo en orden de creación
+        lineas (Optional[List[int]]): Líneas del código fuente que originan
+            el nodo
 
     Methods:
         agregar_hijo(hijo: Nodo) -> None:
             Agrega un nodo hijo a la lista de hijos.
+        obtener_nombre_clase() -> Optional[str]:
+            Obtiene el nombre de la clase si el nodo es de tipo CLASS.
 
     Example:
         >>> nodo = Nodo(TipoNodo.FUNCION, "def ejemplo():", 0)
@@ -47,17 +60,25 @@ class Nodo:
         >>> nodo.agregar_hijo(nodo_hijo)
     """
 
+    __slots__ = ('tipo', 'contenido', 'nivel_indentacion', 'hijos', 'padre',
+                 'numero_nodo', 'lineas')
+
     def __init__(
             self,
             tipo: TipoNodo,
             contenido: str,
-            nivel_indentacion: int
+            nivel_indentacion: int,
+            numero_nodo: Optional[int] = None,
+            lineas: Optional[List[int]] = None
         ):
         self.tipo = tipo
         self.contenido = contenido
         self.nivel_indentacion = nivel_indentacion
-        self.hijos: List[Nodo] = []
+        self.hijos: Sequence[Nodo] = SIN_HIJOS
         self.padre: Optional[Nodo] = None
+        # Permiten mapear un nodo a las líneas de código que lo originan
+        self.numero_nodo = numero_nodo
+        self.lineas = lineas
 
     def agregar_hijo(self, hijo: 'Nodo') -> None:
         """
@@ -67,4 +88,30 @@ class Nodo:
             hijo (Nodo): Nodo a agregar como hijo
         """
         hijo.padre = self
-        self.hijos.append(hijo)
+        if self.hijos is SIN_HIJOS:
+            self.hijos = [hijo]
+        else:
+            self.hijos.append(hijo)
+
+    def obtener_nombre_clase(self) -> Optional[str]:
+        """
+        Obtiene el nombre de la clase si el nodo es de tipo CLASS.
+
+        Returns:
+            Optional[str]: Nombre de la clase o None si no es nodo clase
+
+        Example:
+            >>> nodo = Nodo(TipoNodo.CLASS, "class Formateador:", 0)
+            >>> print(nodo.obtener_nombre_clase())
+            'Formateador'
+        """
+        if self.tipo != TipoNodo.CLASS:
+            return None
+
+        try:
+            if len(self.contenido) == 0:
+                return ""
+            nombre = self.contenido.split("class ")[1].split(":")[0].strip()
+            return nombre
+        except IndexError:
+            return None
@@ -0,0 +1,121 @@
+"""
+Nombre del módulo: recorrido_arbol.py
+Ruta: contador_lineas/core/arbol/recorrido_arbol.py
+Descripción: Recorridos iterativos del árbol sintáctico en preorden y
+             postorden
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - core.arbol.nodo.Nodo
+
+Uso:
+    from contador_lineas.core.arbol.recorrido_arbol import (
+        recorrer_arbol, recorrer_preorden
+    )
+
+    for nodo in recorrer_preorden(raiz):
+        print(nodo.contenido)
+
+    recorrer_arbol(raiz, al_entrar=abrir_bloque, al_salir=cerrar_bloque)
+
+Notas:
+    - Los recorridos usan una pila explícita, así que la profundidad del árbol
+      no está limitada por el límite de recursión de Python
+    - Funcionan con cualquier nodo que tenga el atributo hijos, por lo que
+      sirven para los árboles de los tres paquetes
+"""
+
+from typing import Callable, Iterator, Optional
+
+from contador_lineas.core.arbol.nodo import Nodo
+
+
+def recorrer_preorden(
+        raiz: Nodo,
+        omitir: Optional[Callable[[Nodo], bool]] = None) -> Iterator[Nodo]:
+    """
+    Recorre el árbol visitando cada nodo antes que a sus hijos.
+
+    Args:
+        raiz (Nodo): Nodo donde inicia el recorrido
+        omitir (Optional[Callable[[Nodo], bool]]): Si retorna True para un
+            nodo, ni el nodo ni sus descendientes se visitan
+
+    Returns:
+        Iterator[Nodo]: Nodos en preorden, hijos de izquierda a derecha
+
+    Example:
+        >>> [nodo.contenido for nodo in recorrer_preorden(raiz)]
+        ['', 'def f():', 'return 1']
+    """
+    pila = [raiz]
+    while pila:
+        nodo = pila.pop()
+        if omitir is not None and omitir(nodo):
+            continue
+        yield nodo
+        # Apilamos en orden inverso para que el primer hijo salga primero
+        pila.extend(reversed(nodo.hijos))
+
+
+def recorrer_postorden(raiz: Nodo) -> Iterator[Nodo]:
+    """
+    Recorre el árbol visitando cada nodo después de todos sus hijos.
+
+    Args:
+        raiz (Nodo): Nodo donde inicia el recorrido
+
+    Returns:
+        Iterator[Nodo]: Nodos en postorden, hijos de izquierda a derecha
+
+    Example:
+        >>> [nodo.contenido for nodo in recorrer_postorden(raiz)]
+        ['return 1', 'def f():', '']
+    """
+    # Cada entrada indica si los hijos del nodo ya fueron apilados
+    pila = [(raiz, False)]
+    while pila:
+        nodo, expandido = pila.pop()
+        if expandido:
+            yield nodo
+            continue
+        pila.append((nodo, True))
+        pila.extend((hijo, False) for hijo in reversed(nodo.hijos))
+
+
+def recorrer_arbol(
+        raiz: Nodo,
+        al_entrar: Optional[Callable[[Nodo], Optional[bool]]] = None,
+        al_salir: Optional[Callable[[Nodo], None]] = None) -> None:
+    """
+    Recorre el árbol en profundidad invocando funciones al entrar y salir.
+
+    al_entrar se invoca en preorden y al_salir en postorden. Si al_entrar
+    retorna False, se omiten los descendientes del nodo y su al_salir.
+
+    Args:
+        raiz (Nodo): Nodo donde inicia el recorrido
+        al_entrar (Optional[Callable[[Nodo], Optional[bool]]]): Función
+            invocada antes de visitar a los hijos
+        al_salir (Optional[Callable[[Nodo], None]]): Función invocada después
+            de visitar a todos los hijos
+
+    Example:
+        >>> recorrer_arbol(raiz, al_entrar=print)
+    """
+    pila = [(raiz, False)]
+    while pila:
+        nodo, saliendo = pila.pop()
+        if saliendo:
+            al_salir(nodo)
+            continue
+        if al_entrar is not None and al_entrar(nodo) is False:
+            continue
+        if al_salir is not None:
+            pila.append((nodo, True))
+        pila.extend((hijo, False) for hijo in reversed(nodo.hijos))
@@ -8,14 +8,16 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.analizadores.analizador_cadenas.AnalizadorCadenas
     - core.analizadores.analizador_expresiones.AnalizadorExpresiones
     - core.arbol.nodo.Nodo
+    - core.arbol.recorrido_arbol.recorrer_preorden
     - config.node_types.PARENT_NODE_TYPES, COMMENT_NODE_TYPES, NO_NESTED_ALLOWED
     - models.nodos.TipoNodo
+    - utils.perfil.fase
 
 Uso:
     from contador_lineas.core.arbol.verificador_estandar_codigo import (
@@ -38,10 +40,12 @@ from contador_lineas.core.analizadores.analizador_expresiones import (
     AnalizadorExpresiones
 )
 from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_preorden
 from contador_lineas.config.node_types import (
     PARENT_NODE_TYPES, COMMENT_NODE_TYPES, NO_NESTED_ALLOWED
 )
 from contador_lineas.models.nodos import TipoNodo
+from contador_lineas.utils.perfil import fase
 
 
 class VerificadorEstandarCodigo:
@@ -51,6 +55,8 @@ class VerificadorEstandarCodigo:
     Methods:
         es_arbol_sintactico_valido(self, raiz: Nodo) -> Tuple[bool, str]: 
             Valida si el árbol cumple los estándares
+        validar_nodo_individual(self, nodo: Nodo) -> Tuple[bool, str]:
+            Valida un nodo sin revisar a sus hijos
 
     Example:
         >>> verificador = VerificadorEstandarCodigo()
@@ -60,6 +66,7 @@ class VerificadorEstandarCodigo:
     def __init__(self):
         pass
 
+    @fase("validar estándar")
     def es_arbol_sintactico_valido(self, raiz: Nodo) -> Tuple[bool, str]:
         """
         Verifica si el árbol sintáctico cumple con los estándares de código.
@@ -81,7 +88,7 @@ class VerificadorEstandarCodigo:
 
     def _validar_nodo(self, nodo: Nodo) -> Tuple[bool, str]:
         """
-        Valida recursivamente un nodo y sus hijos con los estándares de código.
+        Valida un nodo y sus descendientes con los estándares de código.
 
         Args:
             nodo (Nodo): Nodo a validar con sus hijos
@@ -95,39 +102,10 @@ class VerificadorEstandarCodigo:
             False "No se permiten expresiones lambda"
         """
         try:
-            # Un archivo vacío no es válido según el estándar de codificación
-            if nodo.tipo == TipoNodo.ROOT and len(nodo.hijos) == 0:
-                return False, "El archivo debe tener al menos una línea de " + \
-                "código"
-
-            # Los nodos padre (funciones, clases, etc.) deben tener contenido
-            # para evitar definiciones vacías
-            if nodo.tipo in PARENT_NODE_TYPES and len(nodo.hijos) == 0:
-                return False, f"La estructura {nodo.tipo} debe tener contenido"
-
-            # Solo verificamos declaraciones múltiples en código ejecutable,
-            # ignorando comentarios y docstrings
-            if (nodo.tipo not in COMMENT_NODE_TYPES and
-                    self._tiene_multiples_declaraciones(nodo.contenido)):
-                return False, "No se permiten varias declaraciones en una línea"
-
-            # No se permiten operadores ternarios/comprehension/generator según
-            # el estándar de codificación
-            if (nodo.tipo not in COMMENT_NODE_TYPES and
-                    self._tiene_operadores_anidados(nodo)):
-                return False, "No se permiten operadores " + \
-                "ternarios/comprehension/generator anidados"
-
-            # No se permiten expresiones lambda según el estándar de
-            # codificación
-            if (nodo.tipo not in COMMENT_NODE_TYPES and
-                    self._tiene_expresion_lambda(nodo.contenido)):
-                return False, "No se permiten expresiones lambda"
-
-            # Validación recursiva de todos los hijos para asegurar cumplimiento
-            # completo del estándar
-            for hijo in nodo.hijos:
-                es_valido, error = self._validar_nodo(hijo)
+            # Validamos todo el subárbol en preorden para reportar la primera
+            # violación; el recorrido iterativo admite anidamiento profundo
+            for descendiente in recorrer_preorden(nodo):
+                es_valido, error = self.validar_nodo_individual(descendiente)
                 if not es_valido:
                     return False, error
 
@@ -135,6 +113,52 @@ class VerificadorEstandarCodigo:
         except Exception as e:
             return False, f"Error al validar nodo: {str(e)}"
 
+    def validar_nodo_individual(self, nodo: Nodo) -> Tuple[bool, str]:
+        """
+        Valida un nodo con los estándares de código sin revisar a sus hijos.
+
+        Args:
+            nodo (Nodo): Nodo a validar
+
+        Returns:
+            Tuple[bool, str]: (es_valido, mensaje_error)
+
+        Example:
+            >>> verificador.validar_nodo_individual(nodo_lambda)
+            (False, "No se permiten expresiones lambda")
+        """
+        # Un archivo vacío no es válido según el estándar de codificación
+        if nodo.tipo == TipoNodo.ROOT and len(nodo.hijos) == 0:
+            return False, "El archivo debe tener al menos una línea de " + \
+            "código"
+
+        # Los nodos padre (funciones, clases, etc.) deben tener contenido
+        # para evitar definiciones vacías
+        if nodo.tipo in PARENT_NODE_TYPES and len(nodo.hijos) == 0:
+            return False, f"La estructura {nodo.tipo} debe tener contenido"
+
+        # Los comentarios y docstrings no se validan como código
+        if nodo.tipo in COMMENT_NODE_TYPES:
+            return True, ""
+
+        # Solo verificamos declaraciones múltiples en código ejecutable,
+        # ignorando comentarios y docstrings
+        if self._tiene_multiples_declaraciones(nodo.contenido):
+            return False, "No se permiten varias declaraciones en una línea"
+
+        # No se permiten operadores ternarios/comprehension/generator según
+        # el estándar de codificación
+        if self._tiene_operadores_anidados(nodo):
+            return False, "No se permiten operadores " + \
+            "ternarios/comprehension/generator anidados"
+
+        # No se permiten expresiones lambda según el estándar de
+        # codificación
+        if self._tiene_expresion_lambda(nodo.contenido):
+            return False, "No se permiten expresiones lambda"
+
+        return True, ""
+
     @staticmethod
     def _tiene_multiples_declaraciones(contenido: str) -> bool:
         """
@@ -153,6 +177,11 @@ class VerificadorEstandarCodigo:
             >>> print(tiene)
             True
         """
+        # La gran mayoría de las líneas no tiene punto y coma; evitamos
+        # recorrerlas carácter por carácter
+        if ';' not in contenido:
+            return False
+
         # Usamos banderas para rastrear si estamos dentro de cadenas y evitar
         # falsos positivos con punto y coma en strings
         en_comilla_simple = False
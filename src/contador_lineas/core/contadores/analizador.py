@@ -7,12 +7,15 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.contadores.contador_fisico.ContadorLineasFisicas
     - core.contadores.contador_logico.ContadorLineasLogicas
+    - core.contadores.recorrido_metricas.RecorridoMetricas
     - core.gestion_archivos.lector_archivo.LectorArchivoPython
+    - core.gestion_archivos.cache_resultados.CacheResultados
+    - core.gestion_archivos.cache_arboles.CacheArboles
     - core.gestion_archivos.manejador_json.AlmacenamientoMetricas
     - core.arbol_sintaxis.arbol_archivo.ArbolArchivoPython
     - models.metricas.MetricasArchivo
@@ -27,10 +30,21 @@ Uso:
 Notas:
     - Procesa solo archivos Python válidos
     - Retorna métricas de líneas físicas y lógicas
+    - Con leer_en_flujo y sin caché, el árbol se construye leyendo el
+      archivo línea por línea: la memoria la ocupa el árbol, no además la
+      lista de líneas
+    - Con una caché de árboles, el árbol se carga de ella en lugar de
+      construirse; como la clave depende de todas las líneas, el archivo se
+      lee completo aunque se pida leer en flujo
+    - Con umbral_mapeo, un archivo leído en flujo que alcanza ese tamaño se
+      mapea en memoria (LectorArchivoPython.mapear) y el árbol se construye
+      desde el mapeo; está desactivado por defecto porque construir el árbol
+      domina el tiempo y leer en flujo no resultó más lento
 """
 
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, List
 
 from contador_lineas.core.contadores.contador_fisico import (
     ContadorLineasFisicas
@@ -38,17 +52,27 @@ from contador_lineas.core.contadores.contador_fisico import (
 from contador_lineas.core.contadores.contador_logico import (
     ContadorLineasLogicas
 )
+from contador_lineas.core.contadores.recorrido_metricas import (
+    RecorridoMetricas
+)
 from contador_lineas.core.gestion_archivos.lector_archivo import (
     LectorArchivoPython
 )
 from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
     AlmacenamientoMetricas
 )
+from contador_lineas.core.gestion_archivos.cache_resultados import (
+    CacheResultados, EntradaCache
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.core.arbol.arbol_sintactico import ArbolArchivoPython
 from contador_lineas.core.arbol.verificador_estandar_codigo import (
     VerificadorEstandarCodigo
 )
 from contador_lineas.models.metricas import MetricasArchivo
+from contador_lineas.utils.archivo_utils import (
+    decodificar_lineas, describir_error_lectura, leer_archivo_bytes
+)
 
 
 class ExcepcionAnalizador(Exception):
@@ -96,26 +120,54 @@ class AnalizadorCodigo:
 
     Attributes:
         almacenamiento (AlmacenamientoMetricas): Gestor de almacenamiento
+        cache (Optional[CacheResultados]): Caché de resultados por contenido
+        leer_en_flujo (bool): Si True, el archivo se lee línea por línea
+            sin guardar sus líneas en codigo ni en el árbol, por lo que no
+            admite aplicar_edicion
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+            con lineas_por_clase y analizador_cambios
+        umbral_mapeo (Optional[int]): Tamaño en bytes desde el que un
+            archivo leído en flujo se mapea en memoria, o None para no
+            mapear nunca
         formateador (FormateadorLinea): Formateador de líneas
         contador_fisico (ContadorLineasFisicas): Contador de líneas físicas
         contador_logico (ContadorLineasLogicas): Contador de líneas lógicas
+        recorrido_metricas (RecorridoMetricas): Validación y conteo en un
+            solo recorrido del árbol
 
     Methods:
         analizar_archivo(ruta_archivo: str, 
             nombre_archivo: str) -> ResultadoAnalisis:
             Analiza un archivo Python y retorna sus métricas.
+        obtener_metricas(ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+            Calcula las métricas de un archivo sin almacenarlas.
+        aplicar_edicion(linea_inicio: int, linea_fin: int,
+            nuevas_lineas: Sequence[str],
+            metricas: MetricasArchivo) -> MetricasArchivo:
+            Actualiza las métricas tras editar un rango de líneas.
 
     Example:
         >>> analizador = Analizador()
         >>> resultado = analizador.analizar_archivo("script.py", "script.py")
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            cache: Optional[CacheResultados] = None,
+            leer_en_flujo: bool = False,
+            cache_arboles: Optional[CacheArboles] = None,
+            umbral_mapeo: Optional[int] = None):
+        self.cache = cache
+        self.leer_en_flujo = leer_en_flujo
+        self.cache_arboles = cache_arboles
+        self.umbral_mapeo = umbral_mapeo
         self.arbol = None
         self.codigo = None
         self.contador_fisico = ContadorLineasFisicas()
         self.contador_logico = ContadorLineasLogicas()
         self.verificador_estandar = VerificadorEstandarCodigo()
+        self.recorrido_metricas = RecorridoMetricas()
 
     def validate_syntax_tree(
             self, tree: ArbolArchivoPython) -> Tuple[bool, Optional[str]]:
@@ -137,7 +189,8 @@ class AnalizadorCodigo:
             self, 
             ruta_archivo: str, 
             nombre_archivo: str, 
-            ruta_almacenamiento: str = "db/metricas_registro.json"
+            ruta_almacenamiento: str = "db/metricas_registro.json",
+            almacen: Optional[AlmacenamientoMetricas] = None
         ) -> ResultadoAnalisis:
         """
         Analiza un archivo Python y obtiene sus métricas.
@@ -145,6 +198,9 @@ class AnalizadorCodigo:
         Args:
             ruta_archivo (str): Ruta al archivo
             nombre_archivo (str): Nombre del archivo
+            ruta_almacenamiento (str): Registro a usar si no se inyecta almacen
+            almacen (Optional[AlmacenamientoMetricas]): Almacenamiento
+                compartido; evita abrir el registro en cada llamada
 
         Returns:
             ResultadoAnalisis: Métricas del archivo
@@ -152,14 +208,180 @@ class AnalizadorCodigo:
         Example:
             >>> analizar_archivo("script.py", "script.py")
         """
+        metricas = self.obtener_metricas(ruta_archivo, nombre_archivo)
+        if almacen is None:
+            almacen = AlmacenamientoMetricas(ruta_almacenamiento)
+        almacen.guardar_metricas(metricas)
+        return self._crear_resultado(metricas)
+
+    def obtener_metricas(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Valida, lee y mide un archivo Python sin almacenar sus métricas.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo es inválido o viola el estándar
+
+        Example:
+            >>> obtener_metricas("script.py", "script.py")
+        """
+        # Un acierto de caché o un error no construyen árbol; se descarta el
+        # del archivo anterior para que aplicar_edicion no lo edite
+        self.arbol = None
+        self.codigo = None
+
         # El flujo de análisis sigue un orden específico para garantizar la
-        # validez del código antes de procesar y almacenar métricas
+        # validez del código antes de procesar métricas
         self._validar_archivo(ruta_archivo)
+        if self.cache is not None:
+            return self._obtener_metricas_con_cache(ruta_archivo,
+                                                    nombre_archivo)
+        if self.leer_en_flujo and self.cache_arboles is None:
+            if self._debe_mapear(ruta_archivo):
+                return self._procesar_mapeado(ruta_archivo, nombre_archivo)
+            return self._procesar_codigo(self._iterar_codigo(ruta_archivo),
+                                         nombre_archivo)
         codigo = self._obtener_codigo(ruta_archivo)
         self.codigo = codigo
-        metricas = self._procesar_codigo(codigo, nombre_archivo)
-        AlmacenamientoMetricas(ruta_almacenamiento).guardar_metricas(metricas)
-        return self._crear_resultado(metricas)
+        return self._procesar_codigo(codigo, nombre_archivo)
+
+    def aplicar_edicion(
+            self,
+            linea_inicio: int,
+            linea_fin: int,
+            nuevas_lineas: Sequence[str],
+            metricas: MetricasArchivo) -> MetricasArchivo:
+        """
+        Actualiza las métricas del último archivo analizado tras una edición.
+
+        Reemplaza las líneas [linea_inicio, linea_fin) en el árbol, valida
+        solo los bloques reconstruidos y ajusta los conteos restando los de
+        los bloques retirados y sumando los de los nuevos.
+
+        Args:
+            linea_inicio (int): Primera línea reemplazada, desde 0
+            linea_fin (int): Línea siguiente a la última reemplazada
+            nuevas_lineas (Sequence[str]): Líneas que ocupan el rango
+            metricas (MetricasArchivo): Métricas del código antes de editarlo
+
+        Returns:
+            MetricasArchivo: Métricas del código editado
+
+        Raises:
+            ExcepcionAnalizador: Si no hay un árbol analizado con su código
+                                 (ver leer_en_flujo; un acierto de la caché
+                                 de resultados tampoco deja árbol) o el
+                                 código editado
+                                 viola el estándar; en ese caso el árbol se
+                                 descarta, como en un análisis completo
+
+        Example:
+            >>> metricas = analizador.obtener_metricas("script.py", "script.py")
+            >>> analizador.aplicar_edicion(10, 11, ["    return 2"], metricas)
+        """
+        arbol = self.arbol
+        if arbol is None or arbol.lineas is None:
+            raise ExcepcionAnalizador("No hay un árbol analizado con su "
+                                      "código que editar")
+
+        edicion = arbol.aplicar_edicion(linea_inicio, linea_fin, nuevas_lineas)
+        self.codigo = arbol.lineas
+
+        # Los bloques que no cambiaron ya cumplían el estándar; solo falta la
+        # raíz, que deja de ser válida si el archivo queda sin código
+        es_valido, error = \
+        self.verificador_estandar.validar_nodo_individual(arbol.raiz)
+        nuevos = self.recorrido_metricas.recorrer_nodos(edicion.nodos_nuevos)
+        if es_valido and not nuevos.es_valido:
+            es_valido, error = False, nuevos.error
+        if not es_valido:
+            self.arbol = None
+            raise ExcepcionAnalizador(f"Violación del estándar: {error}")
+
+        anteriores = self.recorrido_metricas.recorrer_nodos(
+            edicion.nodos_anteriores)
+        return MetricasArchivo(
+            nombre_archivo=metricas.nombre_archivo,
+            lineas_fisicas=metricas.lineas_fisicas -
+            anteriores.lineas_fisicas + nuevos.lineas_fisicas,
+            lineas_logicas=metricas.lineas_logicas -
+            anteriores.lineas_logicas + nuevos.lineas_logicas
+        )
+
+    def _obtener_metricas_con_cache(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Obtiene las métricas desde la caché o las calcula y las almacena.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo ya validado
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            MetricasArchivo: Métricas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo no se puede leer o viola el
+                                 estándar (también cuando viene de la caché)
+
+        Example:
+            >>> self._obtener_metricas_con_cache("script.py", "script.py")
+        """
+        contenido, error = leer_archivo_bytes(ruta_archivo)
+        if error:
+            raise ExcepcionAnalizador(f"Error al leer archivo: {error}")
+
+        # Un acierto evita decodificar, construir el árbol y validar
+        entrada = self.cache.obtener(contenido)
+        if entrada is None:
+            codigo, error = decodificar_lineas(contenido)
+            if error:
+                raise ExcepcionAnalizador(f"Error al leer archivo: {error}")
+            self.codigo = codigo
+            entrada = self._analizar_para_cache(codigo, nombre_archivo)
+            self.cache.guardar(contenido, entrada)
+
+        # Las violaciones del estándar dependen solo del contenido, así que
+        # también se reproducen desde la caché
+        if not entrada.es_valido:
+            raise ExcepcionAnalizador(entrada.error)
+        return MetricasArchivo(
+            nombre_archivo=nombre_archivo,
+            lineas_logicas=entrada.lineas_logicas,
+            lineas_fisicas=entrada.lineas_fisicas
+        )
+
+    def _analizar_para_cache(
+            self,
+            codigo: List[str],
+            nombre_archivo: str) -> EntradaCache:
+        """
+        Analiza el código y empaqueta el resultado como entrada de caché.
+
+        Args:
+            codigo (List[str]): Líneas de código a procesar
+            nombre_archivo (str): Nombre del archivo procesado
+
+        Returns:
+            EntradaCache: Métricas o violación del estándar encontrada
+        """
+        try:
+            metricas = self._procesar_codigo(codigo, nombre_archivo)
+        except ExcepcionAnalizador as e:
+            return EntradaCache(0, 0, False, str(e))
+        return EntradaCache(metricas.lineas_fisicas, metricas.lineas_logicas,
+                            True, "")
 
     def _validar_archivo(self, ruta_archivo: str) -> None:
         """
@@ -200,14 +422,81 @@ class AnalizadorCodigo:
             raise ExcepcionAnalizador(f"Error al leer archivo: {error}")
         return codigo
 
+    def _iterar_codigo(self, ruta_archivo: str) -> Iterator[str]:
+        """
+        Recorre las líneas del archivo sin guardarlas.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo ya validado
+
+        Returns:
+            Iterator[str]: Líneas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo no se puede leer; se lanza
+                                 durante el recorrido
+
+        Example:
+            >>> arbol = ArbolArchivoPython(self._iterar_codigo("script.py"))
+        """
+        try:
+            yield from LectorArchivoPython(ruta_archivo).iterar_lineas()
+        except (OSError, UnicodeDecodeError) as e:
+            raise ExcepcionAnalizador(
+                f"Error al leer archivo: {describir_error_lectura(e, 'utf-8')}")
+
+    def _debe_mapear(self, ruta_archivo: str) -> bool:
+        """
+        Indica si el archivo alcanza el tamaño para mapearlo en memoria.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo ya validado
+
+        Returns:
+            bool: True si hay umbral_mapeo y el archivo lo alcanza
+        """
+        return (self.umbral_mapeo is not None and
+                Path(ruta_archivo).stat().st_size >= self.umbral_mapeo)
+
+    def _procesar_mapeado(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Procesa el archivo construyendo el árbol desde su mapeo en memoria.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo ya validado
+            nombre_archivo (str): Nombre del archivo procesado
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del código
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo no se puede leer o viola el
+                                 estándar
+
+        Example:
+            >>> metricas = self._procesar_mapeado("grande.py", "grande.py")
+        """
+        # Los nodos guardan copias de sus líneas, así que el mapeo se puede
+        # cerrar en cuanto el árbol está construido
+        try:
+            with LectorArchivoPython(ruta_archivo).mapear() as archivo:
+                return self._procesar_codigo(archivo, nombre_archivo)
+        except (OSError, UnicodeDecodeError) as e:
+            error = describir_error_lectura(e, 'utf-8')
+            raise ExcepcionAnalizador(f"Error al leer archivo: {error}")
+
     def _procesar_codigo(
-            self, codigo: List[str], nombre_archivo: str
+            self, codigo: Iterable[str], nombre_archivo: str
         ) -> MetricasArchivo:
         """
         Procesa el código y calcula sus métricas.
 
         Args:
-            codigo (List[str]): Líneas de código a procesar
+            codigo (Iterable[str]): Líneas de código a procesar, en una
+                lista o en un flujo
             nombre_archivo (str): Nombre del archivo procesado
 
         Returns:
@@ -216,18 +505,19 @@ class AnalizadorCodigo:
         Example:
             >>> metricas = self._procesar_codigo(codigo, "script.py")
         """
-        # Construimos y validamos el AST primero para asegurar que el código
-        # cumple con el estándar antes de calcular métricas
-        arbol = ArbolArchivoPython(codigo)
-        self._validar_arbol_sintaxis(arbol)
+        # Validamos y contamos en un mismo recorrido; las métricas solo se
+        # usan si el código cumple con el estándar
+        arbol = ArbolArchivoPython(codigo, self.cache_arboles)
+        resultado = self.recorrido_metricas.recorrer(arbol.raiz)
+        if not resultado.es_valido:
+            raise ExcepcionAnalizador(
+                f"Violación del estándar: {resultado.error}")
         self.arbol = arbol
 
         return MetricasArchivo(
             nombre_archivo=nombre_archivo,
-            lineas_fisicas = \
-            self.contador_fisico.contar_lineas_fisicas( arbol.raiz ),
-            lineas_logicas = \
-            self.contador_logico.contar_lineas_logicas( arbol.raiz )
+            lineas_fisicas=resultado.lineas_fisicas,
+            lineas_logicas=resultado.lineas_logicas
         )
 
     def _validar_arbol_sintaxis(self, arbol: ArbolArchivoPython) -> None:
@@ -0,0 +1,270 @@
+"""
+Nombre del módulo: analizador_lote.py
+Ruta: contador_lineas/core/contadores/analizador_lote.py
+Descripción: Analiza directorios completos de archivos Python en paralelo
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - concurrent.futures.ProcessPoolExecutor (con más de un trabajador)
+    - core.contadores.analizador.AnalizadorCodigo, ExcepcionAnalizador
+    - core.gestion_archivos.cache_resultados.CacheResultados
+    - core.gestion_archivos.cache_arboles.CacheArboles
+    - models.metricas.MetricasArchivo
+
+Uso:
+    from contador_lineas.core.contadores.analizador_lote import (
+        AnalizadorLote
+    )
+
+    analizador = AnalizadorLote(trabajadores=4)
+    for resultado in analizador.analizar_directorio("proyecto", True):
+        print(resultado.nombre_archivo, resultado.error)
+
+Notas:
+    - Los archivos se descubren y se envían al pool de forma perezosa, con un
+      número acotado de grupos en vuelo para mantener la memoria constante
+    - agrupar y ejecutar_por_grupos también los usan los lotes de
+      analizador_cambios y analisis_completo
+    - Las métricas se registran con la ruta relativa al directorio analizado
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+from contador_lineas.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from contador_lineas.core.gestion_archivos.cache_resultados import (
+    CacheResultados
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.models.metricas import MetricasArchivo
+
+# Archivos enviados a un proceso en cada tarea; agrupar reduce el costo de
+# comunicación entre procesos frente a enviar archivo por archivo
+TAMANO_GRUPO = 32
+
+# Grupos en vuelo por trabajador; limita los resultados pendientes en memoria
+GRUPOS_POR_TRABAJADOR = 2
+
+
+@dataclass
+class ResultadoLote:
+    """
+    Resultado del análisis de un archivo dentro de un lote.
+
+    Attributes:
+        nombre_archivo (str): Nombre con el que se registra el archivo
+        metricas (Optional[MetricasArchivo]): Métricas o None si hubo error
+        error (Optional[str]): Mensaje de error o None si fue exitoso
+
+    Example:
+        >>> ResultadoLote("pkg/mod.py", metricas, None)
+    """
+
+    nombre_archivo: str
+    metricas: Optional[MetricasArchivo]
+    error: Optional[str]
+
+
+def agrupar(elementos: Iterable[Any], tamano: int) -> Iterator[List[Any]]:
+    """
+    Agrupa los elementos en listas de tamaño tamano sin consumirlos antes.
+
+    Args:
+        elementos (Iterable[Any]): Elementos a agrupar
+        tamano (int): Elementos por grupo; el último puede tener menos
+
+    Returns:
+        Iterator[List[Any]]: Grupos de elementos
+
+    Example:
+        >>> list(agrupar(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    grupo = []
+    for elemento in elementos:
+        grupo.append(elemento)
+        if len(grupo) >= tamano:
+            yield grupo
+            grupo = []
+    if grupo:
+        yield grupo
+
+
+def ejecutar_por_grupos(
+        funcion: Callable[..., List[Any]],
+        grupos: Iterable[List[Any]],
+        trabajadores: int,
+        *args: Any) -> Iterator[Any]:
+    """
+    Ejecuta funcion(grupo, *args) para cada grupo y entrega sus resultados.
+
+    Args:
+        funcion (Callable[..., List[Any]]): Función de módulo que procesa un
+            grupo y retorna un resultado por elemento
+        grupos (Iterable[List[Any]]): Grupos a procesar, consumidos de forma
+            perezosa
+        trabajadores (int): Número de procesos trabajadores
+        *args (Any): Argumentos adicionales para funcion
+
+    Returns:
+        Iterator[Any]: Resultados en el orden en que terminan los grupos
+
+    Example:
+        >>> list(ejecutar_por_grupos(_analizar_grupo, grupos, 4, None, None))
+    """
+    # Con un solo trabajador evitamos el costo de levantar procesos
+    if trabajadores == 1:
+        for grupo in grupos:
+            yield from funcion(grupo, *args)
+        return
+
+    # concurrent.futures arrastra logging y multiprocessing; con un solo
+    # trabajador no se cargan
+    from concurrent.futures import (
+        FIRST_COMPLETED, ProcessPoolExecutor, wait
+    )
+
+    limite_en_vuelo = trabajadores * GRUPOS_POR_TRABAJADOR
+    with ProcessPoolExecutor(max_workers=trabajadores) as ejecutor:
+        pendientes = set()
+        for grupo in grupos:
+            pendientes.add(ejecutor.submit(funcion, grupo, *args))
+            # Solo enviamos más trabajo cuando algún grupo termina, así la
+            # memoria no crece con el tamaño del repositorio
+            if len(pendientes) >= limite_en_vuelo:
+                terminados, pendientes = wait(
+                    pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminados:
+                    yield from futuro.result()
+
+        for futuro in wait(pendientes).done:
+            yield from futuro.result()
+
+
+def _analizar_grupo(
+        archivos: List[Tuple[str, str]],
+        cache: Optional[CacheResultados] = None,
+        cache_arboles: Optional[CacheArboles] = None) -> List[ResultadoLote]:
+    """
+    Analiza un grupo de archivos dentro de un proceso trabajador.
+
+    Args:
+        archivos (List[Tuple[str, str]]): Pares (ruta_archivo, nombre_archivo)
+        cache (Optional[CacheResultados]): Caché de resultados compartida
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Returns:
+        List[ResultadoLote]: Resultado de cada archivo del grupo
+    """
+    # Debe ser una función de módulo para que el pool pueda serializarla;
+    # solo se devuelven métricas, así que los archivos se leen en flujo
+    analizador = AnalizadorCodigo(cache, leer_en_flujo=True,
+                                  cache_arboles=cache_arboles)
+    resultados = []
+    for ruta_archivo, nombre_archivo in archivos:
+        try:
+            metricas = analizador.obtener_metricas(ruta_archivo, nombre_archivo)
+            resultados.append(ResultadoLote(nombre_archivo, metricas, None))
+        except ExcepcionAnalizador as e:
+            resultados.append(ResultadoLote(nombre_archivo, None, str(e)))
+        except Exception as e:
+            resultados.append(ResultadoLote(
+                nombre_archivo, None, f"Error inesperado: {str(e)}"))
+    return resultados
+
+
+class AnalizadorLote:
+    """
+    Analiza todos los archivos Python de un directorio.
+
+    Attributes:
+        trabajadores (int): Número de procesos trabajadores
+        tamano_grupo (int): Archivos enviados por tarea
+        cache (Optional[CacheResultados]): Caché de resultados por contenido
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+
+    Methods:
+        descubrir_archivos(ruta_directorio: str,
+                           recursivo: bool) -> Iterator[Tuple[str, str]]:
+            Enumera los archivos Python del directorio.
+        analizar_directorio(ruta_directorio: str,
+                            recursivo: bool) -> Iterator[ResultadoLote]:
+            Analiza los archivos y entrega resultados conforme terminan.
+
+    Example:
+        >>> analizador = AnalizadorLote(trabajadores=2)
+        >>> list(analizador.analizar_directorio("src", recursivo=True))
+    """
+
+    def __init__(
+            self,
+            trabajadores: Optional[int] = None,
+            tamano_grupo: int = TAMANO_GRUPO,
+            cache: Optional[CacheResultados] = None,
+            cache_arboles: Optional[CacheArboles] = None):
+        self.trabajadores = trabajadores or os.cpu_count() or 1
+        self.tamano_grupo = tamano_grupo
+        self.cache = cache
+        self.cache_arboles = cache_arboles
+
+    def descubrir_archivos(
+            self,
+            ruta_directorio: str,
+            recursivo: bool = False) -> Iterator[Tuple[str, str]]:
+        """
+        Enumera los archivos .py del directorio de forma perezosa.
+
+        Args:
+            ruta_directorio (str): Directorio a explorar
+            recursivo (bool): Si True, incluye subdirectorios
+
+        Returns:
+            Iterator[Tuple[str, str]]: Pares (ruta_archivo, nombre_archivo)
+
+        Example:
+            >>> list(descubrir_archivos("src", True))
+            [('src/mod.py', 'mod.py')]
+        """
+        raiz = Path(ruta_directorio)
+        for directorio, subdirectorios, archivos in os.walk(raiz):
+            # Ordenamos para que el orden de los resultados sea reproducible
+            subdirectorios.sort()
+            if not recursivo:
+                subdirectorios.clear()
+            for archivo in sorted(archivos):
+                if not archivo.endswith('.py'):
+                    continue
+                ruta = Path(directorio) / archivo
+                yield str(ruta), ruta.relative_to(raiz).as_posix()
+
+    def analizar_directorio(
+            self,
+            ruta_directorio: str,
+            recursivo: bool = False) -> Iterator[ResultadoLote]:
+        """
+        Analiza los archivos del directorio repartiéndolos entre procesos.
+
+        Args:
+            ruta_directorio (str): Directorio a analizar
+            recursivo (bool): Si True, incluye subdirectorios
+
+        Returns:
+            Iterator[ResultadoLote]: Resultados en el orden en que terminan
+
+        Example:
+            >>> for resultado in analizar_directorio("src", True):
+            ...     print(resultado.nombre_archivo)
+        """
+        grupos = agrupar(self.descubrir_archivos(ruta_directorio, recursivo),
+                         self.tamano_grupo)
+        return ejecutar_por_grupos(_analizar_grupo, grupos, self.trabajadores,
+                                   self.cache, self.cache_arboles)
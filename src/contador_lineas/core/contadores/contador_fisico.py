@@ -7,12 +7,14 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.arbol.nodo.Nodo
+    - core.arbol.recorrido_arbol.recorrer_preorden
     - config.node_types.COMMENT_NODE_TYPES, VALID_CODE_NODE_TYPES
     - models.nodos.TipoNodo
+    - utils.perfil.fase
 
 Uso:
     from from contador_lineas.core.contadores.contador_fisico import (
@@ -28,10 +30,12 @@ Notas:
 """
 
 from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_preorden
 from contador_lineas.config.node_types import (
     COMMENT_NODE_TYPES, VALID_CODE_NODE_TYPES
 )
 from contador_lineas.models.nodos import TipoNodo
+from contador_lineas.utils.perfil import fase
 
 
 class ContadorLineasFisicas:
@@ -44,6 +48,10 @@ class ContadorLineasFisicas:
     Methods:
         contar_lineas_fisicas(raiz: Nodo) -> int:
             Cuenta el total de líneas físicas en el árbol.
+        omite_subarbol(nodo: Nodo) -> bool:
+            Indica si el nodo y sus descendientes se excluyen del conteo.
+        contar_lineas_propias(nodo: Nodo) -> int:
+            Cuenta las líneas físicas del nodo sin sus hijos.
 
     Example:
         >>> contador = ContadorLineasFisicas()
@@ -51,6 +59,7 @@ class ContadorLineasFisicas:
     """
 
     @staticmethod
+    @fase("contar")
     def contar_lineas_fisicas(raiz: Nodo) -> int:
         """
         Cuenta líneas físicas totales en un árbol sintáctico.
@@ -70,7 +79,7 @@ class ContadorLineasFisicas:
     @staticmethod
     def _contar_lineas_nodo(nodo: Nodo) -> int:
         """
-        Cuenta líneas físicas para un nodo específico.
+        Cuenta líneas físicas de un nodo y sus descendientes.
 
         Args:
             nodo (Nodo): Nodo a procesar
@@ -82,26 +91,52 @@ class ContadorLineasFisicas:
             >>> _contar_lineas_nodo(nodo)
             4
         """
-        if (nodo.tipo != TipoNodo.ROOT and nodo.tipo != TipoNodo.CLASS):
-            if len(nodo.contenido) == 0:
-                return 0
-        
-        contador = 0
+        # Recorrido iterativo: el código muy anidado no alcanza el límite de
+        # recursión. Un nodo omitido excluye también a sus descendientes
+        return sum(
+            ContadorLineasFisicas.contar_lineas_propias(descendiente)
+            for descendiente in recorrer_preorden(
+                nodo, ContadorLineasFisicas.omite_subarbol)
+        )
+
+    @staticmethod
+    def omite_subarbol(nodo: Nodo) -> bool:
+        """
+        Indica si el nodo y todos sus descendientes se excluyen del conteo.
+
+        Args:
+            nodo (Nodo): Nodo a evaluar
+
+        Returns:
+            bool: True si el nodo está vacío y no es raíz ni clase
+        """
+        return (nodo.tipo != TipoNodo.ROOT and nodo.tipo != TipoNodo.CLASS
+                and len(nodo.contenido) == 0)
+
+    @staticmethod
+    def contar_lineas_propias(nodo: Nodo) -> int:
+        """
+        Cuenta las líneas físicas del nodo sin incluir a sus hijos.
+
+        Args:
+            nodo (Nodo): Nodo a procesar
+
+        Returns:
+            int: Líneas físicas del propio nodo
+
+        Example:
+            >>> ContadorLineasFisicas.contar_lineas_propias(nodo_import)
+            2  # Para 'import os, sys'
+        """
         if nodo.tipo == TipoNodo.IMPORT:
-            contador += ContadorLineasFisicas._procesar_importacion(nodo)
-        elif nodo.tipo == TipoNodo.ASSIGNMENT:
-            contador += ContadorLineasFisicas._procesar_asignacion(nodo)
-        elif nodo.tipo in COMMENT_NODE_TYPES:
-            contador += 0 # Explícitamente ignoramos comentarios
-        elif nodo.tipo in VALID_CODE_NODE_TYPES:
-            contador += 1
-
-        # Procesamiento recursivo necesario para mantener la estructura
-        # jerárquica del árbol
-        for hijo in nodo.hijos:
-            contador += ContadorLineasFisicas._contar_lineas_nodo(hijo)
-
-        return contador
+            return ContadorLineasFisicas._procesar_importacion(nodo)
+        if nodo.tipo == TipoNodo.ASSIGNMENT:
+            return ContadorLineasFisicas._procesar_asignacion(nodo)
+        if nodo.tipo in COMMENT_NODE_TYPES:
+            return 0 # Explícitamente ignoramos comentarios
+        if nodo.tipo in VALID_CODE_NODE_TYPES:
+            return 1
+        return 0
 
     @staticmethod
     def _procesar_importacion(nodo: Nodo) -> int:
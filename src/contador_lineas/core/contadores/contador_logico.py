@@ -7,11 +7,13 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.arbol.nodo.Nodo
+    - core.arbol.recorrido_arbol.recorrer_preorden
     - config.node_types.LOGICAL_NODE_TYPES
+    - utils.perfil.fase
 
 Uso:
     from contador_lineas.core.contadores.contador_logico import (
@@ -27,8 +29,10 @@ Notas:
 """
 
 from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_preorden
 from contador_lineas.config.node_types import LOGICAL_NODE_TYPES
 from contador_lineas.models.nodos import TipoNodo
+from contador_lineas.utils.perfil import fase
 
 class ContadorLineasLogicas:
     """
@@ -40,6 +44,10 @@ class ContadorLineasLogicas:
     Methods:
         contar_lineas_logicas(raiz: Nodo) -> int:
             Cuenta el total de líneas lógicas en el árbol.
+        omite_subarbol(nodo: Nodo) -> bool:
+            Indica si el nodo y sus descendientes se excluyen del conteo.
+        contar_lineas_propias(nodo: Nodo) -> int:
+            Cuenta las líneas lógicas del nodo sin sus hijos.
 
     Example:
         >>> contador = ContadorLineasLogicas()
@@ -47,6 +55,7 @@ class ContadorLineasLogicas:
     """
 
     @staticmethod
+    @fase("contar")
     def contar_lineas_logicas(raiz: Nodo) -> int:
         """
         Cuenta líneas lógicas totales en un árbol sintáctico.
@@ -66,7 +75,7 @@ class ContadorLineasLogicas:
     @staticmethod
     def _contar_lineas_nodo(nodo: Nodo) -> int:
         """
-        Cuenta líneas lógicas para un nodo específico.
+        Cuenta líneas lógicas de un nodo y sus descendientes.
 
         Args:
             nodo (Nodo): Nodo a procesar
@@ -78,20 +87,39 @@ class ContadorLineasLogicas:
             >>> _contar_lineas_nodo(nodo)
             1
         """
-        if nodo.tipo != TipoNodo.ROOT and len(nodo.contenido) == 0:
-            return 0
-        
-        contador = 0
+        # Recorrido iterativo: el código muy anidado no alcanza el límite de
+        # recursión. Un nodo omitido excluye también a sus descendientes
+        return sum(
+            ContadorLineasLogicas.contar_lineas_propias(descendiente)
+            for descendiente in recorrer_preorden(
+                nodo, ContadorLineasLogicas.omite_subarbol)
+        )
 
+    @staticmethod
+    def omite_subarbol(nodo: Nodo) -> bool:
+        """
+        Indica si el nodo y todos sus descendientes se excluyen del conteo.
+
+        Args:
+            nodo (Nodo): Nodo a evaluar
+
+        Returns:
+            bool: True si el nodo está vacío y no es la raíz
+        """
+        return nodo.tipo != TipoNodo.ROOT and len(nodo.contenido) == 0
+
+    @staticmethod
+    def contar_lineas_propias(nodo: Nodo) -> int:
+        """
+        Cuenta las líneas lógicas del nodo sin incluir a sus hijos.
+
+        Args:
+            nodo (Nodo): Nodo a procesar
+
+        Returns:
+            int: 1 si el nodo es una declaración ejecutable, 0 si no
+        """
         # Solo contamos nodos que representan declaraciones ejecutables
         # (definidos en LOGICAL_NODE_TYPES) ignorando cualquier otro tipo de
         # elemento
-        if nodo.tipo in LOGICAL_NODE_TYPES:
-            contador += 1
-
-        # El recorrido recursivo es necesario ya que las declaraciones lógicas
-        # pueden estar anidadas (por ejemplo, dentro de funciones o clases)
-        for hijo in nodo.hijos:
-            contador += ContadorLineasLogicas._contar_lineas_nodo(hijo)
-
-        return contador
+        return 1 if nodo.tipo in LOGICAL_NODE_TYPES else 0
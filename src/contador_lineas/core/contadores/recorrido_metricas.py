@@ -0,0 +1,174 @@
+"""
+Nombre del módulo: recorrido_metricas.py
+Ruta: contador_lineas/core/contadores/recorrido_metricas.py
+Descripción: Valida el estándar y cuenta líneas físicas y lógicas en un solo
+             recorrido del árbol sintáctico
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - core.arbol.nodo.Nodo
+    - core.arbol.verificador_estandar_codigo.VerificadorEstandarCodigo
+    - core.contadores.contador_fisico.ContadorLineasFisicas
+    - core.contadores.contador_logico.ContadorLineasLogicas
+    - utils.perfil.fase
+
+Uso:
+    from contador_lineas.core.contadores.recorrido_metricas import (
+        RecorridoMetricas
+    )
+
+    resultado = RecorridoMetricas().recorrer(arbol.raiz)
+    if resultado.es_valido:
+        print(resultado.lineas_fisicas, resultado.lineas_logicas)
+
+    # Solo los subárboles de una edición
+    parcial = RecorridoMetricas().recorrer_nodos(edicion.nodos_nuevos)
+
+Notas:
+    - Aplica las mismas reglas por nodo que VerificadorEstandarCodigo,
+      ContadorLineasFisicas y ContadorLineasLogicas, mediante sus métodos
+      por nodo (validar_nodo_individual, omite_subarbol y
+      contar_lineas_propias), por lo que el resultado coincide con ejecutar
+      los tres recorridos por separado
+    - Se detiene en la primera violación del estándar, en el mismo orden
+      (preorden) en que la reporta el verificador
+"""
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.verificador_estandar_codigo import (
+    VerificadorEstandarCodigo
+)
+from contador_lineas.core.contadores.contador_fisico import (
+    ContadorLineasFisicas
+)
+from contador_lineas.core.contadores.contador_logico import (
+    ContadorLineasLogicas
+)
+from contador_lineas.utils.perfil import fase
+
+
+@dataclass
+class ResultadoRecorrido:
+    """
+    Resultado combinado de validar y contar un árbol sintáctico.
+
+    Attributes:
+        es_valido (bool): Si el árbol cumple el estándar de codificación
+        error (str): Mensaje de la primera violación, vacío si es válido
+        lineas_fisicas (int): Líneas físicas contadas, 0 si no es válido
+        lineas_logicas (int): Líneas lógicas contadas, 0 si no es válido
+
+    Example:
+        >>> ResultadoRecorrido(True, "", 20, 15)
+    """
+
+    es_valido: bool
+    error: str
+    lineas_fisicas: int
+    lineas_logicas: int
+
+
+class RecorridoMetricas:
+    """
+    Valida y mide un árbol sintáctico visitando cada nodo una sola vez.
+
+    Attributes:
+        verificador (VerificadorEstandarCodigo): Reglas del estándar por nodo
+
+    Methods:
+        recorrer(raiz: Nodo) -> ResultadoRecorrido:
+            Valida el árbol y acumula ambos conteos.
+        recorrer_nodos(nodos: Sequence[Nodo]) -> ResultadoRecorrido:
+            Valida y mide varios subárboles hermanos.
+
+    Example:
+        >>> resultado = RecorridoMetricas().recorrer(arbol.raiz)
+        >>> resultado.lineas_logicas
+        15
+    """
+
+    def __init__(self):
+        self.verificador = VerificadorEstandarCodigo()
+
+    @fase("validar y contar")
+    def recorrer(self, raiz: Nodo) -> ResultadoRecorrido:
+        """
+        Valida el árbol y cuenta sus líneas físicas y lógicas.
+
+        Args:
+            raiz (Nodo): Nodo raíz del árbol sintáctico
+
+        Returns:
+            ResultadoRecorrido: Conteos, o la primera violación encontrada
+
+        Example:
+            >>> RecorridoMetricas().recorrer(arbol.raiz)
+            ResultadoRecorrido(es_valido=True, error='', lineas_fisicas=20,
+                               lineas_logicas=15)
+        """
+        return self.recorrer_nodos([raiz])
+
+    def recorrer_nodos(self, nodos: Sequence[Nodo]) -> ResultadoRecorrido:
+        """
+        Valida y cuenta varios subárboles como si fueran hijos de la raíz.
+
+        Como la raíz nunca excluye a sus hijos del conteo, el resultado es la
+        parte que esos subárboles aportan a las métricas del archivo.
+
+        Args:
+            nodos (Sequence[Nodo]): Raíces de los subárboles, en orden
+
+        Returns:
+            ResultadoRecorrido: Conteos sumados, o la primera violación
+
+        Example:
+            >>> RecorridoMetricas().recorrer_nodos(edicion.nodos_nuevos)
+            ResultadoRecorrido(es_valido=True, error='', lineas_fisicas=4,
+                               lineas_logicas=3)
+        """
+        validar_nodo = self.verificador.validar_nodo_individual
+        omite_fisicas = ContadorLineasFisicas.omite_subarbol
+        contar_fisicas = ContadorLineasFisicas.contar_lineas_propias
+        omite_logicas = ContadorLineasLogicas.omite_subarbol
+        contar_logicas = ContadorLineasLogicas.contar_lineas_propias
+
+        lineas_fisicas = 0
+        lineas_logicas = 0
+
+        # Cada entrada indica si el subárbol aún cuenta para cada métrica; un
+        # nodo vacío excluye a todos sus descendientes, igual que en los
+        # contadores recursivos
+        pila = [(nodo, True, True) for nodo in reversed(nodos)]
+        while pila:
+            nodo, cuenta_fisicas, cuenta_logicas = pila.pop()
+
+            try:
+                es_valido, error = validar_nodo(nodo)
+            except Exception as e:
+                es_valido, error = False, f"Error al validar nodo: {str(e)}"
+            if not es_valido:
+                return ResultadoRecorrido(False, error, 0, 0)
+
+            if cuenta_fisicas and not omite_fisicas(nodo):
+                lineas_fisicas += contar_fisicas(nodo)
+            else:
+                cuenta_fisicas = False
+            if cuenta_logicas and not omite_logicas(nodo):
+                lineas_logicas += contar_logicas(nodo)
+            else:
+                cuenta_logicas = False
+
+            # Apilamos los hijos en orden inverso para visitarlos en preorden
+            # y reportar la misma violación que el verificador recursivo
+            for hijo in reversed(nodo.hijos):
+                pila.append((hijo, cuenta_fisicas, cuenta_logicas))
+
+        return ResultadoRecorrido(True, "", lineas_fisicas, lineas_logicas)
@@ -0,0 +1,262 @@
+"""
+Nombre del módulo: vigilancia.py
+Ruta: contador_lineas/core/contadores/vigilancia.py
+Descripción: Vigila un directorio y vuelve a analizar solo los archivos
+             Python que cambian
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - os
+    - time
+    - operator.attrgetter
+    - core.contadores.analizador_lote.AnalizadorLote
+
+Uso:
+    from contador_lineas.core.contadores.vigilancia import Vigilancia
+
+    vigilancia = Vigilancia("src", AnalizadorCodigo(), almacen)
+    vigilancia.sincronizar()
+    def imprimir_cambios(cambios):
+        print(len(cambios))
+
+    vigilancia.vigilar(imprimir_cambios)
+
+Notas:
+    - Detecta cambios por sondeo de la fecha de modificación (st_mtime_ns) y
+      el tamaño de cada archivo; la biblioteca estándar no expone inotify y
+      un stat por archivo cuesta microsegundos
+    - Sirve para contador_lineas y lineas_por_clase: el analizador solo debe
+      ofrecer obtener_metricas(ruta, nombre)
+    - Solo la firma y las métricas de cada archivo se conservan en memoria
+      entre eventos; un archivo modificado se vuelve a analizar completo y
+      las cachés del analizador, si las tiene, evitan repetir contenidos ya
+      vistos. Un archivo borrado se reporta pero su registro histórico se
+      conserva
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from contador_lineas.core.contadores.analizador_lote import AnalizadorLote
+
+# Segundos entre dos sondeos del directorio
+INTERVALO_SONDEO = 0.5
+
+# Firma de un archivo: (fecha de modificación en ns, tamaño en bytes)
+Firma = Tuple[int, int]
+
+
+@dataclass
+class EstadoArchivo:
+    """
+    Estado en memoria de un archivo vigilado.
+
+    Attributes:
+        firma (Firma): Fecha de modificación y tamaño del último análisis
+        metricas (Any): Métricas del último análisis exitoso, o None
+
+    Example:
+        >>> EstadoArchivo((1700000000000000000, 120), metricas)
+    """
+
+    firma: Firma
+    metricas: Any = None
+
+
+@dataclass
+class CambioVigilado:
+    """
+    Cambio de un archivo detectado en un sondeo.
+
+    Attributes:
+        nombre_archivo (str): Ruta relativa al directorio vigilado
+        anterior (Any): Métricas previas, None si el archivo es nuevo
+        actual (Any): Métricas nuevas, None si se borró o hubo error
+        error (Optional[str]): Mensaje de error del análisis, o None
+
+    Example:
+        >>> CambioVigilado("pkg/mod.py", metricas_previas, metricas_nuevas)
+    """
+
+    nombre_archivo: str
+    anterior: Any = None
+    actual: Any = None
+    error: Optional[str] = None
+
+
+class Vigilancia:
+    """
+    Mantiene al día las métricas de los archivos Python de un directorio.
+
+    Attributes:
+        ruta_directorio (str): Directorio vigilado
+        analizador (Any): Analizador con obtener_metricas(ruta, nombre)
+        almacen (Any): Almacenamiento donde se guardan las métricas
+        recursivo (bool): Si True, incluye subdirectorios
+        intervalo (float): Segundos entre sondeos
+        estados (Dict[str, EstadoArchivo]): Estado por ruta relativa
+        ultima_duracion (float): Segundos que tomó el último sondeo
+
+    Methods:
+        sincronizar() -> List[CambioVigilado]:
+            Analiza los archivos nuevos o modificados desde el último sondeo.
+        vigilar(al_cambiar: Callable[[List[CambioVigilado]], None],
+                ciclos: Optional[int]) -> None:
+            Sondea el directorio hasta ser interrumpido.
+
+    Example:
+        >>> vigilancia = Vigilancia("src", AnalizadorCodigo(), almacen)
+        >>> len(vigilancia.sincronizar())
+        42
+    """
+
+    def __init__(
+            self,
+            ruta_directorio: str,
+            analizador: Any,
+            almacen: Any,
+            recursivo: bool = True,
+            intervalo: float = INTERVALO_SONDEO):
+        self.ruta_directorio = ruta_directorio
+        self.analizador = analizador
+        self.almacen = almacen
+        self.recursivo = recursivo
+        self.intervalo = intervalo
+        self.estados: Dict[str, EstadoArchivo] = {}
+        self.ultima_duracion = 0.0
+
+    def sincronizar(self) -> List[CambioVigilado]:
+        """
+        Analiza los archivos nuevos o modificados desde el último sondeo.
+
+        Las métricas nuevas se guardan en el almacenamiento con una sola
+        escritura.
+
+        Returns:
+            List[CambioVigilado]: Cambios detectados, ordenados por nombre
+
+        Example:
+            >>> [cambio.nombre_archivo for cambio in sincronizar()]
+            ['pkg/mod.py']
+        """
+        inicio = time.perf_counter()
+        firmas = self._explorar()
+        cambios = []
+        for nombre_archivo, (ruta, firma) in firmas.items():
+            estado = self.estados.get(nombre_archivo)
+            if estado is not None and estado.firma == firma:
+                continue
+            cambios.append(self._analizar(nombre_archivo, ruta, firma, estado))
+
+        for nombre_archivo in self.estados.keys() - firmas.keys():
+            estado = self.estados.pop(nombre_archivo)
+            cambios.append(CambioVigilado(nombre_archivo, estado.metricas))
+
+        metricas = [cambio.actual for cambio in cambios
+                    if cambio.actual is not None]
+        if metricas:
+            self.almacen.guardar_multiples_metricas(metricas)
+        cambios.sort(key=attrgetter("nombre_archivo"))
+        self.ultima_duracion = time.perf_counter() - inicio
+        return cambios
+
+    def vigilar(
+            self,
+            al_cambiar: Callable[[List[CambioVigilado]], None],
+            ciclos: Optional[int] = None) -> None:
+        """
+        Sondea el directorio y notifica cada grupo de cambios.
+
+        Args:
+            al_cambiar (Callable[[List[CambioVigilado]], None]): Función que
+                recibe los cambios de cada sondeo que encontró alguno
+            ciclos (Optional[int]): Sondeos a realizar, None para seguir
+                hasta una interrupción
+
+        Example:
+            >>> vigilar(imprimir_cambios)
+        """
+        ciclo = 0
+        while ciclos is None or ciclo < ciclos:
+            time.sleep(self.intervalo)
+            cambios = self.sincronizar()
+            if cambios:
+                al_cambiar(cambios)
+            ciclo += 1
+
+    def _explorar(self) -> Dict[str, Tuple[str, Firma]]:
+        """
+        Obtiene la firma actual de cada archivo del directorio.
+
+        Returns:
+            Dict[str, Tuple[str, Firma]]: Ruta y firma por ruta relativa
+        """
+        firmas = {}
+        descubridor = AnalizadorLote(trabajadores=1)
+        for ruta, nombre_archivo in descubridor.descubrir_archivos(
+                self.ruta_directorio, self.recursivo):
+            try:
+                estado = os.stat(ruta)
+            except OSError:
+                # El archivo se borró entre el listado y el stat
+                continue
+            firmas[nombre_archivo] = (ruta, (estado.st_mtime_ns,
+                                             estado.st_size))
+        return firmas
+
+    def _analizar(
+            self,
+            nombre_archivo: str,
+            ruta: str,
+            firma: Firma,
+            estado: Optional[EstadoArchivo]) -> CambioVigilado:
+        """
+        Analiza un archivo nuevo o modificado y actualiza su estado.
+
+        Args:
+            nombre_archivo (str): Ruta relativa al directorio vigilado
+            ruta (str): Ruta del archivo
+            firma (Firma): Firma actual del archivo
+            estado (Optional[EstadoArchivo]): Estado previo, None si es nuevo
+
+        Returns:
+            CambioVigilado: Cambio con las métricas previas y nuevas
+        """
+        anterior = estado.metricas if estado is not None else None
+        try:
+            metricas = self.analizador.obtener_metricas(ruta, nombre_archivo)
+        except Exception as e:
+            # Un archivo a medio guardar puede no cumplir el estándar; se
+            # recuerda su firma para no reintentarlo hasta el próximo cambio
+            self.estados[nombre_archivo] = EstadoArchivo(firma, anterior)
+            return CambioVigilado(nombre_archivo, anterior, None, str(e))
+        self.estados[nombre_archivo] = EstadoArchivo(firma, metricas)
+        return CambioVigilado(nombre_archivo, anterior, metricas)
+
+
+def formatear_diferencia(actual: int, anterior: Optional[int]) -> str:
+    """
+    Formatea un valor junto con su diferencia respecto al anterior.
+
+    Args:
+        actual (int): Valor actual
+        anterior (Optional[int]): Valor previo, None si no existía
+
+    Returns:
+        str: El valor y, si hay valor previo, la diferencia con signo
+
+    Example:
+        >>> formatear_diferencia(120, 117)
+        '120 (+3)'
+    """
+    if anterior is None:
+        return str(actual)
+    return f"{actual} ({actual - anterior:+d})"
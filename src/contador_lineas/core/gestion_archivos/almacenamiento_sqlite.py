@@ -0,0 +1,204 @@
+"""
+Nombre del módulo: almacenamiento_sqlite.py
+Ruta: contador_lineas/core/gestion_archivos/almacenamiento_sqlite.py
+Descripción: Gestiona el almacenamiento de métricas de archivos Python en SQLite
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - sqlite3
+    - contextlib.contextmanager
+    - core.gestion_archivos.almacenamiento_metricas.AlmacenamientoMetricas
+    - models.metricas.MetricasArchivo
+    - utils.sqlite_utils.conectar_sqlite
+
+Uso:
+    from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+        AlmacenamientoMetricas
+    )
+    # Una ruta .db o una URL sqlite:/// selecciona este backend
+    almacen = AlmacenamientoMetricas("sqlite:///db/metricas_registro.db")
+    almacen.guardar_metricas(metricas)
+
+Notas:
+    - Guardar y cargar un archivo cuesta lo mismo sin importar el tamaño del
+      registro, a diferencia del JSON que se reescribe completo
+    - El orden de obtener_todas_las_metricas es el de primera inserción, igual
+      que en el registro JSON
+"""
+
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas
+)
+from contador_lineas.models.metricas import MetricasArchivo
+from contador_lineas.utils.sqlite_utils import conectar_sqlite
+
+# El índice único sobre nombre_archivo (que en modo directorio es la ruta
+# relativa) resuelve las búsquedas y las actualizaciones por clave
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS archivos (
+    id INTEGER PRIMARY KEY,
+    nombre_archivo TEXT NOT NULL,
+    lineas_logicas INTEGER NOT NULL,
+    lineas_fisicas INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_archivos_nombre
+    ON archivos (nombre_archivo);
+"""
+
+
+class AlmacenamientoMetricasSqlite(AlmacenamientoMetricas):
+    """
+    Gestiona el almacenamiento persistente de métricas en una base SQLite.
+
+    Attributes:
+        ruta_almacenamiento (str): Ruta o URL de la base de datos
+        conexion (sqlite3.Connection): Conexión abierta a la base
+
+    Methods:
+        guardar_metricas(metricas: MetricasArchivo) -> None:
+            Guarda nuevas métricas en el almacenamiento.
+        guardar_multiples_metricas(metricas: Iterable[MetricasArchivo]) -> None:
+            Guarda varias métricas en una sola transacción.
+        cargar_metricas(nombre_archivo: str) -> Optional[MetricasArchivo]:
+            Carga métricas para un archivo específico.
+        obtener_todas_las_metricas() -> List[MetricasArchivo]:
+            Obtiene todas las métricas almacenadas.
+        lote() -> Iterator[AlmacenamientoMetricasSqlite]:
+            Agrupa varias operaciones en una sola transacción.
+
+    Example:
+        >>> almacen = AlmacenamientoMetricasSqlite("db/metricas.db")
+        >>> almacen.guardar_metricas(metricas)
+    """
+
+    def __init__(self, ruta_almacenamiento: str):
+        self.ruta_almacenamiento = ruta_almacenamiento
+        self.conexion = conectar_sqlite(ruta_almacenamiento, ESQUEMA)
+        # Métricas guardadas dentro de un lote abierto, None si no hay lote
+        self._pendientes: Optional[Dict[str, MetricasArchivo]] = None
+
+    def guardar_multiples_metricas(
+            self,
+            metricas: Iterable[MetricasArchivo]) -> None:
+        """
+        Guarda varias métricas en una sola transacción.
+
+        Args:
+            metricas (Iterable[MetricasArchivo]): Métricas a almacenar
+
+        Example:
+            >>> guardar_multiples_metricas([metricas_a, metricas_b])
+        """
+        if self._pendientes is not None:
+            for metrica in metricas:
+                self._pendientes[metrica.nombre_archivo] = metrica
+            return
+
+        # El upsert conserva el id original, y con él la posición del archivo
+        # en el listado, igual que al actualizar una clave del JSON
+        with self.conexion:
+            self.conexion.executemany(
+                "INSERT INTO archivos "
+                "(nombre_archivo, lineas_logicas, lineas_fisicas) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (nombre_archivo) DO UPDATE SET "
+                "lineas_logicas = excluded.lineas_logicas, "
+                "lineas_fisicas = excluded.lineas_fisicas",
+                [(metrica.nombre_archivo, metrica.lineas_logicas,
+                  metrica.lineas_fisicas) for metrica in metricas]
+            )
+
+    def cargar_metricas(self, nombre_archivo: str) -> Optional[MetricasArchivo]:
+        """
+        Carga métricas almacenadas para un archivo.
+
+        Args:
+            nombre_archivo (str): Nombre del archivo a buscar
+
+        Returns:
+            Optional[MetricasArchivo]: Métricas encontradas o None
+
+        Example:
+            >>> cargar_metricas("script.py")
+        """
+        if self._pendientes and nombre_archivo in self._pendientes:
+            return self._pendientes[nombre_archivo]
+
+        fila = self.conexion.execute(
+            "SELECT nombre_archivo, lineas_logicas, lineas_fisicas "
+            "FROM archivos WHERE nombre_archivo = ?",
+            (nombre_archivo,)
+        ).fetchone()
+        return MetricasArchivo(*fila) if fila else None
+
+    def obtener_todas_las_metricas(self) -> List[MetricasArchivo]:
+        """
+        Obtiene lista de todas las métricas almacenadas.
+
+        Returns:
+            List[MetricasArchivo]: Lista de métricas encontradas
+
+        Example:
+            >>> obtener_todas_las_metricas()
+        """
+        filas = self.conexion.execute(
+            "SELECT nombre_archivo, lineas_logicas, lineas_fisicas "
+            "FROM archivos ORDER BY id"
+        )
+        return self._combinar_pendientes(
+            [MetricasArchivo(*fila) for fila in filas])
+
+    @contextmanager
+    def lote(self) -> Iterator["AlmacenamientoMetricasSqlite"]:
+        """
+        Agrupa las métricas guardadas en el bloque en una sola transacción.
+
+        Las métricas pendientes se consultan desde memoria mientras el lote
+        está abierto; si el bloque lanza una excepción se descartan.
+
+        Returns:
+            Iterator[AlmacenamientoMetricasSqlite]: El propio almacenamiento
+
+        Example:
+            >>> with almacen.lote():
+            ...     almacen.guardar_metricas(metricas)
+        """
+        if self._pendientes is not None:
+            yield self
+            return
+
+        self._pendientes = {}
+        try:
+            yield self
+            pendientes, self._pendientes = self._pendientes, None
+            self.guardar_multiples_metricas(pendientes.values())
+        finally:
+            self._pendientes = None
+
+    def _combinar_pendientes(
+            self,
+            metricas: List[MetricasArchivo]) -> List[MetricasArchivo]:
+        """
+        Combina las métricas almacenadas con las pendientes del lote.
+
+        Args:
+            metricas (List[MetricasArchivo]): Métricas leídas de la base
+
+        Returns:
+            List[MetricasArchivo]: Métricas con las pendientes aplicadas
+        """
+        if not self._pendientes:
+            return metricas
+        # Actualizar una clave de un diccionario conserva su posición, igual
+        # que el upsert conserva el id de la fila
+        combinadas = {metrica.nombre_archivo: metrica for metrica in metricas}
+        combinadas.update(self._pendientes)
+        return list(combinadas.values())
@@ -0,0 +1,175 @@
+"""
+Nombre del módulo: archivo_mapeado.py
+Ruta: contador_lineas/core/gestion_archivos/archivo_mapeado.py
+Descripción: Acceso por línea a un archivo mapeado en memoria, decodificando
+             cada línea solo cuando se pide
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - array
+    - mmap
+    - re
+
+Uso:
+    from contador_lineas.core.gestion_archivos.archivo_mapeado import (
+        ArchivoMapeado
+    )
+
+    with ArchivoMapeado("generado.py") as archivo:
+        print(len(archivo), archivo[1000])
+        arbol = ArbolArchivoPython(archivo)
+
+Notas:
+    - El índice guarda el desplazamiento en bytes del inicio de cada línea en
+      un array('Q'): 8 bytes por línea, sin crear un str por línea
+    - Las líneas se entregan igual que readlines() en modo texto: los saltos
+      \\r\\n y \\r se convierten en \\n
+    - Cada línea se decodifica por separado, lo que es correcto para UTF-8 y
+      cualquier codificación donde el byte \\n no aparezca dentro de un
+      carácter
+"""
+
+import mmap
+import re
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+# Fin de línea en modo texto universal, y su versión para archivos sin \r
+PATRON_FIN_LINEA = re.compile(rb'\r\n|\r|\n')
+PATRON_SALTO_LINEA = re.compile(rb'\n')
+
+
+class ArchivoMapeado:
+    """
+    Secuencia de las líneas de un archivo respaldada por mmap.
+
+    Attributes:
+        ruta_archivo (Path): Ruta del archivo mapeado
+        codificacion (str): Codificación de las líneas
+        desplazamientos (array): Inicio en bytes de cada línea, con un
+            elemento final igual al tamaño del archivo
+
+    Methods:
+        desplazamiento(numero_linea: int) -> int:
+            Obtiene la posición en bytes donde empieza una línea.
+        cerrar() -> None:
+            Libera el mapeo del archivo.
+
+    Example:
+        >>> with ArchivoMapeado("script.py") as archivo:
+        ...     archivo[0]
+        'def suma(a, b):\\n'
+    """
+
+    def __init__(
+            self,
+            ruta_archivo: Union[str, Path],
+            codificacion: str = 'utf-8'):
+        self.ruta_archivo = Path(ruta_archivo)
+        self.codificacion = codificacion
+        self._mapa: Optional[mmap.mmap] = None
+        with open(self.ruta_archivo, 'rb') as archivo:
+            # mmap no admite archivos vacíos
+            if self.ruta_archivo.stat().st_size > 0:
+                self._mapa = mmap.mmap(archivo.fileno(), 0,
+                                       access=mmap.ACCESS_READ)
+        self.desplazamientos = self._indexar()
+
+    def __enter__(self) -> 'ArchivoMapeado':
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def __len__(self) -> int:
+        return len(self.desplazamientos) - 1
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(indice, slice):
+            return [self._decodificar(i)
+                    for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("Línea fuera del archivo")
+        return self._decodificar(indice)
+
+    def __iter__(self) -> Iterator[str]:
+        for indice in range(len(self)):
+            yield self._decodificar(indice)
+
+    def desplazamiento(self, numero_linea: int) -> int:
+        """
+        Obtiene la posición en bytes donde empieza una línea.
+
+        Args:
+            numero_linea (int): Índice de la línea, desde 0; len(self) da el
+                tamaño del archivo
+
+        Returns:
+            int: Desplazamiento en bytes desde el inicio del archivo
+
+        Example:
+            >>> archivo.desplazamiento(1)
+            16
+        """
+        return self.desplazamientos[numero_linea]
+
+    def cerrar(self) -> None:
+        """
+        Libera el mapeo del archivo; las líneas ya no pueden leerse.
+        """
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+
+    def _indexar(self) -> array:
+        """
+        Construye el índice de inicios de línea recorriendo el mapeo.
+
+        Returns:
+            array: Desplazamientos de cada línea más el tamaño del archivo
+        """
+        desplazamientos = array('Q', [0])
+        if self._mapa is None:
+            return desplazamientos
+        # La mayoría de los archivos solo usa \n, y buscar un único byte es
+        # bastante más rápido que la alternativa de tres patrones
+        patron = (PATRON_FIN_LINEA if self._mapa.find(b'\r') != -1
+                  else PATRON_SALTO_LINEA)
+        desplazamientos.extend(fin.end()
+                               for fin in patron.finditer(self._mapa))
+        # La última línea puede no terminar en salto de línea
+        if desplazamientos[-1] != len(self._mapa):
+            desplazamientos.append(len(self._mapa))
+        return desplazamientos
+
+    def _decodificar(self, indice: int) -> str:
+        """
+        Decodifica una línea normalizando su salto de línea.
+
+        Args:
+            indice (int): Índice de la línea
+
+        Returns:
+            str: Línea decodificada
+
+        Raises:
+            ValueError: Si el archivo ya se cerró
+            UnicodeDecodeError: Si la línea no está en la codificación
+        """
+        if self._mapa is None:
+            raise ValueError("El archivo mapeado está cerrado")
+        contenido = self._mapa[self.desplazamientos[indice]:
+                               self.desplazamientos[indice + 1]]
+        if contenido.endswith(b'\r\n'):
+            contenido = contenido[:-2] + b'\n'
+        elif contenido.endswith(b'\r'):
+            contenido = contenido[:-1] + b'\n'
+        return contenido.decode(self.codificacion)
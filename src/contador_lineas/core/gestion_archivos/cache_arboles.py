@@ -0,0 +1,300 @@
+"""
+Nombre del módulo: cache_arboles.py
+Ruta: contador_lineas/core/gestion_archivos/cache_arboles.py
+Descripción: Caché persistente de árboles sintácticos serializados, indexada
+             por el hash de las líneas con que se construyeron
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - array
+    - marshal
+    - core.arbol.nodo.Nodo
+    - core.gestion_archivos.cache_disco.CacheDisco
+    - models.nodos.TipoNodo
+    - utils.perfil.fase
+
+Uso:
+    from contador_lineas.core.gestion_archivos.cache_arboles import (
+        CacheArboles
+    )
+
+    cache = CacheArboles("db/arboles")
+    clave = cache.calcular_clave(lineas, "estandar")
+    entrada = cache.obtener(clave)
+    if entrada is None:
+        raiz = ConstructorArbol().construir(lineas)
+        cache.guardar(clave, raiz)
+
+Notas:
+    - La caché la comparten contador_lineas, lineas_por_clase y
+      analizador_cambios: la clave depende solo de las líneas y de la
+      variante del árbol, no de la herramienta que lo construyó
+    - La variante distingue árboles distintos de las mismas líneas; el de
+      analizador_cambios conserva las líneas vacías y numera sus nodos, así
+      que no coincide con el de las otras dos herramientas
+    - Cada árbol se guarda con marshal como arreglos planos en preorden
+      (tipos, indentaciones, padres y contenidos), sin un objeto por nodo
+    - Los arreglos usan el orden de bytes de la máquina: la caché es local
+    - Un cambio en el autómata del constructor debe incrementar
+      VERSION_FORMATO_ARBOL para invalidar los árboles ya guardados
+"""
+
+import marshal
+from array import array
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import List, Optional, Sequence, Type
+
+from contador_lineas.core.arbol.constructor_arbol import Corte
+from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.gestion_archivos.cache_disco import CacheDisco
+from contador_lineas.models.nodos import TipoNodo
+from contador_lineas.utils.perfil import fase
+
+# Código numérico de cada tipo de nodo, en el orden de la enumeración
+TIPO_POR_CODIGO: List[TipoNodo] = list(TipoNodo)
+CODIGO_POR_TIPO = {tipo: codigo
+                   for codigo, tipo in enumerate(TIPO_POR_CODIGO)}
+
+# Versión del formato serializado y del autómata que generó los árboles
+VERSION_FORMATO_ARBOL = "arboles-1"
+
+# Tamaño máximo por defecto de la caché de árboles en disco (256 MiB)
+TAMANO_MAXIMO_CACHE_ARBOLES = 256 * 1024 * 1024
+
+
+@dataclass
+class EntradaArbol:
+    """
+    Árbol recuperado de la caché.
+
+    Attributes:
+        raiz (Nodo): Raíz del árbol reconstruido
+        cortes (List[Corte]): Puntos de corte guardados con el árbol, vacío
+            si no se guardaron
+
+    Example:
+        >>> entrada = cache.obtener(clave)
+        >>> entrada.raiz.hijos[0].contenido
+        'import os'
+    """
+
+    raiz: Nodo
+    cortes: List[Corte] = field(default_factory=list)
+
+
+def serializar_arbol(raiz: Nodo, cortes: Sequence[Corte] = ()) -> bytes:
+    """
+    Serializa un árbol como arreglos planos en preorden.
+
+    Args:
+        raiz (Nodo): Raíz del árbol
+        cortes (Sequence[Corte]): Puntos de corte a guardar con el árbol
+
+    Returns:
+        bytes: Árbol serializado con marshal
+
+    Example:
+        >>> datos = serializar_arbol(ConstructorArbol().construir(["x = 1"]))
+    """
+    tipos = bytearray()
+    indentaciones = array('i')
+    padres = array('i')
+    contenidos = []
+    numeros = array('i')
+    limites_lineas = array('i', [0])
+    lineas = array('i')
+    numerado = raiz.numero_nodo is not None
+
+    # Apilamos cada nodo con el índice de su padre; en orden inverso para
+    # que el primer hijo salga primero
+    pila = [(raiz, -1)]
+    while pila:
+        nodo, padre = pila.pop()
+        indice = len(contenidos)
+        tipos.append(CODIGO_POR_TIPO[nodo.tipo])
+        indentaciones.append(nodo.nivel_indentacion)
+        padres.append(padre)
+        contenidos.append(nodo.contenido)
+        if numerado:
+            numeros.append(nodo.numero_nodo)
+        if nodo.lineas:
+            lineas.extend(nodo.lineas)
+        limites_lineas.append(len(lineas))
+        pila.extend((hijo, indice) for hijo in reversed(nodo.hijos))
+
+    # Los números y las líneas se omiten cuando el árbol no los tiene
+    bytes_numeros = numeros.tobytes() if numerado else None
+    bytes_limites = limites_lineas.tobytes() if lineas else None
+    return marshal.dumps((
+        bytes(tipos), indentaciones.tobytes(), padres.tobytes(), contenidos,
+        bytes_numeros, bytes_limites, lineas.tobytes(), list(cortes)))
+
+
+def deserializar_arbol(
+        datos: bytes,
+        clase_nodo: Type[Nodo] = Nodo) -> EntradaArbol:
+    """
+    Reconstruye un árbol serializado con serializar_arbol.
+
+    Args:
+        datos (bytes): Árbol serializado
+        clase_nodo (Type[Nodo]): Clase de los nodos a crear
+
+    Returns:
+        EntradaArbol: Raíz del árbol y sus puntos de corte
+
+    Raises:
+        ValueError: Si los datos no son un árbol serializado válido
+
+    Example:
+        >>> deserializar_arbol(serializar_arbol(raiz)).raiz.contenido
+        'raiz'
+    """
+    try:
+        (tipos, bytes_indentaciones, bytes_padres, contenidos, bytes_numeros,
+         bytes_limites, bytes_lineas, cortes) = marshal.loads(datos)
+        indentaciones = _arreglo(bytes_indentaciones)
+        padres = _arreglo(bytes_padres)
+        numeros = (repeat(None) if bytes_numeros is None
+                   else _arreglo(bytes_numeros))
+        lineas_nodos = repeat(None)
+        if bytes_limites is not None:
+            limites = _arreglo(bytes_limites)
+            lineas = _arreglo(bytes_lineas)
+            # Un nodo sin líneas, como la raíz, tiene un rango vacío
+            lineas_nodos = (lineas[inicio:fin].tolist() or None
+                            for inicio, fin in zip(limites, limites[1:]))
+
+        nodos: List[Nodo] = []
+        for tipo, contenido, indentacion, padre, numero, lineas_nodo in zip(
+                tipos, contenidos, indentaciones, padres, numeros,
+                lineas_nodos):
+            nodo = clase_nodo(TIPO_POR_CODIGO[tipo], contenido, indentacion,
+                              numero, lineas_nodo)
+            # En preorden el padre siempre se creó antes que sus hijos
+            if padre >= 0:
+                nodos[padre].agregar_hijo(nodo)
+            nodos.append(nodo)
+        raiz = nodos[0]
+    except (EOFError, TypeError, ValueError, IndexError) as e:
+        raise ValueError(f"Árbol serializado inválido: {e}") from e
+    return EntradaArbol(raiz, [tuple(corte) for corte in cortes])
+
+
+def _arreglo(datos: bytes) -> array:
+    """
+    Convierte los bytes de un array('i') de vuelta en el arreglo.
+
+    Args:
+        datos (bytes): Bytes obtenidos con array.tobytes()
+
+    Returns:
+        array: Arreglo de enteros
+    """
+    arreglo = array('i')
+    arreglo.frombytes(datos)
+    return arreglo
+
+
+class CacheArboles(CacheDisco):
+    """
+    Caché en disco de árboles sintácticos con expulsión LRU.
+
+    Attributes:
+        ruta_directorio (str): Directorio donde se guardan los árboles
+        tamano_maximo (int): Tamaño máximo de la caché en bytes
+
+    Methods:
+        calcular_clave(lineas: Sequence[str], variante: str) -> str:
+            Calcula la clave de un árbol a partir de sus líneas.
+        obtener(clave: str, clase_nodo: Type[Nodo]) -> Optional[EntradaArbol]:
+            Recupera un árbol si está en caché.
+        guardar(clave: str, raiz: Nodo, cortes: Sequence[Corte]) -> None:
+            Guarda un árbol recién construido.
+        podar() -> None:
+            Expulsa las entradas menos usadas hasta respetar el tamaño máximo.
+
+    Example:
+        >>> cache = CacheArboles("db/arboles")
+        >>> cache.obtener(cache.calcular_clave(["x = 1\\n"], "estandar"))
+    """
+
+    extension = '.marshal'
+
+    def __init__(
+            self,
+            ruta_directorio: str,
+            tamano_maximo: int = TAMANO_MAXIMO_CACHE_ARBOLES):
+        # La versión es la del formato y no la de cada herramienta, para que
+        # las tres compartan las entradas
+        super().__init__(ruta_directorio, VERSION_FORMATO_ARBOL,
+                         tamano_maximo)
+
+    def calcular_clave(self, lineas: Sequence[str], variante: str) -> str:
+        """
+        Calcula la clave del árbol de unas líneas.
+
+        Args:
+            lineas (Sequence[str]): Líneas con las que se construye el árbol
+            variante (str): Variante del árbol, según el constructor usado
+
+        Returns:
+            str: Hash sha256 en hexadecimal
+
+        Example:
+            >>> cache.calcular_clave(["x = 1\\n"], "estandar")
+        """
+        # marshal conserva los límites entre líneas, a diferencia de unirlas
+        return self._calcular_clave(marshal.dumps(list(lineas)), variante)
+
+    @fase("caché")
+    def obtener(
+            self,
+            clave: str,
+            clase_nodo: Type[Nodo] = Nodo) -> Optional[EntradaArbol]:
+        """
+        Recupera el árbol almacenado con una clave.
+
+        Args:
+            clave (str): Clave obtenida con calcular_clave
+            clase_nodo (Type[Nodo]): Clase de los nodos a crear
+
+        Returns:
+            Optional[EntradaArbol]: Árbol reconstruido o None
+
+        Example:
+            >>> entrada = cache.obtener(clave)
+        """
+        datos = self._leer(clave)
+        if datos is None:
+            return None
+        try:
+            return deserializar_arbol(datos, clase_nodo)
+        except ValueError:
+            # Una entrada corrupta es un fallo de caché, no un error
+            return None
+
+    @fase("caché")
+    def guardar(
+            self,
+            clave: str,
+            raiz: Nodo,
+            cortes: Sequence[Corte] = ()) -> None:
+        """
+        Guarda un árbol en la caché.
+
+        Args:
+            clave (str): Clave obtenida con calcular_clave
+            raiz (Nodo): Raíz del árbol recién construido
+            cortes (Sequence[Corte]): Puntos de corte del árbol
+
+        Example:
+            >>> cache.guardar(clave, arbol.raiz, arbol.cortes)
+        """
+        self._escribir(clave, serializar_arbol(raiz, cortes))
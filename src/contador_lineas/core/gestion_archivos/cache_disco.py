@@ -0,0 +1,233 @@
+"""
+Nombre del módulo: cache_disco.py
+Ruta: contador_lineas/core/gestion_archivos/cache_disco.py
+Descripción: Base de las cachés persistentes en disco indexadas por hash de
+             contenido, con expulsión LRU y tamaño máximo
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - hashlib
+    - os
+    - tempfile (al escribir una entrada)
+
+Uso:
+    from contador_lineas.core.gestion_archivos.cache_disco import CacheDisco
+
+    class CacheTextos(CacheDisco):
+        extension = '.txt'
+
+Notas:
+    - La clave es sha256(versión + calificadores + contenido): un cambio de
+      versión invalida todas las entradas previas sin necesidad de borrarlas
+    - Cada entrada es un archivo escrito de forma atómica, por lo que varios
+      procesos pueden compartir la caché
+    - La expulsión es LRU por fecha de modificación, que se actualiza en cada
+      acierto, y se activa al superar el tamaño máximo
+    - Las subclases solo deciden la extensión y el formato de las entradas
+"""
+
+import hashlib
+import os
+from typing import Iterator, Optional
+
+# Al podar, dejamos la caché por debajo de esta fracción del máximo para no
+# volver a podar en cada escritura
+FRACCION_TRAS_PODA = 0.9
+
+
+class CacheDisco:
+    """
+    Directorio de entradas binarias con expulsión LRU.
+
+    Attributes:
+        ruta_directorio (str): Directorio donde se guardan las entradas
+        version (str): Versión del formato incluida en la clave
+        tamano_maximo (int): Tamaño máximo de la caché en bytes
+        extension (str): Extensión de los archivos de entrada
+
+    Methods:
+        podar() -> None:
+            Expulsa las entradas menos usadas hasta respetar el tamaño máximo.
+
+    Example:
+        >>> cache = CacheResultados("db/cache", "1.0.0")
+        >>> cache.podar()
+    """
+
+    extension = '.bin'
+
+    def __init__(
+            self,
+            ruta_directorio: str,
+            version: str,
+            tamano_maximo: int):
+        self.ruta_directorio = ruta_directorio
+        self.version = version
+        self.tamano_maximo = tamano_maximo
+        # El tamaño se calcula en la primera escritura y luego se estima
+        # sumando lo escrito, evitando recorrer el directorio cada vez
+        self._tamano_estimado: Optional[int] = None
+
+    def podar(self) -> None:
+        """
+        Expulsa las entradas menos usadas hasta quedar bajo el tamaño máximo.
+
+        Example:
+            >>> cache.podar()
+        """
+        entradas = []
+        for ruta_entrada in self._listar_entradas():
+            try:
+                estado = os.stat(ruta_entrada)
+            except OSError:
+                continue
+            entradas.append((estado.st_mtime, estado.st_size, ruta_entrada))
+
+        tamano_total = sum(tamano for _, tamano, _ in entradas)
+        if tamano_total > self.tamano_maximo:
+            limite = self.tamano_maximo * FRACCION_TRAS_PODA
+            # Las entradas más antiguas son las usadas hace más tiempo
+            for _, tamano, ruta_entrada in sorted(entradas):
+                if tamano_total <= limite:
+                    break
+                try:
+                    os.remove(ruta_entrada)
+                except OSError:
+                    continue
+                tamano_total -= tamano
+        self._tamano_estimado = tamano_total
+
+    def _leer(self, clave: str) -> Optional[bytes]:
+        """
+        Lee los datos de una entrada y la marca como usada.
+
+        Args:
+            clave (str): Clave de la entrada
+
+        Returns:
+            Optional[bytes]: Datos de la entrada o None si no existe
+        """
+        ruta_entrada = self._ruta_entrada(clave)
+        try:
+            with open(ruta_entrada, 'rb') as archivo:
+                datos = archivo.read()
+        except OSError:
+            return None
+
+        # Actualizamos la fecha de modificación para que la expulsión LRU
+        # conserve las entradas usadas recientemente
+        try:
+            os.utime(ruta_entrada)
+        except OSError:
+            pass
+        return datos
+
+    def _escribir(self, clave: str, datos: bytes) -> None:
+        """
+        Escribe una entrada y poda la caché si supera el tamaño máximo.
+
+        Args:
+            clave (str): Clave de la entrada
+            datos (bytes): Contenido de la entrada
+        """
+        ruta_entrada = self._ruta_entrada(clave)
+        directorio = os.path.dirname(ruta_entrada)
+        ruta_temporal = None
+
+        try:
+            os.makedirs(directorio, exist_ok=True)
+            if self._tamano_estimado is None:
+                self._tamano_estimado = self._calcular_tamano()
+
+            # Escribimos en un temporal y renombramos para que ningún proceso
+            # lea una entrada a medio escribir. tempfile solo se carga al
+            # escribir: un acierto de la caché no lo necesita
+            import tempfile
+            descriptor, ruta_temporal = tempfile.mkstemp(dir=directorio)
+            with os.fdopen(descriptor, 'wb') as archivo:
+                archivo.write(datos)
+            os.replace(ruta_temporal, ruta_entrada)
+        except OSError:
+            # La caché es una optimización; si no se puede escribir seguimos,
+            # sin dejar el temporal huérfano en el directorio
+            if ruta_temporal is not None:
+                try:
+                    os.remove(ruta_temporal)
+                except OSError:
+                    pass
+            return
+
+        self._tamano_estimado += len(datos)
+        if self._tamano_estimado > self.tamano_maximo:
+            self.podar()
+
+    def _calcular_clave(self, contenido: bytes, *calificadores: str) -> str:
+        """
+        Calcula la clave de un contenido para la versión actual.
+
+        Args:
+            contenido (bytes): Contenido indexado
+            *calificadores (str): Datos adicionales que distinguen entradas
+                del mismo contenido
+
+        Returns:
+            str: Hash sha256 en hexadecimal
+        """
+        resumen = hashlib.sha256(self.version.encode('utf-8'))
+        for calificador in calificadores:
+            resumen.update(b'\0')
+            resumen.update(calificador.encode('utf-8'))
+        resumen.update(b'\0')
+        resumen.update(contenido)
+        return resumen.hexdigest()
+
+    def _ruta_entrada(self, clave: str) -> str:
+        """
+        Obtiene la ruta del archivo de una entrada.
+
+        Args:
+            clave (str): Clave de la entrada
+
+        Returns:
+            str: Ruta del archivo de la entrada
+        """
+        # Repartimos las entradas en subdirectorios por prefijo para no tener
+        # cientos de miles de archivos en un mismo directorio
+        return os.path.join(self.ruta_directorio, clave[:2],
+                            f"{clave}{self.extension}")
+
+    def _listar_entradas(self) -> Iterator[str]:
+        """
+        Enumera las rutas de todas las entradas de la caché.
+
+        Returns:
+            Iterator[str]: Rutas de las entradas
+        """
+        if not os.path.isdir(self.ruta_directorio):
+            return
+        for subdirectorio in os.scandir(self.ruta_directorio):
+            if not subdirectorio.is_dir():
+                continue
+            for entrada in os.scandir(subdirectorio.path):
+                if entrada.name.endswith(self.extension):
+                    yield entrada.path
+
+    def _calcular_tamano(self) -> int:
+        """
+        Calcula el tamaño total de las entradas de la caché.
+
+        Returns:
+            int: Tamaño en bytes
+        """
+        tamano = 0
+        for ruta_entrada in self._listar_entradas():
+            try:
+                tamano += os.path.getsize(ruta_entrada)
+            except OSError:
+                continue
+        return tamano
@@ -0,0 +1,146 @@
+"""
+Nombre del módulo: cache_resultados.py
+Ruta: contador_lineas/core/gestion_archivos/cache_resultados.py
+Descripción: Caché persistente de resultados de análisis indexada por el hash
+             del contenido de cada archivo
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - json
+    - core.gestion_archivos.cache_disco.CacheDisco
+    - utils.perfil.fase
+
+Uso:
+    from contador_lineas.core.gestion_archivos.cache_resultados import (
+        CacheResultados
+    )
+
+    cache = CacheResultados("db/cache", "1.0.0")
+    entrada = cache.obtener(contenido_bytes)
+    if entrada is None:
+        cache.guardar(contenido_bytes, EntradaCache(10, 8, True, ""))
+
+Notas:
+    - La clave es sha256(VERSION_FORMATO_ANALISIS + versión + contenido): un
+      cambio de cualquiera de las dos invalida todas las entradas previas
+      sin necesidad de borrarlas
+    - La versión de la herramienta no cambia cuando cambian las reglas de
+      conteo o de clasificación; esos cambios deben incrementar
+      VERSION_FORMATO_ANALISIS
+    - Cada entrada es un JSON pequeño; la escritura atómica y la expulsión
+      LRU las implementa CacheDisco
+"""
+
+import json
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from contador_lineas.core.gestion_archivos.cache_disco import CacheDisco
+from contador_lineas.utils.perfil import fase
+
+# Versión de las reglas de construcción, validación y conteo que generaron
+# los resultados
+VERSION_FORMATO_ANALISIS = "analisis-1"
+
+# Tamaño máximo por defecto de la caché en disco (64 MiB)
+TAMANO_MAXIMO_CACHE = 64 * 1024 * 1024
+
+
+@dataclass
+class EntradaCache:
+    """
+    Resultado almacenado en caché para un contenido de archivo.
+
+    Attributes:
+        lineas_fisicas (int): Número de líneas físicas
+        lineas_logicas (int): Número de líneas lógicas
+        es_valido (bool): Si el código cumple el estándar
+        error (str): Mensaje de la violación del estándar, vacío si es válido
+
+    Example:
+        >>> EntradaCache(10, 8, True, "")
+    """
+
+    lineas_fisicas: int
+    lineas_logicas: int
+    es_valido: bool
+    error: str
+
+
+class CacheResultados(CacheDisco):
+    """
+    Caché en disco de resultados de análisis con expulsión LRU.
+
+    Attributes:
+        ruta_directorio (str): Directorio donde se guardan las entradas
+        version (str): Versión del formato de análisis y de la herramienta
+            incluida en la clave
+        tamano_maximo (int): Tamaño máximo de la caché en bytes
+
+    Methods:
+        obtener(contenido: bytes) -> Optional[EntradaCache]:
+            Recupera el resultado de un contenido si está en caché.
+        guardar(contenido: bytes, entrada: EntradaCache) -> None:
+            Guarda el resultado de un contenido.
+        podar() -> None:
+            Expulsa las entradas menos usadas hasta respetar el tamaño máximo.
+
+    Example:
+        >>> cache = CacheResultados("db/cache", "1.0.0")
+        >>> cache.obtener(b"x = 1\\n")
+    """
+
+    extension = '.json'
+
+    def __init__(
+            self,
+            ruta_directorio: str,
+            version: str,
+            tamano_maximo: int = TAMANO_MAXIMO_CACHE):
+        super().__init__(ruta_directorio,
+                         f"{VERSION_FORMATO_ANALISIS}:{version}",
+                         tamano_maximo)
+
+    @fase("caché")
+    def obtener(self, contenido: bytes) -> Optional[EntradaCache]:
+        """
+        Recupera el resultado almacenado para un contenido.
+
+        Args:
+            contenido (bytes): Contenido del archivo analizado
+
+        Returns:
+            Optional[EntradaCache]: Entrada encontrada o None
+
+        Example:
+            >>> cache.obtener(b"x = 1\\n")
+        """
+        datos = self._leer(self._calcular_clave(contenido))
+        if datos is None:
+            return None
+        try:
+            return EntradaCache(**json.loads(datos))
+        except (ValueError, TypeError):
+            # Una entrada corrupta o de otro formato es un fallo de caché, no
+            # un error del análisis
+            return None
+
+    @fase("caché")
+    def guardar(self, contenido: bytes, entrada: EntradaCache) -> None:
+        """
+        Guarda el resultado de un contenido en la caché.
+
+        Args:
+            contenido (bytes): Contenido del archivo analizado
+            entrada (EntradaCache): Resultado a almacenar
+
+        Example:
+            >>> cache.guardar(b"x = 1\\n", EntradaCache(1, 1, True, ""))
+        """
+        self._escribir(self._calcular_clave(contenido),
+                       json.dumps(asdict(entrada)).encode('utf-8'))
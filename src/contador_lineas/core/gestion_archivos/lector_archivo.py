@@ -7,12 +7,13 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 16-11-2024
-Última Actualización: 17-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - pathlib
     - typing
     - utils.validador.validar_archivo_python
+    - utils.perfil.fase
 
 Uso:
     from contador_lineas.core.gestion_archivos.lector_archivo import (
@@ -21,16 +22,32 @@ Uso:
     lector = LectorArchivoPython("script.py")
     lineas, error = lector.leer_lineas()
 
+    for linea in lector.iterar_lineas():
+        procesar(linea)
+
+    with lector.mapear() as archivo:
+        print(archivo[1000])
+
 Notas:
     - Maneja archivos de texto en formato Python
     - Implementa caché para optimizar lecturas múltiples
+    - iterar_lineas no guarda el contenido: permite construir el árbol de
+      archivos muy grandes sin tener también todas sus líneas en memoria
+    - mapear da acceso aleatorio por línea sobre un mmap del archivo, con un
+      índice de desplazamientos y decodificación bajo demanda
 """
 
 from pathlib import Path
-from typing import Union, Optional, List, Tuple
+from typing import Iterator, Union, Optional, List, Tuple
 
+from contador_lineas.core.gestion_archivos.archivo_mapeado import (
+    ArchivoMapeado
+)
 from contador_lineas.utils.validador import validar_archivo_python
-from contador_lineas.utils.archivo_utils import leer_archivo_texto
+from contador_lineas.utils.archivo_utils import (
+    iterar_archivo_texto, leer_archivo_texto
+)
+from contador_lineas.utils.perfil import fase
 
 
 class LectorArchivoPython:
@@ -47,6 +64,8 @@ class LectorArchivoPython:
     Methods:
         validar() -> Tuple[bool, str]: Valida si es un archivo Python válido
         leer_lineas() -> Tuple[List[str], Optional[str]]: Lee todas las líneas
+        iterar_lineas() -> Iterator[str]: Recorre las líneas sin guardarlas
+        mapear() -> ArchivoMapeado: Acceso por línea mediante mmap
         contenido() -> List[str]: Retorna contenido en caché o lo lee
 
     Example:
@@ -60,6 +79,7 @@ class LectorArchivoPython:
         self.ruta_archivo = Path(ruta_archivo)
         self._contenido: Optional[List[str]] = None
 
+    @fase("validar archivo")
     def validar(self) -> Tuple[bool, str]:
         """
         Valida si el archivo es un archivo Python válido.
@@ -74,6 +94,7 @@ class LectorArchivoPython:
         # separación de responsabilidades
         return validar_archivo_python(self.ruta_archivo)
 
+    @fase("leer archivo")
     def leer_lineas(self) -> Tuple[List[str], Optional[str]]:
         """
         Lee todas las líneas del archivo Python.
@@ -95,3 +116,42 @@ class LectorArchivoPython:
         # sin acceder al almacenamiento cada vez
         self._contenido, error = leer_archivo_texto(self.ruta_archivo)
         return self._contenido, error
+
+    def iterar_lineas(self) -> Iterator[str]:
+        """
+        Recorre las líneas del archivo sin guardarlas en memoria.
+
+        A diferencia de leer_lineas, no valida el archivo ni llena la caché;
+        se espera que el archivo se haya validado con validar().
+
+        Returns:
+            Iterator[str]: Líneas del archivo con su salto de línea
+
+        Raises:
+            OSError: Si el archivo no se puede leer
+            UnicodeDecodeError: Si el archivo no está en UTF-8
+
+        Example:
+            >>> sum(1 for _ in lector.iterar_lineas())
+            42
+        """
+        return iterar_archivo_texto(self.ruta_archivo)
+
+    def mapear(self) -> ArchivoMapeado:
+        """
+        Mapea el archivo en memoria para leer sus líneas bajo demanda.
+
+        Igual que iterar_lineas, no valida el archivo. El resultado debe
+        cerrarse, de preferencia usándolo como gestor de contexto.
+
+        Returns:
+            ArchivoMapeado: Secuencia de líneas del archivo
+
+        Raises:
+            OSError: Si el archivo no se puede abrir o mapear
+
+        Example:
+            >>> with lector.mapear() as archivo:
+            ...     arbol = ArbolArchivoPython(archivo)
+        """
+        return ArchivoMapeado(self.ruta_archivo)
@@ -8,7 +8,7 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 18-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - dataclasses
@@ -80,6 +80,11 @@ class TipoNodo(Enum):
     ASSERT = "assert"
     WHITE_SPACE = "white_space"
 
+    # Cada miembro es único, así que el hash por identidad es equivalente al
+    # de Enum (calculado en Python a partir del nombre) pero mucho más barato;
+    # los recorridos del árbol consultan conjuntos de tipos en cada nodo
+    __hash__ = object.__hash__
+
 
 @dataclass
 class InformacionExpresion:
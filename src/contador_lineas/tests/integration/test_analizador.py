@@ -7,6 +7,7 @@ from contador_lineas.core.contadores.analizador import (
     ResultadoAnalisis, 
     ExcepcionAnalizador
 )
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import AlmacenamientoMetricas
 from contador_lineas.tests.fixtures.estructuras_basicas import *
 from contador_lineas.tests.fixtures.casos_evaluacion import CASOS_EVALUACION
 
@@ -94,4 +95,23 @@ def funcion():
         
         # Verificar que el árbol se construyó correctamente
         assert analizador.arbol.raiz is not None
-        assert len(analizador.arbol.raiz.hijos) > 0
\ No newline at end of file
+        assert len(analizador.arbol.raiz.hijos) > 0
+
+    def test_almacen_inyectado(self, analizador, crear_archivo_temporal, tmp_path):
+        archivo = crear_archivo_temporal(FUNCION_BASICA)
+        almacen = AlmacenamientoMetricas(str(tmp_path / "registro.json"))
+        with almacen.lote():
+            analizador.analizar_archivo(str(archivo), "test.py", almacen=almacen)
+            assert almacen.cargar_metricas("test.py").lineas_fisicas == 2
+        assert AlmacenamientoMetricas(str(tmp_path / "registro.json")).cargar_metricas("test.py") is not None
+
+    def test_anidamiento_profundo(self, analizador, crear_archivo_temporal, tmp_path):
+        # 5000 niveles superan por mucho el límite de recursión de Python
+        profundidad = 5000
+        codigo = "".join(" " * nivel + "if x:\n" for nivel in range(profundidad))
+        archivo = crear_archivo_temporal(codigo + " " * profundidad + "y = 1\n")
+
+        resultado = analizador.analizar_archivo(
+            str(archivo), "test.py", str(tmp_path / "registro.json"))
+        assert resultado.lineas_fisicas == profundidad + 1
+        assert resultado.lineas_logicas == profundidad
@@ -0,0 +1,38 @@
+# tests/integration/test_analizador_lote.py
+import pytest
+
+from contador_lineas.core.contadores.analizador_lote import AnalizadorLote
+from contador_lineas.tests.fixtures.estructuras_basicas import *
+
+
+class TestAnalizadorLote:
+    @pytest.fixture
+    def directorio(self, tmp_path):
+        (tmp_path / "paquete").mkdir()
+        (tmp_path / "a.py").write_text(FUNCION_BASICA)
+        (tmp_path / "notas.txt").write_text("no es python")
+        (tmp_path / "paquete" / "b.py").write_text(CLASE_BASICA)
+        (tmp_path / "paquete" / "malo.py").write_text("x = 1; y = 2\n")
+        return tmp_path
+
+    def test_descubrir_no_recursivo(self, directorio):
+        archivos = list(AnalizadorLote(1).descubrir_archivos(str(directorio)))
+        assert [nombre for _, nombre in archivos] == ["a.py"]
+
+    def test_descubrir_recursivo(self, directorio):
+        archivos = AnalizadorLote(1).descubrir_archivos(str(directorio), True)
+        assert [nombre for _, nombre in archivos] == \
+            ["a.py", "paquete/b.py", "paquete/malo.py"]
+
+    @pytest.mark.parametrize("trabajadores", [1, 2])
+    def test_analizar_directorio(self, directorio, trabajadores):
+        analizador = AnalizadorLote(trabajadores, tamano_grupo=1)
+        resultados = {
+            resultado.nombre_archivo: resultado
+            for resultado in analizador.analizar_directorio(
+                str(directorio), True)
+        }
+        assert resultados["a.py"].metricas.lineas_fisicas == 2
+        assert resultados["a.py"].metricas.lineas_logicas == 1
+        assert resultados["paquete/b.py"].error is None
+        assert "Violación del estándar" in resultados["paquete/malo.py"].error
@@ -0,0 +1,91 @@
+# tests/integration/test_arranque.py
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from contador_lineas.tests.fixtures.estructuras_basicas import FUNCION_BASICA
+
+RAIZ = Path(__file__).resolve().parents[3]
+
+PUNTOS_DE_ENTRADA = ["contador_lineas", "lineas_por_clase",
+                     "analizador_cambios", "analisis_completo"]
+
+# Módulos de salida, de comparación o de procesos que el arranque no carga
+DIFERIDOS = {"colorama", "tabulate", "difflib", "multiprocessing",
+             "concurrent.futures", "sqlite3"}
+
+# Tiempo acumulado de importación de cada __main__ según -X importtime; el
+# arranque actual está alrededor de 100 ms, así que el margen solo detecta
+# regresiones gruesas. Depende de la máquina, por lo que solo se mide con
+# MEDIR_ARRANQUE=1; la prueba de DIFERIDOS es la que siempre se ejecuta
+PRESUPUESTO_IMPORTACION_MS = 250
+MEDIR_ARRANQUE = os.environ.get("MEDIR_ARRANQUE") == "1"
+
+
+def _ejecutar(*argumentos, cwd=None):
+    entorno = dict(os.environ, PYTHONPATH=str(RAIZ))
+    return subprocess.run([sys.executable, *argumentos], cwd=cwd,
+                          env=entorno, capture_output=True, text=True,
+                          check=True)
+
+
+def _importar(modulo):
+    """Devuelve {módulo: microsegundos acumulados} de -X importtime."""
+    salida = _ejecutar("-X", "importtime", "-c", f"import {modulo}").stderr
+    tiempos = {}
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        tiempos[nombre.strip()] = int(acumulado)
+    return tiempos
+
+
+@pytest.mark.parametrize("paquete", PUNTOS_DE_ENTRADA)
+def test_arranque_no_carga_modulos_diferidos(paquete):
+    tiempos = _importar(f"{paquete}.__main__")
+    assert DIFERIDOS.isdisjoint(tiempos)
+
+
+@pytest.mark.skipif(not MEDIR_ARRANQUE,
+                    reason="Tiempo absoluto; activar con MEDIR_ARRANQUE=1")
+@pytest.mark.parametrize("paquete", PUNTOS_DE_ENTRADA)
+def test_presupuesto_de_importacion(paquete):
+    # El mejor de tres intentos descarta la compilación de los .pyc y el
+    # ruido de la máquina
+    mejor = min(_importar(f"{paquete}.__main__")[f"{paquete}.__main__"]
+                for _ in range(3))
+    assert mejor / 1000 < PRESUPUESTO_IMPORTACION_MS
+
+
+class TestSinColor:
+    @pytest.fixture
+    def archivo(self, tmp_path):
+        archivo = tmp_path / "modulo.py"
+        archivo.write_text(FUNCION_BASICA)
+        return archivo
+
+    def _main(self, archivo, *opciones):
+        programa = (
+            "import sys\n"
+            "from contador_lineas.__main__ import main\n"
+            "main()\n"
+            "print('colorama' in sys.modules)\n")
+        return _ejecutar("-c", programa, str(archivo), "-t", "--sin-cache",
+                         "--dev-db-path", "tests.json", *opciones,
+                         cwd=archivo.parent).stdout
+
+    def test_sin_color_no_carga_colorama(self, archivo):
+        salida = self._main(archivo, "--sin-color")
+        assert "\x1b[" not in salida
+        assert "LOC Físicas" in salida
+        assert salida.splitlines()[-1] == "False"
+
+    def test_con_color_por_defecto(self, archivo):
+        # colorama quita los códigos al escribir en una tubería, así que solo
+        # se comprueba que se cargó
+        salida = self._main(archivo)
+        assert salida.splitlines()[-1] == "True"
@@ -89,7 +89,8 @@ class TestMainIntegracion:
 
     def test_main_archivo_simple(self, crear_archivo_temporal, mock_args, capsys):
         archivo = crear_archivo_temporal(FUNCION_BASICA)
-        mock_args([str(archivo), '--dev-db-path', "tests.json"])
+        mock_args([str(archivo), '--dev-db-path', "tests.json",
+                   '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
@@ -97,7 +98,8 @@ class TestMainIntegracion:
 
     def test_main_archivo_con_tabla(self, crear_archivo_temporal, mock_args, capsys):
         archivo = crear_archivo_temporal(FUNCION_BASICA)
-        mock_args([str(archivo), "-t", '--dev-db-path', "tests.json"])
+        mock_args([str(archivo), "-t", '--dev-db-path', "tests.json",
+                   '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
@@ -115,11 +117,12 @@ class TestMainIntegracion:
         ]
         for nombre, contenido in archivos:
             archivo = crear_archivo_temporal(contenido, nombre)
-            mock_args([str(archivo), '--dev-db-path', "tests.json"])
+            mock_args([str(archivo), '--dev-db-path', "tests.json",
+                       '--sin-cache'])
             main()
         
         # Solicitar tabla completa
-        mock_args(["-tc", '--dev-db-path', "tests.json"])
+        mock_args(["-tc", '--dev-db-path', "tests.json", '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
@@ -128,7 +131,8 @@ class TestMainIntegracion:
             assert nombre in captured.out
 
     def test_main_error_archivo_invalido(self, mock_args, capsys):
-        mock_args(["no_existe.py", '--dev-db-path', "tests.json"])
+        mock_args(["no_existe.py", '--dev-db-path', "tests.json",
+                   '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
@@ -137,16 +141,30 @@ class TestMainIntegracion:
     def test_main_error_archivo_viola_estandar(self, crear_archivo_temporal, mock_args, capsys):
         contenido = "x = 1; y = 2\n"  # Múltiples declaraciones
         archivo = crear_archivo_temporal(contenido)
-        mock_args([str(archivo), '--dev-db-path', "tests.json"])
+        mock_args([str(archivo), '--dev-db-path', "tests.json",
+                   '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
         assert "Violación del estándar" in captured.out
 
     def test_main_sin_argumentos(self, mock_args, capsys):
-        mock_args(['--dev-db-path', "tests.json"])
+        mock_args(['--dev-db-path', "tests.json", '--sin-cache'])
         main()
         
         captured = capsys.readouterr()
         assert "Error" in captured.out
-        assert "Se requiere el archivo cuando no se usa -tc" in captured.out
\ No newline at end of file
+        assert "Se requiere el archivo cuando no se usa -tc" in captured.out
+
+    def test_main_directorio_recursivo(self, tmp_path, mock_args, capsys):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "uno.py").write_text(FUNCION_BASICA)
+        (tmp_path / "sub" / "dos.py").write_text(CLASE_BASICA)
+        mock_args([str(tmp_path), "--recursivo", "--trabajadores", "2",
+                   '--dev-db-path', "tests.json", '--sin-cache'])
+        main()
+
+        captured = capsys.readouterr()
+        assert "¡2 archivos procesados exitosamente!" in captured.out
+        almacen = AlmacenamientoMetricas("tests.json")
+        assert almacen.cargar_metricas("sub/dos.py") is not None
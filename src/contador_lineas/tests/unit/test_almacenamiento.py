@@ -80,4 +80,64 @@ class TestAlmacenamientoMetricas:
             assert metricas.nombre_archivo in METRICAS_REGISTRO
             original = METRICAS_REGISTRO[metricas.nombre_archivo]
             assert metricas.lineas_logicas == original['lineas_logicas']
-            assert metricas.lineas_fisicas == original['lineas_fisicas']
\ No newline at end of file
+            assert metricas.lineas_fisicas == original['lineas_fisicas']
+
+class TestLoteAlmacenamiento:
+    @pytest.fixture
+    def ruta_temporal(self, tmp_path):
+        return tmp_path / "metricas_test.json"
+
+    @pytest.fixture
+    def almacenamiento(self, ruta_temporal):
+        return AlmacenamientoMetricas(str(ruta_temporal))
+
+    def test_lote_escribe_una_sola_vez(self, almacenamiento, ruta_temporal, monkeypatch):
+        escrituras = []
+        import contador_lineas.core.gestion_archivos.almacenamiento_metricas as modulo
+        escribir_original = modulo.escribir_json
+        monkeypatch.setattr(modulo, "escribir_json",
+                            lambda ruta, datos: (escrituras.append(ruta),
+                                                 escribir_original(ruta, datos)))
+
+        with almacenamiento.lote():
+            for i in range(10):
+                almacenamiento.guardar_metricas(MetricasArchivo(f"m{i}.py", i, i))
+            # Dentro del lote el registro en disco aún no cambia
+            assert ruta_temporal.read_text() == "{}"
+
+        assert len(escrituras) == 1
+        assert len(AlmacenamientoMetricas(str(ruta_temporal)).obtener_todas_las_metricas()) == 10
+
+    def test_lecturas_desde_buffer(self, almacenamiento):
+        almacenamiento.guardar_metricas(MetricasArchivo("viejo.py", 1, 1))
+        with almacenamiento.lote():
+            almacenamiento.guardar_metricas(MetricasArchivo("nuevo.py", 2, 3))
+            assert almacenamiento.cargar_metricas("nuevo.py") == MetricasArchivo("nuevo.py", 2, 3)
+            nombres = [m.nombre_archivo for m in almacenamiento.obtener_todas_las_metricas()]
+            assert nombres == ["viejo.py", "nuevo.py"]
+
+    def test_lote_anidado(self, almacenamiento, ruta_temporal):
+        with almacenamiento.lote():
+            with almacenamiento.lote():
+                almacenamiento.guardar_metricas(MetricasArchivo("a.py", 1, 1))
+            assert ruta_temporal.read_text() == "{}"
+        assert almacenamiento.cargar_metricas("a.py") is not None
+
+    def test_excepcion_descarta_cambios(self, almacenamiento, ruta_temporal):
+        with pytest.raises(RuntimeError):
+            with almacenamiento.lote():
+                almacenamiento.guardar_metricas(MetricasArchivo("a.py", 1, 1))
+                raise RuntimeError("fallo")
+        assert almacenamiento.cargar_metricas("a.py") is None
+        assert not list(ruta_temporal.parent.glob("*.tmp"))
+
+    def test_lote_sqlite(self, tmp_path):
+        almacen = AlmacenamientoMetricas(str(tmp_path / "metricas.db"))
+        almacen.guardar_metricas(MetricasArchivo("a.py", 1, 1))
+        with almacen.lote():
+            almacen.guardar_metricas(MetricasArchivo("b.py", 2, 2))
+            almacen.guardar_metricas(MetricasArchivo("a.py", 3, 3))
+            assert AlmacenamientoMetricas(str(tmp_path / "metricas.db")).cargar_metricas("b.py") is None
+            assert almacen.obtener_todas_las_metricas() == [
+                MetricasArchivo("a.py", 3, 3), MetricasArchivo("b.py", 2, 2)]
+        assert AlmacenamientoMetricas(str(tmp_path / "metricas.db")).cargar_metricas("b.py") is not None
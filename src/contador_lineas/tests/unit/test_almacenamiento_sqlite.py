@@ -0,0 +1,79 @@
+# tests/unit/gestion_archivos/test_almacenamiento_sqlite.py
+import pytest
+
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import AlmacenamientoMetricas
+from contador_lineas.core.gestion_archivos.almacenamiento_sqlite import AlmacenamientoMetricasSqlite
+from contador_lineas.models.metricas import MetricasArchivo
+from contador_lineas.tests.fixtures.json_metricas import METRICAS_REGISTRO
+from contador_lineas.utils.sqlite_utils import es_ruta_sqlite, obtener_ruta_sqlite
+
+
+class TestSeleccionBackend:
+    @pytest.mark.parametrize("ruta, esperado", [
+        ("db/metricas.db", True),
+        ("db/metricas.sqlite3", True),
+        ("sqlite:///db/metricas", True),
+        ("db/metricas_registro.json", False),
+    ])
+    def test_es_ruta_sqlite(self, ruta, esperado):
+        assert es_ruta_sqlite(ruta) is esperado
+
+    def test_obtener_ruta_sqlite(self):
+        assert obtener_ruta_sqlite("sqlite:///db/metricas.db") == "db/metricas.db"
+        assert obtener_ruta_sqlite("sqlite:////tmp/metricas.db") == "/tmp/metricas.db"
+
+    def test_constructor_selecciona_sqlite(self, tmp_path):
+        almacen = AlmacenamientoMetricas(f"sqlite:///{tmp_path}/metricas")
+        assert isinstance(almacen, AlmacenamientoMetricasSqlite)
+        assert (tmp_path / "metricas").exists()
+
+    def test_constructor_conserva_json(self, tmp_path):
+        almacen = AlmacenamientoMetricas(str(tmp_path / "metricas.json"))
+        assert not isinstance(almacen, AlmacenamientoMetricasSqlite)
+
+
+class TestAlmacenamientoMetricasSqlite:
+    @pytest.fixture
+    def ruta_temporal(self, tmp_path):
+        return tmp_path / "metricas_test.db"
+
+    @pytest.fixture
+    def almacenamiento(self, ruta_temporal):
+        return AlmacenamientoMetricas(str(ruta_temporal))
+
+    def test_guardar_y_cargar(self, almacenamiento):
+        almacenamiento.guardar_metricas(MetricasArchivo("test.py", 10, 20))
+        metricas = almacenamiento.cargar_metricas("test.py")
+        assert metricas == MetricasArchivo("test.py", 10, 20)
+
+    def test_cargar_metricas_inexistentes(self, almacenamiento):
+        assert almacenamiento.cargar_metricas("no_existe.py") is None
+
+    def test_actualizar_conserva_orden(self, almacenamiento):
+        almacenamiento.guardar_multiples_metricas([
+            MetricasArchivo("a.py", 1, 2),
+            MetricasArchivo("b.py", 3, 4),
+        ])
+        almacenamiento.guardar_metricas(MetricasArchivo("a.py", 5, 6))
+
+        todas = almacenamiento.obtener_todas_las_metricas()
+        assert [m.nombre_archivo for m in todas] == ["a.py", "b.py"]
+        assert todas[0] == MetricasArchivo("a.py", 5, 6)
+
+    def test_persistencia_entre_instancias(self, ruta_temporal):
+        AlmacenamientoMetricas(str(ruta_temporal)).guardar_metricas(
+            MetricasArchivo("pkg/mod.py", 7, 9))
+        metricas = AlmacenamientoMetricas(str(ruta_temporal)).cargar_metricas(
+            "pkg/mod.py")
+        assert metricas == MetricasArchivo("pkg/mod.py", 7, 9)
+
+    def test_multiples_archivos_registro(self, almacenamiento):
+        almacenamiento.guardar_multiples_metricas(
+            MetricasArchivo(**metricas) for metricas in METRICAS_REGISTRO.values())
+
+        todas_las_metricas = almacenamiento.obtener_todas_las_metricas()
+        assert [m.nombre_archivo for m in todas_las_metricas] == list(METRICAS_REGISTRO)
+        for metricas in todas_las_metricas:
+            original = METRICAS_REGISTRO[metricas.nombre_archivo]
+            assert metricas.lineas_logicas == original['lineas_logicas']
+            assert metricas.lineas_fisicas == original['lineas_fisicas']
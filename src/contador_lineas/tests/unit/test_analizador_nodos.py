@@ -0,0 +1,83 @@
+# tests/unit/test_analizador_nodos.py
+import pytest
+
+from contador_lineas.core.arbol.analizador_nodos import AnalizadorTipoNodo
+from contador_lineas.models.nodos import TipoNodo
+
+
+@pytest.fixture
+def analizador():
+    return AnalizadorTipoNodo()
+
+
+class TestDespachoPorPalabra:
+    @pytest.mark.parametrize("linea, esperado", [
+        ("", TipoNodo.WHITE_SPACE),
+        ("# comentario", TipoNodo.COMMENT),
+        ("import os", TipoNodo.IMPORT),
+        ("from os import path", TipoNodo.IMPORT),
+        ("def funcion():", TipoNodo.FUNCTION),
+        ("async def funcion():", TipoNodo.FUNCTION),
+        ("class Clase:", TipoNodo.CLASS),
+        ("if x:", TipoNodo.IF),
+        ("elif x:", TipoNodo.ELIF),
+        ("else:", TipoNodo.ELSE),
+        ("for x in y:", TipoNodo.FOR),
+        ("while x:", TipoNodo.WHILE),
+        ("match x:", TipoNodo.MATCH),
+        ("case 1:", TipoNodo.CASE),
+        ("with open(ruta):", TipoNodo.WITH),
+        ("try:", TipoNodo.TRY),
+        ("except ValueError:", TipoNodo.EXCEPT),
+        ("finally:", TipoNodo.FINALLY),
+        ("return x", TipoNodo.RETURN),
+        ("break", TipoNodo.BREAK),
+        ("continue", TipoNodo.CONTINUE),
+        ("raise ValueError()", TipoNodo.RAISE),
+        ("assert x", TipoNodo.ASSERT),
+        ("@property", TipoNodo.PROPERTY),
+        ("@staticmethod", TipoNodo.DECORATOR),
+        ("CONSTANTE = 1", TipoNodo.CONSTANT),
+        ("x = f(a=1)", TipoNodo.ASSIGNMENT),
+        ("f(a=1)", TipoNodo.EXPRESSION),
+        ("print(x)", TipoNodo.EXPRESSION),
+    ])
+    def test_tipos_basicos(self, analizador, linea, esperado):
+        assert analizador.obtener_tipo_nodo(linea) == esperado
+
+    @pytest.mark.parametrize("linea, esperado", [
+        # La palabra no coincide con el prefijo exacto, como en la cadena
+        # original de reglas
+        ("breakfast = 1", TipoNodo.BREAK),
+        ("exceptional = 2", TipoNodo.EXCEPT),
+        ("continued(x)", TipoNodo.CONTINUE),
+        ("else :", TipoNodo.EXPRESSION),
+        ("if(x):", TipoNodo.EXPRESSION),
+        ("match = 3", TipoNodo.MATCH),
+        ("async_x = 1", TipoNodo.ASSIGNMENT),
+        ('"abc".join(x)', TipoNodo.EXPRESSION),
+        # Comprensiones y ternarios tienen prioridad sobre algunas palabras
+        ("return [x for x in y]", TipoNodo.LIST_COMPREHENSION),
+        ("return a if b else c", TipoNodo.TERNARY),
+        ("with a(b for b in c):", TipoNodo.GENERATOR_EXPRESSION),
+        ("raise E(x for x in y)", TipoNodo.GENERATOR_EXPRESSION),
+        ("y = {k : v for k, v in d}", TipoNodo.DICT_COMPREHENSION),
+        ("x = 1 if y else 2", TipoNodo.TERNARY),
+        # Constantes y propiedades se reconocen en cualquier posición
+        ("@FOO(A=1)", TipoNodo.CONSTANT),
+        ("x = '@property'", TipoNodo.PROPERTY),
+        ("x = a)", TipoNodo.EXPRESSION),
+    ])
+    def test_casos_limite(self, analizador, linea, esperado):
+        assert analizador.obtener_tipo_nodo(linea) == esperado
+
+    def test_contexto_de_clase(self, analizador):
+        assert analizador.obtener_tipo_nodo('"""Módulo."""') == \
+            TipoNodo.MODULE_DOCSTRING
+        assert analizador.obtener_tipo_nodo("class A:") == TipoNodo.CLASS
+        assert analizador.obtener_tipo_nodo("async def f(self):") == \
+            TipoNodo.METHOD
+        assert analizador.obtener_tipo_nodo('"""Método."""') == \
+            TipoNodo.CLASS_DOCSTRING
+        assert analizador.obtener_contexto() == (True, False, True,
+                                                 "class A:")
@@ -0,0 +1,72 @@
+# tests/unit/gestion_archivos/test_archivo_mapeado.py
+import pytest
+
+from contador_lineas.core.arbol.arbol_sintactico import ArbolArchivoPython
+from contador_lineas.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from contador_lineas.core.gestion_archivos.lector_archivo import (
+    LectorArchivoPython
+)
+from contador_lineas.utils.archivo_utils import leer_archivo_texto
+
+
+class TestArchivoMapeado:
+    @pytest.fixture
+    def crear_archivo(self, tmp_path):
+        def _crear_archivo(contenido: bytes):
+            archivo = tmp_path / "modulo.py"
+            archivo.write_bytes(contenido)
+            return archivo
+        return _crear_archivo
+
+    @pytest.mark.parametrize("contenido", [
+        b"",
+        b"x = 1\n",
+        b"x = 1\ny = 2",
+        b"x = 1\r\ny = 'h\xc3\xa9'\rz = 3\n\n",
+    ])
+    def test_coincide_con_lectura_de_texto(self, crear_archivo, contenido):
+        archivo = crear_archivo(contenido)
+        lineas, _ = leer_archivo_texto(archivo)
+        with LectorArchivoPython(archivo).mapear() as mapeado:
+            assert len(mapeado) == len(lineas)
+            assert list(mapeado) == lineas
+            assert mapeado[1:3] == lineas[1:3]
+
+    def test_acceso_por_indice_y_desplazamiento(self, crear_archivo):
+        archivo = crear_archivo(b"a = 1\r\nbb = 2\nc = 3")
+        with LectorArchivoPython(archivo).mapear() as mapeado:
+            assert mapeado[-1] == "c = 3"
+            assert [mapeado.desplazamiento(i) for i in range(4)] == \
+                [0, 7, 14, 19]
+            with pytest.raises(IndexError):
+                mapeado[3]
+
+    def test_construye_arbol(self, crear_archivo):
+        archivo = crear_archivo(b"def f():\n    return 1\n")
+        with LectorArchivoPython(archivo).mapear() as mapeado:
+            arbol = ArbolArchivoPython(mapeado)
+        assert arbol.raiz.hijos[0].hijos[0].contenido == "return 1"
+
+    def test_cerrado_no_lee(self, crear_archivo):
+        mapeado = LectorArchivoPython(crear_archivo(b"x = 1\n")).mapear()
+        mapeado.cerrar()
+        with pytest.raises(ValueError):
+            mapeado[0]
+
+    @pytest.mark.parametrize("umbral", [None, 0, 10 ** 6])
+    def test_analizador_mapea_segun_umbral(self, crear_archivo, umbral):
+        archivo = crear_archivo(b"def f(a):\r\n    return a\n\nx = 1\n")
+        analizador = AnalizadorCodigo(leer_en_flujo=True,
+                                      umbral_mapeo=umbral)
+        metricas = analizador.obtener_metricas(str(archivo), "modulo.py")
+        assert metricas == AnalizadorCodigo().obtener_metricas(str(archivo),
+                                                               "modulo.py")
+        assert analizador.arbol.lineas is None
+
+    def test_analizador_reporta_error_de_decodificacion(self, crear_archivo):
+        archivo = crear_archivo(b"x = '\xff'\n")
+        analizador = AnalizadorCodigo(leer_en_flujo=True, umbral_mapeo=0)
+        with pytest.raises(ExcepcionAnalizador, match="Error al leer"):
+            analizador.obtener_metricas(str(archivo), "modulo.py")
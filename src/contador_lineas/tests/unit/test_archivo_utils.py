@@ -4,6 +4,7 @@ import pytest
 from pathlib import Path
 
 from contador_lineas.utils.archivo_utils import (
+    iterar_archivo_texto,
     leer_archivo_texto,
     leer_json,
     escribir_json,
@@ -46,6 +47,17 @@ class TestLeerArchivoTexto:
         assert lineas == []
         assert "Error al leer el archivo" in error
 
+    def test_iterar_coincide_con_leer(self, tmp_path):
+        archivo = tmp_path / "test.txt"
+        archivo.write_bytes(b"a = 1\r\nb = 2\rc = 3")
+        lineas, _ = leer_archivo_texto(archivo)
+        assert list(iterar_archivo_texto(archivo)) == lineas
+
+    def test_iterar_codificacion_invalida(self, crear_archivo_temporal):
+        archivo = crear_archivo_temporal("áéíóú")
+        with pytest.raises(UnicodeDecodeError):
+            list(iterar_archivo_texto(archivo, 'ascii'))
+
 class TestLeerEscribirJson:
     @pytest.fixture
     def crear_json_temporal(self, tmp_path):
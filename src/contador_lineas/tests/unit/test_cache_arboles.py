@@ -0,0 +1,177 @@
+# tests/unit/gestion_archivos/test_cache_arboles.py
+import os
+
+import pytest
+
+from analizador_cambios.core.arbol.arbol_sintactico import (
+    ArbolArchivoPython as ArbolCambios
+)
+from contador_lineas.core.arbol.arbol_sintactico import (
+    VARIANTE_ESTANDAR, ArbolArchivoPython
+)
+from contador_lineas.core.contadores.analizador import AnalizadorCodigo
+from contador_lineas.core.gestion_archivos import cache_arboles
+from contador_lineas.core.gestion_archivos.cache_arboles import (
+    CacheArboles, deserializar_arbol, serializar_arbol
+)
+from lineas_por_clase.core.arbol.arbol_sintactico import (
+    ArbolArchivoPython as ArbolClases
+)
+from lineas_por_clase.core.contadores.analizador import (
+    AnalizadorCodigo as AnalizadorClases
+)
+
+CODIGO = [
+    '"""Módulo de ejemplo."""\n',
+    "import os\n",
+    "\n",
+    "class A:\n",
+    "    def f(self, x):\n",
+    "        total = (x +\n",
+    "                 1)\n",
+    "\n",
+    "        return total\n",
+    "\n",
+    "def g():\n",
+    '    """Docstring\n',
+    '    de dos líneas."""\n',
+    "    return 2\n",
+]
+
+
+def _resumir(nodo):
+    return (nodo.tipo, nodo.contenido, nodo.nivel_indentacion,
+            nodo.numero_nodo, nodo.lineas,
+            [_resumir(hijo) for hijo in nodo.hijos])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CacheArboles(str(tmp_path / "arboles"))
+
+
+class TestSerializacion:
+    def test_ida_y_vuelta(self):
+        arbol = ArbolArchivoPython(CODIGO)
+        entrada = deserializar_arbol(serializar_arbol(arbol.raiz,
+                                                      arbol.cortes))
+        assert _resumir(entrada.raiz) == _resumir(arbol.raiz)
+        assert entrada.cortes == arbol.cortes
+        hijo = entrada.raiz.hijos[2]
+        assert hijo.padre is entrada.raiz
+
+    def test_conserva_numeracion_y_lineas(self):
+        raiz = ArbolCambios(CODIGO).raiz
+        entrada = deserializar_arbol(serializar_arbol(raiz))
+        assert _resumir(entrada.raiz) == _resumir(raiz)
+        assert entrada.cortes == []
+
+    def test_datos_invalidos(self):
+        with pytest.raises(ValueError):
+            deserializar_arbol(b"no es un arbol")
+
+
+class TestCacheArboles:
+    def test_fallo_y_acierto(self, cache):
+        clave = cache.calcular_clave(CODIGO, VARIANTE_ESTANDAR)
+        assert cache.obtener(clave) is None
+        arbol = ArbolArchivoPython(CODIGO, cache)
+        entrada = cache.obtener(clave)
+        assert _resumir(entrada.raiz) == _resumir(arbol.raiz)
+
+    def test_clave_respeta_limites_de_lineas(self, cache):
+        assert cache.calcular_clave(["ab\n", "c\n"], VARIANTE_ESTANDAR) != \
+            cache.calcular_clave(["a", "b\nc\n"], VARIANTE_ESTANDAR)
+
+    def test_arbol_cargado_admite_ediciones(self, cache):
+        ArbolArchivoPython(CODIGO, cache)
+        cargado = ArbolArchivoPython(CODIGO, cache)
+        cargado.aplicar_edicion(13, 14, ["    return 3\n"])
+        nuevo = CODIGO[:13] + ["    return 3\n"] + CODIGO[14:]
+        assert _resumir(cargado.raiz) == \
+            _resumir(ArbolArchivoPython(nuevo).raiz)
+
+    def test_flujo_no_usa_la_cache(self, cache):
+        ArbolArchivoPython(iter(CODIGO), cache)
+        assert list(cache._listar_entradas()) == []
+
+    def test_entrada_corrupta_es_un_fallo(self, cache):
+        clave = cache.calcular_clave(CODIGO, VARIANTE_ESTANDAR)
+        cache._escribir(clave, b"corrupta")
+        arbol = ArbolArchivoPython(CODIGO, cache)
+        assert _resumir(cache.obtener(clave).raiz) == _resumir(arbol.raiz)
+
+    def test_expulsion_lru(self, cache):
+        ArbolArchivoPython(["a = 1\n"], cache)
+        clave_a = cache.calcular_clave(["a = 1\n"], VARIANTE_ESTANDAR)
+        # Caben dos entradas pequeñas, pero no tres
+        tamano = os.path.getsize(cache._ruta_entrada(clave_a))
+        cache.tamano_maximo = tamano * 5 // 2
+        ArbolArchivoPython(["b = 2\n"], cache)
+        clave_b = cache.calcular_clave(["b = 2\n"], VARIANTE_ESTANDAR)
+        # Marcamos "a" como la entrada más antigua antes de agregar "c"
+        os.utime(cache._ruta_entrada(clave_a), (0, 0))
+        ArbolArchivoPython(["c = 3\n"], cache)
+        assert cache.obtener(clave_a) is None
+        assert cache.obtener(clave_b) is not None
+
+    def test_escritura_fallida_no_deja_temporales(self, cache, monkeypatch):
+        def fallar(origen, destino):
+            raise OSError("disco lleno")
+
+        clave = cache.calcular_clave(CODIGO, VARIANTE_ESTANDAR)
+        monkeypatch.setattr(os, "replace", fallar)
+        cache._escribir(clave, b"datos")
+        directorio = os.path.dirname(cache._ruta_entrada(clave))
+        assert os.listdir(directorio) == []
+        assert cache.obtener(clave) is None
+
+
+class TestCompartidaEntreHerramientas:
+    def test_lineas_por_clase_carga_arbol_de_contador_lineas(self, cache,
+                                                             monkeypatch):
+        arbol = ArbolArchivoPython(CODIGO, cache)
+        # Si el árbol sale de la caché, el constructor no se ejecuta
+        monkeypatch.setattr(
+            "contador_lineas.core.arbol.constructor_arbol.ConstructorArbol."
+            "construir", lambda *args: pytest.fail("se construyó el árbol"))
+        clases = ArbolClases(CODIGO, cache)
+        assert _resumir(clases.raiz) == _resumir(arbol.raiz)
+        assert [nodo.obtener_nombre_clase()
+                for nodo in clases.obtener_nodos_clase()] == ["A"]
+
+    def test_contador_lineas_carga_arbol_de_lineas_por_clase(self, cache):
+        clases = ArbolClases(CODIGO, cache)
+        arbol = ArbolArchivoPython(CODIGO, cache)
+        assert _resumir(arbol.raiz) == _resumir(clases.raiz)
+        assert arbol.cortes == ArbolArchivoPython(CODIGO).cortes
+
+    def test_analizador_cambios_usa_su_variante(self, cache):
+        ArbolArchivoPython(CODIGO, cache)
+        construido = ArbolCambios(CODIGO, cache)
+        cargado = ArbolCambios(CODIGO, cache)
+        assert _resumir(cargado.raiz) == _resumir(construido.raiz)
+        assert cargado.mapeo_lineas == construido.mapeo_lineas
+        assert cargado.raiz.hash_subarbol == construido.raiz.hash_subarbol
+        assert len(list(cache._listar_entradas())) == 2
+
+    def test_analizadores_comparten_la_cache(self, cache, tmp_path):
+        ruta = tmp_path / "modulo.py"
+        ruta.write_text("".join(CODIGO), encoding="utf-8")
+        metricas = AnalizadorCodigo(cache_arboles=cache).obtener_metricas(
+            str(ruta), "modulo.py")
+        assert metricas == AnalizadorCodigo().obtener_metricas(str(ruta),
+                                                               "modulo.py")
+        clases = AnalizadorClases(cache).obtener_metricas(str(ruta),
+                                                          "modulo.py")
+        assert clases == AnalizadorClases().obtener_metricas(str(ruta),
+                                                             "modulo.py")
+        assert len(list(cache._listar_entradas())) == 1
+
+    def test_version_de_formato_invalida_entradas(self, cache, monkeypatch):
+        ArbolArchivoPython(CODIGO, cache)
+        monkeypatch.setattr(cache_arboles, "VERSION_FORMATO_ARBOL",
+                            "arboles-otro")
+        otra = CacheArboles(cache.ruta_directorio)
+        assert otra.obtener(otra.calcular_clave(CODIGO,
+                                                VARIANTE_ESTANDAR)) is None
@@ -0,0 +1,75 @@
+# tests/unit/gestion_archivos/test_cache_resultados.py
+import os
+
+import pytest
+
+from contador_lineas.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from contador_lineas.core.gestion_archivos import cache_resultados
+from contador_lineas.core.gestion_archivos.cache_resultados import (
+    CacheResultados, EntradaCache
+)
+from contador_lineas.tests.fixtures.estructuras_basicas import *
+
+
+class TestCacheResultados:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return CacheResultados(str(tmp_path / "cache"), "1.0.0")
+
+    def test_fallo_y_acierto(self, cache):
+        assert cache.obtener(b"x = 1\n") is None
+        cache.guardar(b"x = 1\n", EntradaCache(1, 1, True, ""))
+        assert cache.obtener(b"x = 1\n") == EntradaCache(1, 1, True, "")
+
+    def test_version_distinta_no_comparte_entradas(self, cache, tmp_path):
+        cache.guardar(b"x = 1\n", EntradaCache(1, 1, True, ""))
+        otra = CacheResultados(cache.ruta_directorio, "2.0.0")
+        assert otra.obtener(b"x = 1\n") is None
+
+    def test_version_de_analisis_invalida_entradas(self, cache, monkeypatch):
+        cache.guardar(b"x = 1\n", EntradaCache(1, 1, True, ""))
+        monkeypatch.setattr(cache_resultados, "VERSION_FORMATO_ANALISIS",
+                            "analisis-otro")
+        otra = CacheResultados(cache.ruta_directorio, "1.0.0")
+        assert otra.obtener(b"x = 1\n") is None
+
+    def test_expulsion_lru(self, tmp_path):
+        cache = CacheResultados(str(tmp_path / "cache"), "1.0.0", 200)
+        cache.guardar(b"a", EntradaCache(1, 1, True, ""))
+        cache.guardar(b"b", EntradaCache(2, 2, True, ""))
+        # Marcamos "a" como la entrada más antigua antes de leer "b"
+        ruta_a = cache._ruta_entrada(cache._calcular_clave(b"a"))
+        os.utime(ruta_a, (0, 0))
+        cache.guardar(b"c", EntradaCache(3, 3, True, ""))
+        assert cache.obtener(b"a") is None
+        assert cache.obtener(b"c") is not None
+
+
+class TestAnalizadorConCache:
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return CacheResultados(str(tmp_path / "cache"), "1.0.0")
+
+    def test_acierto_omite_analisis(self, cache, tmp_path):
+        archivo = tmp_path / "modulo.py"
+        archivo.write_text(FUNCION_BASICA)
+        primera = AnalizadorCodigo(cache).obtener_metricas(
+            str(archivo), "modulo.py")
+
+        analizador = AnalizadorCodigo(cache)
+        segunda = analizador.obtener_metricas(str(archivo), "otro.py")
+        assert analizador.arbol is None
+        assert segunda.nombre_archivo == "otro.py"
+        assert (segunda.lineas_fisicas, segunda.lineas_logicas) == \
+            (primera.lineas_fisicas, primera.lineas_logicas)
+
+    def test_violacion_desde_cache(self, cache, tmp_path):
+        archivo = tmp_path / "malo.py"
+        archivo.write_text("x = 1; y = 2\n")
+        for _ in range(2):
+            with pytest.raises(ExcepcionAnalizador,
+                               match="Violación del estándar"):
+                AnalizadorCodigo(cache).obtener_metricas(
+                    str(archivo), "malo.py")
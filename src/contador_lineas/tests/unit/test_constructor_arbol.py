@@ -0,0 +1,47 @@
+# tests/unit/arbol/test_constructor_arbol.py
+import pytest
+
+from contador_lineas.core.arbol.constructor_arbol import ConstructorArbol
+from contador_lineas.models.nodos import TipoNodo
+
+
+def _resumir(nodo):
+    return [(hijo.tipo, hijo.contenido, hijo.nivel_indentacion,
+             _resumir(hijo)) for hijo in nodo.hijos]
+
+
+class TestConstructorArbol:
+    @pytest.fixture
+    def constructor(self):
+        return ConstructorArbol()
+
+    def test_delimitadores_multilinea(self, constructor):
+        raiz = constructor.construir(["x = (1,", "     2)", "y = 3"])
+        assert [hijo.contenido for hijo in raiz.hijos] == \
+            ["x = (1, 2)", "y = 3"]
+
+    def test_continuacion_explicita(self, constructor):
+        raiz = constructor.construir(["x = 1 + \\", "    2"])
+        assert raiz.hijos[0].contenido == "x = 1 +  2"
+
+    def test_docstring_multilinea(self, constructor):
+        raiz = constructor.construir([
+            "def f(a,",
+            "      b):",
+            '    """doc',
+            '    mas"""',
+            "    return a"
+        ])
+        assert _resumir(raiz) == [(TipoNodo.FUNCTION, "def f(a, b):", 0, [
+            (TipoNodo.FUNCTION_DOCSTRING, '"""doc', 4, []),
+            (TipoNodo.FUNCTION_DOCSTRING, 'mas"""', 4, []),
+            (TipoNodo.RETURN, "return a", 4, [])
+        ])]
+
+    def test_bloques_abiertos_al_final(self, constructor):
+        raiz = constructor.construir(["x = [1,", "", "     2"])
+        assert raiz.hijos[0].contenido == "x = [1,  2"
+
+    def test_acepta_iteradores(self, constructor):
+        raiz = constructor.construir(iter(["if x:", "    y = 1"]))
+        assert raiz.hijos[0].hijos[0].contenido == "y = 1"
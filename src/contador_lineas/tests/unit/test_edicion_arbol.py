@@ -0,0 +1,144 @@
+# tests/unit/arbol/test_edicion_arbol.py
+import pytest
+
+from contador_lineas.core.arbol.arbol_sintactico import ArbolArchivoPython
+from contador_lineas.core.contadores.analizador import (
+    AnalizadorCodigo, ExcepcionAnalizador
+)
+from contador_lineas.core.gestion_archivos.cache_resultados import (
+    CacheResultados
+)
+from contador_lineas.models.nodos import TipoNodo
+
+CODIGO = [
+    "import os\n",
+    "\n",
+    "def f(a):\n",
+    "    x = a + 1\n",
+    "    return x\n",
+    "\n",
+    "def g(b):\n",
+    "    return b\n",
+    "\n",
+    "y = 2\n",
+]
+
+
+def _resumir(nodo):
+    return [(hijo.tipo, hijo.contenido, hijo.nivel_indentacion,
+             _resumir(hijo)) for hijo in nodo.hijos]
+
+
+def _editar(lineas, inicio, fin, nuevas):
+    arbol = ArbolArchivoPython(lineas)
+    edicion = arbol.aplicar_edicion(inicio, fin, nuevas)
+    completo = ArbolArchivoPython(lineas[:inicio] + nuevas + lineas[fin:])
+    assert _resumir(arbol.raiz) == _resumir(completo.raiz)
+    assert arbol.cortes == completo.cortes
+    return arbol, edicion
+
+
+class TestAplicarEdicion:
+    def test_reconstruye_solo_el_bloque_editado(self):
+        original = ArbolArchivoPython(CODIGO)
+        intactos = [original.raiz.hijos[0], original.raiz.hijos[2]]
+
+        edicion = original.aplicar_edicion(3, 4, ["    x = a * 2\n"])
+
+        assert [nodo.contenido for nodo in edicion.nodos_anteriores] == \
+            ["def f(a):"]
+        assert edicion.nodos_nuevos[0].hijos[0].contenido == "x = a * 2"
+        assert edicion.nodos_nuevos[0].padre is original.raiz
+        assert (edicion.linea_inicio, edicion.linea_fin) == (2, 6)
+        assert [original.raiz.hijos[0], original.raiz.hijos[2]] == intactos
+
+    @pytest.mark.parametrize("inicio, fin, nuevas", [
+        (3, 4, ["    x = a * 2\n"]),
+        (4, 4, ["    z = 3\n", "    w = 4\n"]),
+        (2, 6, []),
+        (0, 10, []),
+        (10, 10, ["def h():\n", "    pass\n"]),
+    ])
+    def test_coincide_con_construccion_completa(self, inicio, fin, nuevas):
+        _editar(CODIGO, inicio, fin, nuevas)
+
+    def test_cadena_abierta_absorbe_bloques_siguientes(self):
+        arbol, edicion = _editar(CODIGO, 3, 4, ['    """doc\n'])
+        assert edicion.linea_fin == len(arbol.lineas)
+
+    def test_linea_indentada_continua_bloque_anterior(self):
+        arbol, edicion = _editar(CODIGO, 6, 7, ["    z = b\n"])
+        assert edicion.linea_inicio == 2
+        assert arbol.raiz.hijos[1].hijos[-1].contenido == "return b"
+
+    def test_clase_cambia_tipo_de_funciones_posteriores(self):
+        arbol, _ = _editar(CODIGO, 1, 1, ["class A:\n", "    pass\n"])
+        assert arbol.raiz.hijos[3].tipo == TipoNodo.METHOD
+
+    def test_rango_invalido(self):
+        with pytest.raises(ValueError):
+            ArbolArchivoPython(CODIGO).aplicar_edicion(5, 3, [])
+
+    def test_arbol_de_flujo_no_admite_ediciones(self):
+        arbol = ArbolArchivoPython(iter(CODIGO))
+        assert _resumir(arbol.raiz) == \
+            _resumir(ArbolArchivoPython(CODIGO).raiz)
+        assert arbol.lineas is None
+        with pytest.raises(ValueError):
+            arbol.aplicar_edicion(0, 1, [])
+
+
+class TestAnalizadorEdicion:
+    @pytest.fixture
+    def analizador(self, tmp_path):
+        ruta = tmp_path / "modulo.py"
+        ruta.write_text("".join(CODIGO), encoding="utf-8")
+        analizador = AnalizadorCodigo()
+        return analizador, analizador.obtener_metricas(str(ruta), "modulo.py")
+
+    def test_actualiza_metricas(self, analizador):
+        analizador, metricas = analizador
+        nuevas = ["def h(c):\n", "    return c\n", "\n"]
+
+        resultado = analizador.aplicar_edicion(6, 8, nuevas, metricas)
+
+        esperado = AnalizadorCodigo()._procesar_codigo(
+            CODIGO[:6] + nuevas + CODIGO[8:], "modulo.py")
+        assert resultado == esperado
+
+    def test_lectura_en_flujo_no_edita(self, tmp_path):
+        ruta = tmp_path / "modulo.py"
+        ruta.write_text("".join(CODIGO), encoding="utf-8")
+        analizador = AnalizadorCodigo(leer_en_flujo=True)
+        metricas = analizador.obtener_metricas(str(ruta), "modulo.py")
+        assert metricas == AnalizadorCodigo().obtener_metricas(str(ruta),
+                                                               "modulo.py")
+        assert analizador.codigo is None
+        with pytest.raises(ExcepcionAnalizador):
+            analizador.aplicar_edicion(0, 1, [], metricas)
+
+    def test_violacion_descarta_arbol(self, analizador):
+        analizador, metricas = analizador
+        with pytest.raises(ExcepcionAnalizador, match="lambda"):
+            analizador.aplicar_edicion(3, 4, ["    x = lambda a: a\n"],
+                                       metricas)
+        assert analizador.arbol is None
+        with pytest.raises(ExcepcionAnalizador):
+            analizador.aplicar_edicion(0, 0, [], metricas)
+
+    def test_acierto_de_cache_no_edita_arbol_anterior(self, tmp_path):
+        ruta_a = tmp_path / "a.py"
+        ruta_b = tmp_path / "b.py"
+        ruta_a.write_text("".join(CODIGO), encoding="utf-8")
+        ruta_b.write_text("x = 1\n", encoding="utf-8")
+        cache = CacheResultados(str(tmp_path / "cache"), "1.0.0")
+        AnalizadorCodigo(cache=cache).obtener_metricas(str(ruta_b), "b.py")
+
+        analizador = AnalizadorCodigo(cache=cache)
+        analizador.obtener_metricas(str(ruta_a), "a.py")
+        assert analizador.arbol is not None
+        metricas_b = analizador.obtener_metricas(str(ruta_b), "b.py")
+
+        assert analizador.arbol is None
+        with pytest.raises(ExcepcionAnalizador):
+            analizador.aplicar_edicion(0, 1, ["w = 0\n"], metricas_b)
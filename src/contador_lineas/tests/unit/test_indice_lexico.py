@@ -0,0 +1,55 @@
+# tests/unit/analizadores/test_indice_lexico.py
+import pytest
+
+from contador_lineas.core.analizadores.indice_lexico import (
+    IndiceLexico,
+    obtener_indice_lexico
+)
+
+
+class TestIndiceLexicoCadenas:
+    def test_posiciones_dentro_y_fuera(self):
+        indice = IndiceLexico("x = 'abc' + y")
+        assert not indice.esta_en_cadena(0)
+        assert indice.esta_en_cadena(5)
+        assert indice.esta_en_cadena(8)
+        assert not indice.esta_en_cadena(10)
+
+    def test_comilla_escapada(self):
+        indice = IndiceLexico(r"x = 'a\'b' + y")
+        assert indice.esta_en_cadena(8)
+        assert not indice.esta_en_cadena(12)
+
+    def test_cadena_sin_cerrar(self):
+        indice = IndiceLexico('x = "abierta')
+        assert indice.esta_en_cadena(8)
+        assert not indice.esta_en_cadena(8, True)
+
+
+class TestIndiceLexicoBusqueda:
+    def test_encontrar_saltando_cadenas(self):
+        indice = IndiceLexico("f('(', '(') (")
+        assert indice.encontrar_sin_comillas('(', 2) == 12
+
+    def test_contar_ignora_comentario(self):
+        indice = IndiceLexico("x = (1) # (")
+        assert indice.comentario == 8
+        assert indice.contar_sin_comillas('(') == 1
+
+    def test_contar_comilla_sin_pareja(self):
+        assert IndiceLexico("x = 'a").contar_sin_comillas("'") == 1
+
+
+class TestIndiceLexicoCorchetes:
+    @pytest.mark.parametrize("codigo, apertura, cierre", [
+        ("(a + (b))", 0, 8),
+        ("[a, (b, c)]", 4, 9),
+        ("{'k': [1]}", 0, 9),
+        ("(a", 0, -1),
+    ])
+    def test_pares_corchetes(self, codigo, apertura, cierre):
+        assert IndiceLexico(codigo).par_corchete(apertura) == cierre
+
+    def test_indice_reutilizado(self):
+        assert obtener_indice_lexico("x = (1)") is \
+            obtener_indice_lexico("x = (1)")
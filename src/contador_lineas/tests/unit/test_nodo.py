@@ -0,0 +1,58 @@
+# tests/unit/arbol/test_nodo.py
+import pytest
+
+from contador_lineas.core.arbol.nodo import SIN_HIJOS, Nodo
+from contador_lineas.models.nodos import TipoNodo
+from analizador_cambios.core.arbol.nodo import Nodo as NodoCambios
+from lineas_por_clase.core.arbol.nodo import Nodo as NodoClases
+
+
+class TestNodo:
+    def test_nodo_compartido_entre_paquetes(self):
+        assert issubclass(NodoCambios, Nodo)
+        assert NodoClases is Nodo
+
+    def test_nodo_de_cambios_sin_diccionario(self):
+        nodo = NodoCambios(TipoNodo.EXPRESSION, "x = 1", 0, 0)
+        assert not hasattr(nodo, "__dict__")
+        assert nodo.hash_subarbol is None
+
+    def test_sin_diccionario_por_instancia(self):
+        nodo = Nodo(TipoNodo.EXPRESSION, "x = 1", 0)
+        assert not hasattr(nodo, "__dict__")
+        with pytest.raises(AttributeError):
+            nodo.atributo_nuevo = 1
+
+    def test_hojas_comparten_hijos_vacios(self):
+        a = Nodo(TipoNodo.EXPRESSION, "a = 1", 0)
+        b = Nodo(TipoNodo.EXPRESSION, "b = 2", 0)
+        assert a.hijos is SIN_HIJOS
+        assert b.hijos is SIN_HIJOS
+
+    def test_agregar_hijo_crea_lista_propia(self):
+        padre = Nodo(TipoNodo.FUNCTION, "def f():", 0)
+        otro = Nodo(TipoNodo.FUNCTION, "def g():", 0)
+        primero = Nodo(TipoNodo.RETURN, "return 1", 1)
+        segundo = Nodo(TipoNodo.RETURN, "return 2", 1)
+
+        padre.agregar_hijo(primero)
+        padre.agregar_hijo(segundo)
+
+        assert padre.hijos == [primero, segundo]
+        assert primero.padre is padre
+        assert otro.hijos is SIN_HIJOS
+
+    def test_campos_opcionales_de_mapeo(self):
+        nodo = Nodo(TipoNodo.EXPRESSION, "x = 1", 0)
+        assert nodo.numero_nodo is None
+        assert nodo.lineas is None
+
+        numerado = Nodo(TipoNodo.EXPRESSION, "x = 1", 0, 3, [4, 5])
+        assert numerado.numero_nodo == 3
+        assert numerado.lineas == [4, 5]
+
+    def test_obtener_nombre_clase(self):
+        clase = Nodo(TipoNodo.CLASS, "class Formateador(Base):", 0)
+        funcion = Nodo(TipoNodo.FUNCTION, "def f():", 0)
+        assert clase.obtener_nombre_clase() == "Formateador(Base)"
+        assert funcion.obtener_nombre_clase() is None
@@ -0,0 +1,127 @@
+# tests/unit/test_perfil.py
+import argparse
+import io
+import pstats
+
+import pytest
+
+from contador_lineas.utils import perfil
+from contador_lineas.utils.perfil import (
+    PerfilFases, fase, perfilar, tipo_modo_perfil
+)
+from contador_lineas.tests.fixtures.estructuras_basicas import FUNCION_BASICA
+
+
+@fase("interna")
+def interna(valor):
+    return valor * 2
+
+
+@fase("externa")
+def externa(valor):
+    return interna(valor) + 1
+
+
+@fase("externa")
+def reentrante(valor):
+    return externa(valor)
+
+
+class TestFase:
+    def test_sin_perfil_no_mide(self):
+        assert perfil._perfil_activo is None
+        assert externa(3) == 7
+
+    def test_conserva_metadatos(self):
+        assert externa.__name__ == "externa"
+
+    def test_tiempos_exclusivos(self):
+        salida = io.StringIO()
+        with perfilar("fases", salida) as medido:
+            externa(1)
+            externa(2)
+        fases = medido.fases
+        assert fases["externa"].llamadas == 2
+        assert fases["interna"].llamadas == 2
+        assert fases["externa"].pared >= 0
+        assert fases["interna"].pared >= 0
+        assert perfil._perfil_activo is None
+
+    def test_reentrada_se_mide_una_vez(self):
+        with perfilar("fases", io.StringIO()) as medido:
+            reentrante(1)
+        assert medido.fases["externa"].llamadas == 1
+        assert medido.fases["interna"].llamadas == 1
+
+    def test_excepcion_cierra_la_fase(self):
+        @fase("falla")
+        def falla():
+            raise ValueError("error")
+
+        with perfilar("fases", io.StringIO()) as medido:
+            with pytest.raises(ValueError):
+                falla()
+            externa(1)
+        assert medido.fases["falla"].llamadas == 1
+        assert medido._pila == []
+
+
+class TestInforme:
+    def test_incluye_fases_otros_y_total(self):
+        salida = io.StringIO()
+        with perfilar("fases", salida):
+            externa(1)
+        texto = salida.getvalue()
+        assert "Perfil por fases" in texto
+        for fila in ("externa", "interna", "otros", "Total"):
+            assert fila in texto
+
+    def test_suma_de_fases_igual_al_total(self):
+        medido = PerfilFases()
+        if medido.entrar("a"):
+            medido.salir()
+        filas = medido.informe().splitlines()
+        pared = [float(fila.split()[-3]) for fila in filas[1:]]
+        assert sum(pared[:-1]) == pytest.approx(pared[-1], abs=2e-4)
+
+
+class TestModo:
+    @pytest.mark.parametrize("valor", ["fases", "cprofile:salida.prof"])
+    def test_modos_validos(self, valor):
+        assert tipo_modo_perfil(valor) == valor
+
+    @pytest.mark.parametrize("valor", ["", "cprofile:", "archivo.py"])
+    def test_modos_invalidos(self, valor):
+        with pytest.raises(argparse.ArgumentTypeError):
+            tipo_modo_perfil(valor)
+
+    def test_sin_modo_no_activa_perfil(self):
+        with perfilar(None) as medido:
+            assert medido is None
+            assert perfil._perfil_activo is None
+
+    def test_cprofile_guarda_perfil(self, tmp_path):
+        ruta = tmp_path / "salida.prof"
+        salida = io.StringIO()
+        with perfilar(f"cprofile:{ruta}", salida):
+            externa(1)
+        estadisticas = pstats.Stats(str(ruta))
+        funciones = {nombre for _, _, nombre in estadisticas.stats}
+        assert "externa" in funciones
+        assert str(ruta) in salida.getvalue()
+
+
+class TestPerfilMain:
+    def test_main_imprime_fases(self, tmp_path, monkeypatch, capsys):
+        from contador_lineas.__main__ import main
+
+        archivo = tmp_path / "modulo.py"
+        archivo.write_text(FUNCION_BASICA)
+        monkeypatch.setattr("sys.argv", [
+            "contador_lineas", str(archivo), "--sin-cache", "--sin-color",
+            "--dev-db-path", str(tmp_path / "metricas.json"), "--perfil"])
+        main()
+        capturado = capsys.readouterr()
+        assert "procesado exitosamente" in capturado.out
+        assert "construir árbol" in capturado.err
+        assert "validar y contar" in capturado.err
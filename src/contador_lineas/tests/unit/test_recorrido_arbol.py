@@ -0,0 +1,73 @@
+# tests/unit/arbol/test_recorrido_arbol.py
+import pytest
+
+from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.recorrido_arbol import (
+    recorrer_arbol, recorrer_postorden, recorrer_preorden
+)
+from contador_lineas.models.nodos import TipoNodo
+
+
+def crear_arbol():
+    #   raiz
+    #   ├── a
+    #   │   ├── a1
+    #   │   └── a2
+    #   └── b
+    #       └── b1
+    nodos = {nombre: Nodo(TipoNodo.EXPRESSION, nombre, 0)
+             for nombre in ("raiz", "a", "a1", "a2", "b", "b1")}
+    nodos["raiz"].agregar_hijo(nodos["a"])
+    nodos["raiz"].agregar_hijo(nodos["b"])
+    nodos["a"].agregar_hijo(nodos["a1"])
+    nodos["a"].agregar_hijo(nodos["a2"])
+    nodos["b"].agregar_hijo(nodos["b1"])
+    return nodos["raiz"]
+
+
+def crear_arbol_profundo(profundidad):
+    raiz = Nodo(TipoNodo.ROOT, "", 0)
+    actual = raiz
+    for nivel in range(profundidad):
+        hijo = Nodo(TipoNodo.IF, "if x:", nivel)
+        actual.agregar_hijo(hijo)
+        actual = hijo
+    return raiz
+
+
+class TestRecorridoArbol:
+    def test_preorden(self):
+        contenidos = [nodo.contenido for nodo in recorrer_preorden(crear_arbol())]
+        assert contenidos == ["raiz", "a", "a1", "a2", "b", "b1"]
+
+    def test_preorden_omitir_subarbol(self):
+        contenidos = [nodo.contenido for nodo in
+                      recorrer_preorden(crear_arbol(), lambda nodo: nodo.contenido == "a")]
+        assert contenidos == ["raiz", "b", "b1"]
+
+    def test_postorden(self):
+        contenidos = [nodo.contenido for nodo in recorrer_postorden(crear_arbol())]
+        assert contenidos == ["a1", "a2", "a", "b1", "b", "raiz"]
+
+    def test_funciones_entrada_salida(self):
+        eventos = []
+        recorrer_arbol(crear_arbol(),
+                       al_entrar=lambda nodo: eventos.append("+" + nodo.contenido),
+                       al_salir=lambda nodo: eventos.append("-" + nodo.contenido))
+        assert eventos == ["+raiz", "+a", "+a1", "-a1", "+a2", "-a2", "-a",
+                           "+b", "+b1", "-b1", "-b", "-raiz"]
+
+    def test_entrada_falsa_omite_descendientes(self):
+        eventos = []
+
+        def al_entrar(nodo):
+            eventos.append("+" + nodo.contenido)
+            return nodo.contenido != "a"
+
+        recorrer_arbol(crear_arbol(), al_entrar,
+                       lambda nodo: eventos.append("-" + nodo.contenido))
+        assert eventos == ["+raiz", "+a", "+b", "+b1", "-b1", "-b", "-raiz"]
+
+    @pytest.mark.parametrize("recorrido", [recorrer_preorden, recorrer_postorden])
+    def test_arbol_profundo(self, recorrido):
+        assert sum(1 for _ in recorrido(crear_arbol_profundo(5000))) == 5001
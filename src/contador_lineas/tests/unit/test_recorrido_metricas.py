@@ -0,0 +1,52 @@
+# tests/unit/contadores/test_recorrido_metricas.py
+import pytest
+
+from contador_lineas.core.arbol.verificador_estandar_codigo import VerificadorEstandarCodigo
+from contador_lineas.core.contadores.contador_fisico import ContadorLineasFisicas
+from contador_lineas.core.contadores.contador_logico import ContadorLineasLogicas
+from contador_lineas.core.contadores.recorrido_metricas import RecorridoMetricas
+from contador_lineas.tests.conftest import crear_arbol_desde_string
+from contador_lineas.tests.fixtures import estructuras_basicas
+from contador_lineas.tests.fixtures.casos_evaluacion import CASOS_EVALUACION
+
+CODIGOS = {
+    nombre: valor for nombre, valor in vars(estructuras_basicas).items()
+    if nombre.isupper() and isinstance(valor, str)
+}
+CODIGOS.update({nombre: caso['codigo'] for nombre, caso in CASOS_EVALUACION.items()})
+
+
+class TestRecorridoMetricas:
+    @pytest.fixture
+    def recorrido(self):
+        return RecorridoMetricas()
+
+    @pytest.mark.parametrize("nombre", sorted(CODIGOS))
+    def test_coincide_con_recorridos_separados(self, recorrido, nombre):
+        arbol = crear_arbol_desde_string(CODIGOS[nombre])
+        es_valido, error = VerificadorEstandarCodigo().es_arbol_sintactico_valido(arbol.raiz)
+
+        resultado = recorrido.recorrer(arbol.raiz)
+
+        assert (resultado.es_valido, resultado.error) == (es_valido, error)
+        if es_valido:
+            assert resultado.lineas_fisicas == ContadorLineasFisicas.contar_lineas_fisicas(arbol.raiz)
+            assert resultado.lineas_logicas == ContadorLineasLogicas.contar_lineas_logicas(arbol.raiz)
+
+    def test_reporta_primera_violacion(self, recorrido):
+        arbol = crear_arbol_desde_string("x = 1; y = 2\nf = lambda x: x\n")
+        resultado = recorrido.recorrer(arbol.raiz)
+        assert not resultado.es_valido
+        assert resultado.error == "No se permiten varias declaraciones en una línea"
+        assert (resultado.lineas_fisicas, resultado.lineas_logicas) == (0, 0)
+
+    def test_detiene_recorrido_en_violacion(self, recorrido, monkeypatch):
+        arbol = crear_arbol_desde_string("f = lambda x: x\n" + "y = 1\n" * 50)
+        visitados = []
+        validar_original = recorrido.verificador.validar_nodo_individual
+        monkeypatch.setattr(recorrido.verificador, "validar_nodo_individual",
+                            lambda nodo: (visitados.append(nodo), validar_original(nodo))[1])
+
+        assert not recorrido.recorrer(arbol.raiz).es_valido
+        # Solo se visitan la raíz y la línea con la violación
+        assert len(visitados) == 2
@@ -0,0 +1,75 @@
+# tests/unit/contadores/test_vigilancia.py
+import os
+
+import pytest
+
+from contador_lineas.core.contadores.analizador import AnalizadorCodigo
+from contador_lineas.core.contadores.vigilancia import (
+    Vigilancia, formatear_diferencia
+)
+from contador_lineas.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas
+)
+
+CODIGO = "def sumar(a, b):\n    return a + b\n"
+
+
+def escribir(ruta, contenido, desplazamiento):
+    ruta.write_text(contenido, encoding="utf-8")
+    # Forzamos una fecha distinta para no depender de la resolución del reloj
+    # del sistema de archivos
+    marca = 1_700_000_000_000_000_000 + desplazamiento
+    os.utime(ruta, ns=(marca, marca))
+
+
+class TestVigilancia:
+    @pytest.fixture
+    def vigilancia(self, tmp_path):
+        directorio = tmp_path / "src"
+        (directorio / "pkg").mkdir(parents=True)
+        escribir(directorio / "uno.py", CODIGO, 0)
+        escribir(directorio / "pkg" / "dos.py", CODIGO, 0)
+        almacen = AlmacenamientoMetricas(str(tmp_path / "registro.json"))
+        return Vigilancia(str(directorio), AnalizadorCodigo(), almacen)
+
+    def test_sincronizacion_inicial(self, vigilancia):
+        cambios = vigilancia.sincronizar()
+        assert [cambio.nombre_archivo for cambio in cambios] == \
+            ["pkg/dos.py", "uno.py"]
+        assert all(cambio.anterior is None for cambio in cambios)
+        assert vigilancia.almacen.cargar_metricas("uno.py") is not None
+        assert vigilancia.estados["uno.py"].metricas is not None
+
+    def test_sin_cambios_no_reanaliza(self, vigilancia):
+        vigilancia.sincronizar()
+        assert vigilancia.sincronizar() == []
+
+    def test_solo_reanaliza_el_modificado(self, vigilancia, tmp_path):
+        vigilancia.sincronizar()
+        escribir(tmp_path / "src" / "uno.py", CODIGO + "x = 1\n", 1)
+        cambios = vigilancia.sincronizar()
+        assert [cambio.nombre_archivo for cambio in cambios] == ["uno.py"]
+        cambio = cambios[0]
+        assert cambio.actual.lineas_fisicas == \
+            cambio.anterior.lineas_fisicas + 1
+        assert vigilancia.almacen.cargar_metricas("uno.py").lineas_fisicas \
+            == cambio.actual.lineas_fisicas
+
+    def test_archivo_borrado_y_con_error(self, vigilancia, tmp_path):
+        vigilancia.sincronizar()
+        os.remove(tmp_path / "src" / "pkg" / "dos.py")
+        escribir(tmp_path / "src" / "uno.py", "x = 1; y = 2\n", 1)
+        borrado, con_error = sorted(vigilancia.sincronizar(),
+                                    key=lambda cambio: cambio.nombre_archivo)
+        assert borrado.actual is None and borrado.error is None
+        assert "pkg/dos.py" not in vigilancia.estados
+        assert con_error.error is not None
+        assert con_error.actual is None
+        # Hasta que el archivo vuelva a cambiar no se reintenta
+        assert vigilancia.sincronizar() == []
+
+
+def test_formatear_diferencia():
+    assert formatear_diferencia(120, 117) == "120 (+3)"
+    assert formatear_diferencia(5, 8) == "5 (-3)"
+    assert formatear_diferencia(5, None) == "5"
@@ -7,25 +7,37 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 17-11-2024
-Última Actualización: 17-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
+    - io
     - json
+    - os
     - pathlib.Path
     - typing.Union, List, Optional, Tuple
+    - utils.perfil.fase
 
 Uso:
     from contador_lineas.utils.archivo_utils import leer_archivo_texto
 
     contenido, error = leer_archivo_texto("C:/ejemplo.txt")
 
+    for linea in iterar_archivo_texto("generado.py"):
+        procesar(linea)
+
 Notas:
     - Los archivos deben estar en codificación UTF-8
+    - iterar_archivo_texto entrega una línea a la vez; la memoria no depende
+      del tamaño del archivo
 """
 
+import io
 import json
+import os
 from pathlib import Path
-from typing import Union, List, Optional, Tuple
+from typing import Iterator, Union, List, Optional, Tuple
+
+from contador_lineas.utils.perfil import fase
 
 
 def leer_archivo_texto(
@@ -55,13 +67,110 @@ def leer_archivo_texto(
             # Usamos readlines() en lugar de read().splitlines() para preservar
             # los saltos de línea originales del archivo
             return archivo.readlines(), None
+    except Exception as e:
+        return [], describir_error_lectura(e, codificacion)
+
+
+def iterar_archivo_texto(
+        ruta_archivo: Union[str, Path],
+        codificacion: str = 'utf-8') -> Iterator[str]:
+    """
+    Recorre las líneas de un archivo de texto sin cargarlo completo.
+
+    Entrega las mismas líneas que leer_archivo_texto, con su salto de línea.
+    El archivo se abre al pedir la primera línea y se cierra al agotarlo.
+
+    Args:
+        ruta_archivo (Union[str, Path]): Ruta del archivo a leer
+        codificacion (str): Codificación del archivo. Por defecto UTF-8
+
+    Returns:
+        Iterator[str]: Líneas del archivo
+
+    Raises:
+        OSError: Si el archivo no se puede abrir o leer
+        UnicodeDecodeError: Si una parte del archivo no está en la
+                            codificación indicada
+
+    Example:
+        >>> for linea in iterar_archivo_texto("ejemplo.py"):
+        ...     print(linea, end="")
+    """
+    with open(ruta_archivo, 'r', encoding=codificacion) as archivo:
+        yield from archivo
+
+
+def describir_error_lectura(error: Exception, codificacion: str) -> str:
+    """
+    Obtiene el mensaje de error de una lectura de texto fallida.
+
+    Args:
+        error (Exception): Excepción de la lectura
+        codificacion (str): Codificación esperada del archivo
+
+    Returns:
+        str: Mensaje de error para el usuario
+
+    Example:
+        >>> describir_error_lectura(FileNotFoundError("x.py"), "utf-8")
+        'Error al leer el archivo: x.py'
+    """
+    if isinstance(error, UnicodeDecodeError):
+        return f"Error de codificación, codificación esperada:\
+        {codificacion}"
+    return f"Error al leer el archivo: {str(error)}"
+
+
+@fase("leer archivo")
+def leer_archivo_bytes(
+        ruta_archivo: Union[str, Path]) -> Tuple[bytes, Optional[str]]:
+    """
+    Lee el contenido binario de un archivo.
+
+    Args:
+        ruta_archivo (Union[str, Path]): Ruta del archivo a leer
+
+    Returns:
+        Tuple[bytes, Optional[str]]: (contenido, mensaje_error)
+
+    Example:
+        >>> contenido, error = leer_archivo_bytes("ejemplo.py")
+    """
+    try:
+        with open(ruta_archivo, 'rb') as archivo:
+            return archivo.read(), None
+    except Exception as e:
+        return b"", f"Error al leer el archivo: {str(e)}"
+
+
+def decodificar_lineas(
+        contenido: bytes,
+        codificacion: str = 'utf-8') -> Tuple[List[str], Optional[str]]:
+    """
+    Decodifica un contenido binario en líneas de texto.
+
+    Args:
+        contenido (bytes): Contenido binario del archivo
+        codificacion (str): Codificación del archivo. Por defecto UTF-8
+
+    Returns:
+        Tuple[List[str], Optional[str]]: (lineas, mensaje_error)
+
+    Example:
+        >>> decodificar_lineas(b"x = 1\\r\\ny = 2\\n")
+        (['x = 1\\n', 'y = 2\\n'], None)
+    """
+    try:
+        texto = contenido.decode(codificacion)
     except UnicodeDecodeError:
         return [], f"Error de codificación, codificación esperada:\
         {codificacion}"
-    except Exception as e:
-        return [], f"Error al leer el archivo: {str(e)}"
+    # StringIO con newline=None normaliza los saltos de línea igual que
+    # leer_archivo_texto, así ambas lecturas producen las mismas líneas
+    return io.StringIO(texto, newline=None).readlines(), None
 
 
+@fase("leer registro")
 def leer_json(ruta_archivo: Union[str, Path]) -> dict:
     """
     Lee un archivo JSON y retorna su contenido.
@@ -80,9 +189,10 @@ def leer_json(ruta_archivo: Union[str, Path]) -> dict:
         return json.load(archivo)
 
 
+@fase("escribir registro")
 def escribir_json(ruta_archivo: Union[str, Path], datos: dict) -> None:
     """
-    Escribe datos en un archivo JSON.
+    Escribe datos en un archivo JSON de forma atómica.
 
     Args:
         ruta_archivo (Union[str, Path]): Ruta donde guardar el archivo
@@ -91,9 +201,20 @@ def escribir_json(ruta_archivo: Union[str, Path], datos: dict) -> None:
     Example:
         >>> escribir_json("config.json", {"versión": "1.0"})
     """
-    with open(ruta_archivo, 'w') as archivo:
-        json.dump(datos, archivo, indent=4)
+    # Escribimos en un temporal junto al destino y renombramos, así un fallo a
+    # mitad de la escritura nunca deja el archivo truncado
+    ruta_temporal = f"{ruta_archivo}.{os.getpid()}.tmp"
+    try:
+        with open(ruta_temporal, 'w') as archivo:
+            json.dump(datos, archivo, indent=4)
+        os.replace(ruta_temporal, ruta_archivo)
+    except BaseException:
+        if os.path.exists(ruta_temporal):
+            os.remove(ruta_temporal)
+        raise
+
 
+@fase("escribir archivos")
 def escribir_python(
     ruta_archivo: Union[str, Path],
     lineas: List[str],
@@ -0,0 +1,85 @@
+"""
+Nombre del módulo: colores.py
+Ruta: contador_lineas/utils/colores.py
+Descripción: Códigos de color de consola que cargan colorama solo al usarse
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - colorama (solo con los colores activos)
+
+Uso:
+    from contador_lineas.utils.colores import Fore, Style, iniciar_colores
+
+    iniciar_colores(activar=not args.sin_color)
+    print(f"{Fore.GREEN}Listo{Style.RESET_ALL}")
+
+Notas:
+    - Fore y Style se usan igual que los de colorama, pero colorama se
+      importa con el primer código pedido y no al cargar el módulo
+    - Con los colores desactivados cada código es una cadena vacía y
+      colorama no se importa nunca
+    - colorama.init() se llama una sola vez por proceso, aunque varios
+      puntos de entrada o formateadores inicien los colores
+"""
+
+# Si es False, los códigos son cadenas vacías
+_colores_activos = True
+_colorama_iniciado = False
+
+
+class _CodigosColor:
+    """
+    Grupo de códigos de colorama (Fore o Style) resuelto en cada acceso.
+
+    Attributes:
+        _grupo (str): Nombre del grupo dentro de colorama
+
+    Example:
+        >>> Fore = _CodigosColor("Fore")
+        >>> Fore.RED
+        '\\x1b[31m'
+    """
+
+    def __init__(self, grupo: str):
+        self._grupo = grupo
+
+    def __getattr__(self, nombre: str) -> str:
+        # Los atributos especiales no son códigos; sin esta guarda copy o
+        # pickle importarían colorama al inspeccionar el objeto
+        if nombre.startswith('_'):
+            raise AttributeError(nombre)
+        if not _colores_activos:
+            return ""
+        import colorama
+        return getattr(getattr(colorama, self._grupo), nombre)
+
+
+Fore = _CodigosColor("Fore")
+Style = _CodigosColor("Style")
+
+
+def iniciar_colores(activar: bool = True) -> None:
+    """
+    Activa o desactiva los colores de la consola.
+
+    Args:
+        activar (bool): Si es False, los códigos son cadenas vacías y
+            colorama no se carga
+
+    Example:
+        >>> iniciar_colores(activar=False)
+        >>> Fore.RED
+        ''
+    """
+    global _colores_activos, _colorama_iniciado
+    _colores_activos = activar
+    if activar and not _colorama_iniciado:
+        import colorama
+        colorama.init()
+        _colorama_iniciado = True
+
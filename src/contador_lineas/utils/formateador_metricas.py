@@ -8,12 +8,12 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 19-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing.List
-    - tabulate.tabulate
-    - colorama.init, Fore, Style
+    - tabulate.tabulate (al formatear la tabla)
+    - contador_lineas.utils.colores.Fore, Style
     - contador_lineas.models.metricas.MetricasArchivo
 
 Uso:
@@ -21,13 +21,15 @@ Uso:
         mostrar_tabla_metricas
     )
     mostrar_tabla_metricas(lista_metricas)
+
+Notas:
+    - tabulate se importa al formatear la primera tabla, así que cargar el
+      módulo no retrasa el arranque de las ejecuciones que no muestran tablas
 """
 
 from typing import List
 
-from tabulate import tabulate
-from colorama import init, Fore, Style
-
+from contador_lineas.utils.colores import Fore, Style
 from contador_lineas.models.metricas import MetricasArchivo
 
 
@@ -51,7 +53,6 @@ class FormateadorMetricas:
     """
 
     def __init__(self):
-        init()
         # Se optó por usar un diccionario de tema para centralizar los colores y
         # facilitar cambios futuros en el esquema de colores sin modificar la
         # lógica de formateo
@@ -85,6 +86,10 @@ class FormateadorMetricas:
             self._formatear_fila(m) for m in metricas
         ]
 
+        # tabulate es la importación más costosa de la herramienta, así que se
+        # carga solo cuando se muestra una tabla
+        from tabulate import tabulate
+
         # Añadimos un salto de línea inicial para separar visualmente la tabla
         # del contenido anterior en la consola
         print("\n" + tabulate(filas, headers=encabezados, tablefmt="grid"))
@@ -8,10 +8,11 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 17-11-2024
-Última Actualización: 17-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - models.nodos.Nodo
+    - core.arbol.recorrido_arbol.recorrer_arbol
 
 Uso:
     from contador_lineas.utils.impresion_arbol import imprimir_arbol
@@ -22,7 +23,10 @@ Notas:
     - El árbol debe ser construido usando la clase ConstructorArbol
 """
 
+from typing import List, Tuple
+
 from contador_lineas.core.arbol.nodo import Nodo
+from contador_lineas.core.arbol.recorrido_arbol import recorrer_arbol
 
 
 def imprimir_arbol(raiz: Nodo) -> None:
@@ -38,11 +42,34 @@ def imprimir_arbol(raiz: Nodo) -> None:
         └── [function] def main():
     """
     print("Árbol del Archivo Python:")
-    # Recorremos los hijos en orden, necesitamos saber si cada nodo es el último
-    # para usar el conector visual apropiado
-    for i, hijo in enumerate(raiz.hijos):
-        es_ultimo = i == len(raiz.hijos) - 1
-        _imprimir_nodo(hijo, "", es_ultimo)
+
+    # Por cada nodo abierto guardamos el prefijo de sus hijos y cuántos hijos
+    # faltan por imprimir; así sabemos si cada nodo es el último para usar el
+    # conector visual apropiado
+    niveles: List[Tuple[str, int]] = []
+
+    def al_entrar(nodo: Nodo) -> None:
+        if not niveles:
+            # La raíz no se imprime, solo abre el primer nivel
+            niveles.append(("", len(nodo.hijos)))
+            return
+
+        prefijo, pendientes = niveles[-1]
+        niveles[-1] = (prefijo, pendientes - 1)
+        es_ultimo = pendientes == 1
+        _imprimir_nodo(nodo, prefijo, es_ultimo)
+
+        # Para los hijos, ajustamos el prefijo:
+        # - Último hijo: solo espacios (    )
+        # - Hijo intermedio: línea vertical (│   )
+        # Esto crea las líneas verticales que conectan niveles del árbol
+        prefijo_hijo = prefijo + ("    " if es_ultimo else "│   ")
+        niveles.append((prefijo_hijo, len(nodo.hijos)))
+
+    def al_salir(nodo: Nodo) -> None:
+        niveles.pop()
+
+    recorrer_arbol(raiz, al_entrar, al_salir)
 
 
 def _imprimir_nodo(
@@ -65,14 +92,3 @@ def _imprimir_nodo(
     # crear una representación visual clara de la jerarquía
     conector = "└── " if es_ultimo else "├── "
     print(f"{prefijo}{conector}[{nodo.tipo.value}] {nodo.contenido}")
-
-    # Para los hijos, ajustamos el prefijo:
-    # - Último hijo: solo espacios (    )
-    # - Hijo intermedio: línea vertical (│   )
-    # Esto crea las líneas verticales que conectan niveles del árbol
-    prefijo_hijo = prefijo + ("    " if es_ultimo else "│   ")
-
-    for i, hijo in enumerate(nodo.hijos):
-        es_ultimo_hijo = i == len(nodo.hijos) - 1
-        _imprimir_nodo(hijo, prefijo_hijo, es_ultimo_hijo)
-        
\ No newline at end of file
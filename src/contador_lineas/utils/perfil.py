@@ -0,0 +1,280 @@
+"""
+Nombre del módulo: perfil.py
+Ruta: contador_lineas/utils/perfil.py
+Descripción: Mide el tiempo de pared y de CPU de cada fase del análisis y
+             guarda, si se pide, un perfil completo de cProfile
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - argparse.ArgumentTypeError
+    - functools.wraps
+    - time.perf_counter, time.process_time
+    - cProfile (solo con --perfil=cprofile:RUTA)
+
+Uso:
+    from contador_lineas.utils.perfil import fase, perfilar
+
+    @fase("construir árbol")
+    def construir(self, lineas):
+        ...
+
+    with perfilar(args.perfil):
+        ejecutar(args)
+
+Notas:
+    - Sin un perfil activo, una función marcada con fase solo comprueba una
+      variable global antes de ejecutarse; las fases se marcan por archivo
+      y no por línea, así que el costo es despreciable
+    - El tiempo de cada fase es exclusivo: el de las fases que llama se
+      descuenta, y la suma de las fases más "otros" da el total
+    - Una fase que se llama a sí misma, como el constructor de una
+      subclase que llama al de la base, se mide una sola vez
+    - Con varios trabajadores los archivos se analizan en otros procesos,
+      que no se miden; --trabajadores 1 mide las fases de cada archivo
+    - En la lectura en flujo las líneas se leen mientras se construye el
+      árbol, así que la lectura cuenta como parte de la construcción
+"""
+
+import argparse
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import wraps
+from time import perf_counter, process_time
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+# Modo de --perfil sin valor: solo el desglose por fases
+MODO_FASES = "fases"
+PREFIJO_CPROFILE = "cprofile:"
+
+# Perfil de la ejecución actual; None cuando no se mide
+_perfil_activo: Optional["PerfilFases"] = None
+
+
+@dataclass
+class TiempoFase:
+    """
+    Tiempo acumulado de una fase.
+
+    Attributes:
+        llamadas (int): Veces que se entró en la fase
+        pared (float): Segundos de pared propios de la fase
+        cpu (float): Segundos de CPU propios de la fase
+    """
+
+    llamadas: int = 0
+    pared: float = 0.0
+    cpu: float = 0.0
+
+
+class PerfilFases:
+    """
+    Acumula el tiempo exclusivo de las fases de una ejecución.
+
+    Attributes:
+        fases (Dict[str, TiempoFase]): Tiempos por nombre de fase, en el
+            orden en que se midieron por primera vez
+
+    Methods:
+        entrar(nombre: str) -> bool:
+            Empieza a medir una fase.
+        salir() -> None:
+            Termina de medir la última fase abierta.
+        informe() -> str:
+            Genera el desglose de la ejecución.
+
+    Example:
+        >>> perfil = PerfilFases()
+        >>> if perfil.entrar("leer"):
+        ...     perfil.salir()
+        >>> perfil.fases["leer"].llamadas
+        1
+    """
+
+    def __init__(self):
+        self.fases: Dict[str, TiempoFase] = {}
+        # Cada entrada es [nombre, pared_inicio, cpu_inicio, pared_hijas,
+        # cpu_hijas]; las hijas se descuentan al cerrar la fase
+        self._pila: List[list] = []
+        self._inicio = (perf_counter(), process_time())
+
+    def entrar(self, nombre: str) -> bool:
+        """
+        Empieza a medir una fase.
+
+        Args:
+            nombre (str): Nombre de la fase
+
+        Returns:
+            bool: False si la fase ya es la abierta; en ese caso no se debe
+                llamar a salir
+        """
+        if self._pila and self._pila[-1][0] == nombre:
+            return False
+        self._pila.append([nombre, perf_counter(), process_time(), 0.0, 0.0])
+        return True
+
+    def salir(self) -> None:
+        """
+        Termina de medir la última fase abierta y suma su tiempo propio.
+        """
+        nombre, pared_inicio, cpu_inicio, pared_hijas, cpu_hijas = \
+        self._pila.pop()
+        pared = perf_counter() - pared_inicio
+        cpu = process_time() - cpu_inicio
+        tiempo = self.fases.setdefault(nombre, TiempoFase())
+        tiempo.llamadas += 1
+        tiempo.pared += pared - pared_hijas
+        tiempo.cpu += cpu - cpu_hijas
+        if self._pila:
+            self._pila[-1][3] += pared
+            self._pila[-1][4] += cpu
+
+    def informe(self) -> str:
+        """
+        Genera el desglose por fases, de la más lenta a la más rápida.
+
+        La fila "otros" reúne el tiempo fuera de las fases medidas, como
+        la salida por consola; el arranque del programa no se incluye.
+
+        Returns:
+            str: Tabla con llamadas, segundos de pared y de CPU y porcentaje
+                de la pared total
+        """
+        pared_total = perf_counter() - self._inicio[0]
+        cpu_total = process_time() - self._inicio[1]
+        filas = sorted(self.fases.items(), key=_pared_de_fila, reverse=True)
+        pared_fases = 0.0
+        cpu_fases = 0.0
+        for _, tiempo in filas:
+            pared_fases += tiempo.pared
+            cpu_fases += tiempo.cpu
+        otros = TiempoFase(pared=pared_total - pared_fases,
+                           cpu=cpu_total - cpu_fases)
+        filas.append(("otros", otros))
+
+        ancho = max(len(nombre) for nombre, _ in filas)
+        lineas = [f"{'Fase':<{ancho}} {'Llamadas':>8} {'Pared (s)':>10} "
+                  f"{'CPU (s)':>10} {'%':>6}"]
+        for nombre, tiempo in filas:
+            porcentaje = 100 * tiempo.pared / pared_total if pared_total else 0
+            llamadas = tiempo.llamadas if tiempo.llamadas else ""
+            lineas.append(f"{nombre:<{ancho}} {llamadas:>8} "
+                          f"{tiempo.pared:>10.4f} {tiempo.cpu:>10.4f} "
+                          f"{porcentaje:>6.1f}")
+        lineas.append(f"{'Total':<{ancho}} {'':>8} {pared_total:>10.4f} "
+                      f"{cpu_total:>10.4f} {100.0:>6.1f}")
+        return "\n".join(lineas)
+
+
+def _pared_de_fila(fila: tuple) -> float:
+    return fila[1].pared
+
+
+def fase(nombre: str) -> Callable:
+    """
+    Marca una función como fase del análisis.
+
+    Args:
+        nombre (str): Nombre con el que la fase aparece en el desglose
+
+    Returns:
+        Callable: Decorador que mide la función cuando hay un perfil activo
+
+    Example:
+        >>> @fase("leer")
+        ... def leer_lineas(self):
+        ...     ...
+    """
+    def decorador(funcion: Callable) -> Callable:
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            perfil = _perfil_activo
+            if perfil is None or not perfil.entrar(nombre):
+                return funcion(*args, **kwargs)
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                perfil.salir()
+        return envoltura
+    return decorador
+
+
+def tipo_modo_perfil(valor: str) -> str:
+    """
+    Valida el valor de --perfil para argparse.
+
+    Args:
+        valor (str): "fases" o "cprofile:RUTA"
+
+    Returns:
+        str: El mismo valor
+
+    Raises:
+        argparse.ArgumentTypeError: Si el modo no es válido
+
+    Example:
+        >>> tipo_modo_perfil("cprofile:salida.prof")
+        'cprofile:salida.prof'
+    """
+    ruta = valor[len(PREFIJO_CPROFILE):]
+    if valor == MODO_FASES or (valor.startswith(PREFIJO_CPROFILE) and ruta):
+        return valor
+    raise argparse.ArgumentTypeError(
+        f"modo de perfil inválido: '{valor}' (use 'fases' o "
+        f"'{PREFIJO_CPROFILE}RUTA')")
+
+
+@contextmanager
+def perfilar(
+        modo: Optional[str],
+        salida: Optional[TextIO] = None) -> Iterator[Optional[PerfilFases]]:
+    """
+    Mide las fases del bloque e imprime el desglose al terminar.
+
+    Args:
+        modo (Optional[str]): None para no medir, "fases" para el desglose
+            o "cprofile:RUTA" para guardar además un perfil completo en RUTA
+        salida (Optional[TextIO]): Destino del desglose; sys.stderr por
+            defecto, para no mezclarlo con los resultados
+
+    Returns:
+        Iterator[Optional[PerfilFases]]: Perfil activo, o None si no se mide
+
+    Example:
+        >>> with perfilar("cprofile:salida.prof"):
+        ...     main()
+    """
+    global _perfil_activo
+    if modo is None:
+        yield None
+        return
+
+    perfilador = None
+    ruta_perfil = None
+    if modo.startswith(PREFIJO_CPROFILE):
+        # cProfile solo se carga cuando se pide el perfil completo
+        import cProfile
+        ruta_perfil = modo[len(PREFIJO_CPROFILE):]
+        perfilador = cProfile.Profile()
+
+    perfil = PerfilFases()
+    _perfil_activo = perfil
+    if perfilador is not None:
+        perfilador.enable()
+    try:
+        yield perfil
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+            perfilador.dump_stats(ruta_perfil)
+        _perfil_activo = None
+        destino = salida if salida is not None else sys.stderr
+        print(f"\nPerfil por fases\n{perfil.informe()}", file=destino)
+        if ruta_perfil is not None:
+            print(f"Perfil completo guardado en {ruta_perfil}", file=destino)
@@ -0,0 +1,106 @@
+"""
+Nombre del módulo: sqlite_utils.py
+Ruta: contador_lineas/utils/sqlite_utils.py
+Descripción: Utilidades para seleccionar y abrir registros de métricas SQLite
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - os
+    - sqlite3 (al abrir la conexión)
+
+Uso:
+    from contador_lineas.utils.sqlite_utils import (
+        es_ruta_sqlite, conectar_sqlite
+    )
+
+    if es_ruta_sqlite("sqlite:///db/metricas.db"):
+        conexion = conectar_sqlite("sqlite:///db/metricas.db", ESQUEMA)
+
+Notas:
+    - Una ruta es SQLite si usa el prefijo sqlite:/// o termina en .db,
+      .sqlite o .sqlite3; cualquier otra ruta se trata como JSON
+    - Igual que en SQLAlchemy, sqlite:////ruta indica una ruta absoluta
+    - sqlite3 se importa al conectar: los registros JSON solo usan
+      es_ruta_sqlite y no lo cargan
+"""
+
+import os
+
+PREFIJO_URL_SQLITE = "sqlite:///"
+EXTENSIONES_SQLITE = (".db", ".sqlite", ".sqlite3")
+
+
+def es_ruta_sqlite(ruta_almacenamiento: str) -> bool:
+    """
+    Verifica si una ruta de almacenamiento corresponde a SQLite.
+
+    Args:
+        ruta_almacenamiento (str): Ruta de archivo o URL sqlite:///
+
+    Returns:
+        bool: True si se debe usar el backend SQLite
+
+    Example:
+        >>> es_ruta_sqlite("db/metricas.db")
+        True
+    """
+    ruta = str(ruta_almacenamiento)
+    return (ruta.startswith(PREFIJO_URL_SQLITE) or
+            ruta.lower().endswith(EXTENSIONES_SQLITE))
+
+
+def obtener_ruta_sqlite(ruta_almacenamiento: str) -> str:
+    """
+    Obtiene la ruta del archivo de base de datos a partir de una ruta o URL.
+
+    Args:
+        ruta_almacenamiento (str): Ruta de archivo o URL sqlite:///
+
+    Returns:
+        str: Ruta del archivo de base de datos
+
+    Example:
+        >>> obtener_ruta_sqlite("sqlite:///db/metricas.db")
+        'db/metricas.db'
+    """
+    ruta = str(ruta_almacenamiento)
+    if ruta.startswith(PREFIJO_URL_SQLITE):
+        return ruta[len(PREFIJO_URL_SQLITE):]
+    return ruta
+
+
+def conectar_sqlite(
+        ruta_almacenamiento: str,
+        esquema: str) -> 'sqlite3.Connection':
+    """
+    Abre la base de datos y crea el esquema si no existe.
+
+    Args:
+        ruta_almacenamiento (str): Ruta de archivo o URL sqlite:///
+        esquema (str): Sentencias SQL idempotentes que crean tablas e índices
+
+    Returns:
+        sqlite3.Connection: Conexión abierta
+
+    Example:
+        >>> conexion = conectar_sqlite("db/metricas.db", ESQUEMA)
+    """
+    ruta = obtener_ruta_sqlite(ruta_almacenamiento)
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+    import sqlite3
+    conexion = sqlite3.connect(ruta)
+    # WAL permite leer el registro mientras otro proceso escribe y reduce el
+    # costo de cada confirmación
+    conexion.execute("PRAGMA journal_mode=WAL")
+    conexion.execute("PRAGMA synchronous=NORMAL")
+    conexion.execute("PRAGMA foreign_keys=ON")
+    conexion.executescript(esquema)
+    return conexion
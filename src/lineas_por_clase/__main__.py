@@ -7,23 +7,35 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 27-11-2024
-Última Actualización: 28-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - argparse
-    - colorama.Init, Fore, Style
+    - contador_lineas.utils.colores.Fore, Style, iniciar_colores
+    - contador_lineas.utils.perfil.MODO_FASES, perfilar, tipo_modo_perfil
     - pathlib.Path
     - core.contadores.analizador.AnalizadorCodigo, ExcepcionAnalizador
     - core.gestion_archivos.almacenamiento_metricas.AlmacenamientoMetricas
+    - contador_lineas.core.contadores.vigilancia.Vigilancia
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
     - utils.formateador_metricas.mostrar_tabla_metricas
 
 Uso:
     >>> lineas_por_clase archivo.py [-t] [-tc]
+    >>> lineas_por_clase --vigilar directorio
     
     Opciones:
         archivo.py: Ruta del archivo a analizar
         -t: Muestra tabla de LOC físicas y lógicas del archivo actual
         -tc: Muestra tabla de LOC físicas y lógicas de todos los archivos
+        --vigilar: Vuelve a analizar los archivos del directorio y sus
+                   subdirectorios cada vez que cambian, hasta Ctrl+C
+        --cache-arboles: Directorio de la caché de árboles sintácticos
+                         compartida con contador_lineas y analizador_cambios
+        --sin-color: Escribe la salida sin color y sin cargar colorama
+        --perfil[=MODO]: Muestra el tiempo de cada fase al terminar;
+                         --perfil=cprofile:RUTA guarda además un
+                         perfil completo de cProfile
 
 Notas:
     - Requiere permisos de lectura en archivos a analizar
@@ -31,10 +43,16 @@ Notas:
 
 import argparse
 from pathlib import Path
-from typing import Tuple
-
-from colorama import init, Fore, Style
+from typing import List, Optional, Tuple
 
+from contador_lineas.core.contadores.vigilancia import (
+    CambioVigilado, Vigilancia, formatear_diferencia
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
+from contador_lineas.utils.colores import Fore, Style, iniciar_colores
+from contador_lineas.utils.perfil import (
+    MODO_FASES, perfilar, tipo_modo_perfil
+)
 from lineas_por_clase.core.contadores.analizador import (
     AnalizadorCodigo, ExcepcionAnalizador
 )
@@ -99,6 +117,34 @@ def procesar_argumentos() -> argparse.Namespace:
         action="store_true",
         help="Mostrar tabla de métricas de todos los archivos procesados"
     )
+    analizador.add_argument(
+        "--vigilar",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Vigilar un directorio y volver a analizar los archivos que "
+             "cambien"
+    )
+    analizador.add_argument(
+        "--cache-arboles",
+        type=str,
+        metavar="DIRECTORIO",
+        help="Cargar y guardar los árboles sintácticos en una caché "
+             "compartida con contador_lineas y analizador_cambios"
+    )
+    analizador.add_argument(
+        "--sin-color",
+        action="store_true",
+        help="Escribir la salida sin códigos de color"
+    )
+    analizador.add_argument(
+        "--perfil",
+        nargs="?",
+        const=MODO_FASES,
+        type=tipo_modo_perfil,
+        metavar="MODO",
+        help="Mostrar el tiempo de pared y de CPU de cada fase al terminar; "
+             "con cprofile:RUTA guarda además un perfil completo en RUTA"
+    )
     analizador.add_argument(
         "--dev-db-path",
         type=str,
@@ -132,6 +178,12 @@ def validar_argumentos(args: argparse.Namespace) -> Tuple[bool, str]:
         >>> print(es_valido, error)
         True, ""
     """
+    # Los argumentos armados a mano pueden no incluir las opciones nuevas
+    vigilar = getattr(args, 'vigilar', None)
+    if vigilar:
+        if not Path(vigilar).is_dir():
+            return False, f"Error: '{vigilar}' no es un directorio"
+        return True, ""
     if not args.tc and not args.ruta_archivo:
         return False, "Error: Se requiere el archivo cuando no se usa -tc"
     return True, ""
@@ -141,7 +193,8 @@ def procesar_archivo(
         ruta_archivo: str,
         ruta_almacenamiento: str,
         almacen: AlmacenamientoMetricas,
-        mostrar_tabla: bool) -> None:
+        mostrar_tabla: bool,
+        cache_arboles: Optional[CacheArboles] = None) -> None:
     """
     Procesa un archivo individual y muestra resultados.
 
@@ -149,17 +202,18 @@ def procesar_archivo(
         ruta_archivo (str): Ruta del archivo a procesar
         almacen (AlmacenamientoMetricas): Almacenamiento de métricas
         mostrar_tabla (bool): Mostrar tabla de métricas
-        formatear (bool): Guardar archivo formateado
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
 
     Example:
         >>> procesar_archivo("archivo.py", AlmacenamientoMetricas(), True)
     """
     nombre_archivo = obtener_nombre_archivo(ruta_archivo)
-    analizador = AnalizadorCodigo()
+    analizador = AnalizadorCodigo(cache_arboles)
     resultado = analizador.analizar_archivo(
         ruta_archivo,
         nombre_archivo,
-        ruta_almacenamiento)
+        ruta_almacenamiento,
+        almacen)
 
     if mostrar_tabla:
         mostrar_tabla_metricas([
@@ -167,20 +221,78 @@ def procesar_archivo(
         ])
 
 
-def main() -> None:
+def imprimir_cambios_vigilados(cambios: List[CambioVigilado]) -> None:
     """
-    Punto de entrada principal del sistema de conteo de LOCs de código Python
+    Imprime las métricas de los archivos que cambiaron y su diferencia.
+
+    Args:
+        cambios (List[CambioVigilado]): Cambios de un sondeo
+    """
+    for cambio in cambios:
+        if cambio.error:
+            print(f"{Fore.RED}{cambio.nombre_archivo}: "
+                  f"{cambio.error}{Style.RESET_ALL}")
+        elif cambio.actual is None:
+            print(f"{Fore.YELLOW}{cambio.nombre_archivo}: "
+                  f"borrado{Style.RESET_ALL}")
+        else:
+            anterior = cambio.anterior
+            fisicas = formatear_diferencia(
+                cambio.actual.total_lineas_fisicas,
+                anterior.total_lineas_fisicas if anterior else None)
+            clases = formatear_diferencia(
+                len(cambio.actual.clases),
+                len(anterior.clases) if anterior else None)
+            print(f"{cambio.nombre_archivo}: físicas {fisicas}, "
+                  f"clases {clases}")
+
+
+def vigilar_directorio(
+        ruta_directorio: str,
+        almacen: AlmacenamientoMetricas,
+        cache_arboles: Optional[CacheArboles] = None) -> None:
+    """
+    Vuelve a analizar los archivos del directorio cada vez que cambian.
+
+    Args:
+        ruta_directorio (str): Directorio a vigilar, con sus subdirectorios
+        almacen (AlmacenamientoMetricas): Almacenamiento de métricas
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
 
     Example:
-        >>> main()
+        >>> vigilar_directorio("src", almacen)
+    """
+    vigilancia = Vigilancia(ruta_directorio, AnalizadorCodigo(cache_arboles),
+                            almacen)
+    cambios = vigilancia.sincronizar()
+    errores = [cambio for cambio in cambios if cambio.error]
+    imprimir_cambios_vigilados(errores)
+    imprimir_exito(f"Vigilando {len(cambios)} archivos en {ruta_directorio} "
+                   f"({vigilancia.ultima_duracion * 1000:.0f} ms); "
+                   "Ctrl+C para salir")
+
+    def al_cambiar(cambios: List[CambioVigilado]) -> None:
+        imprimir_cambios_vigilados(cambios)
+        print(f"Actualizado en {vigilancia.ultima_duracion * 1000:.1f} ms")
+
+    try:
+        vigilancia.vigilar(al_cambiar)
+    except KeyboardInterrupt:
+        imprimir_exito("Vigilancia terminada")
+
+
+def ejecutar(args: argparse.Namespace) -> None:
+    """
+    Ejecuta la acción indicada por los argumentos.
+
+    Args:
+        args (argparse.Namespace): Argumentos procesados
     """
-    init()
-    args = procesar_argumentos()
     almacen = AlmacenamientoMetricas(args.dev_db_path)
 
     # Caso especial: si solo se pide tabla completa (-tc), mostramos todas las
     # métricas y terminamos
-    if args.tc and not args.ruta_archivo:
+    if args.tc and not (args.ruta_archivo or args.vigilar):
         mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
         return
 
@@ -191,10 +303,17 @@ def main() -> None:
         print(f"{Fore.RED}{mensaje_error}{Style.RESET_ALL}")
         return
 
+    cache_arboles = (CacheArboles(args.cache_arboles)
+                     if args.cache_arboles else None)
+    if args.vigilar:
+        vigilar_directorio(args.vigilar, almacen, cache_arboles)
+        return
+
     try:
         # Procesamos el archivo actual y opcionalmente mostramos la tabla
         # histórica si se solicitó
-        procesar_archivo(args.ruta_archivo, args.dev_db_path, almacen, args.t)
+        procesar_archivo(args.ruta_archivo, args.dev_db_path, almacen, args.t,
+                         cache_arboles)
         imprimir_exito("¡Archivo procesado exitosamente!")
         if args.tc:
             mostrar_tabla_metricas(almacen.obtener_todas_las_metricas())
@@ -206,5 +325,20 @@ def main() -> None:
         print(f"{Fore.RED}Error inesperado: {str(e)}{Style.RESET_ALL}")
 
 
+def main() -> None:
+    """
+    Punto de entrada principal del sistema de conteo de LOCs de código Python
+
+    Example:
+        >>> main()
+    """
+    args = procesar_argumentos()
+    iniciar_colores(activar=not args.sin_color)
+    # El desglose por fases se imprime al terminar, incluso si la
+    # ejecución se interrumpe
+    with perfilar(args.perfil):
+        ejecutar(args)
+
+
 if __name__ == "__main__":
     main()
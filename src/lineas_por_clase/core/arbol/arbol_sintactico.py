@@ -7,10 +7,12 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 18-11-2024
-Última Actualización: 18-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - utils.constructor_arbol.ConstructorArbol
+    - contador_lineas.core.arbol.arbol_sintactico.ArbolArchivoPython
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
     - utils.impresion_arbol.imprimir_arbol
 
 Uso:
@@ -20,10 +22,19 @@ Uso:
 
 Notas:
     - Implementa representación jerárquica del código fuente
+    - El árbol es idéntico al de contador_lineas, así que con una caché de
+      árboles se construye y se guarda con el árbol de contador_lineas y
+      ambas herramientas comparten las entradas
+    - Por la misma razón, desde_raiz acepta el árbol de contador_lineas; así
+      analisis_completo mide las clases sin construir un segundo árbol
 """
 
-from typing import List
+from typing import Iterable, List, Optional
 
+from contador_lineas.core.arbol.arbol_sintactico import (
+    ArbolArchivoPython as ArbolArchivoPythonBase
+)
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.utils.impresion_arbol import imprimir_arbol
 from contador_lineas.models.nodos import TipoNodo
 from lineas_por_clase.core.arbol.constructor_arbol import ConstructorArbol
@@ -39,6 +50,8 @@ class ArbolArchivoPython:
         raiz (Nodo): Nodo raíz del árbol sintáctico
 
     Methods:
+        desde_raiz(raiz: Nodo) -> ArbolArchivoPython:
+            Envuelve un árbol ya construido sin volver a construirlo.
         imprimir_arbol() -> None:
             Imprime el árbol sintáctico en consola.
 
@@ -48,9 +61,35 @@ class ArbolArchivoPython:
         >>> arbol.imprimir_arbol()
     """
 
-    def __init__(self, file_content: List[str]):
+    def __init__(
+            self,
+            file_content: Iterable[str],
+            cache: Optional[CacheArboles] = None):
         self.constructor = ConstructorArbol()
-        self.raiz = self.constructor.construir(file_content)
+        if cache is None:
+            self.raiz = self.constructor.construir(file_content)
+        else:
+            self.raiz = ArbolArchivoPythonBase(file_content, cache).raiz
+
+    @classmethod
+    def desde_raiz(cls, raiz: Nodo) -> 'ArbolArchivoPython':
+        """
+        Envuelve un árbol ya construido, por ejemplo el de contador_lineas.
+
+        Args:
+            raiz (Nodo): Raíz de un árbol del constructor estándar
+
+        Returns:
+            ArbolArchivoPython: Árbol con esa raíz, sin volver a construirlo
+
+        Example:
+            >>> base = ArbolArchivoPythonBase(["class A:", "    pass"])
+            >>> ArbolArchivoPython.desde_raiz(base.raiz).obtener_nodos_clase()
+        """
+        arbol = cls.__new__(cls)
+        arbol.constructor = ConstructorArbol()
+        arbol.raiz = raiz
+        return arbol
 
     def imprimir_arbol(self) -> None:
         """
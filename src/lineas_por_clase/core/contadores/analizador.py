@@ -7,7 +7,7 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 27-11-2024
-Última Actualización: 28-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - core.contadores.contador_fisico.ContadorLineasFisicas
@@ -16,7 +16,9 @@ Dependencias:
     - core.gestion_archivos.manejador_json.AlmacenamientoMetricas
     - core.arbol_sintaxis.arbol_archivo.ArbolArchivoPython
     - models.metricas.MetricasArchivo
+    - contador_lineas.core.gestion_archivos.cache_arboles.CacheArboles
     - utils.formateador_linea.FormateadorLinea
+    - contador_lineas.utils.perfil.fase
 
 Uso:
     from lineas_por_clase.core.contadores.analizador import Analizador
@@ -32,6 +34,7 @@ Notas:
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 
+from contador_lineas.core.gestion_archivos.cache_arboles import CacheArboles
 from contador_lineas.core.contadores.contador_fisico import (
     ContadorLineasFisicas
 )
@@ -47,6 +50,7 @@ from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
     AlmacenamientoMetricas
 )
 from lineas_por_clase.models.metricas import MetricasClase, MetricasArchivo
+from contador_lineas.utils.perfil import fase
 
 
 class ExcepcionAnalizador(Exception):
@@ -96,18 +100,27 @@ class AnalizadorCodigo:
         almacenamiento (AlmacenamientoMetricas): Gestor de almacenamiento
         formateador (FormateadorLinea): Formateador de líneas
         contador_fisico (ContadorLineasFisicas): Contador de líneas físicas
+        cache_arboles (Optional[CacheArboles]): Caché de árboles compartida
+            con contador_lineas y analizador_cambios
 
     Methods:
         analizar_archivo(ruta_archivo: str, 
             nombre_archivo: str) -> ResultadoAnalisis:
             Analiza un archivo Python y retorna sus métricas.
+        obtener_metricas(ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+            Calcula las métricas de un archivo sin almacenarlas.
+        medir_arbol(arbol: ArbolArchivoPython,
+            nombre_archivo: str) -> MetricasArchivo:
+            Calcula las métricas de un árbol ya construido y validado.
 
     Example:
         >>> analizador = Analizador()
         >>> resultado = analizador.analizar_archivo("script.py", "script.py")
     """
 
-    def __init__(self):
+    def __init__(self, cache_arboles: Optional[CacheArboles] = None):
+        self.cache_arboles = cache_arboles
         self.arbol = None
         self.codigo = None
         self.contador_fisico = ContadorLineasFisicas()
@@ -133,7 +146,8 @@ class AnalizadorCodigo:
             self, 
             ruta_archivo: str,
             nombre_archivo: str,
-            ruta_almacenamiento: str = "db/lineas_por_clase_registro.json"
+            ruta_almacenamiento: str = "db/lineas_por_clase_registro.json",
+            almacen: Optional[AlmacenamientoMetricas] = None
         ) -> ResultadoAnalisis:
         """
         Analiza un archivo Python y obtiene sus métricas.
@@ -141,6 +155,9 @@ class AnalizadorCodigo:
         Args:
             ruta_archivo (str): Ruta al archivo
             nombre_archivo (str): Nombre del archivo
+            ruta_almacenamiento (str): Registro a usar si no se inyecta almacen
+            almacen (Optional[AlmacenamientoMetricas]): Almacenamiento
+                compartido; evita abrir el registro en cada llamada
 
         Returns:
             ResultadoAnalisis: Métricas del archivo
@@ -148,14 +165,41 @@ class AnalizadorCodigo:
         Example:
             >>> analizar_archivo("script.py", "script.py")
         """
+        metricas = self.obtener_metricas(ruta_archivo, nombre_archivo)
+        if almacen is None:
+            almacen = AlmacenamientoMetricas(ruta_almacenamiento)
+        almacen.guardar_metricas(metricas)
+        return self._crear_resultado(metricas)
+
+    def obtener_metricas(
+            self,
+            ruta_archivo: str,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Valida, lee y mide un archivo Python sin almacenar sus métricas.
+
+        Args:
+            ruta_archivo (str): Ruta al archivo
+            nombre_archivo (str): Nombre con el que se registran las métricas
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del archivo
+
+        Raises:
+            ExcepcionAnalizador: Si el archivo es inválido o viola el estándar
+
+        Example:
+            >>> obtener_metricas("script.py", "script.py")
+        """
+        # Si el análisis falla no debe quedar el árbol del archivo anterior
+        self.arbol = None
+
         # El flujo de análisis sigue un orden específico para garantizar la
-        # validez del código antes de procesar y almacenar métricas
+        # validez del código antes de procesar métricas
         self._validar_archivo(ruta_archivo)
         codigo = self._obtener_codigo(ruta_archivo)
         self.codigo = codigo
-        metricas = self._procesar_codigo(codigo, nombre_archivo)
-        AlmacenamientoMetricas(ruta_almacenamiento).guardar_metricas(metricas)
-        return self._crear_resultado(metricas)
+        return self._procesar_codigo(codigo, nombre_archivo)
 
     def _validar_archivo(self, ruta_archivo: str) -> None:
         """
@@ -214,11 +258,33 @@ class AnalizadorCodigo:
         """
         # Construimos y validamos el AST primero para asegurar que el código
         # cumple con el estándar antes de calcular métricas
-        arbol = ArbolArchivoPython(codigo)
+        arbol = ArbolArchivoPython(codigo, self.cache_arboles)
         self._validar_arbol_sintaxis(arbol)
+        return self.medir_arbol(arbol, nombre_archivo)
+
+    def medir_arbol(
+            self,
+            arbol: ArbolArchivoPython,
+            nombre_archivo: str) -> MetricasArchivo:
+        """
+        Calcula las métricas por clase de un árbol ya validado.
+
+        Args:
+            arbol (ArbolArchivoPython): Árbol que cumple con el estándar
+            nombre_archivo (str): Nombre del archivo procesado
+
+        Returns:
+            MetricasArchivo: Métricas calculadas del árbol
+
+        Example:
+            >>> raiz = ArbolArchivoPythonBase(codigo).raiz
+            >>> medir_arbol(ArbolArchivoPython.desde_raiz(raiz), "script.py")
+        """
         self.arbol = arbol
 
-        # Obtenemos las métricas de las clases y otros nodos del archivo
+        # Obtenemos las métricas de las clases y otros nodos del archivo; el
+        # nodo "otros" reindenta los nodos de nivel superior, así que el
+        # árbol no debe medirse de nuevo después
         clases = self._analizar_clases(arbol)
 
         return MetricasArchivo(
@@ -226,6 +292,7 @@ class AnalizadorCodigo:
             clases=clases
         )
 
+    @fase("contar clases")
     def _analizar_clases(
             self,
             arbol: ArbolArchivoPython) -> List[MetricasClase]:
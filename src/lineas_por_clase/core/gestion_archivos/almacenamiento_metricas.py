@@ -7,13 +7,15 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 27-11-2024
-Última Actualización: 28-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - os
-    - typing.List, Optional
+    - contextlib.contextmanager
+    - typing.Iterator, List, Optional
     - models.metricas.MetricasArchivo
     - utils.utilidades_archivo.leer_json, escribir_json
+    - contador_lineas.utils.sqlite_utils.es_ruta_sqlite
 
 Uso:
     from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
@@ -22,16 +24,27 @@ Uso:
     almacen = AlmacenamientoMetricas()
     almacen.guardar_metricas(metricas)
 
+    # Varias escrituras con un solo volcado del registro
+    with almacen.lote():
+        for metricas in metricas_por_archivo:
+            almacen.guardar_metricas(metricas)
+
 Notas:
     - Almacena datos en formato JSON
     - Maneja errores de archivo no encontrado
+    - Una ruta .db/.sqlite/.sqlite3 o una URL sqlite:/// crea en su lugar un
+      AlmacenamientoMetricasSqlite con los mismos métodos públicos
+    - Dentro de lote() las lecturas y escrituras usan un búfer en memoria que
+      se vuelca con un renombrado atómico al salir sin errores
 """
 
 import os
-from typing import List, Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional
 
 from lineas_por_clase.models.metricas import MetricasArchivo, MetricasClase
 from contador_lineas.utils.archivo_utils import leer_json, escribir_json
+from contador_lineas.utils.sqlite_utils import es_ruta_sqlite
 
 
 class AlmacenamientoMetricas:
@@ -48,22 +61,39 @@ class AlmacenamientoMetricas:
     Methods:
         guardar_metricas(metricas: MetricasArchivo) -> None:
             Guarda nuevas métricas en el almacenamiento.
+        guardar_multiples_metricas(metricas: Iterable[MetricasArchivo]) -> None:
+            Guarda varias métricas con una sola escritura.
         cargar_metricas(nombre_archivo: str) -> Optional[MetricasArchivo]:
             Carga métricas para un archivo específico.
         obtener_todas_metricas() -> List[MetricasArchivo]:
             Obtiene todas las métricas almacenadas.
+        lote() -> Iterator[AlmacenamientoMetricas]:
+            Agrupa varias operaciones en una sola escritura.
 
     Example:
         >>> almacen = AlmacenamientoMetricas("metricas.json")
         >>> almacen.guardar_metricas(metricas)
     """
 
+    def __new__(cls, ruta_almacenamiento: str):
+        # Elegimos el backend a partir de la ruta para que los llamadores no
+        # tengan que conocerlo; la importación es local porque el backend
+        # SQLite hereda de esta clase
+        if cls is AlmacenamientoMetricas and \
+        es_ruta_sqlite(ruta_almacenamiento):
+            from lineas_por_clase.core.gestion_archivos.almacenamiento_sqlite \
+                import AlmacenamientoMetricasSqlite
+            cls = AlmacenamientoMetricasSqlite
+        return super().__new__(cls)
+
     def __init__(
             self,
             ruta_almacenamiento: str):
         # Usamos un archivo JSON por defecto en la carpeta db/ para mantener
         # persistencia entre ejecuciones
         self.ruta_almacenamiento = ruta_almacenamiento
+        # Contenido del registro mientras hay un lote abierto, None si no
+        self._datos_lote: Optional[dict] = None
         self._asegurar_archivo_almacenamiento()
 
     def guardar_metricas(self, metricas: MetricasArchivo) -> None:
@@ -73,29 +103,45 @@ class AlmacenamientoMetricas:
         Args:
             metricas (MetricasArchivo): Métricas a almacenar
         """
-        datos = leer_json(self.ruta_almacenamiento)
-
-        # Convertir cada MetricasClase a diccionario
-        clases_dict = [
-            {
-                "nombre_clase": clase.nombre_clase,
-                "cantidad_metodos": clase.cantidad_metodos,
-                "lineas_fisicas": clase.lineas_fisicas
+        self.guardar_multiples_metricas([metricas])
+
+    def guardar_multiples_metricas(
+            self,
+            metricas: Iterable[MetricasArchivo]) -> None:
+        """
+        Guarda varias métricas leyendo y escribiendo el JSON una sola vez.
+
+        Args:
+            metricas (Iterable[MetricasArchivo]): Métricas a almacenar
+        """
+        datos = self._leer_datos()
+
+        for metrica in metricas:
+            # Convertir cada MetricasClase a diccionario
+            clases_dict = [
+                {
+                    "nombre_clase": clase.nombre_clase,
+                    "cantidad_metodos": clase.cantidad_metodos,
+                    "lineas_fisicas": clase.lineas_fisicas
+                }
+                for clase in metrica.clases
+            ]
+
+            # Convertimos el objeto MetricasArchivo a diccionario para facilitar
+            # la serialización JSON y mantener la estructura consistente
+            diccionario_metricas = {
+                "nombre_archivo": metrica.nombre_archivo,
+                "clases": clases_dict,
+                "total_lineas_fisicas": metrica.total_lineas_fisicas
             }
-            for clase in metricas.clases
-        ]
 
-        # Convertimos el objeto MetricasArchivo a diccionario para facilitar la
-        # serialización JSON y mantener la estructura de datos consistente
-        diccionario_metricas = {
-            "nombre_archivo": metricas.nombre_archivo,
-            "clases": clases_dict,
-            "total_lineas_fisicas": metricas.total_lineas_fisicas
-        }
+            # Usamos el nombre del archivo como clave para permitir
+            # actualizaciones
+            datos[metrica.nombre_archivo] = diccionario_metricas
 
-        # Usamos el nombre del archivo como clave para permitir actualizaciones
-        datos[metricas.nombre_archivo] = diccionario_metricas
-        escribir_json(self.ruta_almacenamiento, datos)
+        # Dentro de un lote la escritura se difiere hasta cerrarlo
+        if self._datos_lote is None:
+            escribir_json(self.ruta_almacenamiento, datos)
 
     def cargar_metricas(self, nombre_archivo: str) -> Optional[MetricasArchivo]:
         """
@@ -107,7 +153,7 @@ class AlmacenamientoMetricas:
         Returns:
             Optional[MetricasArchivo]: Métricas encontradas o None
         """
-        datos = leer_json(self.ruta_almacenamiento)
+        datos = self._leer_datos()
         if nombre_archivo in datos:
             diccionario_metricas = datos[nombre_archivo]
 
@@ -128,7 +174,7 @@ class AlmacenamientoMetricas:
         """
         Obtiene lista de todas las métricas almacenadas.
         """
-        datos = leer_json(self.ruta_almacenamiento)
+        datos = self._leer_datos()
         metricas = []
 
         for diccionario_metricas in datos.values():
@@ -143,6 +189,46 @@ class AlmacenamientoMetricas:
 
         return metricas
 
+    @contextmanager
+    def lote(self) -> Iterator["AlmacenamientoMetricas"]:
+        """
+        Agrupa las operaciones del bloque en una sola lectura y escritura.
+
+        El registro se lee al abrir el lote y las métricas guardadas dentro
+        del bloque se consultan desde memoria. Al salir sin errores el
+        registro se escribe una única vez; si el bloque lanza una excepción,
+        los cambios se descartan.
+
+        Returns:
+            Iterator[AlmacenamientoMetricas]: El propio almacenamiento
+
+        Example:
+            >>> with almacen.lote():
+            ...     almacen.guardar_metricas(metricas)
+        """
+        # Un lote anidado comparte el búfer del lote exterior
+        if self._datos_lote is not None:
+            yield self
+            return
+
+        self._datos_lote = leer_json(self.ruta_almacenamiento)
+        try:
+            yield self
+            escribir_json(self.ruta_almacenamiento, self._datos_lote)
+        finally:
+            self._datos_lote = None
+
+    def _leer_datos(self) -> dict:
+        """
+        Obtiene el contenido del registro, desde el búfer si hay un lote.
+
+        Returns:
+            dict: Métricas indexadas por nombre de archivo
+        """
+        if self._datos_lote is not None:
+            return self._datos_lote
+        return leer_json(self.ruta_almacenamiento)
+
     def _asegurar_archivo_almacenamiento(self) -> None:
         """
         Crea el archivo JSON si no existe.
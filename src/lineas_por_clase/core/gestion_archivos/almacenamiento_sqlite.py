@@ -0,0 +1,234 @@
+"""
+Nombre del módulo: almacenamiento_sqlite.py
+Ruta: lineas_por_clase/core/gestion_archivos/almacenamiento_sqlite.py
+Descripción: Gestiona el almacenamiento de métricas por clase en SQLite
+Proyecto: Sistema de Conteo de Líneas Físicas y Lógicas en Python
+Autor: Amílcar Pérez
+Organización: Equipo 3
+Licencia: MIT
+Fecha de Creación: 18-10-2026
+Última Actualización: 18-10-2026
+
+Dependencias:
+    - sqlite3
+    - contextlib.contextmanager
+    - core.gestion_archivos.almacenamiento_metricas.AlmacenamientoMetricas
+    - models.metricas.MetricasArchivo, MetricasClase
+    - contador_lineas.utils.sqlite_utils.conectar_sqlite
+
+Uso:
+    from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
+        AlmacenamientoMetricas
+    )
+    # Una ruta .db o una URL sqlite:/// selecciona este backend
+    almacen = AlmacenamientoMetricas("sqlite:///db/lineas_por_clase.db")
+    almacen.guardar_metricas(metricas)
+
+Notas:
+    - Las clases se guardan en su propia tabla enlazada al archivo, con la
+      posición original para reconstruir la lista en el mismo orden
+    - No usa RETURNING (SQLite 3.35), que falta en la biblioteca SQLite
+      de muchos intérpretes de Python 3.8 y 3.9; el upsert requiere 3.24
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import (
+    AlmacenamientoMetricas
+)
+from lineas_por_clase.models.metricas import MetricasArchivo, MetricasClase
+from contador_lineas.utils.sqlite_utils import conectar_sqlite
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS archivos (
+    id INTEGER PRIMARY KEY,
+    nombre_archivo TEXT NOT NULL,
+    total_lineas_fisicas INTEGER NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_archivos_nombre
+    ON archivos (nombre_archivo);
+CREATE TABLE IF NOT EXISTS clases (
+    id INTEGER PRIMARY KEY,
+    archivo_id INTEGER NOT NULL REFERENCES archivos (id) ON DELETE CASCADE,
+    posicion INTEGER NOT NULL,
+    nombre_clase TEXT NOT NULL,
+    cantidad_metodos INTEGER NOT NULL,
+    lineas_fisicas INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_clases_archivo
+    ON clases (archivo_id, posicion);
+CREATE INDEX IF NOT EXISTS idx_clases_nombre ON clases (nombre_clase);
+"""
+
+CONSULTA_CLASES = (
+    "SELECT archivo_id, nombre_clase, cantidad_metodos, lineas_fisicas "
+    "FROM clases"
+)
+
+
+class AlmacenamientoMetricasSqlite(AlmacenamientoMetricas):
+    """
+    Gestiona el almacenamiento persistente de métricas por clase en SQLite.
+
+    Attributes:
+        ruta_almacenamiento (str): Ruta o URL de la base de datos
+        conexion (sqlite3.Connection): Conexión abierta a la base
+
+    Methods:
+        guardar_metricas(metricas: MetricasArchivo) -> None:
+            Guarda nuevas métricas en el almacenamiento.
+        guardar_multiples_metricas(metricas: Iterable[MetricasArchivo]) -> None:
+            Guarda varias métricas en una sola transacción.
+        cargar_metricas(nombre_archivo: str) -> Optional[MetricasArchivo]:
+            Carga métricas para un archivo específico.
+        obtener_todas_las_metricas() -> List[MetricasArchivo]:
+            Obtiene todas las métricas almacenadas.
+        lote() -> Iterator[AlmacenamientoMetricasSqlite]:
+            Agrupa varias operaciones en una sola transacción.
+
+    Example:
+        >>> almacen = AlmacenamientoMetricasSqlite("db/lineas_por_clase.db")
+        >>> almacen.guardar_metricas(metricas)
+    """
+
+    def __init__(self, ruta_almacenamiento: str):
+        self.ruta_almacenamiento = ruta_almacenamiento
+        self.conexion = conectar_sqlite(ruta_almacenamiento, ESQUEMA)
+        # Métricas guardadas dentro de un lote abierto, None si no hay lote
+        self._pendientes: Optional[Dict[str, MetricasArchivo]] = None
+
+    def guardar_multiples_metricas(
+            self,
+            metricas: Iterable[MetricasArchivo]) -> None:
+        """
+        Guarda varias métricas en una sola transacción.
+
+        Args:
+            metricas (Iterable[MetricasArchivo]): Métricas a almacenar
+        """
+        if self._pendientes is not None:
+            for metrica in metricas:
+                self._pendientes[metrica.nombre_archivo] = metrica
+            return
+
+        with self.conexion:
+            for metrica in metricas:
+                # El upsert conserva el id del archivo y con él su posición en
+                # el listado; sus clases se reemplazan por completo. El id se
+                # consulta aparte porque RETURNING requiere SQLite 3.35
+                self.conexion.execute(
+                    "INSERT INTO archivos "
+                    "(nombre_archivo, total_lineas_fisicas) VALUES (?, ?) "
+                    "ON CONFLICT (nombre_archivo) DO UPDATE SET "
+                    "total_lineas_fisicas = excluded.total_lineas_fisicas",
+                    (metrica.nombre_archivo, metrica.total_lineas_fisicas)
+                )
+                archivo_id = self.conexion.execute(
+                    "SELECT id FROM archivos WHERE nombre_archivo = ?",
+                    (metrica.nombre_archivo,)
+                ).fetchone()[0]
+                self.conexion.execute(
+                    "DELETE FROM clases WHERE archivo_id = ?", (archivo_id,))
+                self.conexion.executemany(
+                    "INSERT INTO clases (archivo_id, posicion, nombre_clase, "
+                    "cantidad_metodos, lineas_fisicas) VALUES (?, ?, ?, ?, ?)",
+                    [(archivo_id, posicion, clase.nombre_clase,
+                      clase.cantidad_metodos, clase.lineas_fisicas)
+                     for posicion, clase in enumerate(metrica.clases)]
+                )
+
+    def cargar_metricas(self, nombre_archivo: str) -> Optional[MetricasArchivo]:
+        """
+        Carga métricas almacenadas para un archivo.
+
+        Args:
+            nombre_archivo (str): Nombre del archivo a buscar
+
+        Returns:
+            Optional[MetricasArchivo]: Métricas encontradas o None
+        """
+        if self._pendientes and nombre_archivo in self._pendientes:
+            return self._pendientes[nombre_archivo]
+
+        fila = self.conexion.execute(
+            "SELECT id FROM archivos WHERE nombre_archivo = ?",
+            (nombre_archivo,)
+        ).fetchone()
+        if fila is None:
+            return None
+
+        clases = [
+            MetricasClase(*datos_clase)
+            for _, *datos_clase in self.conexion.execute(
+                CONSULTA_CLASES + " WHERE archivo_id = ? ORDER BY posicion",
+                (fila[0],)
+            )
+        ]
+        return MetricasArchivo(nombre_archivo=nombre_archivo, clases=clases)
+
+    def obtener_todas_las_metricas(self) -> List[MetricasArchivo]:
+        """
+        Obtiene lista de todas las métricas almacenadas.
+        """
+        # Leemos todas las clases en una sola consulta y las agrupamos por
+        # archivo para no consultar una vez por cada archivo
+        clases_por_archivo = defaultdict(list)
+        for archivo_id, *datos_clase in self.conexion.execute(
+                CONSULTA_CLASES + " ORDER BY archivo_id, posicion"):
+            clases_por_archivo[archivo_id].append(MetricasClase(*datos_clase))
+
+        return self._combinar_pendientes([
+            MetricasArchivo(nombre_archivo=nombre_archivo,
+                            clases=clases_por_archivo[archivo_id])
+            for archivo_id, nombre_archivo in self.conexion.execute(
+                "SELECT id, nombre_archivo FROM archivos ORDER BY id")
+        ])
+
+    @contextmanager
+    def lote(self) -> Iterator["AlmacenamientoMetricasSqlite"]:
+        """
+        Agrupa las métricas guardadas en el bloque en una sola transacción.
+
+        Las métricas pendientes se consultan desde memoria mientras el lote
+        está abierto; si el bloque lanza una excepción se descartan.
+
+        Returns:
+            Iterator[AlmacenamientoMetricasSqlite]: El propio almacenamiento
+
+        Example:
+            >>> with almacen.lote():
+            ...     almacen.guardar_metricas(metricas)
+        """
+        if self._pendientes is not None:
+            yield self
+            return
+
+        self._pendientes = {}
+        try:
+            yield self
+            pendientes, self._pendientes = self._pendientes, None
+            self.guardar_multiples_metricas(pendientes.values())
+        finally:
+            self._pendientes = None
+
+    def _combinar_pendientes(
+            self,
+            metricas: List[MetricasArchivo]) -> List[MetricasArchivo]:
+        """
+        Combina las métricas almacenadas con las pendientes del lote.
+
+        Args:
+            metricas (List[MetricasArchivo]): Métricas leídas de la base
+
+        Returns:
+            List[MetricasArchivo]: Métricas con las pendientes aplicadas
+        """
+        if not self._pendientes:
+            return metricas
+        # Actualizar una clave de un diccionario conserva su posición, igual
+        # que el upsert conserva el id de la fila
+        combinadas = {metrica.nombre_archivo: metrica for metrica in metricas}
+        combinadas.update(self._pendientes)
+        return list(combinadas.values())
@@ -0,0 +1,41 @@
+# tests/regression/test_almacenamiento_sqlite_clases.py
+import pytest
+
+from lineas_por_clase.core.gestion_archivos.almacenamiento_metricas import AlmacenamientoMetricas
+from lineas_por_clase.core.gestion_archivos.almacenamiento_sqlite import AlmacenamientoMetricasSqlite
+from lineas_por_clase.models.metricas import MetricasArchivo, MetricasClase
+from lineas_por_clase.tests.fixtures.json_metricas import METRICAS_REGISTRO_CLASES
+
+
+class TestAlmacenamientoMetricasSqlite:
+    @pytest.fixture
+    def almacenamiento(self, tmp_path):
+        return AlmacenamientoMetricas(str(tmp_path / "metricas_test.db"))
+
+    def test_selecciona_backend_sqlite(self, almacenamiento):
+        assert isinstance(almacenamiento, AlmacenamientoMetricasSqlite)
+
+    def test_actualizar_reemplaza_clases(self, almacenamiento):
+        almacenamiento.guardar_metricas(MetricasArchivo("test.py", [
+            MetricasClase("A", 1, 10), MetricasClase("B", 2, 20)]))
+        almacenamiento.guardar_metricas(MetricasArchivo("test.py", [
+            MetricasClase("C", 3, 30)]))
+
+        metricas = almacenamiento.cargar_metricas("test.py")
+        assert [c.nombre_clase for c in metricas.clases] == ["C"]
+        assert metricas.total_lineas_fisicas == 30
+
+    def test_multiples_archivos_registro(self, almacenamiento):
+        almacenamiento.guardar_multiples_metricas(
+            MetricasArchivo(
+                nombre_archivo=metricas_dict["nombre_archivo"],
+                clases=[MetricasClase(**clase) for clase in metricas_dict["clases"]]
+            )
+            for metricas_dict in METRICAS_REGISTRO_CLASES.values()
+        )
+
+        todas_las_metricas = almacenamiento.obtener_todas_las_metricas()
+        assert [m.nombre_archivo for m in todas_las_metricas] == list(METRICAS_REGISTRO_CLASES)
+        for metricas in todas_las_metricas:
+            original = METRICAS_REGISTRO_CLASES[metricas.nombre_archivo]
+            assert [MetricasClase(**clase) for clase in original["clases"]] == metricas.clases
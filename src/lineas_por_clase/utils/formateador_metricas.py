@@ -8,12 +8,12 @@ Autor: Amílcar Pérez
 Organización: Equipo 3
 Licencia: MIT
 Fecha de Creación: 27-11-2024
-Última Actualización: 28-11-2024
+Última Actualización: 18-10-2026
 
 Dependencias:
     - typing.List
-    - tabulate.tabulate
-    - colorama.init, Fore, Style
+    - tabulate.tabulate (al formatear la tabla)
+    - contador_lineas.utils.colores.Fore, Style
     - contador_lineas.models.metricas.MetricasArchivo
 
 Uso:
@@ -21,13 +21,15 @@ Uso:
         mostrar_tabla_metricas
     )
     mostrar_tabla_metricas(lista_metricas)
+
+Notas:
+    - tabulate se importa al formatear la primera tabla, así que cargar el
+      módulo no retrasa el arranque de las ejecuciones que no muestran tablas
 """
 
 from typing import List
 
-from tabulate import tabulate
-from colorama import init, Fore, Style
-
+from contador_lineas.utils.colores import Fore, Style
 from lineas_por_clase.models.metricas import MetricasArchivo
 
 class FormateadorMetricas:
@@ -50,7 +52,6 @@ class FormateadorMetricas:
     """
 
     def __init__(self):
-        init()
         self.tema = {
             'encabezado': Fore.WHITE + Style.BRIGHT,
             'nombre_archivo': Fore.GREEN,
@@ -86,6 +87,9 @@ class FormateadorMetricas:
 
         filas = self._formatear_fila(metricas)
 
+        # tabulate es la importación más costosa de la herramienta, así que se
+        # carga solo cuando se muestra una tabla
+        from tabulate import tabulate
         print("\n" + tabulate(filas, headers=encabezados, tablefmt="grid"))
 
     def _formatear_fila(self, metricas: List[MetricasArchivo]) -> List[str]: